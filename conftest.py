@@ -19,6 +19,8 @@ pytest_plugins = [
     'pytest_plugins.rerun_rp.rerun_rp',
     'pytest_plugins.fspath_plugins',
     'pytest_plugins.factory_collection',
+    'pytest_plugins.fixture_profiler',
+    'pytest_plugins.fixture_reuse_ordering',
     'pytest_plugins.requirements.update_requirements',
     'pytest_plugins.sanity_plugin',
     'pytest_plugins.video_cleanup',
@@ -26,6 +28,9 @@ pytest_plugins = [
     'pytest_plugins.select_random_tests',
     'pytest_plugins.capsule_n-minus',
     'pytest_plugins.upstream_pr',
+    'pytest_plugins.impacted_tests',
+    'pytest_plugins.resource_usage',
+    'pytest_plugins.api_latency',
     # Fixtures
     'pytest_fixtures.core.broker',
     'pytest_fixtures.core.sat_cap_factory',
@@ -2,7 +2,8 @@
 from fauxfactory import gen_string
 import pytest
 
-from robottelo.constants import LIBRARY_LCE, PRDS, REPOS, REPOSET
+from robottelo import constants
+from robottelo.constants import LIBRARY_LCE, PRDS
 
 
 @pytest.fixture
@@ -33,8 +34,8 @@ def setup_rhst_repo(module_target_sat):
     module_target_sat.cli_factory.setup_org_for_a_rh_repo(
         {
             'product': PRDS['rhel'],
-            'repository-set': REPOSET[repo_name],
-            'repository': REPOS[repo_name]['name'],
+            'repository-set': constants.REPOSET[repo_name],
+            'repository': constants.REPOS[repo_name]['name'],
             'organization-id': org.id,
             'content-view-id': cv.id,
             'lifecycle-environment-id': lce.id,
@@ -1,13 +1,13 @@
 import pytest
 
-from robottelo.constants import PERMISSIONS
+from robottelo import constants
 
 
 @pytest.fixture(scope="session")
 def expected_permissions(session_target_sat):
     """Return the list of permissions valid for current instance."""
 
-    permissions = PERMISSIONS.copy()
+    permissions = constants.PERMISSIONS.copy()
     rpm_packages = session_target_sat.execute('rpm -qa').stdout
     if 'rubygem-foreman_rh_cloud' not in rpm_packages:
         permissions.pop('InsightsHit')
@@ -1,7 +1,6 @@
 # Azure CR Fixtures
 from fauxfactory import gen_string
 import pytest
-from wrapanapi import AzureSystem
 
 from robottelo.config import settings
 from robottelo.constants import (
@@ -72,6 +71,8 @@ def azurerm_settings():
 @pytest.fixture(scope='session')
 def azurermclient(azurerm_settings):
     """Connect to AzureRM using wrapanapi AzureSystem"""
+    from wrapanapi import AzureSystem
+
     azurermclient = AzureSystem(
         username=azurerm_settings['app_ident'],
         password=azurerm_settings['secret'],
@@ -4,7 +4,6 @@ from tempfile import mkstemp
 
 from fauxfactory import gen_string
 import pytest
-from wrapanapi.systems.google import GoogleCloudSystem
 
 from robottelo.config import settings
 from robottelo.constants import (
@@ -81,6 +80,8 @@ def gce_cert(sat_gce):
 
 @pytest.fixture(scope='session')
 def googleclient(gce_cert):
+    from wrapanapi.systems.google import GoogleCloudSystem
+
     gceclient = GoogleCloudSystem(
         project=gce_cert['project_id'],
         zone=settings.gce.zone,
@@ -1,8 +1,6 @@
 from broker import Broker
 from fauxfactory import gen_string
 import pytest
-from wrapanapi import VMWareSystem
-from wrapanapi.systems.virtualcenter import VMWareVirtualMachine
 
 from robottelo.config import settings
 from robottelo.hosts import ContentHost
@@ -19,6 +17,8 @@ def vmware(request):
 
 @pytest.fixture
 def vmwareclient(vmware):
+    from wrapanapi import VMWareSystem
+
     vmwareclient = VMWareSystem(
         hostname=vmware.hostname,
         username=settings.vmware.username,
@@ -136,6 +136,8 @@ def provisioning_vmware_host(pxe_loader, vmwareclient, module_ssh_key_file):
     ) as provisioning_host:
         yield provisioning_host
         # Delete the host
+        from wrapanapi.systems.virtualcenter import VMWareVirtualMachine
+
         vmware_host = VMWareVirtualMachine(vmwareclient, name=provisioning_host.name)
         vmware_host.delete()
         # Verify host is deleted from VMware
@@ -3,8 +3,9 @@ from fauxfactory import gen_string
 from nailgun.entity_mixins import call_entity_method_with_timeout
 import pytest
 
+from robottelo import constants
 from robottelo.config import settings
-from robottelo.constants import DEFAULT_ARCHITECTURE, DEFAULT_ORG, PRDS, REPOS, REPOSET
+from robottelo.constants import DEFAULT_ARCHITECTURE, DEFAULT_ORG, PRDS
 
 
 @pytest.fixture(scope='module')
@@ -40,8 +41,8 @@ def module_rhst_repo(module_target_sat, module_sca_manifest_org, module_promoted
         basearch=DEFAULT_ARCHITECTURE,
         org_id=module_sca_manifest_org.id,
         product=PRDS['rhel'],
-        repo=REPOS['rhst7']['name'],
-        reposet=REPOSET['rhst7'],
+        repo=constants.REPOS['rhst7']['name'],
+        reposet=constants.REPOSET['rhst7'],
         releasever=None,
     )
     rh_repo = module_target_sat.api.Repository(id=rh_repo_id).read()
@@ -53,7 +54,7 @@ def module_rhst_repo(module_target_sat, module_sca_manifest_org, module_promoted
     cv = cv.read()
     cv.version.sort(key=lambda version: version.id)
     cv.version[-1].promote(data={'environment_ids': module_lce.id})
-    return REPOS['rhst7']['id']
+    return constants.REPOS['rhst7']['id']
 
 
 @pytest.fixture
@@ -1,9 +1,18 @@
 # Content Component fixtures
+from contextlib import contextmanager
+
 from manifester import Manifester
 import pytest
 
 from robottelo.config import settings
 from robottelo.constants import DEFAULT_LOC, DEFAULT_ORG
+from robottelo.utils import manifest_cache
+from robottelo.utils.manifest_cache import ManifestCache
+
+
+def pytest_sessionfinish(session):
+    """Wait for the manifest cache refills, whose allocations would be left out of the cache"""
+    manifest_cache.join_refills()
 
 
 @pytest.fixture(scope='session')
@@ -136,11 +145,23 @@ def class_els_sca_manifest_org(class_org, class_sca_els_manifest, class_target_s
 # or stage RHSM accounts.
 
 
+@contextmanager
+def manifest_for(category):
+    """Yield a manifest of the given `settings.manifest` category, taken from the shared
+    manifest cache when `manifest.cache.enabled` is set, or generated by Manifester otherwise."""
+    if settings.manifest.cache.enabled:
+        with ManifestCache(category).checkout() as manifest:
+            yield manifest
+    else:
+        with Manifester(manifest_category=settings.manifest[category]) as manifest:
+            yield manifest
+
+
 @pytest.fixture(scope='session')
 def session_sca_manifest():
     """Yields a manifest in entitlement mode with subscriptions determined by the
     `manifest_category.entitlement` setting in conf/manifest.yaml."""
-    with Manifester(manifest_category=settings.manifest.golden_ticket) as manifest:
+    with manifest_for('golden_ticket') as manifest:
         yield manifest
 
 
@@ -148,7 +169,7 @@ def session_sca_manifest():
 def module_extra_rhel_sca_manifest():
     """Yields a manifest in sca mode with subscriptions determined by the
     'manifest_category.extra_rhel_entitlement` setting in conf/manifest.yaml."""
-    with Manifester(manifest_category=settings.manifest.extra_rhel_entitlement) as manifest:
+    with manifest_for('extra_rhel_entitlement') as manifest:
         yield manifest
 
 
@@ -156,7 +177,7 @@ def module_extra_rhel_sca_manifest():
 def module_sca_manifest():
     """Yields a manifest in Simple Content Access mode with subscriptions determined by the
     `manifest_category.golden_ticket` setting in conf/manifest.yaml."""
-    with Manifester(manifest_category=settings.manifest.golden_ticket) as manifest:
+    with manifest_for('golden_ticket') as manifest:
         yield manifest
 
 
@@ -164,7 +185,7 @@ def module_sca_manifest():
 def module_sca_multiarch_manifest():
     """Yields a manifest in Simple Content Access mode with multiarchitecture subscriptions
     determined by the `manifest_category.arm_testing_manifest` setting in conf/manifest.yaml."""
-    with Manifester(manifest_category=settings.manifest.arm_testing_manifest) as manifest:
+    with manifest_for('arm_testing_manifest') as manifest:
         yield manifest
 
 
@@ -172,7 +193,7 @@ def module_sca_multiarch_manifest():
 def class_sca_manifest():
     """Yields a manifest in Simple Content Access mode with subscriptions determined by the
     `manifest_category.golden_ticket` setting in conf/manifest.yaml."""
-    with Manifester(manifest_category=settings.manifest.golden_ticket) as manifest:
+    with manifest_for('golden_ticket') as manifest:
         yield manifest
 
 
@@ -180,7 +201,7 @@ def class_sca_manifest():
 def function_sca_manifest():
     """Yields a manifest in Simple Content Access mode with subscriptions determined by the
     `manifest_category.golden_ticket` setting in conf/manifest.yaml."""
-    with Manifester(manifest_category=settings.manifest.golden_ticket) as manifest:
+    with manifest_for('golden_ticket') as manifest:
         yield manifest
 
 
@@ -189,7 +210,7 @@ def second_function_sca_manifest():
     """Yields a manifest in Simple Content Access mode with subscriptions determined by the
     `manifest_category.golden_ticket` setting in conf/manifest.yaml.
     A different one than is used in `function_sca_manifest_org`."""
-    with Manifester(manifest_category=settings.manifest.golden_ticket) as manifest:
+    with manifest_for('golden_ticket') as manifest:
         yield manifest
 
 
@@ -197,7 +218,7 @@ def second_function_sca_manifest():
 def module_sca_els_manifest():
     """Yields a manifest in Simple Content Access mode with subscriptions determined by the
     `manifest_category.els_rhel_manifest` setting in conf/manifest.yaml."""
-    with Manifester(manifest_category=settings.manifest.els_rhel_manifest) as manifest:
+    with manifest_for('els_rhel_manifest') as manifest:
         yield manifest
 
 
@@ -205,7 +226,7 @@ def module_sca_els_manifest():
 def class_sca_els_manifest():
     """Yields a manifest in Simple Content Access mode with subscriptions determined by the
     `manifest_category.els_rhel_manifest` setting in conf/manifest.yaml."""
-    with Manifester(manifest_category=settings.manifest.els_rhel_manifest) as manifest:
+    with manifest_for('els_rhel_manifest') as manifest:
         yield manifest
 
 
@@ -213,7 +234,7 @@ def class_sca_els_manifest():
 def function_sca_els_manifest():
     """Yields a manifest in Simple Content Access mode with subscriptions determined by the
     `manifest_category.els_rhel_manifest` setting in conf/manifest.yaml."""
-    with Manifester(manifest_category=settings.manifest.els_rhel_manifest) as manifest:
+    with manifest_for('els_rhel_manifest') as manifest:
         yield manifest
 
 
@@ -244,5 +265,5 @@ def sca_manifest_for_upgrade():
 @pytest.fixture
 def func_future_dated_subscription_manifest():
     """Returns future dated manifest. Used only for future date subscription scenarios."""
-    with Manifester(manifest_category=settings.manifest.future_date_subscription) as manifest:
+    with manifest_for('future_date_subscription') as manifest:
         yield manifest
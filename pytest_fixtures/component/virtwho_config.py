@@ -1,7 +1,7 @@
 import pytest
 
+from robottelo import constants
 from robottelo.config import settings
-from robottelo.constants import REPOS
 from robottelo.utils.datafactory import gen_string
 from robottelo.utils.virtwho import (
     deploy_configure_by_command,
@@ -430,6 +430,8 @@ def delete_host(form_data_api, target_sat):
 def register_sat_and_enable_aps_repo(module_target_sat):
     """Register Satellite to CDN and Enable rhel aps repos"""
     module_target_sat.register_to_cdn()
-    module_target_sat.enable_repo(REPOS[f'rhel{module_target_sat.os_version.major}_aps']['id'])
+    module_target_sat.enable_repo(
+        constants.REPOS[f'rhel{module_target_sat.os_version.major}_aps']['id']
+    )
     yield
     module_target_sat.unregister()
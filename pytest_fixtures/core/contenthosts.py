@@ -13,7 +13,7 @@ import pytest
 from robottelo import constants
 from robottelo.config import settings
 from robottelo.enums import NetworkType
-from robottelo.hosts import ContentHost, Satellite
+from robottelo.hosts import ContentHost, ContentHostPool, Satellite
 
 
 def host_conf(request):
@@ -86,6 +86,21 @@ def contenthost_factory(request, **kwargs):
     post_configs = host_params.pop("post_configs", [])
     host_class = kwargs.pop("host_class", ContentHost)
     broker_args = {**host_params, **kwargs}
+    if (
+        settings.content_host.reuse_containers
+        and request.scope == 'function'
+        and 'container_host' in broker_args
+        and '_count' not in broker_args
+        and not post_configs
+    ):
+        # reset and reuse the container host from the per-worker pool
+        pool = request.getfixturevalue('contenthost_pool')
+        host = pool.checkout(host_class, **broker_args)
+        try:
+            yield host
+        finally:
+            pool.release(host)
+        return
     with Broker(host_class=host_class, **broker_args) as host:
         if post_configs:
             hosts = host if isinstance(host, list) else [host]
@@ -94,6 +109,14 @@ def contenthost_factory(request, **kwargs):
         yield host
 
 
+@pytest.fixture(scope='session')
+def contenthost_pool():
+    """A per-worker pool of reusable container content hosts, checked in at session end"""
+    pool = ContentHostPool()
+    yield pool
+    pool.checkin_all()
+
+
 @pytest.fixture
 def rhel_contenthost(request):
     """A function-level fixture that provides a content host object parametrized"""
@@ -44,13 +44,11 @@ def pytest_sessionstart(session):
             xml.add_global_property(
                 'start_time', datetime.datetime.now(datetime.UTC).strftime(FMT_XUNIT_TIME)
             )
-            rhel_version = get_sat_rhel_version().base_version
             sat_version = settings.server.version.get('release')
             snap_version = settings.server.version.get('snap', '')
             xml.add_global_property("SatelliteNetworkType", str(settings.server.network_type))
             xml.add_global_property("SatelliteVersion", sat_version)
             xml.add_global_property("SnapVersion", snap_version)
-            xml.add_global_property("BaseOS", rhel_version)
             if settings.server.deploy_arguments.deploy_container:
                 for name, value in container_image_properties(
                     settings.ohsnap,
@@ -60,6 +58,20 @@ def pytest_sessionstart(session):
                     xml.add_global_property(name, value)
 
 
+@pytest.hookimpl(tryfirst=True)
+def pytest_sessionfinish(session):
+    """Add the RHEL version of the Satellite to the junit global properties
+
+    Resolved at the end of the session rather than at its start, so that collection does not
+    need to connect to the Satellite, and not at all with --collect-only
+    """
+    if get_xdist_worker_id(session) == 'master' and (
+        xml := session.config._store.get(xml_key, None)
+    ):
+        rhel_version = get_sat_rhel_version(offline=session.config.option.collectonly)
+        xml.add_global_property("BaseOS", rhel_version.base_version)
+
+
 @pytest.fixture(autouse=False, scope='session')
 def record_testsuite_timestamp_xml(record_testsuite_property):
     now = datetime.datetime.now(datetime.UTC)
@@ -1,3 +1,4 @@
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
 from contextlib import contextmanager
 from functools import lru_cache
 
@@ -130,6 +131,62 @@ def capsule_factory():
     return factory
 
 
+def _checkin_provisioned(future):
+    """Check in the host of a concurrent checkout whose set of hosts failed, once it is ready"""
+    if future.cancelled():
+        return
+    if err := future.exception():
+        logger.error(f'Concurrent host provisioning failed: {err}')
+        return
+    host = future.result()
+    logger.info(f'Rolling back partially provisioned host {host.hostname}')
+    Broker(hosts=[host]).checkin()
+
+
+@pytest.fixture(scope='session')
+def multi_host_factory(satellite_factory, capsule_factory):
+    """Provision several Satellite and Capsule hosts concurrently
+
+    Each host spec is either a host type ('satellite' or 'capsule') or a tuple of the
+    host type and a dictionary of broker args for that host. Every host is checked out
+    through its own factory, so each one is retried independently. As soon as any host
+    fails to provision, the error is raised: the checkouts that did not start are cancelled,
+    and the hosts already checked out, or still being checked out, are checked in when ready,
+    so a partial set of hosts is never leaked.
+
+    Usage::
+
+        sat, cap1, cap2 = multi_host_factory('satellite', 'capsule', 'capsule')
+
+    :return: A list of hosts, in the same order as the host specs
+    """
+    factories = {'satellite': satellite_factory, 'capsule': capsule_factory}
+
+    def factory(*host_specs, retry_limit=3, delay=300):
+        specs = [(spec, {}) if isinstance(spec, str) else spec for spec in host_specs]
+        if unknown := {host_type for host_type, _ in specs} - factories.keys():
+            raise ValueError(f'Unknown host types {unknown}, expected one of {list(factories)}')
+        logger.debug(f'Provisioning {len(specs)} hosts concurrently: {specs}')
+        executor = ThreadPoolExecutor(max_workers=len(specs))
+        futures = [
+            executor.submit(
+                factories[host_type], retry_limit=retry_limit, delay=delay, **broker_args
+            )
+            for host_type, broker_args in specs
+        ]
+        done, _ = wait(futures, return_when=FIRST_EXCEPTION)
+        if not (failed := [future for future in futures if future in done and future.exception()]):
+            executor.shutdown()
+            return [future.result() for future in futures]
+        executor.shutdown(wait=False, cancel_futures=True)
+        for future in futures:
+            if future is not failed[0]:
+                future.add_done_callback(_checkin_provisioned)
+        raise failed[0].exception()
+
+    return factory
+
+
 @pytest.fixture
 def satellite_host(request, satellite_factory):
     """A fixture that provides a Satellite based on config settings"""
@@ -268,30 +325,16 @@ def module_capsule_configured_mqtt(request, module_capsule_configured_ansible):
 
 
 @pytest.fixture(scope='module')
-def module_lb_capsules(retry_limit=3, delay=300, **broker_args):
+def module_lb_capsules(multi_host_factory):
     """A fixture that spins 2 capsule for loadbalancer
     :return: List of capsules
     """
-    if settings.capsule.get('deploy_arguments'):
-        resolved = resolve_deploy_args(settings.capsule.deploy_arguments)
-        settings.set('capsule.deploy_arguments', resolved)
-        broker_args.update(settings.capsule.deploy_arguments)
-        timeout = (1200 + delay) * retry_limit
-        hosts = Broker(
-            host_class=Capsule,
-            workflow=settings.capsule.deploy_workflows.product,
-            _count=2,
-            **broker_args,
-        )
-        cap_hosts = wait_for(
-            hosts.checkout, timeout=timeout, delay=delay, handle_exception=True, raise_original=True
-        )
-
-    [cap.enable_ipv6_dnf_and_rhsm_proxy() for cap in cap_hosts.out]
-    yield cap_hosts.out
+    caps = multi_host_factory('capsule', 'capsule')
+    [cap.enable_ipv6_dnf_and_rhsm_proxy() for cap in caps]
+    yield caps
 
-    [cap.teardown() for cap in cap_hosts.out]
-    Broker(hosts=cap_hosts.out).checkin()
+    [cap.teardown() for cap in caps]
+    Broker(hosts=caps).checkin()
 
 
 @pytest.fixture(scope='module')
@@ -8,6 +8,20 @@ import pytest
 from robottelo.config import configure_airgun, configure_nailgun, settings
 from robottelo.hosts import ContentHost, Satellite
 from robottelo.logging import logger
+from robottelo.utils.shared_resource import remove_shared_results
+
+xdist_run_ids = pytest.StashKey[set]()
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """Remember the run ID of the xdist workers, to remove their shared results at the end"""
+    node.config.stash.setdefault(xdist_run_ids, set()).add(node.workerinput['testrunuid'])
+
+
+def pytest_sessionfinish(session):
+    for run_id in session.config.stash.get(xdist_run_ids, ()):
+        remove_shared_results(run_id)
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -0,0 +1,118 @@
+"""Record the latency of the API calls to the Satellite, by endpoint.
+
+Enable with ``--api-latency <path>``. The API calls sent through the keep-alive session of
+``Satellite.api`` are recorded by ``robottelo.utils.api_latency`` in latency histograms by
+method and path template. With pytest-xdist, each worker sends its histograms to the controller,
+which merges them.
+
+Two files are written at the end of the session:
+
+* ``<path>.txt``: the calls, errors, retried calls, latency percentiles and mean response size of
+  each endpoint. The percentiles are those of the calls answered at the first attempt, the calls
+  retried by the session are recorded apart, see ``robottelo.utils.api_latency``.
+* ``<path>.json``: the histograms, to be compared with those of another run
+
+With ``--api-latency-baseline <baseline>.json``, the histograms of a previous run, the report
+gives the ratio of the median and 90th percentile latencies to those of the baseline, and ranks
+the endpoints by it, so that an endpoint getting slower between snaps stands out.
+"""
+
+import json
+from pathlib import Path
+
+from pytest_plugins.session_report import SessionReport, add_report_option
+from robottelo.utils import api_latency
+
+# endpoints called less often than this in either run are not compared to the baseline
+MIN_BASELINE_CALLS = 5
+
+
+def pytest_addoption(parser):
+    """Add the --api-latency and --api-latency-baseline options"""
+    add_report_option(
+        parser,
+        '--api-latency',
+        help='Record the latency of the API calls by endpoint, and write a report to <path>.txt '
+        'and the latency histograms to <path>.json',
+    )
+    parser.addoption(
+        '--api-latency-baseline',
+        action='store',
+        default=None,
+        help='Compare the API latencies with the histograms of a previous --api-latency run',
+    )
+
+
+def pytest_configure(config):
+    ApiLatencyRecorder.register(config, 'api_latency_recorder')
+
+
+def _ratio(value, baseline):
+    return value / baseline if baseline else 0.0
+
+
+class ApiLatencyRecorder(SessionReport):
+    """Enables the recording of the API calls and writes the latency reports"""
+
+    option = 'api_latency'
+    title = 'API latency'
+
+    def __init__(self, config):
+        super().__init__(config)
+        baseline = config.getoption('api_latency_baseline')
+        self.baseline = api_latency.load(json.loads(Path(baseline).read_text())) if baseline else {}
+        api_latency.enabled = True
+
+    def dump(self):
+        return api_latency.dump()
+
+    def merge(self, data):
+        api_latency.merge(data)
+
+    def write(self):
+        self.write_report()
+        self.report_file('json').write_text(json.dumps(api_latency.dump()))
+
+    def pytest_unconfigure(self, config):
+        api_latency.enabled = False
+
+    def rank(self):
+        """Return the endpoint stats, as (endpoint, stats, p50 ratio, p90 ratio)
+
+        Ranked by the ratio to the baseline of the 90th percentile latency if there is a
+        baseline, by the total latency otherwise.
+        """
+        ranked = []
+        for endpoint, stats in api_latency.endpoints().items():
+            p50_ratio = p90_ratio = 0.0
+            baseline = self.baseline.get(endpoint)
+            if baseline and min(baseline.latency.count, stats.latency.count) >= MIN_BASELINE_CALLS:
+                p50_ratio = _ratio(stats.latency.percentile(50), baseline.latency.percentile(50))
+                p90_ratio = _ratio(stats.latency.percentile(90), baseline.latency.percentile(90))
+            ranked.append((endpoint, stats, p50_ratio, p90_ratio))
+        if self.baseline:
+            return sorted(ranked, key=lambda row: row[3], reverse=True)
+        return sorted(
+            ranked, key=lambda row: row[1].latency.total + row[1].retried.total, reverse=True
+        )
+
+    def write_report(self):
+        header = (
+            f'{"calls":>7} {"errors":>6} {"retried":>7} {"p50 ms":>9} {"p90 ms":>9} {"p99 ms":>9} '
+            f'{"max ms":>9} {"mean KiB":>9}'
+        )
+        if self.baseline:
+            header += f' {"p50 x":>6} {"p90 x":>6}'
+        lines = [f'{header}  endpoint']
+        for endpoint, stats, p50_ratio, p90_ratio in self.rank():
+            latency = stats.latency
+            line = (
+                f'{stats.calls:7d} {stats.errors:6d} {stats.retried.count:7d} '
+                f'{latency.percentile(50) / 1000:9.1f} {latency.percentile(90) / 1000:9.1f} '
+                f'{latency.percentile(99) / 1000:9.1f} {latency.max / 1000:9.1f} '
+                f'{stats.size / stats.calls / 1024:9.1f}'
+            )
+            if self.baseline:
+                line += f' {p50_ratio:6.2f} {p90_ratio:6.2f}'
+            lines.append(f'{line}  {endpoint}')
+        self.report_file('txt').write_text('\n'.join(lines) + '\n')
@@ -1,9 +1,9 @@
-"""Plugin enables pytest to notify and update the requirements"""
+"""Plugin logging in to vault on pytest start, unless the vault token is still valid"""
 
 from robottelo.utils.vault import Vault
 
 
 def pytest_addoption(parser):
-    """Options to allow user to update the requirements"""
+    """Log in to vault, the vault secrets of the settings need a valid token"""
     with Vault() as vclient:
         vclient.login()
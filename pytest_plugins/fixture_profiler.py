@@ -0,0 +1,159 @@
+"""Profile the wall time spent in fixture setup and teardown.
+
+Enable with ``--fixture-profile <path>``. Setup and teardown of every fixture are timed and
+attributed to the fixture, its scope and its parameter. Time spent setting up the fixtures it
+depends on is attributed to those fixtures and included in the fixture's inclusive time. With
+pytest-xdist, each worker sends its data to the controller, which merges it.
+
+Two files are written at the end of the session:
+
+* ``<path>.txt``: fixtures ranked by inclusive time, with setup/teardown counts and times
+* ``<path>.folded``: collapsed stacks (in microseconds) for flamegraph.pl or speedscope
+"""
+
+from collections import defaultdict
+import time
+
+import pytest
+
+from pytest_plugins.session_report import SessionReport, add_report_option
+
+
+def pytest_addoption(parser):
+    """Add the --fixture-profile option"""
+    add_report_option(
+        parser,
+        '--fixture-profile',
+        help='Profile fixture setup/teardown and write a ranked report to <path>.txt '
+        'and collapsed stacks to <path>.folded',
+    )
+
+
+def pytest_configure(config):
+    FixtureProfiler.register(config, 'fixture_profiler')
+
+
+def _frame(request):
+    """Name of a fixture request as it appears in reports: name[param]"""
+    if hasattr(request, 'param'):
+        return f'{request.fixturename}[{request.param}]'
+    return request.fixturename
+
+
+def _stack(request):
+    """Return the chain of fixture frames that led to the given fixture request"""
+    frames = []
+    while hasattr(request, '_parent_request'):
+        frames.append(_frame(request))
+        request = request._parent_request
+    return frames[::-1]
+
+
+class FixtureProfiler(SessionReport):
+    """Records fixture setup and teardown events and writes the profile reports"""
+
+    option = 'fixture_profile'
+    title = 'Fixture profile'
+    suffixes = ('txt', 'folded')
+
+    def __init__(self, config):
+        super().__init__(config)
+        self.events = []
+
+    def _record(self, fixturedef, request, phase, duration):
+        self.events.append(
+            {
+                'fixture': fixturedef.argname,
+                'scope': fixturedef.scope,
+                'param': str(request.param) if hasattr(request, 'param') else None,
+                'phase': phase,
+                'stack': _stack(request),
+                'duration': duration,
+            }
+        )
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_fixture_setup(self, fixturedef, request):
+        start = time.perf_counter()
+        yield
+        self._record(fixturedef, request, 'setup', time.perf_counter() - start)
+        # finalizers run in reverse order, so this runs right before the fixture's own teardown
+        fixturedef.addfinalizer(
+            lambda: setattr(fixturedef, '_profile_teardown_start', time.perf_counter())
+        )
+
+    def pytest_fixture_post_finalizer(self, fixturedef, request):
+        if start := getattr(fixturedef, '_profile_teardown_start', None):
+            self._record(fixturedef, request, 'teardown', time.perf_counter() - start)
+            fixturedef._profile_teardown_start = None
+
+    def dump(self):
+        return self.events
+
+    def merge(self, data):
+        self.events.extend(data)
+
+    def write(self):
+        self.write_report()
+        self.write_folded()
+
+    def aggregate(self):
+        """Aggregate events per fixture, scope and parameter
+
+        :return: A list of dicts sorted by descending inclusive time
+        """
+        stats = defaultdict(
+            lambda: {'setups': 0, 'setup': 0.0, 'teardowns': 0, 'teardown': 0.0, 'inclusive': 0.0}
+        )
+        frames = defaultdict(dict)
+        for event in self.events:
+            key = (event['fixture'], event['scope'], event['param'])
+            stat = stats[key]
+            stat[f"{event['phase']}s"] += 1
+            stat[event['phase']] += event['duration']
+            frames[_frame_of(key)][key] = stat
+        # an event also counts toward the inclusive time of every fixture that requested it
+        for event in self.events:
+            for frame in set(event['stack']):
+                for stat in frames[frame].values():
+                    stat['inclusive'] += event['duration']
+        return sorted(
+            (
+                {'fixture': fixture, 'scope': scope, 'param': param, **stat}
+                for (fixture, scope, param), stat in stats.items()
+            ),
+            key=lambda stat: stat['inclusive'],
+            reverse=True,
+        )
+
+    def write_report(self):
+        ranked = self.aggregate()
+        scopes = defaultdict(float)
+        for stat in ranked:
+            scopes[stat['scope']] += stat['setup'] + stat['teardown']
+        lines = [f'{"total":>10}  scope']
+        lines.extend(f'{total:10.2f}  {scope}' for scope, total in scopes.items())
+        lines.append('')
+        lines.append(
+            f'{"inclusive":>10} {"setup":>10} {"teardown":>10} {"setups":>7}  {"scope":<8} fixture'
+        )
+        lines.extend(
+            f'{stat["inclusive"]:10.2f} {stat["setup"]:10.2f} {stat["teardown"]:10.2f} '
+            f'{stat["setups"]:7d}  {stat["scope"]:<8} {_frame_of((stat["fixture"], None, stat["param"]))}'
+            for stat in ranked
+        )
+        self.report_file('txt').write_text('\n'.join(lines) + '\n')
+
+    def write_folded(self):
+        folded = defaultdict(int)
+        for event in self.events:
+            frames = event['stack'] + (['teardown'] if event['phase'] == 'teardown' else [])
+            folded[';'.join(frames)] += int(event['duration'] * 1_000_000)
+        self.report_file('folded').write_text(
+            ''.join(f'{stack} {weight}\n' for stack, weight in folded.items() if weight)
+        )
+
+
+def _frame_of(key):
+    fixture, _, param = key
+    return fixture if param is None else f'{fixture}[{param}]'
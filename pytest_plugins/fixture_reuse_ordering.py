@@ -0,0 +1,146 @@
+"""Reorder collected tests to reuse expensive fixtures.
+
+pytest sets up a higher-scoped fixture once per scope, but a parametrized one is torn down and
+set up again every time consecutive tests use a different parameter. pytest groups the items by
+parameter at collection time, but ``pytest_collection_modifyitems`` hooks running afterwards
+(selection, sorting) can interleave them again, and expensive module and class fixtures then get
+rebuilt over and over.
+
+With ``--fixture-reuse-order``, the items sharing the same parent (module or class) are sorted so
+that the tests using the same parameter of a higher-scoped fixture run next to each other. Then
+the classes and functions of each module are sorted as whole blocks, by the parameters of the
+fixtures broader than class scope, so a module fixture used by both is regrouped too.
+The fixture dependency graph comes from pytest's own fixture resolution: ``item.fixturenames`` is
+the closure of every fixture the test needs, directly or through other fixtures. Classes and
+modules are never interleaved, so class and module scoped fixtures keep their natural lifetime,
+and groups holding tests with an explicit ``order`` marker are left untouched.
+"""
+
+from itertools import groupby
+
+import pytest
+
+from robottelo.logging import logger
+
+SCOPE_ORDER = ('session', 'package', 'module', 'class')
+CLASS_RANK = SCOPE_ORDER.index('class')
+
+fixture_reuse_saved = pytest.StashKey[int]()
+
+
+def pytest_addoption(parser):
+    """Add the --fixture-reuse-order option"""
+    parser.addoption(
+        '--fixture-reuse-order',
+        action='store_true',
+        default=False,
+        help='Reorder tests inside each module and class to minimize setups of '
+        'parametrized higher-scoped fixtures',
+    )
+
+
+def _fixture_params(item):
+    """Return the parameter indices of the parametrized higher-scoped fixtures used by an item
+
+    :return: A dict of {(scope rank, fixture name): parameter index}
+    """
+    callspec = getattr(item, 'callspec', None)
+    fixtureinfo = getattr(item, '_fixtureinfo', None)
+    if callspec is None or fixtureinfo is None:
+        return {}
+    params = {}
+    for name in item.fixturenames:
+        fixturedefs = fixtureinfo.name2fixturedefs.get(name)
+        if not fixturedefs or name not in callspec.indices:
+            continue
+        scope = fixturedefs[-1].scope
+        if scope in SCOPE_ORDER:
+            params[(SCOPE_ORDER.index(scope), name)] = callspec.indices[name]
+    return params
+
+
+def count_setups(items):
+    """Count the setups of parametrized higher-scoped fixtures for a given item order"""
+    setups = 0
+    active = {}
+    for item in items:
+        for fixture, index in _fixture_params(item).items():
+            if active.get(fixture) != index:
+                setups += 1
+                active[fixture] = index
+    return setups
+
+
+def _sorted_by_params(items, key, max_rank=None):
+    """Stable sort of items, or of blocks of items, by the parameters of their fixtures
+
+    Fixtures with a broader scope take precedence, so their parameters change least often, and
+    only the fixtures of a scope rank below ``max_rank``, if given, are considered.
+
+    :param key: A callable returning the item whose parameters stand for an element
+    """
+    fixtures = sorted(
+        {
+            fixture
+            for element in items
+            for fixture in _fixture_params(key(element))
+            if max_rank is None or fixture[0] < max_rank
+        }
+    )
+
+    def sort_key(element):
+        params = _fixture_params(key(element))
+        return [params.get(fixture, -1) for fixture in fixtures]
+
+    return sorted(items, key=sort_key)
+
+
+def reorder(items):
+    """Sort the items of each parent node, then the blocks of each module, by their parameters
+
+    The items of a class, or the functions of a module, are sorted by the parameters of their
+    higher-scoped fixtures. The classes and functions of a module are then sorted as blocks by
+    the parameters of the fixtures broader than class scope, the first item of a block standing
+    for it. Items that do not use a fixture keep their relative order thanks to the stable sort.
+    """
+    reordered = []
+    for _, module_items in groupby(items, key=lambda item: item.getparent(pytest.Module)):
+        blocks = [list(group) for _, group in groupby(module_items, key=lambda item: item.parent)]
+        ordered = [any(item.get_closest_marker('order') for item in block) for block in blocks]
+        blocks = [
+            block if has_order else _sorted_by_params(block, key=lambda item: item)
+            for block, has_order in zip(blocks, ordered, strict=True)
+        ]
+        if any(ordered):
+            reordered.extend(item for block in blocks for item in block)
+            continue
+        units = []
+        for block in blocks:
+            if block[0].getparent(pytest.Class) is None:
+                # each function of the module can join the classes sharing its parameters
+                units.extend([item] for item in block)
+            else:
+                units.append(block)
+        for unit in _sorted_by_params(units, key=lambda unit: unit[0], max_rank=CLASS_RANK):
+            reordered.extend(unit)
+    return reordered
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_collection_modifyitems(items, config):
+    """Reorder items to minimize the number of parametrized fixture setups"""
+    if not config.getoption('fixture_reuse_order'):
+        return
+    before = count_setups(items)
+    items[:] = reorder(items)
+    saved = before - count_setups(items)
+    config.stash[fixture_reuse_saved] = saved
+    logger.info(
+        f'Reordered tests for fixture reuse: {before} parametrized fixture setups '
+        f'reduced by {saved}'
+    )
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    if (saved := config.stash.get(fixture_reuse_saved, None)) is not None:
+        terminalreporter.write_line(f'fixture-reuse-order: saved {saved} fixture setups')
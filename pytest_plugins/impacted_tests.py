@@ -0,0 +1,74 @@
+"""Select the tests impacted by changes to the robottelo framework.
+
+Usage:
+    pytest tests/foreman --impacted-by origin/master...HEAD
+
+The framework lines (``robottelo``, ``pytest_fixtures``, ``pytest_plugins``) executed by each
+test come from an impact map built from a coverage run, see ``robottelo.utils.impact_map``.
+A test is selected if the given git range changes a framework line it executed, if its own test
+module changed, or if it is not in the impact map at all, e.g. a new test. Changes the map cannot
+track select tests conservatively: every test under the directory of a changed ``conftest.py``,
+and every test for any other file, e.g. a settings file, test data or requirements.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from robottelo.config import robottelo_tmp_dir
+from robottelo.logging import collection_logger as logger
+from robottelo.utils import impact_map
+
+
+def pytest_addoption(parser):
+    """Add the --impacted-by and --impact-map options"""
+    parser.addoption(
+        '--impacted-by',
+        action='store',
+        default=None,
+        help='Only run the tests impacted by the changes of a git range, e.g. origin/master...HEAD',
+    )
+    parser.addoption(
+        '--impact-map',
+        action='store',
+        default=str(robottelo_tmp_dir / 'impact_map.json'),
+        help='The impact map used by --impacted-by, built by scripts/build_impact_map.py',
+    )
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_collection_modifyitems(items, config):
+    """Deselect the tests not impacted by the changes of the --impacted-by git range"""
+    if not (git_range := config.getoption('impacted_by')):
+        return
+    map_file = config.getoption('impact_map')
+    try:
+        mapping = impact_map.load(map_file)
+    except (OSError, ValueError) as err:
+        raise pytest.UsageError(f'--impacted-by requires a valid impact map: {err}') from err
+    changes = impact_map.changed_lines(git_range, config.rootpath)
+    impacted = impact_map.impacted_tests(mapping, changes)
+    mapped = set(mapping['tests'])
+    changed_test_files = {path for path in changes if path.startswith('tests/')}
+    unmapped = impact_map.unmapped_changes(changes)
+    for directory, path in unmapped.items():
+        logger.info(f'--impacted-by {git_range}: {path} selects every test in {directory or "."}')
+    selected, deselected = [], []
+    for item in items:
+        path = Path(item.path).relative_to(config.rootpath).as_posix()
+        if (
+            item.nodeid in impacted
+            or item.nodeid not in mapped
+            or path in changed_test_files
+            or any(path.startswith(directory) for directory in unmapped)
+        ):
+            selected.append(item)
+        else:
+            deselected.append(item)
+    logger.info(
+        f'--impacted-by {git_range}: {len(changes)} changed files, '
+        f'selected {len(selected)} of {len(items)} tests'
+    )
+    if deselected:
+        items[:] = selected
+        config.hook.pytest_deselected(items=deselected)
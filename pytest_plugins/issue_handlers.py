@@ -1,5 +1,4 @@
 from collections import defaultdict
-import inspect
 import re
 
 import pytest
@@ -9,6 +8,8 @@ from robottelo.utils.issue_handlers import (
     add_workaround,
     should_deselect,
 )
+from robottelo.utils.issue_handlers.jira import jira_cache
+from robottelo.utils.metadata_index import get_index
 
 
 def pytest_configure(config):
@@ -25,27 +26,10 @@ def pytest_collection_modifyitems(session, items, config):
     pytest.issue_data = generate_issue_collection(items, config)
 
 
-IS_OPEN = re.compile(
-    # To match `if is_open('SAT:123456'):`
-    r"\s*if\sis_open\(\S(?P<src>\D{2})\s*:\s*(?P<num>\d*)\S\)\d*"
-)
-
-NOT_IS_OPEN = re.compile(
-    # To match `if not is_open('SAT:123456'):`
-    r"\s*if\snot\sis_open\(\S(?P<src>\D{2})\s*:\s*(?P<num>\d*)\S\)\d*"
-)
+def pytest_sessionfinish(session):
+    """Write the Jira cache entries updated during the session"""
+    jira_cache.flush()
 
-COMPONENT = re.compile(
-    # To match :CaseComponent: FooBar
-    r"\s*:CaseComponent:\s*(?P<component>\S*)",
-    re.IGNORECASE,
-)
-
-IMPORTANCE = re.compile(
-    # To match :CaseImportance: Critical
-    r"\s*:CaseImportance:\s*(?P<importance>\S*)",
-    re.IGNORECASE,
-)
 
 # Only treat as Jira issue if it looks like PROJECT-NUM (e.g. SAT-20548, RHEL-55871)
 JIRA_ISSUE_PATTERN = re.compile(r'^[A-Za-z]+[-]\d+$')
@@ -102,6 +86,7 @@ def generate_issue_collection(items, config):  # pragma: no cover
     deselect_data = {}  # a local cache for deselected tests
 
     test_modules = set()
+    index = get_index()
 
     # --- Build the issue marked usage collection ---
     for item in items:
@@ -145,8 +130,8 @@ def generate_issue_collection(items, config):  # pragma: no cover
                 deselect_data[item.location] = issue_key
 
         # Then take the workarounds using `is_open` helper.
-        source = inspect.getsource(item.function)
-        if 'is_open(' in source:
+        usages = index.metadata(item.function) or {}
+        if usages.get('is_open') or usages.get('not is_open'):
             kwargs = {
                 'filepath': filepath,
                 'lineno': lineno,
@@ -155,22 +140,18 @@ def generate_issue_collection(items, config):  # pragma: no cover
                 'importance': importance_mark,
                 'component_mark': component_slug,
             }
-            add_workaround(collected_data, IS_OPEN.findall(source), 'is_open', **kwargs)
-            add_workaround(collected_data, NOT_IS_OPEN.findall(source), 'not is_open', **kwargs)
+            add_workaround(collected_data, usages['is_open'], 'is_open', **kwargs)
+            add_workaround(collected_data, usages['not is_open'], 'not is_open', **kwargs)
 
     # Take uses of `is_open` from outside of test cases e.g: SetUp methods
     for test_module in test_modules:
-        module_source = inspect.getsource(test_module)
-        component_matches = COMPONENT.findall(module_source)
-        module_component = None
-        if component_matches:
-            module_component = component_matches[0]
-        if 'is_open(' in module_source:
+        module_metadata = index.file_metadata(test_module.__file__)
+        if module_metadata['is_open'] or module_metadata['not is_open']:
             kwargs = {
                 'filepath': test_module.__file__,
                 'lineno': 1,
                 'testcase': test_module.__name__,
-                'component': module_component,
+                'component': module_metadata['source_component'],
             }
 
             def validation(data, issue, usage, **kwargs):
@@ -178,14 +159,14 @@ def generate_issue_collection(items, config):  # pragma: no cover
 
             add_workaround(
                 collected_data,
-                IS_OPEN.findall(module_source),
+                module_metadata['is_open'],
                 'is_open',
                 validation=validation,
                 **kwargs,
             )
             add_workaround(
                 collected_data,
-                NOT_IS_OPEN.findall(module_source),
+                module_metadata['not is_open'],
                 'not is_open',
                 validation=validation,
                 **kwargs,
@@ -7,15 +7,31 @@ from xdist import is_xdist_worker
 
 from robottelo.logging import (
     DEFAULT_DATE_FORMAT,
+    JsonLinesFormatter,
+    flush_logs,
+    log_output,
     logger,
+    queued,
     robottelo_log_dir,
     robottelo_log_file,
 )
+from robottelo.utils import log_store
 
 with contextlib.suppress(ImportError):
     from pytest_reportportal import RPLogger, RPLogHandler
 
 
+def pytest_addoption(parser):
+    parser.addoption(
+        '--merge-logs',
+        action='store_true',
+        default=False,
+        help='Merge the log files by timestamp at the end of the run, into an indexed and '
+        'compressed logs/robottelo_merged.log.gz. Show the log of a test with '
+        '`scripts/robottelo_logs.py show <nodeid>`',
+    )
+
+
 @pytest.fixture(autouse=True, scope='session')
 def configure_logging(request, worker_id):
     """Handle xdist and ReportPortal logging configuration at session start
@@ -30,6 +46,9 @@ def configure_logging(request, worker_id):
         fmt=f'%(asctime)s - {worker_id} - %(name)s - %(levelname)s - %(message)s',
         datefmt=DEFAULT_DATE_FORMAT,
     )
+    worker_file_formatter = (
+        JsonLinesFormatter(fields={'worker': worker_id}) if log_output.json else worker_formatter
+    )
     use_rp_logger = hasattr(request.node.config, 'py_test_service')
     if use_rp_logger:
         logging.setLoggerClass(RPLogger)
@@ -37,11 +56,11 @@ def configure_logging(request, worker_id):
     if is_xdist_worker(request) and f'{worker_id}' not in [h.get_name() for h in logger.handlers]:
         # Track the core logger's file handler level, set it in case core logger wasn't set
         worker_log_level = 'INFO'
+        # file handlers may be queued, see robottelo.logging.QueuedFileHandler
         handlers_to_remove = [
             h
             for h in logger.handlers
-            if isinstance(h, logging.FileHandler)
-            and getattr(h, 'baseFilename', None) == str(robottelo_log_file)
+            if getattr(h, 'baseFilename', None) == str(robottelo_log_file)
         ]
         for handler in handlers_to_remove:
             logger.removeHandler(handler)
@@ -50,9 +69,9 @@ def configure_logging(request, worker_id):
             robottelo_log_dir.joinpath(f'robottelo_{worker_id}.log')
         )
         worker_handler.set_name(f'{worker_id}')
-        worker_handler.setFormatter(worker_formatter)
+        worker_handler.setFormatter(worker_file_formatter)
         worker_handler.setLevel(worker_log_level)
-        logger.addHandler(worker_handler)
+        logger.addHandler(queued(worker_handler))
 
         if use_rp_logger:
             rp_handler = RPLogHandler(request.node.config.py_test_service)
@@ -60,6 +79,20 @@ def configure_logging(request, worker_id):
             # logger.addHandler(rp_handler)
 
 
+@pytest.hookimpl(trylast=True)
+def pytest_unconfigure(config):
+    """Write the queued log records, xdist workers may exit without running atexit handlers
+
+    The controller then merges the log files of the run, when requested.
+    """
+    flush_logs()
+    if config.getoption('merge_logs', False) and not hasattr(config, 'workerinput'):
+        log_store.merge_logs(
+            sorted(robottelo_log_dir.glob('robottelo*.log')),
+            robottelo_log_dir / 'robottelo_merged.log.gz',
+        )
+
+
 def pytest_runtest_logstart(nodeid, location):
     logger.info(f'Started Test: {nodeid}')
 
@@ -1,6 +1,5 @@
 import datetime
 import inspect
-import re
 
 import pytest
 
@@ -9,6 +8,7 @@ from robottelo.hosts import get_sat_rhel_version
 from robottelo.logging import collection_logger as logger
 from robottelo.utils import parse_comma_separated_list
 from robottelo.utils.issue_handlers.jira import are_any_jira_open
+from robottelo.utils.metadata_index import get_index, parse_docstring
 
 FMT_XUNIT_TIME = '%Y-%m-%dT%H:%M:%S'
 IMPORTANCE_LEVELS = []
@@ -63,37 +63,6 @@ def pytest_configure(config):
         config.addinivalue_line("markers", marker)
 
 
-component_regex = re.compile(
-    # To match :CaseComponent: FooBar
-    r'\s*:CaseComponent:\s*(?P<component>\S*)',
-    re.IGNORECASE,
-)
-
-importance_regex = re.compile(
-    # To match :CaseImportance: Critical
-    r'\s*:CaseImportance:\s*(?P<importance>\S*)',
-    re.IGNORECASE,
-)
-
-team_regex = re.compile(
-    # To match :Team: Rocket
-    r'\s*:Team:\s*(?P<team>\S*)',
-    re.IGNORECASE,
-)
-
-blocked_by_regex = re.compile(
-    # To match :BlockedBy: SAT-32932
-    r'\s*:BlockedBy:\s*(?P<blocked_by>.*\S*)',
-    re.IGNORECASE,
-)
-
-verifies_regex = re.compile(
-    # To match :Verifies: SAT-32932
-    r'\s*:Verifies:\s*(?P<verifies>.*\S*)',
-    re.IGNORECASE,
-)
-
-
 def handle_verification_issues(item, verifies_marker, verifies_issues):
     """Handles the logic for deselecting tests based on Verifies testimony token
     and --verifies-issues pytest option.
@@ -128,6 +97,20 @@ def handle_blocked_by(item, blocked_by_marker, blocked_by):
     return True
 
 
+def item_doc_tokens(item):
+    """Return the parsed testimony tokens of the function, class and module of an item
+
+    Tokens come from the metadata index, objects missing from it are parsed from their docstring
+    """
+    index = get_index()
+    for obj in (item.function, getattr(item, 'cls', None), item.module):
+        if obj is None:
+            continue
+        if (doc_tokens := index.metadata(obj)) is None:
+            doc_tokens = parse_docstring(inspect.getdoc(obj))
+        yield doc_tokens
+
+
 def log_and_deselect(item, option):
     logger.debug(f'Deselected test {item.nodeid} due to "{option}" pytest option.')
     deselected.append(item)
@@ -147,8 +130,6 @@ def pytest_collection_modifyitems(items, config):
     Control test collection for custom options related to testimony metadata
 
     """
-    # get RHEL version of the satellite
-    rhel_version = get_sat_rhel_version().base_version
     sat_version = settings.server.version.get('release')
     snap_version = settings.server.version.get('snap', '')
 
@@ -170,34 +151,22 @@ def pytest_collection_modifyitems(items, config):
 
         # apply the marks for importance, component, and team
         # Find matches from docstrings starting at smallest scope
-        item_docstrings = [
-            d
-            for d in map(inspect.getdoc, (item.function, getattr(item, 'cls', None), item.module))
-            if d is not None
-        ]
         blocked_by_marks_to_add = []
         verifies_marks_to_add = []
-        for docstring in item_docstrings:
+        for doc_tokens in item_doc_tokens(item):
             item_mark_names = [m.name for m in item.iter_markers()]
             # Add marker starting at smallest docstring scope
             # only add the mark if it hasn't already been applied at a lower scope
-            doc_component = component_regex.findall(docstring)
-            if doc_component and 'component' not in item_mark_names:
-                item.add_marker(pytest.mark.component(doc_component[0].lower()))
-            doc_importance = importance_regex.findall(docstring)
-            if doc_importance and 'importance' not in item_mark_names:
-                item.add_marker(pytest.mark.importance(doc_importance[0].lower()))
-            doc_team = team_regex.findall(docstring)
-            if doc_team and 'team' not in item_mark_names:
-                item.add_marker(pytest.mark.team(doc_team[0].lower()))
-            doc_verifies = verifies_regex.findall(docstring)
-            if doc_verifies and 'verifies_issues' not in item_mark_names:
-                verifies_marks_to_add.extend(str(b.strip()) for b in doc_verifies[-1].split(','))
-            doc_blocked_by = blocked_by_regex.findall(docstring)
-            if doc_blocked_by and 'blocked_by' not in item_mark_names:
-                blocked_by_marks_to_add.extend(
-                    str(b.strip()) for b in doc_blocked_by[-1].split(',')
-                )
+            if doc_tokens['component'] and 'component' not in item_mark_names:
+                item.add_marker(pytest.mark.component(doc_tokens['component']))
+            if doc_tokens['importance'] and 'importance' not in item_mark_names:
+                item.add_marker(pytest.mark.importance(doc_tokens['importance']))
+            if doc_tokens['team'] and 'team' not in item_mark_names:
+                item.add_marker(pytest.mark.team(doc_tokens['team']))
+            if doc_tokens['verifies'] and 'verifies_issues' not in item_mark_names:
+                verifies_marks_to_add.extend(doc_tokens['verifies'])
+            if doc_tokens['blocked_by'] and 'blocked_by' not in item_mark_names:
+                blocked_by_marks_to_add.extend(doc_tokens['blocked_by'])
         if blocked_by_marks_to_add:
             item.add_marker(pytest.mark.blocked_by(blocked_by_marks_to_add))
         if verifies_marks_to_add:
@@ -218,8 +187,7 @@ def pytest_collection_modifyitems(items, config):
         # Adding all markers as a single property
         item.user_properties.append(("markers", ", ".join(markers_prop_data)))
 
-        # Version specific user properties
-        item.user_properties.append(("BaseOS", rhel_version))
+        # Version specific user properties, BaseOS is added when the test runs
         item.user_properties.append(("SatelliteVersion", sat_version))
         item.user_properties.append(("SnapVersion", snap_version))
 
@@ -279,3 +247,20 @@ def pytest_collection_modifyitems(items, config):
     # selected will be empty if no filter option was passed, defaulting to full items list
     items[:] = selected if deselected else items
     config.hook.pytest_deselected(items=deselected)
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item):
+    """Add the RHEL version of the Satellite to the user_properties of a running test
+
+    It is resolved here rather than during collection, so collecting tests does not need
+    to connect to the Satellite
+    """
+    if item.nodeid.startswith('tests/robottelo/') and 'test_junit' not in item.nodeid:
+        return
+    item.user_properties.append(("BaseOS", get_sat_rhel_version().base_version))
+
+
+def pytest_collection_finish(session):
+    """Persist the metadata parsed during collection, to be reused by the next collection"""
+    get_index().save()
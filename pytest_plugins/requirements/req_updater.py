@@ -1,6 +1,16 @@
 from functools import cached_property
+import hashlib
+from importlib.metadata import distributions
+import json
+import os
+from pathlib import Path
+import site
 import subprocess
 import sys
+import sysconfig
+
+CACHE_VERSION = 1
+REQUIREMENTS_FILES = ('requirements.txt', 'requirements-optional.txt')
 
 
 class UsageError(Exception):
@@ -10,6 +20,13 @@ class UsageError(Exception):
 
 
 class ReqUpdater:
+    """Compares the installed packages with the requirements files
+
+    The result of the comparison is stored in ``cache_file``, keyed by the content of the
+    requirements files and the mtime of the site-packages directories, and is computed again
+    only when one of them changes.
+    """
+
     # Installed package name as key and its counterpart in requirements file as value
     package_deviates = {
         'broker': 'broker[docker,podman,hussh]',
@@ -19,15 +36,20 @@ class ReqUpdater:
         'pyyaml': 'PyYAML',
     }
 
+    def __init__(self, cache_file=None):
+        self.cache_file = Path(cache_file) if cache_file else None
+
     @cached_property
     def installed_packages(self):
-        """Returns the list of installed packages in venv
+        """Returns the list of installed packages in venv, in the ``pip freeze`` format
 
         This also normalizes any package names that deviates in requirements file vs installed names
         """
-        installer_args = [sys.executable, '-m', 'list', '--format=freeze']
-        installer_args[2:2] = self.packagae_manager.split(' ')
-        installed_pkges = subprocess.run(installer_args, capture_output=True).stdout.decode()
+        installed = {}
+        for dist in distributions():
+            # the first distribution found on sys.path is the one in use, as for pip
+            installed.setdefault(dist.metadata['Name'], dist.version)
+        installed_pkges = '\n'.join(f'{name}=={version}' for name, version in installed.items())
         for pkg in self.package_deviates:
             if pkg in installed_pkges:
                 # Replacing the installed package names with their names in requirements file
@@ -53,15 +75,51 @@ class ReqUpdater:
             opt_packages = [line.strip() for line in reqo.readlines() if line.strip()]
         return list(filter(self.package_filter, opt_packages))
 
+    @property
+    def inputs_key(self):
+        """Returns a key identifying the requirements files and the installed packages"""
+        digest = hashlib.sha256(f'{CACHE_VERSION}:{sys.prefix}'.encode())
+        for req_file in REQUIREMENTS_FILES:
+            digest.update(Path(req_file).read_bytes())
+        site_dirs = {sysconfig.get_path('purelib'), sysconfig.get_path('platlib')}
+        if site.ENABLE_USER_SITE:
+            site_dirs.add(site.getusersitepackages())
+        for site_dir in sorted(site_dirs):
+            # installing, upgrading or removing a package changes its dist-info directory
+            if os.path.isdir(site_dir):
+                digest.update(f'{site_dir}:{os.stat(site_dir).st_mtime_ns}'.encode())
+        return digest.hexdigest()
+
+    @cached_property
+    def deviations(self):
+        """Returns the required and optional deviations, from the cache file when up to date"""
+        key = self.inputs_key
+        if self.cache_file:
+            try:
+                cached = json.loads(self.cache_file.read_text())
+                if cached.get('key') == key:
+                    return cached['deviations']
+            except (OSError, ValueError):
+                pass
+        deviations = {
+            'required': sorted(set(self.requirements_packages).difference(self.installed_packages)),
+            'optional': sorted(set(self.optional_packages).difference(self.installed_packages)),
+        }
+        if self.cache_file:
+            tmp_file = self.cache_file.with_suffix(f'.{os.getpid()}.tmp')
+            tmp_file.write_text(json.dumps({'key': key, 'deviations': deviations}))
+            tmp_file.replace(self.cache_file)
+        return deviations
+
     @cached_property
     def req_deviation(self):
         """Returns new and updates available packages in requirements file"""
-        return set(self.requirements_packages).difference(self.installed_packages)
+        return set(self.deviations['required'])
 
     @cached_property
     def opt_deviation(self):
         """Returns new and updates available packages in requirements-optional file"""
-        return set(self.optional_packages).difference(self.installed_packages)
+        return set(self.deviations['optional'])
 
     @cached_property
     def packagae_manager(self):
@@ -1,8 +1,10 @@
 """Plugin enables pytest to notify and update the requirements"""
 
+from robottelo.config import robottelo_tmp_dir
+
 from .req_updater import ReqUpdater
 
-updater = ReqUpdater()
+updater = ReqUpdater(cache_file=robottelo_tmp_dir / 'requirements_check.json')
 
 
 def git_deviation_filter(deviation):
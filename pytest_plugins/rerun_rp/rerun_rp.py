@@ -97,7 +97,10 @@ def pytest_collection_modifyitems(items, config):
                 f'Provided reference launch {ref_launch_uuid} was not found or is not finished'
             )
     else:
-        sat_release = get_sat_version().base_version
+        # prefer the configured release, the Satellite may not be reachable during collection
+        sat_release = str(settings.server.version.get('release', ''))
+        if len(sat_release.split('.')) != 3:
+            sat_release = get_sat_version().base_version
         sat_snap = settings.server.version.get('snap', '')
         if not all([sat_release, sat_snap, (len(sat_release.split('.')) == 3)]):
             raise pytest.UsageError(
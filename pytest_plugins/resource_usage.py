@@ -0,0 +1,143 @@
+"""Account the SSH commands, hammer and API calls made by each test.
+
+Enable with ``--resource-usage <path>``. The calls, errors, wall time and bytes sent and received
+of the remote calls of every test phase are measured by ``robottelo.utils.resource_usage``, and
+attached to the junit report of each test as the ``resource_usage`` (JSON, by phase and kind)
+and ``remote_time`` (seconds) properties. With pytest-xdist, each worker sends its data to the
+controller, which merges it.
+
+Two files are written at the end of the session:
+
+* ``<path>.txt``: the usage totals by kind, and the tests ranked by remote time
+* ``<path>.json``: the usage of every test, by phase and kind
+"""
+
+from collections import defaultdict
+import json
+
+import pytest
+
+from pytest_plugins.session_report import SessionReport, add_report_option
+from robottelo.utils import resource_usage
+
+USAGE_KEY = 'resource_usage'
+
+
+def pytest_addoption(parser):
+    """Add the --resource-usage option"""
+    add_report_option(
+        parser,
+        '--resource-usage',
+        help='Account the SSH, hammer and API calls of each test, and write a report of the '
+        'tests ranked by remote time to <path>.txt and the usage of each test to <path>.json',
+    )
+
+
+def pytest_configure(config):
+    ResourceUsageRecorder.register(config, 'resource_usage_recorder')
+
+
+def _total(usage_by_phase):
+    """Return the usage by kind of all the phases of a test"""
+    total = defaultdict(resource_usage.Usage)
+    for usage in usage_by_phase.values():
+        for kind, kind_usage in usage.items():
+            total[kind].add(resource_usage.Usage(**kind_usage))
+    return total
+
+
+class ResourceUsageRecorder(SessionReport):
+    """Records the usage of each test phase and writes the usage reports"""
+
+    option = 'resource_usage'
+    title = 'Resource usage'
+
+    def __init__(self, config):
+        super().__init__(config)
+        # {nodeid: {phase: {kind: usage dict}}}
+        self.tests = {}
+        resource_usage.enabled = True
+        resource_usage.instrument_nailgun()
+
+    def _account(self, item, phase):
+        resource_usage.begin()
+        try:
+            yield
+        finally:
+            usage = resource_usage.end()
+        self.tests.setdefault(item.nodeid, {})[phase] = {
+            kind: kind_usage.as_dict() for kind, kind_usage in usage.items()
+        }
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_setup(self, item):
+        yield from self._account(item, 'setup')
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_call(self, item):
+        yield from self._account(item, 'call')
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_teardown(self, item):
+        yield from self._account(item, 'teardown')
+        # the teardown report, which junitxml writes the properties of, is made after this hook
+        usage_by_phase = self.tests.get(item.nodeid, {})
+        item.user_properties.append((USAGE_KEY, json.dumps(usage_by_phase)))
+        remote_time = resource_usage.remote_seconds(_total(usage_by_phase))
+        item.user_properties.append(('remote_time', f'{remote_time:.3f}'))
+
+    def dump(self):
+        return self.tests
+
+    def merge(self, data):
+        self.tests.update(data)
+
+    def write(self):
+        self.write_report()
+        self.report_file('json').write_text(json.dumps(self.tests, indent=1))
+
+    def pytest_unconfigure(self, config):
+        resource_usage.enabled = False
+
+    def rank(self):
+        """Return the (remote seconds, usage by kind, nodeid) of each test, most expensive first"""
+        ranked = []
+        for nodeid, usage_by_phase in self.tests.items():
+            total = _total(usage_by_phase)
+            ranked.append((resource_usage.remote_seconds(total), total, nodeid))
+        return sorted(ranked, key=lambda row: row[0], reverse=True)
+
+    def write_report(self):
+        ranked = self.rank()
+        totals = defaultdict(resource_usage.Usage)
+        for _, total, _ in ranked:
+            for kind, usage in total.items():
+                totals[kind].add(usage)
+        lines = [
+            f'{"seconds":>10} {"calls":>8} {"errors":>7} {"error%":>7} '
+            f'{"sent KiB":>10} {"recv KiB":>10}  kind'
+        ]
+        for kind in resource_usage.KINDS:
+            usage = totals[kind]
+            error_rate = 100 * usage.errors / usage.calls if usage.calls else 0.0
+            lines.append(
+                f'{usage.seconds:10.2f} {usage.calls:8d} {usage.errors:7d} {error_rate:7.1f} '
+                f'{usage.sent / 1024:10.1f} {usage.received / 1024:10.1f}  {kind}'
+            )
+        lines.append('')
+        lines.append(
+            f'{"remote":>10} {"ssh":>10} {"ssh#":>6} {"hammer":>10} {"hammer#":>7} '
+            f'{"api":>10} {"api#":>6} {"errors":>6} {"sent KiB":>10} {"recv KiB":>10}  test'
+        )
+        for remote, total, nodeid in ranked:
+            ssh, hammer, api = (total[kind] for kind in resource_usage.KINDS)
+            # the hammer calls are SSH commands, their errors are among the ssh ones
+            errors = ssh.errors + api.errors
+            sent = (ssh.sent + api.sent) / 1024
+            received = (ssh.received + api.received) / 1024
+            lines.append(
+                f'{remote:10.2f} {ssh.seconds:10.2f} {ssh.calls:6d} {hammer.seconds:10.2f} '
+                f'{hammer.calls:7d} {api.seconds:10.2f} {api.calls:6d} {errors:6d} '
+                f'{sent:10.1f} {received:10.1f}  {nodeid}'
+            )
+        self.report_file('txt').write_text('\n'.join(lines) + '\n')
@@ -1,17 +1,49 @@
+"""Select a random subset of the collected tests.
+
+``--select-random-tests`` picks a number or percentage of the tests uniformly at random.
+
+``--select-budget`` picks tests until their expected run time fills a wall-clock budget, e.g.
+``--select-budget 45m``. The tests are grouped by their ``component`` marker and picked
+round-robin from the components, so that every component is covered before any of them gets a
+second test. Each component offers its tests by ``importance``, most important first, and in a
+random order within an importance. The expected run time of a test is its historical duration,
+recorded in the ``--test-durations-file`` at the end of the sessions run with
+``--select-budget`` or ``--record-test-durations``; tests without history are expected to take
+the median duration.
+
+Both modes are reproducible with ``--random-seed``.
+"""
+
+from collections import defaultdict
+import contextlib
+import json
 import math
+from pathlib import Path
 import random
+import re
+import statistics
 
+from broker.helpers import FileLock
 from fauxfactory import gen_string
 import pytest
 
+from robottelo.config import robottelo_tmp_dir
 from robottelo.logging import logger
 
+IMPORTANCE_ORDER = ('critical', 'high', 'medium', 'low')
+# expected duration of a test when there is no history at all
+DEFAULT_DURATION = 60.0
+# weight of the latest duration in the recorded moving average
+DURATION_WEIGHT = 0.5
+BUDGET_UNITS = {'h': 3600, 'm': 60, 's': 1}
+
 
 def pytest_addoption(parser):
     """Add --select-random-tests option to select and run N random tests from the selected test collection.
     Examples:
         pytest tests/foreman/ --select-random-tests 4 --random-seed fksdjn
         pytest tests/foreman/ --select-random-tests '5%'
+        pytest tests/foreman/ --select-budget 1h30m
     """
     parser.addoption(
         '--select-random-tests',
@@ -21,6 +53,25 @@ def pytest_addoption(parser):
         'To re-run same collection later, provide seed value using --random-seed. '
         'OR check robottelo.log to get the seed value that was generated randomly.',
     )
+    parser.addoption(
+        '--select-budget',
+        action='store',
+        default=None,
+        help='Randomly select tests of every component, most important first, until their '
+        'historical durations fill the given budget, e.g. 45m, 2h or 1h30m.',
+    )
+    parser.addoption(
+        '--record-test-durations',
+        action='store_true',
+        default=False,
+        help='Record the test durations in --test-durations-file, as --select-budget does.',
+    )
+    parser.addoption(
+        '--test-durations-file',
+        action='store',
+        default=str(robottelo_tmp_dir / 'test_durations.json'),
+        help='File to record test durations in, used by --select-budget.',
+    )
     parser.addoption(
         '--random-seed',
         action='store',
@@ -37,14 +88,144 @@ def pytest_configure(config):
     ]
     for marker in markers:
         config.addinivalue_line('markers', marker)
+    # only the xdist controller (or the single process) records the durations
+    recording = config.getoption('select_budget') or config.getoption('record_test_durations')
+    if recording and not hasattr(config, 'workerinput'):
+        config.pluginmanager.register(
+            DurationRecorder(config.getoption('test_durations_file')), 'duration_recorder'
+        )
+
+
+def parse_budget(budget):
+    """Return the number of seconds of a budget like 45m, 2h, 1h30m or 300 (seconds)"""
+    budget = budget.strip().lower()
+    if re.fullmatch(r'\d+(\.\d+)?', budget):
+        return float(budget)
+    parts = re.findall(r'(\d+(?:\.\d+)?)([hms])', budget)
+    if not parts or ''.join(f'{value}{unit}' for value, unit in parts) != budget:
+        raise pytest.UsageError(f'Invalid --select-budget value: {budget}')
+    return sum(float(value) * BUDGET_UNITS[unit] for value, unit in parts)
+
+
+class DurationStore:
+    """Historical test durations by node id, shared by the sessions using the same file"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+
+    def load(self):
+        with contextlib.suppress(OSError, ValueError):
+            return json.loads(self.path.read_text())
+        return {}
+
+    def update(self, durations):
+        """Merge the durations of a session into the moving averages of the store"""
+        if not durations:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with FileLock(self.path, timeout=120):
+            stored = self.load()
+            for nodeid, duration in durations.items():
+                previous = stored.get(nodeid, duration)
+                stored[nodeid] = round(
+                    DURATION_WEIGHT * duration + (1 - DURATION_WEIGHT) * previous, 3
+                )
+            tmp_file = self.path.with_suffix('.tmp')
+            tmp_file.write_text(json.dumps(stored))
+            tmp_file.replace(self.path)
+        logger.debug(f'Recorded the durations of {len(durations)} tests to {self.path}')
+
+
+class DurationRecorder:
+    """Records the setup, call and teardown time of the tests that ran"""
+
+    def __init__(self, path):
+        self.store = DurationStore(path)
+        self.durations = defaultdict(float)
+        self.skipped = set()
+
+    def pytest_runtest_logreport(self, report):
+        if report.skipped:
+            self.skipped.add(report.nodeid)
+        self.durations[report.nodeid] += report.duration
+
+    def pytest_sessionfinish(self):
+        self.store.update(
+            {
+                nodeid: duration
+                for nodeid, duration in self.durations.items()
+                if nodeid not in self.skipped
+            }
+        )
+
+
+def _importance_rank(item):
+    importance = item.get_closest_marker('importance')
+    importance = importance.args[0].lower() if importance else None
+    return IMPORTANCE_ORDER.index(importance) if importance in IMPORTANCE_ORDER else 99
+
+
+def select_by_budget(items, budget, durations, seed):
+    """Select tests from every component until the budget is filled
+
+    The components are visited round-robin, those with the most important tests first. Each
+    component offers its tests most important first, in a random order within an importance,
+    and a test that does not fit the remaining budget is skipped.
+
+    :param list items: The collected items
+    :param float budget: The budget in seconds
+    :param dict durations: The historical durations by node id
+    :param seed: The random seed
+    :return: The selected items, in collection order
+    """
+    default = statistics.median(durations.values()) if durations else DEFAULT_DURATION
+    rng = random.Random(seed)
+    components = defaultdict(list)
+    for item in items:
+        component = item.get_closest_marker('component')
+        components[component.args[0] if component else ''].append(item)
+    queues = []
+    for tests in components.values():
+        rng.shuffle(tests)
+        # sorted is stable, so the tests of an importance remain shuffled; popped from the end
+        queues.append(sorted(tests, key=_importance_rank, reverse=True))
+    queues.sort(key=lambda queue: _importance_rank(queue[-1]))
+    selected = set()
+    remaining = budget
+    while queues:
+        next_queues = []
+        for queue in queues:
+            while queue:
+                item = queue.pop()
+                duration = durations.get(item.nodeid, default)
+                if duration <= remaining:
+                    selected.add(item.nodeid)
+                    remaining -= duration
+                    break
+            if queue:
+                next_queues.append(queue)
+        queues = next_queues
+    logger.info(
+        f'Selected {len(selected)} tests of {len(items)} for an expected duration of '
+        f'{budget - remaining:.0f}s within a budget of {budget:.0f}s'
+    )
+    return [item for item in items if item.nodeid in selected]
 
 
 @pytest.hookimpl(trylast=True)
 def pytest_collection_modifyitems(items, config):
     """Modify test collection to select and run N random tests from the selected test collection."""
     select_random_tests = config.getoption('select_random_tests')
+    select_budget = config.getoption('select_budget')
     random_seed = config.getoption('random_seed')
-    if select_random_tests:
+    if select_budget:
+        durations = DurationStore(config.getoption('test_durations_file')).load()
+        logger.info(
+            'Modifying test collection based on --select-budget pytest option. '
+            f'Tests collected: {len(items)}, Budget: {select_budget}, Seed value: {random_seed}'
+        )
+        selected = select_by_budget(items, parse_budget(select_budget), durations, random_seed)
+    elif select_random_tests:
         select_random_tests = (
             math.ceil(len(items) * float(select_random_tests.split('%')[0]) / 100)
             if '%' in select_random_tests
@@ -63,7 +244,10 @@ def pytest_collection_modifyitems(items, config):
             'Modifying test collection based on --select-random-tests pytest option. '
             f'Tests collected: {len(items)}, Tests to select randomly: {select_random_tests}, Seed value: {random_seed}'
         )
-        deselected = [item for item in items if item not in selected]
-        # selected will be empty if no filter option was passed, defaulting to full items list
-        items[:] = selected if deselected else items
-        config.hook.pytest_deselected(items=deselected)
+    else:
+        return
+    selected_ids = {id(item) for item in selected}
+    deselected = [item for item in items if id(item) not in selected_ids]
+    # selected will be empty if no filter option was passed, defaulting to full items list
+    items[:] = selected if deselected else items
+    config.hook.pytest_deselected(items=deselected)
@@ -0,0 +1,72 @@
+"""Scaffolding of the plugins writing reports of a whole session, as ``--fixture-profile``.
+
+Such a plugin adds a ``--<option> <path>`` option with ``add_report_option``, and registers its
+``SessionReport`` subclass with ``SessionReport.register`` when the option is given. With
+pytest-xdist, each worker sends the data it collected to the controller at the end of the session,
+and the controller merges it and writes the report files, ``<path>.<suffix>``.
+"""
+
+from abc import ABC, abstractmethod
+import json
+from pathlib import Path
+
+import pytest
+
+from robottelo.logging import logger
+
+
+def add_report_option(parser, option, help):
+    """Add a ``--<option> <path>`` option, enabling a session report written to <path>.*"""
+    parser.addoption(option, action='store', default=None, help=help)
+
+
+class SessionReport(ABC):
+    """Collects data in every process, and writes the reports of the session from the controller
+
+    Subclasses set ``option``, the dest of their path option, and the ``title`` and ``suffixes``
+    of their reports, and implement ``dump``, ``merge`` and ``write``.
+    """
+
+    option = None
+    title = 'Report'
+    suffixes = ('txt', 'json')
+
+    def __init__(self, config):
+        self.config = config
+        self.path = Path(config.getoption(self.option))
+
+    @classmethod
+    def register(cls, config, name):
+        """Register the report plugin under name, if its option is given"""
+        if config.getoption(cls.option):
+            config.pluginmanager.register(cls(config), name)
+
+    def report_file(self, suffix):
+        return Path(f'{self.path}.{suffix}')
+
+    @abstractmethod
+    def dump(self):
+        """Return the data collected by this process, JSON serializable"""
+
+    @abstractmethod
+    def merge(self, data):
+        """Merge the data dumped by an xdist worker"""
+
+    @abstractmethod
+    def write(self):
+        """Write the report files"""
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node, error):
+        """Merge the data sent by an xdist worker"""
+        if data := getattr(node, 'workeroutput', {}).get(self.option):
+            self.merge(json.loads(data))
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_sessionfinish(self, session):
+        if (workeroutput := getattr(self.config, 'workeroutput', None)) is not None:
+            workeroutput[self.option] = json.dumps(self.dump())
+            return
+        self.write()
+        report_files = ' and '.join(str(self.report_file(suffix)) for suffix in self.suffixes)
+        logger.info(f'{self.title} written to {report_files}')
@@ -12,9 +12,6 @@ Configuration:
 
 import re
 
-from github import Auth, Github
-from github.GithubException import GithubException
-
 from robottelo.config import settings
 from robottelo.logging import collection_logger as logger
 
@@ -112,6 +109,9 @@ def pytest_collection_modifyitems(session, items, config):
     upstream_prs = [pr_info.strip() for pr_info in upstream_pr_option.split(',') if pr_info.strip()]
     if not upstream_prs:
         return
+    # PyGithub is slow to import, only load it when the option is used
+    from github import Auth, Github
+    from github.GithubException import GithubException
 
     components = set()
     gh_settings = settings.github_repos
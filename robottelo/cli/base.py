@@ -6,9 +6,10 @@ from wait_for import wait_for
 
 from robottelo import ssh
 from robottelo.cli import hammer
-from robottelo.config import settings
+from robottelo.config import hot_settings, settings
 from robottelo.exceptions import CLIDataBaseError, CLIError, CLIReturnCodeError
 from robottelo.logging import logger
+from robottelo.utils import resource_usage
 from robottelo.utils.ssh import get_client
 
 
@@ -165,10 +166,11 @@ class Base:
         :rtype: tuple
 
         """
+        server = hot_settings(settings).server
         if username is None:
-            username = getattr(cls, 'foreman_admin_username', settings.server.admin_username)
+            username = getattr(cls, 'foreman_admin_username', server.admin_username)
         if password is None:
-            password = getattr(cls, 'foreman_admin_password', settings.server.admin_password)
+            password = getattr(cls, 'foreman_admin_password', server.admin_password)
 
         return (username, password)
 
@@ -189,23 +191,26 @@ class Base:
             user, password = None, None
         else:
             user, password = cls._get_username_password(user, password)
-        time_hammer = settings.performance.time_hammer
+        hot = hot_settings(settings)
+        time_hammer = hot.performance.time_hammer
 
         # add time to measure hammer performance
         cmd = 'LANG={} {} hammer -v {} {} {} {}'.format(
-            settings.robottelo.locale,
+            hot.robottelo.locale,
             'time -p' if time_hammer else '',
             f'-u {user}' if user else "--interactive no",
             f'-p {password}' if password else "",
             f'--output={output_format}' if output_format else "",
             command,
         )
-        response = ssh.command(
-            cmd,
-            hostname=hostname or cls.hostname or settings.server.hostname,
-            output_format=output_format,
-            timeout=timeout,
-        )
+        with resource_usage.measure('hammer') as call:
+            response = ssh.command(
+                cmd,
+                hostname=hostname or cls.hostname or hot.server.hostname,
+                output_format=output_format,
+                timeout=timeout,
+            )
+            call.finish(error=response.status != 0)
         if return_raw_response:
             return response
         return cls._handle_response(response, ignore_stderr=ignore_stderr)
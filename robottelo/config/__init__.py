@@ -1,29 +1,130 @@
 import builtins
+from dataclasses import dataclass
 import logging
 import os
 from pathlib import Path
+import sys
 from urllib.parse import urlunsplit
 
 from dynaconf import LazySettings
 from dynaconf.validator import ValidationError
 from nailgun.config import ServerConfig
 
+from robottelo.config import settings_cache
 from robottelo.config.validators import VALIDATORS
 from robottelo.logging import logger, robottelo_root_dir
+from robottelo.utils.url import is_url
 
 if not os.getenv('ROBOTTELO_DIR'):
     # dynaconf robottelo file uses ROBOTELLO_DIR for screenshots
     os.environ['ROBOTTELO_DIR'] = str(robottelo_root_dir)
 
 
+class RobotteloSettings(LazySettings):
+    """The robottelo settings, with a snapshot of the settings read on hot paths"""
+
+    def set(self, *args, **kwargs):
+        # any changed setting can be part of the snapshot, see ``hot_settings``
+        self.__dict__.pop('_hot_snapshot', None)
+        return super().__getattr__('set')(*args, **kwargs)
+
+
+@dataclass(frozen=True, slots=True)
+class ServerSnapshot:
+    hostname: str | None
+    admin_username: str | None
+    admin_password: str | None
+    ssh_username: str | None
+    ssh_password: str | None
+    ssh_port: int | None
+    network_type: str | None
+
+
+@dataclass(frozen=True, slots=True)
+class PerformanceSnapshot:
+    time_hammer: bool
+
+
+@dataclass(frozen=True, slots=True)
+class RobotteloSnapshot:
+    locale: str | None
+
+
+@dataclass(frozen=True, slots=True)
+class ContentHostSnapshot:
+    network_type: str | None
+
+
+@dataclass(frozen=True, slots=True)
+class SettingsSnapshot:
+    server: ServerSnapshot
+    performance: PerformanceSnapshot
+    robottelo: RobotteloSnapshot
+    content_host: ContentHostSnapshot
+
+
+def _build_snapshot(settings_obj):
+    server = settings_obj.server
+    ssh_client = getattr(server, 'ssh_client', None)
+    return SettingsSnapshot(
+        server=ServerSnapshot(
+            hostname=getattr(server, 'hostname', None),
+            admin_username=getattr(server, 'admin_username', None),
+            admin_password=getattr(server, 'admin_password', None),
+            ssh_username=getattr(server, 'ssh_username', None),
+            ssh_password=getattr(server, 'ssh_password', None),
+            ssh_port=getattr(ssh_client, 'port', None),
+            network_type=getattr(server, 'network_type', None),
+        ),
+        performance=PerformanceSnapshot(
+            time_hammer=getattr(settings_obj.performance, 'time_hammer', False)
+        ),
+        robottelo=RobotteloSnapshot(locale=getattr(settings_obj.robottelo, 'locale', None)),
+        content_host=ContentHostSnapshot(
+            network_type=getattr(settings_obj.content_host, 'network_type', None)
+        ),
+    )
+
+
+def hot_settings(settings_obj=None):
+    """Return a frozen snapshot of the settings read on every CLI command and ssh connection
+
+    Reading a setting through dynaconf costs a chain of ``__getattr__`` calls, the snapshot is
+    built once and rebuilt only after ``settings.set(...)``. Settings must not be changed by
+    assigning their attributes, that would leave the snapshot stale.
+
+    :param settings_obj: The settings to snapshot, ``robottelo.config.settings`` by default
+    """
+    settings_obj = settings if settings_obj is None else settings_obj
+    if not isinstance(settings_obj, RobotteloSettings):
+        # e.g. mocked settings, which are changed by assigning their attributes
+        return _build_snapshot(settings_obj)
+    if (snapshot := settings_obj.__dict__.get('_hot_snapshot')) is None:
+        snapshot = _build_snapshot(settings_obj)
+        settings_obj.__dict__['_hot_snapshot'] = snapshot
+    return snapshot
+
+
 def get_settings():
     """Return Lazy settings object after validating
 
+    The merged and validated settings are cached, see ``robottelo.config.settings_cache``.
+
     :return: A validated Lazy settings object
     """
     if getattr(builtins, "__sphinx_build__", False):
         return None
-    settings = LazySettings(
+    run_id = os.environ.get('PYTEST_XDIST_TESTRUNUID')
+    # settings fetching fresh data from Ohsnap are only shared by the workers of a run
+    for key in (settings_cache.inputs_key(), run_id and settings_cache.inputs_key(run_id)):
+        if key and (data := settings_cache.load(key)) is not None:
+            settings = RobotteloSettings(
+                core_loaders=[], loaders=[], envless_mode=True, lowercase_read=True
+            )
+            settings.update(data, tomlfy=False, validate=False)
+            settings.validators.register(**VALIDATORS)
+            return settings
+    settings = RobotteloSettings(
         envvar_prefix="ROBOTTELO",
         core_loaders=["YAML"],
         root_path=str(robottelo_root_dir),
@@ -42,6 +143,16 @@ def get_settings():
             logger.warning(f'Dynaconf validation failed with\n{err}')
         else:
             raise err
+    # see conf/dynaconf_hooks.py
+    fresh = (
+        settings.robottelo.settings.get('get_fresh', True)
+        and settings.server.version.source != 'nightly'
+        and is_url(settings.ohsnap.get('host'))
+    )
+    if not fresh:
+        settings_cache.save(settings, settings_cache.inputs_key())
+    elif run_id:
+        settings_cache.save(settings, settings_cache.inputs_key(run_id))
     return settings
 
 
@@ -133,6 +244,26 @@ def setting_is_set(option):
     return isinstance(opt_inst, DynaBox)
 
 
+def patch_nailgun_entities(entities):
+    """Set a default value for ``nailgun.entities.GPGKey.content``.
+
+    :param entities: The imported ``nailgun.entities`` module
+    """
+    if getattr(entities, '_robottelo_patched', False):
+        return
+    gpgkey_init = entities.GPGKey.__init__
+
+    def patched_gpgkey_init(self, server_config=None, **kwargs):
+        """Set a default value on the ``content`` field."""
+        gpgkey_init(self, server_config, **kwargs)
+        self._fields['content'].default = str(
+            Path().joinpath('tests/foreman/data/valid_gpg_key.txt')
+        )
+
+    entities.GPGKey.__init__ = patched_gpgkey_init
+    entities._robottelo_patched = True
+
+
 def configure_nailgun():
     """Configure NailGun's entity classes.
 
@@ -145,32 +276,29 @@ def configure_nailgun():
         returned by :meth:`robottelo.helpers.get_nailgun_config`. See
         ``robottelo.entity_mixins.Entity`` for more information on the effects
         of this.
-    * Set a default value for ``nailgun.entities.GPGKey.content``.
+    * Set a default value for ``nailgun.entities.GPGKey.content``, if ``nailgun.entities`` is
+        already imported. It is slow to import, so ``Satellite.api`` patches it on first use.
     """
-    from nailgun import entities, entity_mixins
+    from nailgun import entity_mixins
     from nailgun.config import ServerConfig
 
     entity_mixins.CREATE_MISSING = True
     entity_mixins.DEFAULT_SERVER_CONFIG = ServerConfig(
         get_url(), get_credentials(), verify=settings.server.verify_ca
     )
-    gpgkey_init = entities.GPGKey.__init__
-
-    def patched_gpgkey_init(self, server_config=None, **kwargs):
-        """Set a default value on the ``content`` field."""
-        gpgkey_init(self, server_config, **kwargs)
-        self._fields['content'].default = str(
-            Path().joinpath('tests/foreman/data/valid_gpg_key.txt')
-        )
-
-    entities.GPGKey.__init__ = patched_gpgkey_init
+    if (entities := sys.modules.get('nailgun.entities')) is not None:
+        patch_nailgun_entities(entities)
 
 
 configure_nailgun()
 
 
 def configure_airgun():
-    """Pass required settings to AirGun"""
+    """Pass required settings to AirGun
+
+    AirGun pulls in selenium and widgetastic, so it is not configured when robottelo.config is
+    imported, but by ``Satellite.ui_session`` and the fixtures aligning to a Satellite.
+    """
     import airgun
 
     airgun.settings.configure(
@@ -193,6 +321,3 @@ def configure_airgun():
             'webkaifuku': {'config': settings.ui.webkaifuku},
         }
     )
-
-
-configure_airgun()
@@ -0,0 +1,171 @@
+"""A cache of the merged and validated settings, shared by the processes using the same inputs.
+
+Loading ``conf/*.yaml``, the secrets and running every validator takes seconds, and is done by
+every process: each xdist worker and each script. The merged result is stored in a per-user
+temporary directory, keyed by the content and mtime of every input file and by the
+``ROBOTTELO_*`` environment variables, so that a warm start only loads the stored result.
+Any change of an input leads to a new key, and to a full load.
+
+Values formatted lazily by dynaconf (``@jinja``, ``@format``) are stored unevaluated, so they
+still follow the values they refer to.
+
+When the settings fetch fresh repository URLs from Ohsnap (``robottelo.settings.get_fresh``),
+the stored result is only shared by the workers of the same xdist run.
+
+When the Vault loader of dynaconf is enabled, the settings are not cached at all: the merged
+result holds the secrets read from Vault, which are not to be stored in plain text, nor served
+after they were rotated or revoked.
+"""
+
+import contextlib
+import hashlib
+from importlib.metadata import version
+import os
+from pathlib import Path
+import pickle
+import stat
+import tempfile
+import time
+
+from dynaconf.utils.boxing import DynaBox
+from dynaconf.vendor.box import BoxList
+from dynaconf.vendor.dotenv import dotenv_values
+
+from robottelo.logging import logger as _root_logger, robottelo_root_dir
+
+logger = _root_logger.getChild('settings_cache')
+
+CACHE_VERSION = 1
+# cache files unused for longer than this many seconds are removed
+CACHE_MAX_AGE = 7 * 86400
+# files read while loading the settings, relative to the robottelo root dir
+INPUT_PATTERNS = (
+    'settings.yaml',
+    'settings.local.yaml',
+    '.secrets.yaml',
+    '.secrets_*.yaml',
+    '.env',
+    'conf/*.yaml',
+    'conf/dynaconf_hooks.py',
+    'conf/migrations.py',
+    'robottelo/config/validators.py',
+)
+# files read by conf/dynaconf_hooks.py, relative to the current directory
+CWD_INPUT_PATTERNS = ('settings_cache-*.json', '.env')
+# environment variables changing how dynaconf loads the settings, besides the ROBOTTELO_ ones
+DYNACONF_ENV_SUFFIX = '_FOR_DYNACONF'
+VAULT_ENABLED_VAR = f'VAULT_ENABLED{DYNACONF_ENV_SUFFIX}'
+FALSE_VALUES = ('', '0', 'false', 'no', 'off', '@bool false')
+
+
+def _input_files():
+    files = set()
+    for base, patterns in ((robottelo_root_dir, INPUT_PATTERNS), (Path.cwd(), CWD_INPUT_PATTERNS)):
+        for pattern in patterns:
+            files.update(path.resolve() for path in Path(base).glob(pattern) if path.is_file())
+    return sorted(files)
+
+
+def inputs_key(run_id=None):
+    """Return a key identifying every input of the settings
+
+    :param run_id: The xdist run id, for settings that are not to be shared between runs
+    """
+    digest = hashlib.sha256()
+    digest.update(f'{CACHE_VERSION}:{version("dynaconf")}:{robottelo_root_dir}:{run_id}'.encode())
+    for path in _input_files():
+        stats = path.stat()
+        digest.update(f'{path}:{stats.st_mtime_ns}:{stats.st_size}:'.encode())
+        digest.update(hashlib.sha256(path.read_bytes()).digest())
+    for name in sorted(os.environ):
+        if name.startswith('ROBOTTELO_') or name.endswith(DYNACONF_ENV_SUFFIX):
+            digest.update(f'{name}={os.environ[name]}'.encode())
+    return digest.hexdigest()
+
+
+def vault_enabled(settings=None):
+    """Whether the environment, a .env file or the given settings enable the Vault loader"""
+    values = [os.environ.get(VAULT_ENABLED_VAR)]
+    for env_file in (robottelo_root_dir / '.env', Path.cwd() / '.env'):
+        if env_file.is_file():
+            values.append(dotenv_values(env_file).get(VAULT_ENABLED_VAR))
+    if settings is not None:
+        values.append(settings.get(VAULT_ENABLED_VAR))
+    return any(
+        value is not None and str(value).strip().lower() not in FALSE_VALUES for value in values
+    )
+
+
+def _cache_dir():
+    """Return the private cache directory of the current user, None if it is not safe to use"""
+    cache_dir = Path(tempfile.gettempdir()) / f'robottelo-settings-{os.getuid()}'
+    cache_dir.mkdir(mode=0o700, exist_ok=True)
+    stats = cache_dir.lstat()
+    if (
+        not stat.S_ISDIR(stats.st_mode)
+        or stats.st_uid != os.getuid()
+        or stats.st_mode & (stat.S_IRWXG | stat.S_IRWXO)
+    ):
+        logger.warning(f'Not caching the settings in {cache_dir}, it is accessible to others')
+        return None
+    return cache_dir
+
+
+def _raw(value):
+    """Return the stored value of a setting as plain data, with lazy values unevaluated"""
+    if isinstance(value, DynaBox | dict):
+        return {key: _raw(item) for key, item in dict.items(value)}
+    if isinstance(value, BoxList | list | tuple):
+        return [_raw(item) for item in list.__iter__(value)] if isinstance(value, list) else value
+    if getattr(value, '_dynaconf_lazy_format', False):
+        if value.casting is not None:
+            raise TypeError(f'Can not cache the lazy value with casting {value!r}')
+        return value._dynaconf_encode()
+    return value
+
+
+def load(key):
+    """Return the cached settings data of a key, None if there is none"""
+    if vault_enabled():
+        logger.debug('Not loading cached settings, the Vault loader is enabled')
+        return None
+    if (cache_dir := _cache_dir()) is None:
+        return None
+    try:
+        data = pickle.loads((cache_dir / f'{key}.pickle').read_bytes())
+    except FileNotFoundError:
+        return None
+    except Exception as err:
+        # any broken cache file is rebuilt
+        logger.warning(f'Ignoring the broken settings cache {key}: {err}')
+        return None
+    logger.debug(f'Loaded the settings from the cache {key}')
+    # keep the cache file of the inputs in use
+    with contextlib.suppress(OSError):
+        os.utime(cache_dir / f'{key}.pickle')
+    return data
+
+
+def save(settings, key):
+    """Store the merged and validated settings under a key"""
+    if vault_enabled(settings):
+        logger.debug('Not caching the settings, they hold secrets read from Vault')
+        return
+    if (cache_dir := _cache_dir()) is None:
+        return
+    try:
+        data = pickle.dumps(_raw(settings._wrapped._store))
+    except (TypeError, pickle.PicklingError, AttributeError) as err:
+        logger.debug(f'Not caching the settings: {err}')
+        return
+    cache_file = cache_dir / f'{key}.pickle'
+    tmp_file = cache_file.with_suffix(f'.{os.getpid()}.tmp')
+    tmp_file.write_bytes(data)
+    tmp_file.replace(cache_file)
+    logger.debug(f'Cached the settings as {key}')
+    # forget the settings of inputs that are long gone
+    expired = time.time() - CACHE_MAX_AGE
+    for old_file in cache_dir.glob('*.pickle'):
+        with contextlib.suppress(OSError):
+            if old_file.stat().st_mtime < expired:
+                old_file.unlink()
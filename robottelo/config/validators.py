@@ -41,6 +41,11 @@ VALIDATORS = dict(
         Validator('server.ssh_username', default='root'),
         Validator('server.ssh_password', default=None),
         Validator('server.verify_ca', default=False),
+        Validator('server.api_session.enabled', default=True, is_type_of=bool),
+        Validator('server.api_session.pool_size', default=10, is_type_of=int, gte=1),
+        Validator('server.api_session.retries', default=3, is_type_of=int, gte=0),
+        Validator('server.api_session.backoff_factor', default=0.5, is_type_of=int | float),
+        Validator('server.api_session.retry_statuses', default=[502, 503, 504], is_type_of=list),
         Validator(
             'server.network_type',
             cast=NetworkType,
@@ -55,6 +60,13 @@ VALIDATORS = dict(
             cast=NetworkType,
             default=NetworkType.IPV4.value,
         ),
+        Validator('content_host.reuse_containers', is_type_of=bool, default=False),
+        Validator('content_host.reuse_max_uses', is_type_of=int, gte=1, default=10),
+    ],
+    manifest=[
+        Validator('manifest.cache.enabled', is_type_of=bool, default=False),
+        Validator('manifest.cache.size', is_type_of=int, gte=0, default=2),
+        Validator('manifest.cache.max_age', is_type_of=int, gt=0, default=86400),
     ],
     subscription=[
         Validator('subscription.rhn_username', must_exist=True),
@@ -264,8 +276,10 @@ VALIDATORS = dict(
         Validator('jira.comment_visibility', default="Red Hat Employee"),
         Validator('jira.enable_comment', default=False),
         Validator('jira.issue_status', default=["Testing", "Release Pending"]),
-        Validator('jira.cache_file', default='jira_status_cache.json'),
+        Validator('jira.cache_file', default='jira_status_cache.db'),
         Validator('jira.cache_ttl_days', default=7, is_type_of=int),
+        Validator('jira.cache_flush_interval', default=30, is_type_of=int, gte=0),
+        Validator('jira.max_workers', default=4, is_type_of=int, gte=1),
     ],
     ldap=[
         Validator(
@@ -344,6 +358,7 @@ VALIDATORS = dict(
             must_exist=True,
         ),
         Validator('report_portal.fail_threshold', default=20),
+        Validator('report_portal.max_workers', default=8, is_type_of=int, gte=1),
     ],
     rh_cloud=[
         Validator('rh_cloud.token', required=True),
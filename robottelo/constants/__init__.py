@@ -1,9 +1,9 @@
 """Defines various constants"""
 
+from importlib import import_module
 from pathlib import Path
 
 from box import Box
-from nailgun import entities
 
 # This should be updated after each version branch
 SATELLITE_VERSION = "6.20"
@@ -174,8 +174,6 @@ AZURERM_FILE_URI = (
     'https://raw.githubusercontent.com/SatelliteQE/robottelo/master/tests/foreman/data/uri.sh'
 )
 
-OPERATING_SYSTEMS = entities._OPERATING_SYSTEMS
-
 TEMPLATE_TYPES = [
     'finish',
     'iPXE',
@@ -291,53 +289,6 @@ PRDS = {
     'rhel_els': 'Red Hat Enterprise Linux Server - Extended Life Cycle Support',
 }
 
-REPOSET = {
-    'rhct6': 'Red Hat CloudForms Tools for RHEL 6 (RPMs)',
-    'rhel6': 'Red Hat Enterprise Linux 6 Server (RPMs)',
-    'rhel7': 'Red Hat Enterprise Linux 7 Server (RPMs)',
-    'rhel7_els': 'Red Hat Enterprise Linux 7 Server - Extended Life Cycle Support (RPMs)',
-    'rhva6': ('Red Hat Enterprise Virtualization Agents for RHEL 6 Server (RPMs)'),
-    'rhs7': 'Red Hat Satellite 6.11 (for RHEL 7 Server) (RPMs)',
-    'rhs8': 'Red Hat Satellite 6.13 for RHEL 8 x86_64 (RPMs)',
-    'rhs9': 'Red Hat Satellite 6.16 for RHEL 9 x86_64 (RPMs)',
-    'rhsc8': 'Red Hat Satellite Capsule 6.16 for RHEL 8 x86_64 (RPMs)',
-    'rhsc9': 'Red Hat Satellite Capsule 6.16 for RHEL 9 x86_64 (RPMs)',
-    'rhsc7_iso': 'Red Hat Satellite Capsule 6.4 (for RHEL 7 Server) (ISOs)',
-    'rhsclient7': 'Red Hat Satellite Client 6 (for RHEL 7 Server) (RPMs)',
-    'rhsclient8': 'Red Hat Satellite Client 6 for RHEL 8 x86_64 (RPMs)',
-    'rhsclient9': 'Red Hat Satellite Client 6 for RHEL 9 x86_64 (RPMs)',
-    'rhsclient10': 'Red Hat Satellite Client 6 for RHEL 10 x86_64 (RPMs)',
-    'rhst7': 'Red Hat Satellite Tools 6.9 (for RHEL 7 Server) (RPMs)',
-    'rhst7_610': 'Red Hat Satellite Tools 6.10 (for RHEL 7 Server) (RPMs)',
-    'rhst6': 'Red Hat Satellite Tools 6.9 (for RHEL 6 Server) (RPMs)',
-    'rhaht': 'Red Hat Enterprise Linux Atomic Host (RPMs)',
-    'rhdt7': ('Red Hat Developer Tools RPMs for Red Hat Enterprise Linux 7 Server'),
-    'rhscl7': ('Red Hat Software Collections RPMs for Red Hat Enterprise Linux 7 Server'),
-    'rhae2': 'Red Hat Ansible Engine 2.9 RPMs for Red Hat Enterprise Linux 7 Server',
-    'rhae2.9_el8': 'Red Hat Ansible Engine 2.9 for RHEL 8 x86_64 (RPMs)',
-    'rhst8': 'Red Hat Satellite Tools 6.9 for RHEL 8 x86_64 (RPMs)',
-    'fdrh8': 'Fast Datapath for RHEL 8 x86_64 (RPMs)',
-    'kickstart': {
-        'rhel6': 'Red Hat Enterprise Linux 6 Server (Kickstart)',
-        'rhel7': 'Red Hat Enterprise Linux 7 Server (Kickstart)',
-        'rhel8_bos': 'Red Hat Enterprise Linux 8 for x86_64 - BaseOS (Kickstart)',
-        'rhel8_aps': 'Red Hat Enterprise Linux 8 for x86_64 - AppStream (Kickstart)',
-        'rhel9_bos': 'Red Hat Enterprise Linux 9 for x86_64 - BaseOS (Kickstart)',
-        'rhel9_aps': 'Red Hat Enterprise Linux 9 for x86_64 - AppStream (Kickstart)',
-        'rhel10_bos': 'Red Hat Enterprise Linux 10 for x86_64 - BaseOS (Kickstart)',
-        'rhel10_aps': 'Red Hat Enterprise Linux 10 for x86_64 - AppStream (Kickstart)',
-    },
-    'rhel8_bos': 'Red Hat Enterprise Linux 8 for x86_64 - BaseOS (RPMs)',
-    'rhel8_aps': 'Red Hat Enterprise Linux 8 for x86_64 - AppStream (RPMs)',
-    'rhel9_bos': 'Red Hat Enterprise Linux 9 for x86_64 - BaseOS (RPMs)',
-    'rhel9_aps': 'Red Hat Enterprise Linux 9 for x86_64 - AppStream (RPMs)',
-    'rhel10_bos': 'Red Hat Enterprise Linux 10 for x86_64 - BaseOS (RPMs)',
-    'rhel10_aps': 'Red Hat Enterprise Linux 10 for x86_64 - AppStream (RPMs)',
-    'rhel7_extra': 'Red Hat Enterprise Linux 7 Server - Extras (RPMs)',
-    'rhel7_optional': 'Red Hat Enterprise Linux 7 Server - Optional (RPMs)',
-    'rhel7_sup': 'Red Hat Enterprise Linux 7 Server - Supplementary (RPMs)',
-}
-
 RECOMMENDED_REPOS = [
     'rhel-10-for-x86_64-baseos-rpms',
     'rhel-10-for-x86_64-appstream-rpms',
@@ -372,419 +323,12 @@ VERSIONED_REPOS = [
     'satellite-utils-{}-for-rhel-9-x86_64-rpms',
 ]
 
-REPOS = {
-    'rhel7': {
-        'id': 'rhel-7-server-rpms',
-        'name': 'Red Hat Enterprise Linux 7 Server RPMs x86_64 7Server',
-        'releasever': '7Server',
-        'arch': 'x86_64',
-        'distro': 'rhel7',
-        'reposet': REPOSET['rhel7'],
-        'product': PRDS['rhel'],
-        'major_version': 7,
-        'distro_repository': True,
-        'key': 'rhel',
-        'version': '7.9',
-        'basearch': 'x86_64',
-    },
-    'rhel7_els': {
-        'id': 'rhel-7-server-els-rpms',
-        'name': 'Red Hat Enterprise Linux 7 Server - Extended Life Cycle Support RPMs x86_64',
-        'releasever': '7Server',
-        'arch': 'x86_64',
-        'distro': 'rhel7',
-        'reposet': REPOSET['rhel7_els'],
-        'product': PRDS['rhel_els'],
-        'major_version': 7,
-        'distro_repository': True,
-        'key': 'rhel',
-        'version': '7.9',
-        'basearch': 'x86_64',
-    },
-    'rhel6': {
-        'id': 'rhel-6-server-rpms',
-        'name': 'Red Hat Enterprise Linux 6 Server RPMs x86_64 6Server',
-        'releasever': '6Server',
-        'arch': 'x86_64',
-        'distro': 'rhel6',
-        'reposet': REPOSET['rhel6'],
-        'product': PRDS['rhel'],
-        'major_version': 6,
-        'distro_repository': True,
-        'key': 'rhel',
-        'version': '6.8',
-    },
-    'rhs9': {
-        'id': 'satellite-6.16-for-rhel-9-x86_64-rpms',
-        'name': ('Red Hat Satellite 6.16 for RHEL 9 x86_64 RPMs'),
-        'version': '6.16',
-        'reposet': REPOSET['rhs9'],
-        'product': PRDS['rhs'],
-        'distro': 'rhel9',
-        'key': 'rhs',
-    },
-    'rhs8': {
-        'id': 'satellite-6.13-for-rhel-8-x86_64-rpms',
-        'name': ('Red Hat Satellite 6.13 for RHEL 8 x86_64 RPMs'),
-        'version': '6.13',
-        'reposet': REPOSET['rhs8'],
-        'product': PRDS['rhs'],
-        'distro': 'rhel8',
-        'key': 'rhs',
-    },
-    'rhs7': {
-        'id': 'rhel-7-server-satellite-6.11-rpms',
-        'name': ('Red Hat Satellite 6.11 for RHEL 7 Server RPMs x86_64'),
-        'version': '6.11',
-        'reposet': REPOSET['rhs7'],
-        'product': PRDS['rhs'],
-        'distro': 'rhel7',
-        'key': 'rhs',
-    },
-    'rhsc8': {
-        'id': 'satellite-capsule-6.16-for-rhel-8-x86_64-rpms',
-        'name': ('Red Hat Satellite Capsule 6.16 for RHEL 8 x86_64 RPMs'),
-        'version': '6.16',
-        'reposet': REPOSET['rhsc8'],
-        'product': PRDS['rhsc'],
-        'distro': 'rhel8',
-        'key': 'rhsc',
-    },
-    'rhsc9': {
-        'id': 'satellite-capsule-6.16-for-rhel-9-x86_64-rpms',
-        'name': ('Red Hat Satellite Capsule 6.16 for RHEL 9 x86_64 RPMs'),
-        'version': '6.16',
-        'reposet': REPOSET['rhsc9'],
-        'product': PRDS['rhsc'],
-        'distro': 'rhel9',
-        'key': 'rhsc',
-    },
-    'rhsc7_iso': {
-        'id': 'rhel-7-server-satellite-capsule-6.4-isos',
-        'name': ('Red Hat Satellite Capsule 6.4 for RHEL 7 Server ISOs x86_64'),
-    },
-    'rhsclient7': {
-        'id': 'rhel-7-server-satellite-client-6-rpms',
-        'name': ('Red Hat Satellite Client 6 for RHEL 7 Server RPMs x86_64'),
-        'version': '6',
-        'reposet': REPOSET['rhsclient7'],
-        'product': PRDS['rhel'],
-        'distro': 'rhel7',
-        'key': PRODUCT_KEY_SAT_CLIENT,
-    },
-    'rhsclient8': {
-        'id': 'satellite-client-6-for-rhel-8-x86_64-rpms',
-        'name': ('Red Hat Satellite Client 6 for RHEL 8 x86_64 RPMs'),
-        'version': '6',
-        'reposet': REPOSET['rhsclient8'],
-        'product': PRDS['rhel8'],
-        'distro': 'rhel8',
-        'releasever': None,
-        'key': PRODUCT_KEY_SAT_CLIENT,
-    },
-    'rhsclient9': {
-        'id': 'satellite-client-6-for-rhel-9-x86_64-rpms',
-        'name': ('Red Hat Satellite Client 6 for RHEL 9 x86_64 RPMs'),
-        'version': '6',
-        'reposet': REPOSET['rhsclient9'],
-        'product': PRDS['rhel9'],
-        'distro': 'rhel9',
-        'releasever': '9',
-        'key': PRODUCT_KEY_SAT_CLIENT,
-    },
-    'rhsclient10': {
-        'id': 'satellite-client-6-for-rhel-10-x86_64-rpms',
-        'name': ('Red Hat Satellite Client 6 for RHEL 10 x86_64 RPMs'),
-        'version': '6',
-        'reposet': REPOSET['rhsclient10'],
-        'product': PRDS['rhel10'],
-        'distro': 'rhel10',
-        'releasever': '10',
-        'key': PRODUCT_KEY_SAT_CLIENT,
-    },
-    'rhst7': {
-        'id': 'rhel-7-server-satellite-tools-6.9-rpms',
-        'name': ('Red Hat Satellite Tools 6.9 for RHEL 7 Server RPMs x86_64'),
-        'version': '6.9',
-        'reposet': REPOSET['rhst7'],
-        'product': PRDS['rhel'],
-        'distro': 'rhel7',
-        'key': 'rhst',
-    },
-    'rhst7_610': {
-        'id': 'rhel-7-server-satellite-tools-6.10-rpms',
-        'name': ('Red Hat Satellite Tools 6.10 for RHEL 7 Server RPMs x86_64'),
-        'version': '6.10',
-        'reposet': REPOSET['rhst7_610'],
-        'product': PRDS['rhel'],
-        'distro': 'rhel7',
-        'key': 'rhst',
-    },
-    'rhst6': {
-        'id': 'rhel-6-server-satellite-tools-6.9-rpms',
-        'name': ('Red Hat Satellite Tools 6.9 for RHEL 6 Server RPMs x86_64'),
-        'version': '6.9',
-        'reposet': REPOSET['rhst6'],
-        'product': PRDS['rhel'],
-        'distro': 'rhel6',
-        'key': 'rhst',
-    },
-    'rhva6': {
-        'id': 'rhel-6-server-rhev-agent-rpms',
-        'name': ('Red Hat Enterprise Virtualization Agents for RHEL 6 Server RPMs x86_64 6Server'),
-        'version': '6.0',
-        'reposet': REPOSET['rhva6'],
-        'product': PRDS['rhel'],
-        'distro': 'rhel6',
-        'releasever': '6Server',
-        'key': 'rhva6',
-    },
-    'rhva610': {
-        'name': ('Red Hat Enterprise Virtualization Agents for RHEL 6 Server RPMs x86_64 6.10'),
-        'version': '6.10',
-        'reposet': REPOSET['rhva6'],
-        'product': PRDS['rhel'],
-        'distro': 'rhel6',
-        'key': 'rhva610',
-    },
-    'rhct6': {
-        'name': 'Red Hat CloudForms Tools for RHEL 6 RPMs x86_64 6Server',
-        'releasever': '6Server',
-        'version': '6Server',
-        'arch': 'x86_64',
-        'reposet': REPOSET['rhct6'],
-        'product': PRDS['rhel'],
-        'distro': 'rhel6',
-        'key': 'rhct6',
-    },
-    'rhaht': {'name': ('Red Hat Enterprise Linux Atomic Host RPMs x86_64')},
-    'rhdt7': {
-        'name': ('Red Hat Developer Tools RPMs for Red Hat Enterprise Linux 7 Server x86_64')
-    },
-    'rhae2': {
-        'id': 'rhel-7-server-ansible-2.9-rpms',
-        'name': 'Red Hat Ansible Engine 2.9 RPMs for Red Hat Enterprise Linux 7 Server x86_64',
-        'version': '2.9',
-        'releasever': None,
-        'arch': 'x86_64',
-        'reposet': REPOSET['rhae2'],
-        'product': PRDS['rhae'],
-        'distro': 'rhel7',
-        'key': 'rhae2',
-    },
-    'rhae2.9_el8': {
-        'id': 'ansible-2.9-for-rhel-8-x86_64-rpms',
-        'name': 'Red Hat Ansible Engine 2.9 for RHEL 8 x86_64 RPMs',
-        'version': '2.9',
-        'releasever': None,
-        'arch': 'x86_64',
-        'reposet': REPOSET['rhae2.9_el8'],
-        'product': PRDS['rhae'],
-        'distro': 'rhel8',
-        'key': 'rhae2.9_el8',
-    },
-    'rhst8': {
-        'id': 'satellite-tools-6.9-for-rhel-8-x86_64-rpms',
-        'name': 'Red Hat Satellite Tools 6.9 for RHEL 8 x86_64 RPMs',
-        'version': '6.9',
-        'reposet': REPOSET['rhst8'],
-        'product': PRDS['rhel8'],
-        'distro': 'rhel8',
-        'releasever': None,
-        'key': 'rhst',
-    },
-    'kickstart': {
-        'rhel6': {
-            'id': 'rhel-6-server-kickstart',
-            'name': 'Red Hat Enterprise Linux 6 Server Kickstart x86_64 6.10',
-            'version': '6.10',
-            'reposet': REPOSET['kickstart']['rhel6'],
-            'product': PRDS['rhel'],
-            'distro': 'rhel6',
-        },
-        'rhel7': {
-            'id': 'rhel-7-server-kickstart',
-            'name': 'Red Hat Enterprise Linux 7 Server Kickstart x86_64 7.9',
-            'version': '7.9',
-            'reposet': REPOSET['kickstart']['rhel7'],
-            'product': PRDS['rhel'],
-            'distro': 'rhel7',
-        },
-        'rhel8_bos': {
-            'id': 'rhel-8-for-x86_64-baseos-kickstart',
-            'name': 'Red Hat Enterprise Linux 8 for x86_64 - BaseOS Kickstart 8.10',
-            'version': '8.10',
-            'reposet': REPOSET['kickstart']['rhel8_bos'],
-            'product': PRDS['rhel8'],
-            'distro': 'rhel8',
-        },
-        'rhel8_aps': {
-            'id': 'rhel-8-for-x86_64-appstream-kickstart',
-            'name': 'Red Hat Enterprise Linux 8 for x86_64 - AppStream Kickstart 8.10',
-            'version': '8.10',
-            'reposet': REPOSET['kickstart']['rhel8_aps'],
-            'product': PRDS['rhel8'],
-            'distro': 'rhel8',
-        },
-        'rhel9_bos': {
-            'id': 'rhel-9-for-x86_64-baseos-kickstart',
-            'name': 'Red Hat Enterprise Linux 9 for x86_64 - BaseOS Kickstart 9.8',
-            'version': '9.8',
-            'reposet': REPOSET['kickstart']['rhel9_bos'],
-            'product': PRDS['rhel9'],
-            'distro': 'rhel9',
-        },
-        'rhel9_aps': {
-            'id': 'rhel-9-for-x86_64-appstream-kickstart',
-            'name': 'Red Hat Enterprise Linux 9 for x86_64 - AppStream Kickstart 9.8',
-            'version': '9.8',
-            'reposet': REPOSET['kickstart']['rhel9_aps'],
-            'product': PRDS['rhel9'],
-            'distro': 'rhel9',
-        },
-        'rhel10_bos': {
-            'id': 'rhel-10-for-x86_64-baseos-kickstart',
-            'name': 'Red Hat Enterprise Linux 10 for x86_64 - BaseOS Kickstart 10.2',
-            'version': '10.2',
-            'reposet': REPOSET['kickstart']['rhel10_bos'],
-            'product': PRDS['rhel10'],
-            'distro': 'rhel10',
-        },
-        'rhel10_aps': {
-            'id': 'rhel-10-for-x86_64-appstream-kickstart',
-            'name': 'Red Hat Enterprise Linux 10 for x86_64 - AppStream Kickstart 10.2',
-            'version': '10.2',
-            'reposet': REPOSET['kickstart']['rhel10_aps'],
-            'product': PRDS['rhel10'],
-            'distro': 'rhel10',
-        },
-    },
-    'rhel8_bos': {
-        'id': 'rhel-8-for-x86_64-baseos-rpms',
-        'name': 'Red Hat Enterprise Linux 8 for x86_64 - BaseOS RPMs 8',
-        'releasever': '8',
-        'version': '8',
-        'reposet': REPOSET['rhel8_bos'],
-        'product': PRDS['rhel8'],
-        'distro': 'rhel8',
-        'key': 'rhel8_bos',
-        'basearch': 'x86_64',
-    },
-    'rhel8_aps': {
-        'id': 'rhel-8-for-x86_64-appstream-rpms',
-        'name': 'Red Hat Enterprise Linux 8 for x86_64 - AppStream RPMs 8',
-        'releasever': '8',
-        'basearch': 'x86_64',
-        'version': '8',
-        'reposet': REPOSET['rhel8_aps'],
-        'product': PRDS['rhel8'],
-        'distro': 'rhel8',
-        'key': 'rhel8_aps',
-    },
-    'rhel9_bos': {
-        'id': 'rhel-9-for-x86_64-baseos-rpms',
-        'name': 'Red Hat Enterprise Linux 9 for x86_64 - BaseOS RPMs 9',
-        'releasever': '9',
-        'version': '9',
-        'reposet': REPOSET['rhel9_bos'],
-        'product': PRDS['rhel9'],
-        'distro': 'rhel9',
-        'key': 'rhel9_bos',
-        'basearch': 'x86_64',
-    },
-    'rhel9_aps': {
-        'id': 'rhel-9-for-x86_64-appstream-rpms',
-        'name': 'Red Hat Enterprise Linux 9 for x86_64 - AppStream RPMs 9',
-        'releasever': '9',
-        'basearch': 'x86_64',
-        'version': '9',
-        'reposet': REPOSET['rhel9_aps'],
-        'product': PRDS['rhel9'],
-        'distro': 'rhel9',
-        'key': 'rhel9_aps',
-    },
-    'rhel10_bos': {
-        'id': 'rhel-10-for-x86_64-baseos-rpms',
-        'name': 'Red Hat Enterprise Linux 10 for x86_64 - BaseOS RPMs 10',
-        'releasever': '10',
-        'version': '10',
-        'reposet': REPOSET['rhel10_bos'],
-        'product': PRDS['rhel10'],
-        'distro': 'rhel10',
-        'key': 'rhel10_bos',
-        'basearch': 'x86_64',
-    },
-    'rhel10_aps': {
-        'id': 'rhel-10-for-x86_64-appstream-rpms',
-        'name': 'Red Hat Enterprise Linux 10 for x86_64 - AppStream RPMs 10',
-        'releasever': '10',
-        'basearch': 'x86_64',
-        'version': '10',
-        'reposet': REPOSET['rhel10_aps'],
-        'product': PRDS['rhel10'],
-        'distro': 'rhel10',
-        'key': 'rhel10_aps',
-    },
-    'rhel7_optional': {
-        'id': 'rhel-7-server-optional-rpms',
-        'name': 'Red Hat Enterprise Linux 7 Server - Optional RPMs x86_64 7Server',
-        'releasever': '7Server',
-        'version': '7',
-        'reposet': REPOSET['rhel7_optional'],
-        'product': PRDS['rhel'],
-        'distro': 'rhel7',
-        'key': 'rhel7_optional',
-    },
-    'rhel7_extra': {
-        'id': 'rhel-7-server-extras-rpms',
-        'name': 'Red Hat Enterprise Linux 7 Server - Extras RPMs x86_64',
-        'releasever': '7',
-        'version': '7',
-        'reposet': REPOSET['rhel7_extra'],
-        'product': PRDS['rhel'],
-        'distro': 'rhel7',
-        'key': 'rhel7_extra',
-    },
-    'rhel7_sup': {
-        'id': 'rhel-7-server-supplementary-rpms',
-        'name': 'Red Hat Enterprise Linux 7 Server - Supplementary RPMs x86_64 7Server',
-        'releasever': '7Server',
-        'version': '7',
-        'reposet': REPOSET['rhel7_sup'],
-        'product': PRDS['rhel'],
-        'distro': 'rhel7',
-        'key': 'rhel7_sup',
-    },
-    'rhscl7': {
-        'id': 'rhel-server-rhscl-7-rpms',
-        'name': (
-            'Red Hat Software Collections RPMs for Red Hat Enterprise Linux 7 Server x86_64 7Server'
-        ),
-        'releasever': '7Server',
-        'version': '7',
-        'reposet': REPOSET['rhscl7'],
-        'product': PRDS['rhscl'],
-        'distro': 'rhel7',
-        'key': 'rhscl7',
-    },
-}
-
 # RHEL versions for LEAPP testing
 RHEL7_VER = '7.9'
 RHEL8_VER = '8.10'
 RHEL9_VER = '9.8'
 RHEL10_VER = '10.2'
 
-BULK_REPO_LIST = [
-    REPOS['rhel7_optional'],
-    REPOS['rhel7_sup'],
-    REPOS['rhel7'],
-    REPOS['rhel6'],
-    REPOS['rhscl7'],
-    REPOS['rhel8_aps'],
-]
-
-DISTRO_REPOS = {'rhel7': REPOS['rhel7']}
 #: Name (not label!) of the default organization.
 DEFAULT_ORG = "Default Organization"
 #: Name (not label!) of the default location.
@@ -1063,87 +607,6 @@ SUPPORTED_MIRRORING_POLICIES = {
     'ansible_collection': ['additive', 'mirror_content_only'],
     'file': ['additive', 'mirror_content_only'],
 }
-PULP_HREF_PRN_MAP = {
-    '/pulp/api/v3/contentguards/certguard/rhsm': 'prn:certguard.rhsmcertguard:',
-    '/pulp/api/v3/remotes/ansible/collection': 'prn:ansible.collectionremote:',
-    '/pulp/api/v3/remotes/file/file': 'prn:file.fileremote:',
-    '/pulp/api/v3/remotes/rpm/rpm': 'prn:rpm.rpmremote:',
-    '/pulp/api/v3/remotes/rpm/uln': 'prn:rpm.ulnremote:',
-    '/pulp/api/v3/remotes/container/container': 'prn:container.containerremote:',
-    '/pulp/api/v3/distributions/rpm/rpm': 'prn:rpm.rpmdistribution:',
-    '/pulp/api/v3/distributions/container/container': 'prn:container.containerdistribution:',
-    '/pulp/api/v3/distributions/ansible/ansible': 'prn:ansible.ansibledistribution:',
-    '/pulp/api/v3/distributions/file/file': 'prn:file.filedistribution:',
-    '/pulp/api/v3/publications/file/file': 'prn:file.filepublication:',
-    '/pulp/api/v3/publications/rpm/rpm': 'prn:rpm.rpmpublication:',
-    '/pulp/api/v3/content/ansible/collection_versions': 'prn:ansible.collectionversion:',
-    '/pulp/api/v3/content/rpm/modulemds': 'prn:rpm.modulemd:',
-    '/pulp/api/v3/content/container/manifests': 'prn:container.manifest:',
-    '/pulp/api/v3/content/container/tags': 'prn:container.tag:',
-    '/pulp/api/v3/content/rpm/packages': 'prn:rpm.package:',
-    '/pulp/api/v3/content/file/files': 'prn:file.filecontent:',
-    '/pulp/api/v3/content/rpm/packagegroups': 'prn:rpm.packagegroup:',
-    '/pulp/api/v3/repositories/ansible/ansible': 'prn:ansible.ansiblerepository:',
-    '/pulp/api/v3/repositories/rpm/rpm': 'prn:rpm.rpmrepository:',
-    '/pulp/api/v3/repositories/container/container': 'prn:container.containerrepository:',
-    '/pulp/api/v3/repositories/file/file': 'prn:file.filerepository:',
-    '/pulp/api/v3/content/rpm/advisories': 'prn:rpm.updaterecord:',
-    '/pulp/api/v3/acs/rpm/rpm': 'prn:rpm.rpmalternatecontentsource:',
-    '/pulp/api/v3/acs/file/file': 'prn:file.filealternatecontentsource:',
-}
-
-PULP_PRN_TABLES = [
-    {'name': 'katello_content_guards', 'href_key': 'pulp_href', 'prn_key': 'pulp_prn'},
-    {'name': 'katello_repositories', 'href_key': 'remote_href', 'prn_key': 'remote_prn'},
-    {
-        'name': 'katello_repositories',
-        'href_key': 'publication_href',
-        'prn_key': 'publication_prn',
-    },  # Only for rpm and file types, otherwise NULL
-    {'name': 'katello_ansible_collections', 'href_key': 'pulp_id', 'prn_key': 'pulp_prn'},
-    # {'name': 'katello_generic_content_units', 'href_key': 'pulp_id', 'prn_key': 'pulp_prn'},  # Unsupported downstream
-    {'name': 'katello_module_streams', 'href_key': 'pulp_id', 'prn_key': 'pulp_prn'},
-    {
-        'name': 'katello_docker_manifest_lists',
-        'href_key': 'pulp_id',
-        'prn_key': 'pulp_prn',
-    },
-    {'name': 'katello_docker_manifests', 'href_key': 'pulp_id', 'prn_key': 'pulp_prn'},
-    {'name': 'katello_docker_tags', 'href_key': 'pulp_id', 'prn_key': 'pulp_prn'},
-    {'name': 'katello_rpms', 'href_key': 'pulp_id', 'prn_key': 'pulp_prn'},
-    {'name': 'katello_srpms', 'href_key': 'pulp_id', 'prn_key': 'pulp_prn'},
-    {'name': 'katello_files', 'href_key': 'pulp_id', 'prn_key': 'pulp_prn'},
-    {'name': 'katello_package_groups', 'href_key': 'pulp_id', 'prn_key': 'pulp_prn'},
-    # {'name': 'katello_debs', 'href_key': 'pulp_id', 'prn_key': 'pulp_prn'},  # Unsupported downstream
-    {'name': 'katello_distribution_references', 'href_key': 'href', 'prn_key': 'prn'},
-    {
-        'name': 'katello_distribution_references',
-        'href_key': 'content_guard_href',
-        'prn_key': 'content_guard_prn',
-        'skip': '/pulp/api/v3/contentguards/core/content_redirect',
-    },  # Only for RH repos, otherwise NULL
-    {
-        'name': 'katello_repository_references',
-        'href_key': 'repository_href',
-        'prn_key': 'repository_prn',
-    },
-    {
-        'name': 'katello_repository_errata',
-        'href_key': 'erratum_pulp3_href',
-        'prn_key': 'erratum_prn',
-    },
-    {
-        'name': 'katello_smart_proxy_alternate_content_sources',
-        'href_key': 'remote_href',
-        'prn_key': 'remote_prn',
-    },
-    {
-        'name': 'katello_smart_proxy_alternate_content_sources',
-        'href_key': 'alternate_content_source_href',
-        'prn_key': 'alternate_content_source_prn',
-    },
-]
-
 PUPPET_COMMON_INSTALLER_OPTS = {
     'foreman-proxy-puppetca': 'true',
     'foreman-proxy-puppet': 'true',
@@ -1169,760 +632,6 @@ KICKSTART_CONTENT = [
     'images/pxeboot/vmlinuz',
 ]
 
-#: All permissions exposed by the server.
-#: :mod:`tests.foreman.api.test_permission` makes use of this.
-PERMISSIONS = {
-    None: [
-        'access_dashboard',
-        'create_arf_reports',
-        'create_recurring_logics',
-        'destroy_arf_reports',
-        'destroy_config_reports',
-        'download_bootdisk',
-        'edit_recurring_logics',
-        'escalate_roles',
-        'generate_ansible_inventory',
-        'my_organizations',
-        'upload_config_reports',
-        'view_arf_reports',
-        'view_config_reports',
-        'view_plugins',
-        'view_recurring_logics',
-        'view_statuses',
-        'generate_foreman_rh_cloud',
-        'forget_status_hosts',
-        'edit_user_mail_notifications',
-        'destroy_vm_compute_resources',
-        'power_vm_compute_resources',
-        'view_foreman_rh_cloud',
-        'import_ansible_playbooks',
-        'dispatch_cloud_requests',
-        'control_organization_insights',
-        'view_statistics',
-        'upload_monitoring_results',
-    ],
-    'AnsibleRole': ['view_ansible_roles', 'destroy_ansible_roles', 'import_ansible_roles'],
-    'AnsibleVariable': [
-        'edit_ansible_variables',
-        'view_ansible_variables',
-        'import_ansible_variables',
-        'destroy_ansible_variables',
-        'create_ansible_variables',
-    ],
-    'Architecture': [
-        'view_architectures',
-        'create_architectures',
-        'edit_architectures',
-        'destroy_architectures',
-    ],
-    'Audit': ['view_audit_logs'],
-    'AuthSource': [
-        'view_authenticators',
-        'create_authenticators',
-        'edit_authenticators',
-        'destroy_authenticators',
-    ],
-    'Bookmark': ['create_bookmarks', 'edit_bookmarks', 'destroy_bookmarks'],
-    'ComputeProfile': [
-        'view_compute_profiles',
-        'create_compute_profiles',
-        'edit_compute_profiles',
-        'destroy_compute_profiles',
-    ],
-    'ComputeResource': [
-        'view_compute_resources',
-        'create_compute_resources',
-        'edit_compute_resources',
-        'destroy_compute_resources',
-        'view_compute_resources_vms',
-        'create_compute_resources_vms',
-        'edit_compute_resources_vms',
-        'destroy_compute_resources_vms',
-        'power_compute_resources_vms',
-        'console_compute_resources_vms',
-        'destroy_vm_compute_resources',
-        'power_vm_compute_resources',
-    ],
-    'DiscoveryRule': [
-        'create_discovery_rules',
-        'destroy_discovery_rules',
-        'edit_discovery_rules',
-        'execute_discovery_rules',
-        'view_discovery_rules',
-    ],
-    'Domain': ['view_domains', 'create_domains', 'edit_domains', 'destroy_domains'],
-    'ExternalUsergroup': [
-        'view_external_usergroups',
-        'create_external_usergroups',
-        'edit_external_usergroups',
-        'destroy_external_usergroups',
-    ],
-    'FactValue': ['view_facts', 'upload_facts'],
-    'Filter': [
-        'view_filters',
-        'create_filters',
-        'edit_filters',
-        'destroy_filters',
-    ],
-    'ForemanAnsibleDirector::AnsibleContentAssignment': [
-        'create_ansible_assignments',
-        'destroy_ansible_assignments',
-        'view_ansible_assignments',
-    ],
-    'ForemanAnsibleDirector::ContentUnit': [
-        'create_ansible_content',
-        'destroy_ansible_content',
-        'view_ansible_content',
-    ],
-    'ForemanAnsibleDirector::ExecutionEnvironment': [
-        'create_ansible_execution_environments',
-        'destroy_ansible_execution_environments',
-        'edit_ansible_execution_environments',
-        'view_ansible_execution_environments',
-    ],
-    'ForemanAnsibleDirector::LifecycleEnvironment': [
-        'create_ansible_lifecycle_environments',
-        'destroy_ansible_lifecycle_environments',
-        'edit_ansible_lifecycle_environments',
-        'view_ansible_lifecycle_environments',
-    ],
-    'ForemanAnsibleDirector::LifecycleEnvironmentPath': [
-        'create_ansible_lifecycle_environment_paths',
-        'destroy_ansible_lifecycle_environment_paths',
-        'edit_ansible_lifecycle_environment_paths',
-        'promote_ansible_lifecycle_environment_paths',
-        'view_ansible_lifecycle_environment_paths',
-    ],
-    'ForemanResourceQuota::ResourceQuota': [
-        "destroy_resource_quotas",
-        "create_resource_quotas",
-        "view_resource_quotas",
-        "edit_resource_quotas",
-    ],
-    'ForemanSalt::SaltVariable': [
-        'edit_salt_variables',
-        'destroy_salt_variables',
-        'create_salt_variables',
-        'view_salt_variables',
-    ],
-    'ForemanSalt::SaltEnvironment': [
-        'edit_salt_environments',
-        'create_salt_environments',
-        'destroy_salt_environments',
-        'view_salt_environments',
-    ],
-    'ForemanSalt::SaltModule': [
-        'import_salt_modules',
-        'create_salt_modules',
-        'edit_salt_modules',
-        'view_salt_modules',
-        'destroy_salt_modules',
-    ],
-    'ForemanStatistics::Trend': [
-        'create_trends',
-        'view_trends',
-        'edit_trends',
-        'update_trends',
-        'destroy_trends',
-    ],
-    'ForemanTasks::RecurringLogic': [
-        'create_recurring_logics',
-        'view_recurring_logics',
-        'edit_recurring_logics',
-    ],
-    'ForemanOpenscap::ArfReport': [
-        'create_arf_reports',
-        'view_arf_reports',
-        'destroy_arf_reports',
-    ],
-    'ForemanOpenscap::Policy': [
-        'assign_policies',
-        'create_policies',
-        'destroy_policies',
-        'edit_policies',
-        'view_policies',
-    ],
-    'ForemanOpenscap::ScapContent': [
-        'create_scap_contents',
-        'destroy_scap_contents',
-        'edit_scap_contents',
-        'view_scap_contents',
-    ],
-    'ForemanRhCloud': [
-        'view_vulnerability',
-        'edit_vulnerability',
-        'view_advisor',
-        'edit_advisor',
-    ],
-    'ForemanTasks::Task': ['edit_foreman_tasks', 'view_foreman_tasks'],
-    'JobInvocation': [
-        'view_job_invocations',
-        'create_job_invocations',
-        'cancel_job_invocations',
-        'execute_jobs_on_infrastructure_hosts',
-    ],
-    'JobTemplate': [
-        'view_job_templates',
-        'edit_job_templates',
-        'destroy_job_templates',
-        'create_job_templates',
-        'lock_job_templates',
-    ],
-    'ConfigReport': ['destroy_config_reports', 'view_config_reports', 'upload_config_reports'],
-    'ForemanVirtWhoConfigure::Config': [
-        "view_virt_who_config",
-        "create_virt_who_config",
-        "edit_virt_who_config",
-        "destroy_virt_who_config",
-    ],
-    "ForemanOpenscap::TailoringFile": [
-        "create_tailoring_files",
-        "view_tailoring_files",
-        "edit_tailoring_files",
-        "destroy_tailoring_files",
-    ],
-    'Hostgroup': [
-        'view_hostgroups',
-        'create_hostgroups',
-        'edit_hostgroups',
-        'destroy_hostgroups',
-        'play_roles_on_hostgroup',
-    ],
-    'ForemanPuppet::ConfigGroup': [
-        'view_config_groups',
-        'create_config_groups',
-        'edit_config_groups',
-        'destroy_config_groups',
-    ],
-    'ForemanPuppet::Environment': [
-        'view_environments',
-        'create_environments',
-        'edit_environments',
-        'destroy_environments',
-        'import_environments',
-    ],
-    'ForemanPuppet::HostClass': [
-        'edit_classes',
-    ],
-    'ForemanPuppet::Puppetclass': [
-        'view_puppetclasses',
-        'create_puppetclasses',
-        'edit_puppetclasses',
-        'destroy_puppetclasses',
-        'import_puppetclasses',
-    ],
-    'ForemanPuppet::PuppetclassLookupKey': [
-        'view_external_parameters',
-        'create_external_parameters',
-        'edit_external_parameters',
-        'destroy_external_parameters',
-    ],
-    'HttpProxy': [
-        'view_http_proxies',
-        'create_http_proxies',
-        'edit_http_proxies',
-        'destroy_http_proxies',
-    ],
-    'Image': ['view_images', 'create_images', 'edit_images', 'destroy_images'],
-    'InsightsHit': ['view_insights_hits'],
-    'Katello::AlternateContentSource': [
-        'create_alternate_content_sources',
-        'edit_alternate_content_sources',
-        'destroy_alternate_content_sources',
-        'view_alternate_content_sources',
-    ],
-    'Katello::FlatpakRemote': [
-        'view_flatpak_remotes',
-        'create_flatpak_remotes',
-        'edit_flatpak_remotes',
-        'destroy_flatpak_remotes',
-    ],
-    'KeyPair': ["view_keypairs", "destroy_keypairs"],
-    'Location': [
-        'view_locations',
-        'create_locations',
-        'edit_locations',
-        'destroy_locations',
-        'assign_locations',
-    ],
-    'LookupValue': [
-        'edit_lookup_values',
-        'create_lookup_values',
-        'destroy_lookup_values',
-        'view_lookup_values',
-        'destroy_ansible_variable_overrides',
-        'edit_ansible_variable_overrides',
-        'create_ansible_variable_overrides',
-        'view_ansible_variable_overrides',
-    ],
-    'MailNotification': ['view_mail_notifications', 'edit_user_mail_notifications'],
-    'Medium': ['view_media', 'create_media', 'edit_media', 'destroy_media'],
-    'Model': ['view_models', 'create_models', 'edit_models', 'destroy_models'],
-    'Operatingsystem': [
-        'view_operatingsystems',
-        'create_operatingsystems',
-        'edit_operatingsystems',
-        'destroy_operatingsystems',
-    ],
-    'Parameter': ['view_params', 'create_params', 'edit_params', 'destroy_params'],
-    'PersonalAccessToken': [
-        'view_personal_access_tokens',
-        'create_personal_access_tokens',
-        'revoke_personal_access_tokens',
-    ],
-    'ProvisioningTemplate': [
-        'view_provisioning_templates',
-        'create_provisioning_templates',
-        'edit_provisioning_templates',
-        'destroy_provisioning_templates',
-        'deploy_provisioning_templates',
-        'lock_provisioning_templates',
-    ],
-    'Ptable': [
-        'view_ptables',
-        'create_ptables',
-        'edit_ptables',
-        'destroy_ptables',
-        'lock_ptables',
-    ],
-    'Realm': ['view_realms', 'create_realms', 'edit_realms', 'destroy_realms'],
-    'RemoteExecutionFeature': ['view_remote_execution_features', 'edit_remote_execution_features'],
-    'ReportTemplate': [
-        'edit_report_templates',
-        'destroy_report_templates',
-        'generate_report_templates',
-        'create_report_templates',
-        'view_report_templates',
-        'lock_report_templates',
-    ],
-    'Role': ['view_roles', 'create_roles', 'edit_roles', 'destroy_roles'],
-    'Report': ['create_reports'],
-    'SccAccount': [
-        "delete_scc_accounts",
-        "edit_scc_accounts",
-        "new_scc_accounts",
-        "sync_scc_accounts",
-        "test_connection_scc_accounts",
-        "use_scc_accounts",
-        "view_scc_accounts",
-    ],
-    'SccProduct': [
-        "subscribe_scc_products",
-        "view_scc_products",
-    ],
-    'Setting': ['view_settings', 'edit_settings'],
-    'SmartProxy': [
-        'view_smart_proxies',
-        'create_smart_proxies',
-        'edit_smart_proxies',
-        'destroy_smart_proxies',
-        'view_smart_proxies_autosign',
-        'create_smart_proxies_autosign',
-        'destroy_smart_proxies_autosign',
-        'view_smart_proxies_puppetca',
-        'edit_smart_proxies_puppetca',
-        'destroy_smart_proxies_puppetca',
-        'manage_capsule_content',
-        'view_capsule_content',
-        'view_openscap_proxies',
-        'destroy_smart_proxies_salt_autosign',
-        'view_smart_proxies_salt_autosign',
-        'destroy_smart_proxies_salt_keys',
-        'view_smart_proxies_salt_keys',
-        'edit_smart_proxies_salt_keys',
-        'auth_smart_proxies_salt_autosign',
-        'create_smart_proxies_salt_autosign',
-    ],
-    'SshKey': ["view_ssh_keys", "create_ssh_keys", "destroy_ssh_keys"],
-    'Subnet': [
-        'view_subnets',
-        'create_subnets',
-        'edit_subnets',
-        'destroy_subnets',
-        'import_subnets',
-    ],
-    'Template': ['export_templates', 'import_templates', 'view_template_syncs'],
-    'TemplateInvocation': [
-        'filter_autocompletion_for_template_invocation',
-        'create_template_invocations',
-        'view_template_invocations',
-    ],
-    'Usergroup': ['view_usergroups', 'create_usergroups', 'edit_usergroups', 'destroy_usergroups'],
-    'User': ['view_users', 'create_users', 'edit_users', 'destroy_users'],
-    'Webhook': [
-        'create_webhooks',
-        'destroy_webhooks',
-        'edit_webhooks',
-        'view_webhooks',
-    ],
-    'WebhookTemplate': [
-        'create_webhook_templates',
-        'destroy_webhook_templates',
-        'edit_webhook_templates',
-        'lock_webhook_templates',
-        'view_webhook_templates',
-    ],
-    'Host': [
-        'auto_provision_discovered_hosts',
-        'build_hosts',
-        'cockpit_hosts',
-        'console_hosts',
-        'create_hosts',
-        'destroy_discovered_hosts',
-        'destroy_hosts',
-        'edit_discovered_hosts',
-        'edit_hosts',
-        'ipmi_boot_hosts',
-        'play_roles_on_host',
-        'power_hosts',
-        'provision_discovered_hosts',
-        'submit_discovered_hosts',
-        'view_discovered_hosts',
-        'view_hosts',
-        'forget_status_hosts',
-        'saltrun_hosts',
-        'view_snapshots',
-        'create_snapshots',
-        'edit_snapshots',
-        'revert_snapshots',
-        'destroy_snapshots',
-        'view_monitoring_results',
-        'manage_downtime_hosts',
-    ],
-    'Katello::ActivationKey': [
-        'view_activation_keys',
-        'create_activation_keys',
-        'edit_activation_keys',
-        'destroy_activation_keys',
-    ],
-    'Katello::ContentView': [
-        'view_content_views',
-        'create_content_views',
-        'edit_content_views',
-        'destroy_content_views',
-        'publish_content_views',
-        'promote_or_remove_content_views',
-    ],
-    'Katello::ContentCredential': [
-        'create_content_credentials',
-        'destroy_content_credentials',
-        'edit_content_credentials',
-        'view_content_credentials',
-    ],
-    'Katello::HostCollection': [
-        'view_host_collections',
-        'create_host_collections',
-        'edit_host_collections',
-        'destroy_host_collections',
-    ],
-    'Katello::KTEnvironment': [
-        'view_lifecycle_environments',
-        'create_lifecycle_environments',
-        'edit_lifecycle_environments',
-        'destroy_lifecycle_environments',
-        'promote_or_remove_content_views_to_environments',
-    ],
-    'Katello::Product': [
-        'view_products',
-        'create_products',
-        'edit_products',
-        'destroy_products',
-        'sync_products',
-    ],
-    'Katello::Subscription': [
-        'view_subscriptions',
-        'attach_subscriptions',
-        'unattach_subscriptions',
-        'import_manifest',
-        'delete_manifest',
-        'manage_subscription_allocations',
-    ],
-    'Organization': [
-        'view_organizations',
-        'create_organizations',
-        'edit_organizations',
-        'destroy_organizations',
-        'assign_organizations',
-        'import_content',
-        'export_content',
-    ],
-    'Katello::SyncPlan': [
-        'view_sync_plans',
-        'create_sync_plans',
-        'edit_sync_plans',
-        'destroy_sync_plans',
-        'sync_sync_plans',
-    ],
-}
-
-PERMISSIONS_UI = {
-    '(Miscellaneous)': [
-        'access_dashboard',
-        'view_plugins',
-        'escalate_roles',
-        'view_statuses',
-        'generate_ansible_inventory',
-        'download_bootdisk',
-        'my_organizations',
-        'generate_foreman_rh_cloud',
-        'view_foreman_rh_cloud',
-        'dispatch_cloud_requests',
-    ],
-    'Activation Keys': [
-        'view_activation_keys',
-        'create_activation_keys',
-        'edit_activation_keys',
-        'destroy_activation_keys',
-    ],
-    'Architecture': [
-        'view_architectures',
-        'create_architectures',
-        'edit_architectures',
-        'destroy_architectures',
-    ],
-    'Audit': ['view_audit_logs'],
-    'Auth source': [
-        'view_authenticators',
-        'create_authenticators',
-        'edit_authenticators',
-        'destroy_authenticators',
-    ],
-    'Bookmark': ['create_bookmarks', 'edit_bookmarks', 'destroy_bookmarks'],
-    'Capsule': [
-        'view_smart_proxies',
-        'create_smart_proxies',
-        'edit_smart_proxies',
-        'destroy_smart_proxies',
-        'view_smart_proxies_autosign',
-        'create_smart_proxies_autosign',
-        'destroy_smart_proxies_autosign',
-        'view_smart_proxies_puppetca',
-        'edit_smart_proxies_puppetca',
-        'destroy_smart_proxies_puppetca',
-        'manage_capsule_content',
-        'view_capsule_content',
-        'view_openscap_proxies',
-    ],
-    'Compute profile': [
-        'view_compute_profiles',
-        'create_compute_profiles',
-        'edit_compute_profiles',
-        'destroy_compute_profiles',
-    ],
-    'Compute resource': [
-        'view_compute_resources',
-        'create_compute_resources',
-        'edit_compute_resources',
-        'destroy_compute_resources',
-        'power_vm_compute_resources',
-        'destroy_vm_compute_resources',
-        'view_compute_resources_vms',
-        'create_compute_resources_vms',
-        'edit_compute_resources_vms',
-        'destroy_compute_resources_vms',
-        'power_compute_resources_vms',
-        'console_compute_resources_vms',
-    ],
-    'Config report': ['view_config_reports', 'destroy_config_reports', 'upload_config_reports'],
-    'Content Views': [
-        'view_content_views',
-        'create_content_views',
-        'edit_content_views',
-        'destroy_content_views',
-        'publish_content_views',
-        'promote_or_remove_content_views',
-    ],
-    'Discovery rule': [
-        'view_discovery_rules',
-        'create_discovery_rules',
-        'edit_discovery_rules',
-        'execute_discovery_rules',
-        'destroy_discovery_rules',
-    ],
-    'Domain': ['view_domains', 'create_domains', 'edit_domains', 'destroy_domains'],
-    'External usergroup': [
-        'view_external_usergroups',
-        'create_external_usergroups',
-        'edit_external_usergroups',
-        'destroy_external_usergroups',
-    ],
-    'Fact value': ['view_facts', 'upload_facts'],
-    'Filter': ['view_filters', 'create_filters', 'edit_filters', 'destroy_filters'],
-    'Host': [
-        'view_hosts',
-        'create_hosts',
-        'edit_hosts',
-        'destroy_hosts',
-        'build_hosts',
-        'power_hosts',
-        'console_hosts',
-        'ipmi_boot_hosts',
-        'forget_status_hosts',
-        'cockpit_hosts',
-        'play_roles_on_host',
-        'view_discovered_hosts',
-        'submit_discovered_hosts',
-        'auto_provision_discovered_hosts',
-        'provision_discovered_hosts',
-        'edit_discovered_hosts',
-        'destroy_discovered_hosts',
-    ],
-    'Host Collections': [
-        'view_host_collections',
-        'create_host_collections',
-        'edit_host_collections',
-        'destroy_host_collections',
-    ],
-    'Host Group': [
-        'view_hostgroups',
-        'create_hostgroups',
-        'edit_hostgroups',
-        'destroy_hostgroups',
-        'play_roles_on_hostgroup',
-    ],
-    'Host сlass': ['edit_classes'],
-    'Image': ['view_images', 'create_images', 'edit_images', 'destroy_images'],
-    'Job invocation': [
-        'create_job_invocations',
-        'view_job_invocations',
-        'execute_jobs_on_infrastructure_hosts',
-        'cancel_job_invocations',
-    ],
-    'Job template': [
-        'view_job_templates',
-        'create_job_templates',
-        'edit_job_templates',
-        'destroy_job_templates',
-        'lock_job_templates',
-    ],
-    'Key pair': ["view_keypairs", "destroy_keypairs"],
-    'Lifecycle Environment': [
-        'view_lifecycle_environments',
-        'create_lifecycle_environments',
-        'edit_lifecycle_environments',
-        'destroy_lifecycle_environments',
-        'promote_or_remove_content_views_to_environments',
-    ],
-    'Location': [
-        'view_locations',
-        'create_locations',
-        'edit_locations',
-        'destroy_locations',
-        'assign_locations',
-    ],
-    'Mail notification': ['view_mail_notifications', 'edit_user_mail_notifications'],
-    'Medium': ['view_media', 'create_media', 'edit_media', 'destroy_media'],
-    'Model': ['view_models', 'create_models', 'edit_models', 'destroy_models'],
-    'Operatingsystem': [
-        'view_operatingsystems',
-        'create_operatingsystems',
-        'edit_operatingsystems',
-        'destroy_operatingsystems',
-    ],
-    'Organization': [
-        'view_organizations',
-        'create_organizations',
-        'edit_organizations',
-        'destroy_organizations',
-        'assign_organizations',
-        'import_content',
-        'export_content',
-    ],
-    'Parameter': ['view_params', 'create_params', 'edit_params', 'destroy_params'],
-    'Ptable': [
-        'view_ptables',
-        'create_ptables',
-        'edit_ptables',
-        'destroy_ptables',
-        'lock_ptables',
-    ],
-    'Product and Repositories': [
-        'view_products',
-        'create_products',
-        'edit_products',
-        'destroy_products',
-        'sync_products',
-    ],
-    'Provisioning template': [
-        'view_provisioning_templates',
-        'create_provisioning_templates',
-        'edit_provisioning_templates',
-        'destroy_provisioning_templates',
-        'deploy_provisioning_templates',
-        'lock_provisioning_templates',
-    ],
-    'Realm': ['view_realms', 'create_realms', 'edit_realms', 'destroy_realms'],
-    'Remote execution feature': ['edit_remote_execution_features'],
-    'Report': ['view_reports', 'destroy_reports', 'upload_reports'],
-    'Role': ['view_roles', 'create_roles', 'edit_roles', 'destroy_roles'],
-    'Satellite openscap/arf report': [
-        'create_arf_reports',
-        'view_arf_reports',
-        'destroy_arf_reports',
-    ],
-    'Satellite openscap/policy': [
-        'view_policies',
-        'edit_policies',
-        'create_policies',
-        'destroy_policies',
-        'assign_policies',
-    ],
-    'Satellite openscap/scap content': [
-        'create_scap_contents',
-        'destroy_scap_contents',
-        'edit_scap_contents',
-        'view_scap_contents',
-    ],
-    'Satellite openscap/tailoring file': [
-        "create_tailoring_files",
-        "view_tailoring_files",
-        "edit_tailoring_files",
-        "destroy_tailoring_files",
-    ],
-    'Satellite tasks/recurring logic': [
-        'create_recurring_logics',
-        'view_recurring_logics',
-        'edit_recurring_logics',
-    ],
-    'Satellite tasks/task': ['view_foreman_tasks', 'edit_foreman_tasks'],
-    'Satellite virt who configure/config': [
-        "view_virt_who_config",
-        "create_virt_who_config",
-        "edit_virt_who_config",
-        "destroy_virt_who_config",
-    ],
-    'Ssh key': ["view_ssh_keys", "create_ssh_keys", "destroy_ssh_keys"],
-    'Subnet': [
-        'view_subnets',
-        'create_subnets',
-        'edit_subnets',
-        'destroy_subnets',
-        'import_subnets',
-    ],
-    'Subscription': [
-        'view_subscriptions',
-        'attach_subscriptions',
-        'unattach_subscriptions',
-        'import_manifest',
-        'delete_manifest',
-        'manage_subscription_allocations',
-    ],
-    'Sync Plans': [
-        'view_sync_plans',
-        'create_sync_plans',
-        'edit_sync_plans',
-        'destroy_sync_plans',
-        'sync_sync_plans',
-    ],
-    'Template invocation': [
-        'view_template_invocations',
-        'create_template_invocations',
-        'filter_autocompletion_for_template_invocation',
-    ],
-    'User': ['view_users', 'create_users', 'edit_users', 'destroy_users'],
-    'Usergroup': ['view_usergroups', 'create_usergroups', 'edit_usergroups', 'destroy_usergroups'],
-}
-
 
 ANY_CONTEXT = {'org': "Any organization", 'location': "Any location"}
 
@@ -2053,7 +762,7 @@ ROLES_LOCKED = [
     'Viewer',
 ]
 
-BOOKMARK_ENTITIES_SELECTION = [
+_BOOKMARK_ENTITIES_SELECTION = [
     {
         'name': 'ActivationKey',
         'controller': 'katello_activation_keys',
@@ -2064,13 +773,13 @@ BOOKMARK_ENTITIES_SELECTION = [
     {
         'name': 'UserGroup',
         'controller': 'usergroups',
-        'setup': entities.UserGroup,
+        'setup': 'UserGroup',
         'session_name': 'usergroup',
     },
     {
         'name': 'PartitionTable',
         'controller': 'ptables',
-        'setup': entities.PartitionTable,
+        'setup': 'PartitionTable',
         'session_name': 'partitiontable',
     },
     {
@@ -2115,6 +824,7 @@ MAINTAIN_HAMMER_YML = "/etc/foreman-maintain/foreman-maintain-hammer.yml"
 SATELLITE_MAINTAIN_YML = "/etc/foreman-maintain/foreman_maintain.yml"
 FOREMAN_SETTINGS_YML = '/etc/foreman/settings.yaml'
 PODMAN_AUTHFILE_PATH = '/etc/foreman/registry-auth.json'
+CONTENT_HOST_BASELINE_PATH = '/var/lib/robottelo/baseline'
 
 FOREMAN_TEMPLATE_IMPORT_URL = 'https://github.com/SatelliteQE/foreman_templates.git'
 FOREMAN_TEMPLATES_IMPORT_COUNT = {
@@ -2213,216 +923,6 @@ RHSSO_RESET_PASSWORD = {"temporary": "false", "type": "password", "value": ""}
 
 LOGIN_DELEGATION_LOGOUT_URL = "https://theforeman.org/"
 
-FOREMAN_ANSIBLE_MODULES = [
-    "activation_key",
-    "architecture",
-    "auth_source_ldap",
-    "bookmark",
-    "compute_attribute",
-    "compute_profile",
-    "compute_resource",
-    "config_group",
-    "content_credential",
-    "content_export_info",
-    "content_export_library",
-    "content_export_repository",
-    "content_export_version",
-    "content_import_info",
-    "content_import_library",
-    "content_import_repository",
-    "content_import_version",
-    "content_upload",
-    "content_view_filter",
-    "content_view_filter_info",
-    "content_view_filter_rule",
-    "content_view_filter_rule_info",
-    "content_view_history_info",
-    "content_view_info",
-    "content_view",
-    "content_view_version_info",
-    "content_view_version",
-    "discovery_rule",
-    "domain_info",
-    "domain",
-    "external_usergroup",
-    "flatpak_remote",
-    "flatpak_remote_repository_mirror",
-    "flatpak_remote_scan",
-    "global_parameter",
-    "hardware_model",
-    "host_collection",
-    "host_errata_info",
-    "hostgroup_info",
-    "hostgroup",
-    "host_info",
-    "host_power",
-    "host",
-    "http_proxy",
-    "image",
-    "installation_medium",
-    "job_invocation",
-    "job_template",
-    "lifecycle_environment",
-    "location",
-    "operatingsystem",
-    "organization",
-    "organization_info",
-    "os_default_template",
-    "partition_table",
-    "product",
-    "provisioning_template",
-    "puppetclasses_import",
-    "puppet_environment",
-    "realm",
-    "redhat_manifest",
-    "registration_command",
-    "repository_info",
-    "repository",
-    "repository_set_info",
-    "repository_set",
-    "repository_sync",
-    "resource_info",
-    "role",
-    "scap_content",
-    "scap_tailoring_file",
-    "setting_info",
-    "setting",
-    "smart_class_parameter",
-    "smart_class_parameter_override_value",
-    "smart_proxy",
-    "smart_proxy_refresh",
-    "status_info",
-    "subnet_info",
-    "subnet",
-    "subscription_info",
-    "subscription_manifest",
-    "sync_plan",
-    "templates_import",
-    "usergroup",
-    "user",
-    "wait_for_task",
-    "webhook",
-]
-
-FAM_TEST_PLAYBOOKS = [
-    "activation_keys_role",
-    "activation_key",
-    "architecture",
-    "auth_source_ldap",
-    "auth_sources_ldap_role",
-    "bookmark",
-    "compute_attribute",
-    "compute_profiles_role",
-    "compute_profile",
-    "compute_resources_role",
-    "compute_resource",
-    "config_group",
-    "content_credentials_role",
-    "content_credential",
-    "content_export_info",
-    "content_export_library",
-    "content_export_repository",
-    "content_export_version",
-    "content_import_info",
-    "content_import_library",
-    "content_import_repository",
-    "content_import_version",
-    "content_rhel_role",
-    "content_upload",
-    "content_view_filter_info",
-    "content_view_filter_rule_info",
-    "content_view_filter_rule",
-    "content_view_filter",
-    "content_view_history_info",
-    "content_view_info",
-    "content_view_publish_role",
-    "content_views_role",
-    "content_view_version_cleanup_role",
-    "content_view_version_info",
-    "content_view_version",
-    "content_view",
-    "convert2rhel",
-    "discovery_rule",
-    "domain_info",
-    "domains_role",
-    "domain",
-    "external_usergroup",
-    "filters",
-    "flatpak_remote",
-    "flatpak_remote_repository_mirror",
-    "flatpak_remote_scan",
-    "global_parameter",
-    "hardware_model",
-    "host_collection",
-    "host_errata_info",
-    "hostgroup_info",
-    "hostgroups_role",
-    "hostgroup",
-    "host_info",
-    "host_interface_attributes",
-    "host_power",
-    "host",
-    "http_proxy",
-    "image",
-    "installation_medium",
-    "job_invocation",
-    "job_template",
-    "katello_hostgroup",
-    "katello_smart_proxy",
-    "lifecycle_environments_role",
-    "lifecycle_environment",
-    "locations_role",
-    "location",
-    "luna_hostgroup",
-    "manifest_role",
-    "module_defaults",
-    "operatingsystems_role",
-    "operatingsystem",
-    "organization_info",
-    "organizations_role",
-    "organization",
-    "os_default_template",
-    "partition_table",
-    "product",
-    "provisioning_templates_role",
-    "provisioning_template",
-    "puppetclasses_import",
-    "puppet_environment",
-    "realm",
-    "redhat_manifest",
-    "registration_command",
-    "repositories_role",
-    "repository_info",
-    "repository_set_info",
-    "repository_set",
-    "repository_sync",
-    "repository",
-    "resource_info",
-    "role",
-    "scap_content",
-    "scap_tailoring_file",
-    "setting_info",
-    "settings_role",
-    "setting",
-    "smart_class_parameter_override_value",
-    "smart_class_parameter",
-    "smart_proxy",
-    "smart_proxy_refresh",
-    "status_info",
-    "subnet_info",
-    "subnets_role",
-    "subnet",
-    "subscription_info",
-    "subscription_manifest",
-    "sync_plans_role",
-    "sync_plan",
-    "templates_import",
-    "usergroup",
-    "user",
-    "wait_for_task",
-    "webhook",
-]
-
 # randomly selected subset of FAM_TEST_PLAYBOOKS to be run in IDM tests
 FAM_IDM_TEST_PLAYBOOKS = ['activation_key', 'content_view', 'job_invocation']
 
@@ -2618,3 +1118,45 @@ class DataFile(Box):
     EXPIRED_MANIFEST_FILE = DATA_DIR.joinpath(EXPIRED_MANIFEST)
     USAGE_REPORT_ITEMS = DATA_DIR.joinpath('usage_report.yml')
     USAGE_REPORT_ITEMS_CONDENSED = DATA_DIR.joinpath('usage_report_condensed.yml')
+
+
+# large tables living in submodules, by name, loaded on first access
+_LAZY_CONSTANTS = {
+    'REPOSET': 'rh_repos',
+    'REPOS': 'rh_repos',
+    'BULK_REPO_LIST': 'rh_repos',
+    'DISTRO_REPOS': 'rh_repos',
+    'PULP_HREF_PRN_MAP': 'pulp',
+    'PULP_PRN_TABLES': 'pulp',
+    'PERMISSIONS': 'permissions',
+    'PERMISSIONS_UI': 'permissions',
+    'FOREMAN_ANSIBLE_MODULES': 'foreman_ansible',
+    'FAM_TEST_PLAYBOOKS': 'foreman_ansible',
+}
+
+
+def __getattr__(name):
+    """Load the large tables and the constants referring to nailgun entities on first access.
+
+    Most users of this module need neither the large tables nor ``nailgun.entities``, which is
+    slow to import.
+    """
+    if submodule := _LAZY_CONSTANTS.get(name):
+        globals()[name] = getattr(import_module(f'{__name__}.{submodule}'), name)
+        return globals()[name]
+    if name not in ('OPERATING_SYSTEMS', 'BOOKMARK_ENTITIES_SELECTION'):
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    from nailgun import entities
+
+    globals()['OPERATING_SYSTEMS'] = entities._OPERATING_SYSTEMS
+    globals()['BOOKMARK_ENTITIES_SELECTION'] = [
+        entity | {'setup': getattr(entities, entity['setup'])} if 'setup' in entity else entity
+        for entity in _BOOKMARK_ENTITIES_SELECTION
+    ]
+    return globals()[name]
+
+
+def __dir__():
+    return sorted(
+        {*globals(), *_LAZY_CONSTANTS, 'OPERATING_SYSTEMS', 'BOOKMARK_ENTITIES_SELECTION'}
+    )
@@ -0,0 +1,211 @@
+"""Foreman Ansible modules, loaded on first access of ``robottelo.constants``"""
+
+FOREMAN_ANSIBLE_MODULES = [
+    "activation_key",
+    "architecture",
+    "auth_source_ldap",
+    "bookmark",
+    "compute_attribute",
+    "compute_profile",
+    "compute_resource",
+    "config_group",
+    "content_credential",
+    "content_export_info",
+    "content_export_library",
+    "content_export_repository",
+    "content_export_version",
+    "content_import_info",
+    "content_import_library",
+    "content_import_repository",
+    "content_import_version",
+    "content_upload",
+    "content_view_filter",
+    "content_view_filter_info",
+    "content_view_filter_rule",
+    "content_view_filter_rule_info",
+    "content_view_history_info",
+    "content_view_info",
+    "content_view",
+    "content_view_version_info",
+    "content_view_version",
+    "discovery_rule",
+    "domain_info",
+    "domain",
+    "external_usergroup",
+    "flatpak_remote",
+    "flatpak_remote_repository_mirror",
+    "flatpak_remote_scan",
+    "global_parameter",
+    "hardware_model",
+    "host_collection",
+    "host_errata_info",
+    "hostgroup_info",
+    "hostgroup",
+    "host_info",
+    "host_power",
+    "host",
+    "http_proxy",
+    "image",
+    "installation_medium",
+    "job_invocation",
+    "job_template",
+    "lifecycle_environment",
+    "location",
+    "operatingsystem",
+    "organization",
+    "organization_info",
+    "os_default_template",
+    "partition_table",
+    "product",
+    "provisioning_template",
+    "puppetclasses_import",
+    "puppet_environment",
+    "realm",
+    "redhat_manifest",
+    "registration_command",
+    "repository_info",
+    "repository",
+    "repository_set_info",
+    "repository_set",
+    "repository_sync",
+    "resource_info",
+    "role",
+    "scap_content",
+    "scap_tailoring_file",
+    "setting_info",
+    "setting",
+    "smart_class_parameter",
+    "smart_class_parameter_override_value",
+    "smart_proxy",
+    "smart_proxy_refresh",
+    "status_info",
+    "subnet_info",
+    "subnet",
+    "subscription_info",
+    "subscription_manifest",
+    "sync_plan",
+    "templates_import",
+    "usergroup",
+    "user",
+    "wait_for_task",
+    "webhook",
+]
+
+FAM_TEST_PLAYBOOKS = [
+    "activation_keys_role",
+    "activation_key",
+    "architecture",
+    "auth_source_ldap",
+    "auth_sources_ldap_role",
+    "bookmark",
+    "compute_attribute",
+    "compute_profiles_role",
+    "compute_profile",
+    "compute_resources_role",
+    "compute_resource",
+    "config_group",
+    "content_credentials_role",
+    "content_credential",
+    "content_export_info",
+    "content_export_library",
+    "content_export_repository",
+    "content_export_version",
+    "content_import_info",
+    "content_import_library",
+    "content_import_repository",
+    "content_import_version",
+    "content_rhel_role",
+    "content_upload",
+    "content_view_filter_info",
+    "content_view_filter_rule_info",
+    "content_view_filter_rule",
+    "content_view_filter",
+    "content_view_history_info",
+    "content_view_info",
+    "content_view_publish_role",
+    "content_views_role",
+    "content_view_version_cleanup_role",
+    "content_view_version_info",
+    "content_view_version",
+    "content_view",
+    "convert2rhel",
+    "discovery_rule",
+    "domain_info",
+    "domains_role",
+    "domain",
+    "external_usergroup",
+    "filters",
+    "flatpak_remote",
+    "flatpak_remote_repository_mirror",
+    "flatpak_remote_scan",
+    "global_parameter",
+    "hardware_model",
+    "host_collection",
+    "host_errata_info",
+    "hostgroup_info",
+    "hostgroups_role",
+    "hostgroup",
+    "host_info",
+    "host_interface_attributes",
+    "host_power",
+    "host",
+    "http_proxy",
+    "image",
+    "installation_medium",
+    "job_invocation",
+    "job_template",
+    "katello_hostgroup",
+    "katello_smart_proxy",
+    "lifecycle_environments_role",
+    "lifecycle_environment",
+    "locations_role",
+    "location",
+    "luna_hostgroup",
+    "manifest_role",
+    "module_defaults",
+    "operatingsystems_role",
+    "operatingsystem",
+    "organization_info",
+    "organizations_role",
+    "organization",
+    "os_default_template",
+    "partition_table",
+    "product",
+    "provisioning_templates_role",
+    "provisioning_template",
+    "puppetclasses_import",
+    "puppet_environment",
+    "realm",
+    "redhat_manifest",
+    "registration_command",
+    "repositories_role",
+    "repository_info",
+    "repository_set_info",
+    "repository_set",
+    "repository_sync",
+    "repository",
+    "resource_info",
+    "role",
+    "scap_content",
+    "scap_tailoring_file",
+    "setting_info",
+    "settings_role",
+    "setting",
+    "smart_class_parameter_override_value",
+    "smart_class_parameter",
+    "smart_proxy",
+    "smart_proxy_refresh",
+    "status_info",
+    "subnet_info",
+    "subnets_role",
+    "subnet",
+    "subscription_info",
+    "subscription_manifest",
+    "sync_plans_role",
+    "sync_plan",
+    "templates_import",
+    "usergroup",
+    "user",
+    "wait_for_task",
+    "webhook",
+]
@@ -0,0 +1,755 @@
+"""Permissions exposed by the server, loaded on first access of ``robottelo.constants``"""
+
+#: All permissions exposed by the server.
+#: :mod:`tests.foreman.api.test_permission` makes use of this.
+PERMISSIONS = {
+    None: [
+        'access_dashboard',
+        'create_arf_reports',
+        'create_recurring_logics',
+        'destroy_arf_reports',
+        'destroy_config_reports',
+        'download_bootdisk',
+        'edit_recurring_logics',
+        'escalate_roles',
+        'generate_ansible_inventory',
+        'my_organizations',
+        'upload_config_reports',
+        'view_arf_reports',
+        'view_config_reports',
+        'view_plugins',
+        'view_recurring_logics',
+        'view_statuses',
+        'generate_foreman_rh_cloud',
+        'forget_status_hosts',
+        'edit_user_mail_notifications',
+        'destroy_vm_compute_resources',
+        'power_vm_compute_resources',
+        'view_foreman_rh_cloud',
+        'import_ansible_playbooks',
+        'dispatch_cloud_requests',
+        'control_organization_insights',
+        'view_statistics',
+        'upload_monitoring_results',
+    ],
+    'AnsibleRole': ['view_ansible_roles', 'destroy_ansible_roles', 'import_ansible_roles'],
+    'AnsibleVariable': [
+        'edit_ansible_variables',
+        'view_ansible_variables',
+        'import_ansible_variables',
+        'destroy_ansible_variables',
+        'create_ansible_variables',
+    ],
+    'Architecture': [
+        'view_architectures',
+        'create_architectures',
+        'edit_architectures',
+        'destroy_architectures',
+    ],
+    'Audit': ['view_audit_logs'],
+    'AuthSource': [
+        'view_authenticators',
+        'create_authenticators',
+        'edit_authenticators',
+        'destroy_authenticators',
+    ],
+    'Bookmark': ['create_bookmarks', 'edit_bookmarks', 'destroy_bookmarks'],
+    'ComputeProfile': [
+        'view_compute_profiles',
+        'create_compute_profiles',
+        'edit_compute_profiles',
+        'destroy_compute_profiles',
+    ],
+    'ComputeResource': [
+        'view_compute_resources',
+        'create_compute_resources',
+        'edit_compute_resources',
+        'destroy_compute_resources',
+        'view_compute_resources_vms',
+        'create_compute_resources_vms',
+        'edit_compute_resources_vms',
+        'destroy_compute_resources_vms',
+        'power_compute_resources_vms',
+        'console_compute_resources_vms',
+        'destroy_vm_compute_resources',
+        'power_vm_compute_resources',
+    ],
+    'DiscoveryRule': [
+        'create_discovery_rules',
+        'destroy_discovery_rules',
+        'edit_discovery_rules',
+        'execute_discovery_rules',
+        'view_discovery_rules',
+    ],
+    'Domain': ['view_domains', 'create_domains', 'edit_domains', 'destroy_domains'],
+    'ExternalUsergroup': [
+        'view_external_usergroups',
+        'create_external_usergroups',
+        'edit_external_usergroups',
+        'destroy_external_usergroups',
+    ],
+    'FactValue': ['view_facts', 'upload_facts'],
+    'Filter': [
+        'view_filters',
+        'create_filters',
+        'edit_filters',
+        'destroy_filters',
+    ],
+    'ForemanAnsibleDirector::AnsibleContentAssignment': [
+        'create_ansible_assignments',
+        'destroy_ansible_assignments',
+        'view_ansible_assignments',
+    ],
+    'ForemanAnsibleDirector::ContentUnit': [
+        'create_ansible_content',
+        'destroy_ansible_content',
+        'view_ansible_content',
+    ],
+    'ForemanAnsibleDirector::ExecutionEnvironment': [
+        'create_ansible_execution_environments',
+        'destroy_ansible_execution_environments',
+        'edit_ansible_execution_environments',
+        'view_ansible_execution_environments',
+    ],
+    'ForemanAnsibleDirector::LifecycleEnvironment': [
+        'create_ansible_lifecycle_environments',
+        'destroy_ansible_lifecycle_environments',
+        'edit_ansible_lifecycle_environments',
+        'view_ansible_lifecycle_environments',
+    ],
+    'ForemanAnsibleDirector::LifecycleEnvironmentPath': [
+        'create_ansible_lifecycle_environment_paths',
+        'destroy_ansible_lifecycle_environment_paths',
+        'edit_ansible_lifecycle_environment_paths',
+        'promote_ansible_lifecycle_environment_paths',
+        'view_ansible_lifecycle_environment_paths',
+    ],
+    'ForemanResourceQuota::ResourceQuota': [
+        "destroy_resource_quotas",
+        "create_resource_quotas",
+        "view_resource_quotas",
+        "edit_resource_quotas",
+    ],
+    'ForemanSalt::SaltVariable': [
+        'edit_salt_variables',
+        'destroy_salt_variables',
+        'create_salt_variables',
+        'view_salt_variables',
+    ],
+    'ForemanSalt::SaltEnvironment': [
+        'edit_salt_environments',
+        'create_salt_environments',
+        'destroy_salt_environments',
+        'view_salt_environments',
+    ],
+    'ForemanSalt::SaltModule': [
+        'import_salt_modules',
+        'create_salt_modules',
+        'edit_salt_modules',
+        'view_salt_modules',
+        'destroy_salt_modules',
+    ],
+    'ForemanStatistics::Trend': [
+        'create_trends',
+        'view_trends',
+        'edit_trends',
+        'update_trends',
+        'destroy_trends',
+    ],
+    'ForemanTasks::RecurringLogic': [
+        'create_recurring_logics',
+        'view_recurring_logics',
+        'edit_recurring_logics',
+    ],
+    'ForemanOpenscap::ArfReport': [
+        'create_arf_reports',
+        'view_arf_reports',
+        'destroy_arf_reports',
+    ],
+    'ForemanOpenscap::Policy': [
+        'assign_policies',
+        'create_policies',
+        'destroy_policies',
+        'edit_policies',
+        'view_policies',
+    ],
+    'ForemanOpenscap::ScapContent': [
+        'create_scap_contents',
+        'destroy_scap_contents',
+        'edit_scap_contents',
+        'view_scap_contents',
+    ],
+    'ForemanRhCloud': [
+        'view_vulnerability',
+        'edit_vulnerability',
+        'view_advisor',
+        'edit_advisor',
+    ],
+    'ForemanTasks::Task': ['edit_foreman_tasks', 'view_foreman_tasks'],
+    'JobInvocation': [
+        'view_job_invocations',
+        'create_job_invocations',
+        'cancel_job_invocations',
+        'execute_jobs_on_infrastructure_hosts',
+    ],
+    'JobTemplate': [
+        'view_job_templates',
+        'edit_job_templates',
+        'destroy_job_templates',
+        'create_job_templates',
+        'lock_job_templates',
+    ],
+    'ConfigReport': ['destroy_config_reports', 'view_config_reports', 'upload_config_reports'],
+    'ForemanVirtWhoConfigure::Config': [
+        "view_virt_who_config",
+        "create_virt_who_config",
+        "edit_virt_who_config",
+        "destroy_virt_who_config",
+    ],
+    "ForemanOpenscap::TailoringFile": [
+        "create_tailoring_files",
+        "view_tailoring_files",
+        "edit_tailoring_files",
+        "destroy_tailoring_files",
+    ],
+    'Hostgroup': [
+        'view_hostgroups',
+        'create_hostgroups',
+        'edit_hostgroups',
+        'destroy_hostgroups',
+        'play_roles_on_hostgroup',
+    ],
+    'ForemanPuppet::ConfigGroup': [
+        'view_config_groups',
+        'create_config_groups',
+        'edit_config_groups',
+        'destroy_config_groups',
+    ],
+    'ForemanPuppet::Environment': [
+        'view_environments',
+        'create_environments',
+        'edit_environments',
+        'destroy_environments',
+        'import_environments',
+    ],
+    'ForemanPuppet::HostClass': [
+        'edit_classes',
+    ],
+    'ForemanPuppet::Puppetclass': [
+        'view_puppetclasses',
+        'create_puppetclasses',
+        'edit_puppetclasses',
+        'destroy_puppetclasses',
+        'import_puppetclasses',
+    ],
+    'ForemanPuppet::PuppetclassLookupKey': [
+        'view_external_parameters',
+        'create_external_parameters',
+        'edit_external_parameters',
+        'destroy_external_parameters',
+    ],
+    'HttpProxy': [
+        'view_http_proxies',
+        'create_http_proxies',
+        'edit_http_proxies',
+        'destroy_http_proxies',
+    ],
+    'Image': ['view_images', 'create_images', 'edit_images', 'destroy_images'],
+    'InsightsHit': ['view_insights_hits'],
+    'Katello::AlternateContentSource': [
+        'create_alternate_content_sources',
+        'edit_alternate_content_sources',
+        'destroy_alternate_content_sources',
+        'view_alternate_content_sources',
+    ],
+    'Katello::FlatpakRemote': [
+        'view_flatpak_remotes',
+        'create_flatpak_remotes',
+        'edit_flatpak_remotes',
+        'destroy_flatpak_remotes',
+    ],
+    'KeyPair': ["view_keypairs", "destroy_keypairs"],
+    'Location': [
+        'view_locations',
+        'create_locations',
+        'edit_locations',
+        'destroy_locations',
+        'assign_locations',
+    ],
+    'LookupValue': [
+        'edit_lookup_values',
+        'create_lookup_values',
+        'destroy_lookup_values',
+        'view_lookup_values',
+        'destroy_ansible_variable_overrides',
+        'edit_ansible_variable_overrides',
+        'create_ansible_variable_overrides',
+        'view_ansible_variable_overrides',
+    ],
+    'MailNotification': ['view_mail_notifications', 'edit_user_mail_notifications'],
+    'Medium': ['view_media', 'create_media', 'edit_media', 'destroy_media'],
+    'Model': ['view_models', 'create_models', 'edit_models', 'destroy_models'],
+    'Operatingsystem': [
+        'view_operatingsystems',
+        'create_operatingsystems',
+        'edit_operatingsystems',
+        'destroy_operatingsystems',
+    ],
+    'Parameter': ['view_params', 'create_params', 'edit_params', 'destroy_params'],
+    'PersonalAccessToken': [
+        'view_personal_access_tokens',
+        'create_personal_access_tokens',
+        'revoke_personal_access_tokens',
+    ],
+    'ProvisioningTemplate': [
+        'view_provisioning_templates',
+        'create_provisioning_templates',
+        'edit_provisioning_templates',
+        'destroy_provisioning_templates',
+        'deploy_provisioning_templates',
+        'lock_provisioning_templates',
+    ],
+    'Ptable': [
+        'view_ptables',
+        'create_ptables',
+        'edit_ptables',
+        'destroy_ptables',
+        'lock_ptables',
+    ],
+    'Realm': ['view_realms', 'create_realms', 'edit_realms', 'destroy_realms'],
+    'RemoteExecutionFeature': ['view_remote_execution_features', 'edit_remote_execution_features'],
+    'ReportTemplate': [
+        'edit_report_templates',
+        'destroy_report_templates',
+        'generate_report_templates',
+        'create_report_templates',
+        'view_report_templates',
+        'lock_report_templates',
+    ],
+    'Role': ['view_roles', 'create_roles', 'edit_roles', 'destroy_roles'],
+    'Report': ['create_reports'],
+    'SccAccount': [
+        "delete_scc_accounts",
+        "edit_scc_accounts",
+        "new_scc_accounts",
+        "sync_scc_accounts",
+        "test_connection_scc_accounts",
+        "use_scc_accounts",
+        "view_scc_accounts",
+    ],
+    'SccProduct': [
+        "subscribe_scc_products",
+        "view_scc_products",
+    ],
+    'Setting': ['view_settings', 'edit_settings'],
+    'SmartProxy': [
+        'view_smart_proxies',
+        'create_smart_proxies',
+        'edit_smart_proxies',
+        'destroy_smart_proxies',
+        'view_smart_proxies_autosign',
+        'create_smart_proxies_autosign',
+        'destroy_smart_proxies_autosign',
+        'view_smart_proxies_puppetca',
+        'edit_smart_proxies_puppetca',
+        'destroy_smart_proxies_puppetca',
+        'manage_capsule_content',
+        'view_capsule_content',
+        'view_openscap_proxies',
+        'destroy_smart_proxies_salt_autosign',
+        'view_smart_proxies_salt_autosign',
+        'destroy_smart_proxies_salt_keys',
+        'view_smart_proxies_salt_keys',
+        'edit_smart_proxies_salt_keys',
+        'auth_smart_proxies_salt_autosign',
+        'create_smart_proxies_salt_autosign',
+    ],
+    'SshKey': ["view_ssh_keys", "create_ssh_keys", "destroy_ssh_keys"],
+    'Subnet': [
+        'view_subnets',
+        'create_subnets',
+        'edit_subnets',
+        'destroy_subnets',
+        'import_subnets',
+    ],
+    'Template': ['export_templates', 'import_templates', 'view_template_syncs'],
+    'TemplateInvocation': [
+        'filter_autocompletion_for_template_invocation',
+        'create_template_invocations',
+        'view_template_invocations',
+    ],
+    'Usergroup': ['view_usergroups', 'create_usergroups', 'edit_usergroups', 'destroy_usergroups'],
+    'User': ['view_users', 'create_users', 'edit_users', 'destroy_users'],
+    'Webhook': [
+        'create_webhooks',
+        'destroy_webhooks',
+        'edit_webhooks',
+        'view_webhooks',
+    ],
+    'WebhookTemplate': [
+        'create_webhook_templates',
+        'destroy_webhook_templates',
+        'edit_webhook_templates',
+        'lock_webhook_templates',
+        'view_webhook_templates',
+    ],
+    'Host': [
+        'auto_provision_discovered_hosts',
+        'build_hosts',
+        'cockpit_hosts',
+        'console_hosts',
+        'create_hosts',
+        'destroy_discovered_hosts',
+        'destroy_hosts',
+        'edit_discovered_hosts',
+        'edit_hosts',
+        'ipmi_boot_hosts',
+        'play_roles_on_host',
+        'power_hosts',
+        'provision_discovered_hosts',
+        'submit_discovered_hosts',
+        'view_discovered_hosts',
+        'view_hosts',
+        'forget_status_hosts',
+        'saltrun_hosts',
+        'view_snapshots',
+        'create_snapshots',
+        'edit_snapshots',
+        'revert_snapshots',
+        'destroy_snapshots',
+        'view_monitoring_results',
+        'manage_downtime_hosts',
+    ],
+    'Katello::ActivationKey': [
+        'view_activation_keys',
+        'create_activation_keys',
+        'edit_activation_keys',
+        'destroy_activation_keys',
+    ],
+    'Katello::ContentView': [
+        'view_content_views',
+        'create_content_views',
+        'edit_content_views',
+        'destroy_content_views',
+        'publish_content_views',
+        'promote_or_remove_content_views',
+    ],
+    'Katello::ContentCredential': [
+        'create_content_credentials',
+        'destroy_content_credentials',
+        'edit_content_credentials',
+        'view_content_credentials',
+    ],
+    'Katello::HostCollection': [
+        'view_host_collections',
+        'create_host_collections',
+        'edit_host_collections',
+        'destroy_host_collections',
+    ],
+    'Katello::KTEnvironment': [
+        'view_lifecycle_environments',
+        'create_lifecycle_environments',
+        'edit_lifecycle_environments',
+        'destroy_lifecycle_environments',
+        'promote_or_remove_content_views_to_environments',
+    ],
+    'Katello::Product': [
+        'view_products',
+        'create_products',
+        'edit_products',
+        'destroy_products',
+        'sync_products',
+    ],
+    'Katello::Subscription': [
+        'view_subscriptions',
+        'attach_subscriptions',
+        'unattach_subscriptions',
+        'import_manifest',
+        'delete_manifest',
+        'manage_subscription_allocations',
+    ],
+    'Organization': [
+        'view_organizations',
+        'create_organizations',
+        'edit_organizations',
+        'destroy_organizations',
+        'assign_organizations',
+        'import_content',
+        'export_content',
+    ],
+    'Katello::SyncPlan': [
+        'view_sync_plans',
+        'create_sync_plans',
+        'edit_sync_plans',
+        'destroy_sync_plans',
+        'sync_sync_plans',
+    ],
+}
+
+PERMISSIONS_UI = {
+    '(Miscellaneous)': [
+        'access_dashboard',
+        'view_plugins',
+        'escalate_roles',
+        'view_statuses',
+        'generate_ansible_inventory',
+        'download_bootdisk',
+        'my_organizations',
+        'generate_foreman_rh_cloud',
+        'view_foreman_rh_cloud',
+        'dispatch_cloud_requests',
+    ],
+    'Activation Keys': [
+        'view_activation_keys',
+        'create_activation_keys',
+        'edit_activation_keys',
+        'destroy_activation_keys',
+    ],
+    'Architecture': [
+        'view_architectures',
+        'create_architectures',
+        'edit_architectures',
+        'destroy_architectures',
+    ],
+    'Audit': ['view_audit_logs'],
+    'Auth source': [
+        'view_authenticators',
+        'create_authenticators',
+        'edit_authenticators',
+        'destroy_authenticators',
+    ],
+    'Bookmark': ['create_bookmarks', 'edit_bookmarks', 'destroy_bookmarks'],
+    'Capsule': [
+        'view_smart_proxies',
+        'create_smart_proxies',
+        'edit_smart_proxies',
+        'destroy_smart_proxies',
+        'view_smart_proxies_autosign',
+        'create_smart_proxies_autosign',
+        'destroy_smart_proxies_autosign',
+        'view_smart_proxies_puppetca',
+        'edit_smart_proxies_puppetca',
+        'destroy_smart_proxies_puppetca',
+        'manage_capsule_content',
+        'view_capsule_content',
+        'view_openscap_proxies',
+    ],
+    'Compute profile': [
+        'view_compute_profiles',
+        'create_compute_profiles',
+        'edit_compute_profiles',
+        'destroy_compute_profiles',
+    ],
+    'Compute resource': [
+        'view_compute_resources',
+        'create_compute_resources',
+        'edit_compute_resources',
+        'destroy_compute_resources',
+        'power_vm_compute_resources',
+        'destroy_vm_compute_resources',
+        'view_compute_resources_vms',
+        'create_compute_resources_vms',
+        'edit_compute_resources_vms',
+        'destroy_compute_resources_vms',
+        'power_compute_resources_vms',
+        'console_compute_resources_vms',
+    ],
+    'Config report': ['view_config_reports', 'destroy_config_reports', 'upload_config_reports'],
+    'Content Views': [
+        'view_content_views',
+        'create_content_views',
+        'edit_content_views',
+        'destroy_content_views',
+        'publish_content_views',
+        'promote_or_remove_content_views',
+    ],
+    'Discovery rule': [
+        'view_discovery_rules',
+        'create_discovery_rules',
+        'edit_discovery_rules',
+        'execute_discovery_rules',
+        'destroy_discovery_rules',
+    ],
+    'Domain': ['view_domains', 'create_domains', 'edit_domains', 'destroy_domains'],
+    'External usergroup': [
+        'view_external_usergroups',
+        'create_external_usergroups',
+        'edit_external_usergroups',
+        'destroy_external_usergroups',
+    ],
+    'Fact value': ['view_facts', 'upload_facts'],
+    'Filter': ['view_filters', 'create_filters', 'edit_filters', 'destroy_filters'],
+    'Host': [
+        'view_hosts',
+        'create_hosts',
+        'edit_hosts',
+        'destroy_hosts',
+        'build_hosts',
+        'power_hosts',
+        'console_hosts',
+        'ipmi_boot_hosts',
+        'forget_status_hosts',
+        'cockpit_hosts',
+        'play_roles_on_host',
+        'view_discovered_hosts',
+        'submit_discovered_hosts',
+        'auto_provision_discovered_hosts',
+        'provision_discovered_hosts',
+        'edit_discovered_hosts',
+        'destroy_discovered_hosts',
+    ],
+    'Host Collections': [
+        'view_host_collections',
+        'create_host_collections',
+        'edit_host_collections',
+        'destroy_host_collections',
+    ],
+    'Host Group': [
+        'view_hostgroups',
+        'create_hostgroups',
+        'edit_hostgroups',
+        'destroy_hostgroups',
+        'play_roles_on_hostgroup',
+    ],
+    'Host сlass': ['edit_classes'],
+    'Image': ['view_images', 'create_images', 'edit_images', 'destroy_images'],
+    'Job invocation': [
+        'create_job_invocations',
+        'view_job_invocations',
+        'execute_jobs_on_infrastructure_hosts',
+        'cancel_job_invocations',
+    ],
+    'Job template': [
+        'view_job_templates',
+        'create_job_templates',
+        'edit_job_templates',
+        'destroy_job_templates',
+        'lock_job_templates',
+    ],
+    'Key pair': ["view_keypairs", "destroy_keypairs"],
+    'Lifecycle Environment': [
+        'view_lifecycle_environments',
+        'create_lifecycle_environments',
+        'edit_lifecycle_environments',
+        'destroy_lifecycle_environments',
+        'promote_or_remove_content_views_to_environments',
+    ],
+    'Location': [
+        'view_locations',
+        'create_locations',
+        'edit_locations',
+        'destroy_locations',
+        'assign_locations',
+    ],
+    'Mail notification': ['view_mail_notifications', 'edit_user_mail_notifications'],
+    'Medium': ['view_media', 'create_media', 'edit_media', 'destroy_media'],
+    'Model': ['view_models', 'create_models', 'edit_models', 'destroy_models'],
+    'Operatingsystem': [
+        'view_operatingsystems',
+        'create_operatingsystems',
+        'edit_operatingsystems',
+        'destroy_operatingsystems',
+    ],
+    'Organization': [
+        'view_organizations',
+        'create_organizations',
+        'edit_organizations',
+        'destroy_organizations',
+        'assign_organizations',
+        'import_content',
+        'export_content',
+    ],
+    'Parameter': ['view_params', 'create_params', 'edit_params', 'destroy_params'],
+    'Ptable': [
+        'view_ptables',
+        'create_ptables',
+        'edit_ptables',
+        'destroy_ptables',
+        'lock_ptables',
+    ],
+    'Product and Repositories': [
+        'view_products',
+        'create_products',
+        'edit_products',
+        'destroy_products',
+        'sync_products',
+    ],
+    'Provisioning template': [
+        'view_provisioning_templates',
+        'create_provisioning_templates',
+        'edit_provisioning_templates',
+        'destroy_provisioning_templates',
+        'deploy_provisioning_templates',
+        'lock_provisioning_templates',
+    ],
+    'Realm': ['view_realms', 'create_realms', 'edit_realms', 'destroy_realms'],
+    'Remote execution feature': ['edit_remote_execution_features'],
+    'Report': ['view_reports', 'destroy_reports', 'upload_reports'],
+    'Role': ['view_roles', 'create_roles', 'edit_roles', 'destroy_roles'],
+    'Satellite openscap/arf report': [
+        'create_arf_reports',
+        'view_arf_reports',
+        'destroy_arf_reports',
+    ],
+    'Satellite openscap/policy': [
+        'view_policies',
+        'edit_policies',
+        'create_policies',
+        'destroy_policies',
+        'assign_policies',
+    ],
+    'Satellite openscap/scap content': [
+        'create_scap_contents',
+        'destroy_scap_contents',
+        'edit_scap_contents',
+        'view_scap_contents',
+    ],
+    'Satellite openscap/tailoring file': [
+        "create_tailoring_files",
+        "view_tailoring_files",
+        "edit_tailoring_files",
+        "destroy_tailoring_files",
+    ],
+    'Satellite tasks/recurring logic': [
+        'create_recurring_logics',
+        'view_recurring_logics',
+        'edit_recurring_logics',
+    ],
+    'Satellite tasks/task': ['view_foreman_tasks', 'edit_foreman_tasks'],
+    'Satellite virt who configure/config': [
+        "view_virt_who_config",
+        "create_virt_who_config",
+        "edit_virt_who_config",
+        "destroy_virt_who_config",
+    ],
+    'Ssh key': ["view_ssh_keys", "create_ssh_keys", "destroy_ssh_keys"],
+    'Subnet': [
+        'view_subnets',
+        'create_subnets',
+        'edit_subnets',
+        'destroy_subnets',
+        'import_subnets',
+    ],
+    'Subscription': [
+        'view_subscriptions',
+        'attach_subscriptions',
+        'unattach_subscriptions',
+        'import_manifest',
+        'delete_manifest',
+        'manage_subscription_allocations',
+    ],
+    'Sync Plans': [
+        'view_sync_plans',
+        'create_sync_plans',
+        'edit_sync_plans',
+        'destroy_sync_plans',
+        'sync_sync_plans',
+    ],
+    'Template invocation': [
+        'view_template_invocations',
+        'create_template_invocations',
+        'filter_autocompletion_for_template_invocation',
+    ],
+    'User': ['view_users', 'create_users', 'edit_users', 'destroy_users'],
+    'Usergroup': ['view_usergroups', 'create_usergroups', 'edit_usergroups', 'destroy_usergroups'],
+}
@@ -0,0 +1,458 @@
+"""Red Hat repository sets and repositories, loaded on first access of ``robottelo.constants``"""
+
+from robottelo.constants import PRDS, PRODUCT_KEY_SAT_CLIENT
+
+REPOSET = {
+    'rhct6': 'Red Hat CloudForms Tools for RHEL 6 (RPMs)',
+    'rhel6': 'Red Hat Enterprise Linux 6 Server (RPMs)',
+    'rhel7': 'Red Hat Enterprise Linux 7 Server (RPMs)',
+    'rhel7_els': 'Red Hat Enterprise Linux 7 Server - Extended Life Cycle Support (RPMs)',
+    'rhva6': ('Red Hat Enterprise Virtualization Agents for RHEL 6 Server (RPMs)'),
+    'rhs7': 'Red Hat Satellite 6.11 (for RHEL 7 Server) (RPMs)',
+    'rhs8': 'Red Hat Satellite 6.13 for RHEL 8 x86_64 (RPMs)',
+    'rhs9': 'Red Hat Satellite 6.16 for RHEL 9 x86_64 (RPMs)',
+    'rhsc8': 'Red Hat Satellite Capsule 6.16 for RHEL 8 x86_64 (RPMs)',
+    'rhsc9': 'Red Hat Satellite Capsule 6.16 for RHEL 9 x86_64 (RPMs)',
+    'rhsc7_iso': 'Red Hat Satellite Capsule 6.4 (for RHEL 7 Server) (ISOs)',
+    'rhsclient7': 'Red Hat Satellite Client 6 (for RHEL 7 Server) (RPMs)',
+    'rhsclient8': 'Red Hat Satellite Client 6 for RHEL 8 x86_64 (RPMs)',
+    'rhsclient9': 'Red Hat Satellite Client 6 for RHEL 9 x86_64 (RPMs)',
+    'rhsclient10': 'Red Hat Satellite Client 6 for RHEL 10 x86_64 (RPMs)',
+    'rhst7': 'Red Hat Satellite Tools 6.9 (for RHEL 7 Server) (RPMs)',
+    'rhst7_610': 'Red Hat Satellite Tools 6.10 (for RHEL 7 Server) (RPMs)',
+    'rhst6': 'Red Hat Satellite Tools 6.9 (for RHEL 6 Server) (RPMs)',
+    'rhaht': 'Red Hat Enterprise Linux Atomic Host (RPMs)',
+    'rhdt7': ('Red Hat Developer Tools RPMs for Red Hat Enterprise Linux 7 Server'),
+    'rhscl7': ('Red Hat Software Collections RPMs for Red Hat Enterprise Linux 7 Server'),
+    'rhae2': 'Red Hat Ansible Engine 2.9 RPMs for Red Hat Enterprise Linux 7 Server',
+    'rhae2.9_el8': 'Red Hat Ansible Engine 2.9 for RHEL 8 x86_64 (RPMs)',
+    'rhst8': 'Red Hat Satellite Tools 6.9 for RHEL 8 x86_64 (RPMs)',
+    'fdrh8': 'Fast Datapath for RHEL 8 x86_64 (RPMs)',
+    'kickstart': {
+        'rhel6': 'Red Hat Enterprise Linux 6 Server (Kickstart)',
+        'rhel7': 'Red Hat Enterprise Linux 7 Server (Kickstart)',
+        'rhel8_bos': 'Red Hat Enterprise Linux 8 for x86_64 - BaseOS (Kickstart)',
+        'rhel8_aps': 'Red Hat Enterprise Linux 8 for x86_64 - AppStream (Kickstart)',
+        'rhel9_bos': 'Red Hat Enterprise Linux 9 for x86_64 - BaseOS (Kickstart)',
+        'rhel9_aps': 'Red Hat Enterprise Linux 9 for x86_64 - AppStream (Kickstart)',
+        'rhel10_bos': 'Red Hat Enterprise Linux 10 for x86_64 - BaseOS (Kickstart)',
+        'rhel10_aps': 'Red Hat Enterprise Linux 10 for x86_64 - AppStream (Kickstart)',
+    },
+    'rhel8_bos': 'Red Hat Enterprise Linux 8 for x86_64 - BaseOS (RPMs)',
+    'rhel8_aps': 'Red Hat Enterprise Linux 8 for x86_64 - AppStream (RPMs)',
+    'rhel9_bos': 'Red Hat Enterprise Linux 9 for x86_64 - BaseOS (RPMs)',
+    'rhel9_aps': 'Red Hat Enterprise Linux 9 for x86_64 - AppStream (RPMs)',
+    'rhel10_bos': 'Red Hat Enterprise Linux 10 for x86_64 - BaseOS (RPMs)',
+    'rhel10_aps': 'Red Hat Enterprise Linux 10 for x86_64 - AppStream (RPMs)',
+    'rhel7_extra': 'Red Hat Enterprise Linux 7 Server - Extras (RPMs)',
+    'rhel7_optional': 'Red Hat Enterprise Linux 7 Server - Optional (RPMs)',
+    'rhel7_sup': 'Red Hat Enterprise Linux 7 Server - Supplementary (RPMs)',
+}
+
+REPOS = {
+    'rhel7': {
+        'id': 'rhel-7-server-rpms',
+        'name': 'Red Hat Enterprise Linux 7 Server RPMs x86_64 7Server',
+        'releasever': '7Server',
+        'arch': 'x86_64',
+        'distro': 'rhel7',
+        'reposet': REPOSET['rhel7'],
+        'product': PRDS['rhel'],
+        'major_version': 7,
+        'distro_repository': True,
+        'key': 'rhel',
+        'version': '7.9',
+        'basearch': 'x86_64',
+    },
+    'rhel7_els': {
+        'id': 'rhel-7-server-els-rpms',
+        'name': 'Red Hat Enterprise Linux 7 Server - Extended Life Cycle Support RPMs x86_64',
+        'releasever': '7Server',
+        'arch': 'x86_64',
+        'distro': 'rhel7',
+        'reposet': REPOSET['rhel7_els'],
+        'product': PRDS['rhel_els'],
+        'major_version': 7,
+        'distro_repository': True,
+        'key': 'rhel',
+        'version': '7.9',
+        'basearch': 'x86_64',
+    },
+    'rhel6': {
+        'id': 'rhel-6-server-rpms',
+        'name': 'Red Hat Enterprise Linux 6 Server RPMs x86_64 6Server',
+        'releasever': '6Server',
+        'arch': 'x86_64',
+        'distro': 'rhel6',
+        'reposet': REPOSET['rhel6'],
+        'product': PRDS['rhel'],
+        'major_version': 6,
+        'distro_repository': True,
+        'key': 'rhel',
+        'version': '6.8',
+    },
+    'rhs9': {
+        'id': 'satellite-6.16-for-rhel-9-x86_64-rpms',
+        'name': ('Red Hat Satellite 6.16 for RHEL 9 x86_64 RPMs'),
+        'version': '6.16',
+        'reposet': REPOSET['rhs9'],
+        'product': PRDS['rhs'],
+        'distro': 'rhel9',
+        'key': 'rhs',
+    },
+    'rhs8': {
+        'id': 'satellite-6.13-for-rhel-8-x86_64-rpms',
+        'name': ('Red Hat Satellite 6.13 for RHEL 8 x86_64 RPMs'),
+        'version': '6.13',
+        'reposet': REPOSET['rhs8'],
+        'product': PRDS['rhs'],
+        'distro': 'rhel8',
+        'key': 'rhs',
+    },
+    'rhs7': {
+        'id': 'rhel-7-server-satellite-6.11-rpms',
+        'name': ('Red Hat Satellite 6.11 for RHEL 7 Server RPMs x86_64'),
+        'version': '6.11',
+        'reposet': REPOSET['rhs7'],
+        'product': PRDS['rhs'],
+        'distro': 'rhel7',
+        'key': 'rhs',
+    },
+    'rhsc8': {
+        'id': 'satellite-capsule-6.16-for-rhel-8-x86_64-rpms',
+        'name': ('Red Hat Satellite Capsule 6.16 for RHEL 8 x86_64 RPMs'),
+        'version': '6.16',
+        'reposet': REPOSET['rhsc8'],
+        'product': PRDS['rhsc'],
+        'distro': 'rhel8',
+        'key': 'rhsc',
+    },
+    'rhsc9': {
+        'id': 'satellite-capsule-6.16-for-rhel-9-x86_64-rpms',
+        'name': ('Red Hat Satellite Capsule 6.16 for RHEL 9 x86_64 RPMs'),
+        'version': '6.16',
+        'reposet': REPOSET['rhsc9'],
+        'product': PRDS['rhsc'],
+        'distro': 'rhel9',
+        'key': 'rhsc',
+    },
+    'rhsc7_iso': {
+        'id': 'rhel-7-server-satellite-capsule-6.4-isos',
+        'name': ('Red Hat Satellite Capsule 6.4 for RHEL 7 Server ISOs x86_64'),
+    },
+    'rhsclient7': {
+        'id': 'rhel-7-server-satellite-client-6-rpms',
+        'name': ('Red Hat Satellite Client 6 for RHEL 7 Server RPMs x86_64'),
+        'version': '6',
+        'reposet': REPOSET['rhsclient7'],
+        'product': PRDS['rhel'],
+        'distro': 'rhel7',
+        'key': PRODUCT_KEY_SAT_CLIENT,
+    },
+    'rhsclient8': {
+        'id': 'satellite-client-6-for-rhel-8-x86_64-rpms',
+        'name': ('Red Hat Satellite Client 6 for RHEL 8 x86_64 RPMs'),
+        'version': '6',
+        'reposet': REPOSET['rhsclient8'],
+        'product': PRDS['rhel8'],
+        'distro': 'rhel8',
+        'releasever': None,
+        'key': PRODUCT_KEY_SAT_CLIENT,
+    },
+    'rhsclient9': {
+        'id': 'satellite-client-6-for-rhel-9-x86_64-rpms',
+        'name': ('Red Hat Satellite Client 6 for RHEL 9 x86_64 RPMs'),
+        'version': '6',
+        'reposet': REPOSET['rhsclient9'],
+        'product': PRDS['rhel9'],
+        'distro': 'rhel9',
+        'releasever': '9',
+        'key': PRODUCT_KEY_SAT_CLIENT,
+    },
+    'rhsclient10': {
+        'id': 'satellite-client-6-for-rhel-10-x86_64-rpms',
+        'name': ('Red Hat Satellite Client 6 for RHEL 10 x86_64 RPMs'),
+        'version': '6',
+        'reposet': REPOSET['rhsclient10'],
+        'product': PRDS['rhel10'],
+        'distro': 'rhel10',
+        'releasever': '10',
+        'key': PRODUCT_KEY_SAT_CLIENT,
+    },
+    'rhst7': {
+        'id': 'rhel-7-server-satellite-tools-6.9-rpms',
+        'name': ('Red Hat Satellite Tools 6.9 for RHEL 7 Server RPMs x86_64'),
+        'version': '6.9',
+        'reposet': REPOSET['rhst7'],
+        'product': PRDS['rhel'],
+        'distro': 'rhel7',
+        'key': 'rhst',
+    },
+    'rhst7_610': {
+        'id': 'rhel-7-server-satellite-tools-6.10-rpms',
+        'name': ('Red Hat Satellite Tools 6.10 for RHEL 7 Server RPMs x86_64'),
+        'version': '6.10',
+        'reposet': REPOSET['rhst7_610'],
+        'product': PRDS['rhel'],
+        'distro': 'rhel7',
+        'key': 'rhst',
+    },
+    'rhst6': {
+        'id': 'rhel-6-server-satellite-tools-6.9-rpms',
+        'name': ('Red Hat Satellite Tools 6.9 for RHEL 6 Server RPMs x86_64'),
+        'version': '6.9',
+        'reposet': REPOSET['rhst6'],
+        'product': PRDS['rhel'],
+        'distro': 'rhel6',
+        'key': 'rhst',
+    },
+    'rhva6': {
+        'id': 'rhel-6-server-rhev-agent-rpms',
+        'name': ('Red Hat Enterprise Virtualization Agents for RHEL 6 Server RPMs x86_64 6Server'),
+        'version': '6.0',
+        'reposet': REPOSET['rhva6'],
+        'product': PRDS['rhel'],
+        'distro': 'rhel6',
+        'releasever': '6Server',
+        'key': 'rhva6',
+    },
+    'rhva610': {
+        'name': ('Red Hat Enterprise Virtualization Agents for RHEL 6 Server RPMs x86_64 6.10'),
+        'version': '6.10',
+        'reposet': REPOSET['rhva6'],
+        'product': PRDS['rhel'],
+        'distro': 'rhel6',
+        'key': 'rhva610',
+    },
+    'rhct6': {
+        'name': 'Red Hat CloudForms Tools for RHEL 6 RPMs x86_64 6Server',
+        'releasever': '6Server',
+        'version': '6Server',
+        'arch': 'x86_64',
+        'reposet': REPOSET['rhct6'],
+        'product': PRDS['rhel'],
+        'distro': 'rhel6',
+        'key': 'rhct6',
+    },
+    'rhaht': {'name': ('Red Hat Enterprise Linux Atomic Host RPMs x86_64')},
+    'rhdt7': {
+        'name': ('Red Hat Developer Tools RPMs for Red Hat Enterprise Linux 7 Server x86_64')
+    },
+    'rhae2': {
+        'id': 'rhel-7-server-ansible-2.9-rpms',
+        'name': 'Red Hat Ansible Engine 2.9 RPMs for Red Hat Enterprise Linux 7 Server x86_64',
+        'version': '2.9',
+        'releasever': None,
+        'arch': 'x86_64',
+        'reposet': REPOSET['rhae2'],
+        'product': PRDS['rhae'],
+        'distro': 'rhel7',
+        'key': 'rhae2',
+    },
+    'rhae2.9_el8': {
+        'id': 'ansible-2.9-for-rhel-8-x86_64-rpms',
+        'name': 'Red Hat Ansible Engine 2.9 for RHEL 8 x86_64 RPMs',
+        'version': '2.9',
+        'releasever': None,
+        'arch': 'x86_64',
+        'reposet': REPOSET['rhae2.9_el8'],
+        'product': PRDS['rhae'],
+        'distro': 'rhel8',
+        'key': 'rhae2.9_el8',
+    },
+    'rhst8': {
+        'id': 'satellite-tools-6.9-for-rhel-8-x86_64-rpms',
+        'name': 'Red Hat Satellite Tools 6.9 for RHEL 8 x86_64 RPMs',
+        'version': '6.9',
+        'reposet': REPOSET['rhst8'],
+        'product': PRDS['rhel8'],
+        'distro': 'rhel8',
+        'releasever': None,
+        'key': 'rhst',
+    },
+    'kickstart': {
+        'rhel6': {
+            'id': 'rhel-6-server-kickstart',
+            'name': 'Red Hat Enterprise Linux 6 Server Kickstart x86_64 6.10',
+            'version': '6.10',
+            'reposet': REPOSET['kickstart']['rhel6'],
+            'product': PRDS['rhel'],
+            'distro': 'rhel6',
+        },
+        'rhel7': {
+            'id': 'rhel-7-server-kickstart',
+            'name': 'Red Hat Enterprise Linux 7 Server Kickstart x86_64 7.9',
+            'version': '7.9',
+            'reposet': REPOSET['kickstart']['rhel7'],
+            'product': PRDS['rhel'],
+            'distro': 'rhel7',
+        },
+        'rhel8_bos': {
+            'id': 'rhel-8-for-x86_64-baseos-kickstart',
+            'name': 'Red Hat Enterprise Linux 8 for x86_64 - BaseOS Kickstart 8.10',
+            'version': '8.10',
+            'reposet': REPOSET['kickstart']['rhel8_bos'],
+            'product': PRDS['rhel8'],
+            'distro': 'rhel8',
+        },
+        'rhel8_aps': {
+            'id': 'rhel-8-for-x86_64-appstream-kickstart',
+            'name': 'Red Hat Enterprise Linux 8 for x86_64 - AppStream Kickstart 8.10',
+            'version': '8.10',
+            'reposet': REPOSET['kickstart']['rhel8_aps'],
+            'product': PRDS['rhel8'],
+            'distro': 'rhel8',
+        },
+        'rhel9_bos': {
+            'id': 'rhel-9-for-x86_64-baseos-kickstart',
+            'name': 'Red Hat Enterprise Linux 9 for x86_64 - BaseOS Kickstart 9.8',
+            'version': '9.8',
+            'reposet': REPOSET['kickstart']['rhel9_bos'],
+            'product': PRDS['rhel9'],
+            'distro': 'rhel9',
+        },
+        'rhel9_aps': {
+            'id': 'rhel-9-for-x86_64-appstream-kickstart',
+            'name': 'Red Hat Enterprise Linux 9 for x86_64 - AppStream Kickstart 9.8',
+            'version': '9.8',
+            'reposet': REPOSET['kickstart']['rhel9_aps'],
+            'product': PRDS['rhel9'],
+            'distro': 'rhel9',
+        },
+        'rhel10_bos': {
+            'id': 'rhel-10-for-x86_64-baseos-kickstart',
+            'name': 'Red Hat Enterprise Linux 10 for x86_64 - BaseOS Kickstart 10.2',
+            'version': '10.2',
+            'reposet': REPOSET['kickstart']['rhel10_bos'],
+            'product': PRDS['rhel10'],
+            'distro': 'rhel10',
+        },
+        'rhel10_aps': {
+            'id': 'rhel-10-for-x86_64-appstream-kickstart',
+            'name': 'Red Hat Enterprise Linux 10 for x86_64 - AppStream Kickstart 10.2',
+            'version': '10.2',
+            'reposet': REPOSET['kickstart']['rhel10_aps'],
+            'product': PRDS['rhel10'],
+            'distro': 'rhel10',
+        },
+    },
+    'rhel8_bos': {
+        'id': 'rhel-8-for-x86_64-baseos-rpms',
+        'name': 'Red Hat Enterprise Linux 8 for x86_64 - BaseOS RPMs 8',
+        'releasever': '8',
+        'version': '8',
+        'reposet': REPOSET['rhel8_bos'],
+        'product': PRDS['rhel8'],
+        'distro': 'rhel8',
+        'key': 'rhel8_bos',
+        'basearch': 'x86_64',
+    },
+    'rhel8_aps': {
+        'id': 'rhel-8-for-x86_64-appstream-rpms',
+        'name': 'Red Hat Enterprise Linux 8 for x86_64 - AppStream RPMs 8',
+        'releasever': '8',
+        'basearch': 'x86_64',
+        'version': '8',
+        'reposet': REPOSET['rhel8_aps'],
+        'product': PRDS['rhel8'],
+        'distro': 'rhel8',
+        'key': 'rhel8_aps',
+    },
+    'rhel9_bos': {
+        'id': 'rhel-9-for-x86_64-baseos-rpms',
+        'name': 'Red Hat Enterprise Linux 9 for x86_64 - BaseOS RPMs 9',
+        'releasever': '9',
+        'version': '9',
+        'reposet': REPOSET['rhel9_bos'],
+        'product': PRDS['rhel9'],
+        'distro': 'rhel9',
+        'key': 'rhel9_bos',
+        'basearch': 'x86_64',
+    },
+    'rhel9_aps': {
+        'id': 'rhel-9-for-x86_64-appstream-rpms',
+        'name': 'Red Hat Enterprise Linux 9 for x86_64 - AppStream RPMs 9',
+        'releasever': '9',
+        'basearch': 'x86_64',
+        'version': '9',
+        'reposet': REPOSET['rhel9_aps'],
+        'product': PRDS['rhel9'],
+        'distro': 'rhel9',
+        'key': 'rhel9_aps',
+    },
+    'rhel10_bos': {
+        'id': 'rhel-10-for-x86_64-baseos-rpms',
+        'name': 'Red Hat Enterprise Linux 10 for x86_64 - BaseOS RPMs 10',
+        'releasever': '10',
+        'version': '10',
+        'reposet': REPOSET['rhel10_bos'],
+        'product': PRDS['rhel10'],
+        'distro': 'rhel10',
+        'key': 'rhel10_bos',
+        'basearch': 'x86_64',
+    },
+    'rhel10_aps': {
+        'id': 'rhel-10-for-x86_64-appstream-rpms',
+        'name': 'Red Hat Enterprise Linux 10 for x86_64 - AppStream RPMs 10',
+        'releasever': '10',
+        'basearch': 'x86_64',
+        'version': '10',
+        'reposet': REPOSET['rhel10_aps'],
+        'product': PRDS['rhel10'],
+        'distro': 'rhel10',
+        'key': 'rhel10_aps',
+    },
+    'rhel7_optional': {
+        'id': 'rhel-7-server-optional-rpms',
+        'name': 'Red Hat Enterprise Linux 7 Server - Optional RPMs x86_64 7Server',
+        'releasever': '7Server',
+        'version': '7',
+        'reposet': REPOSET['rhel7_optional'],
+        'product': PRDS['rhel'],
+        'distro': 'rhel7',
+        'key': 'rhel7_optional',
+    },
+    'rhel7_extra': {
+        'id': 'rhel-7-server-extras-rpms',
+        'name': 'Red Hat Enterprise Linux 7 Server - Extras RPMs x86_64',
+        'releasever': '7',
+        'version': '7',
+        'reposet': REPOSET['rhel7_extra'],
+        'product': PRDS['rhel'],
+        'distro': 'rhel7',
+        'key': 'rhel7_extra',
+    },
+    'rhel7_sup': {
+        'id': 'rhel-7-server-supplementary-rpms',
+        'name': 'Red Hat Enterprise Linux 7 Server - Supplementary RPMs x86_64 7Server',
+        'releasever': '7Server',
+        'version': '7',
+        'reposet': REPOSET['rhel7_sup'],
+        'product': PRDS['rhel'],
+        'distro': 'rhel7',
+        'key': 'rhel7_sup',
+    },
+    'rhscl7': {
+        'id': 'rhel-server-rhscl-7-rpms',
+        'name': (
+            'Red Hat Software Collections RPMs for Red Hat Enterprise Linux 7 Server x86_64 7Server'
+        ),
+        'releasever': '7Server',
+        'version': '7',
+        'reposet': REPOSET['rhscl7'],
+        'product': PRDS['rhscl'],
+        'distro': 'rhel7',
+        'key': 'rhscl7',
+    },
+}
+
+BULK_REPO_LIST = [
+    REPOS['rhel7_optional'],
+    REPOS['rhel7_sup'],
+    REPOS['rhel7'],
+    REPOS['rhel6'],
+    REPOS['rhscl7'],
+    REPOS['rhel8_aps'],
+]
+
+DISTRO_REPOS = {'rhel7': REPOS['rhel7']}
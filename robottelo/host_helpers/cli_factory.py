@@ -109,7 +109,7 @@ ENTITY_FIELDS = {
     'partition_table': {
         'file': lambda: f'/tmp/{gen_alphanumeric()}',
         'name': gen_alphanumeric,
-        'os-family': partial(gen_choice, constants.OPERATING_SYSTEMS),
+        'os-family': lambda: gen_choice(constants.OPERATING_SYSTEMS),
     },
     'product': {'_redirect': 'product_with_credentials'},
     'product_with_credentials': {
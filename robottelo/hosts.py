@@ -4,6 +4,7 @@ import contextlib
 from contextlib import contextmanager
 from datetime import UTC, datetime
 from functools import cached_property, lru_cache
+import hashlib
 import importlib
 import io
 import json
@@ -23,13 +24,11 @@ from broker.helpers import FileLock
 from broker.hosts import Host
 from dynaconf.vendor.box.exceptions import BoxKeyError
 from fauxfactory import gen_alpha, gen_string
-from nailgun import entities
 from packaging.version import Version
 import pytest
 import requests
 from ssh2.exceptions import AuthenticationError
 from wait_for import TimedOutError, wait_for
-from wrapanapi.entities.vm import VmState
 import yaml
 
 from robottelo import constants
@@ -37,6 +36,8 @@ from robottelo.cli.base import Base
 from robottelo.config import (
     configure_airgun,
     configure_nailgun,
+    hot_settings,
+    patch_nailgun_entities,
     robottelo_tmp_dir,
     settings,
 )
@@ -72,13 +73,19 @@ from robottelo.host_helpers import (
     SatelliteMixins,
 )
 from robottelo.logging import logger
-from robottelo.utils import validate_ssh_pub_key
+from robottelo.utils import resource_usage, validate_ssh_pub_key
 from robottelo.utils.datafactory import valid_emails_list
 from robottelo.utils.installer import InstallerCommand
+from robottelo.utils.shared_resource import xdist_once
+
+# values of wrapanapi.entities.vm.VmState, wrapanapi is not imported as it pulls in the SDKs of
+# every provider
+VM_STATE_RUNNING = 'VmState.RUNNING'
+VM_STATE_STOPPED = 'VmState.STOPPED'
 
 POWER_OPERATIONS = {
-    VmState.RUNNING: 'running',
-    VmState.STOPPED: 'stopped',
+    VM_STATE_RUNNING: 'running',
+    VM_STATE_STOPPED: 'stopped',
     'reboot': 'reboot',
     # TODO paused, suspended, shelved?
 }
@@ -96,29 +103,52 @@ def lru_sat_ready_rhel(rhel_ver):
     return Broker(**deploy_args, host_class=Satellite).checkout()
 
 
-def get_sat_version():
-    """Try to read sat_version from envvar SATELLITE_VERSION
-    if not available fallback to ssh connection to get it."""
-
+@lru_cache
+@xdist_once(key='sat_version')
+def _read_sat_version(hostname):
+    """Read the Satellite version over SSH once per hostname and xdist run, None on failure"""
     try:
-        sat_version = Satellite().version
+        return Satellite(hostname).version
     except (AuthenticationError, ContentHostError, BoxKeyError) as err:
         logger.warning('Failed to get Satellite version: %s', err)
-        if sat_version := str(settings.server.version.get('release')) == 'stream':
-            sat_version = str(settings.robottelo.get('satellite_version'))
-        if not sat_version:
-            sat_version = SATELLITE_VERSION
-    return Version('9999' if 'nightly' in sat_version else sat_version)
-
 
-def get_sat_rhel_version():
-    """Try to read rhel_version from Satellite host
-    if not available fallback to robottelo configuration."""
 
+@lru_cache
+@xdist_once(key='sat_rhel_version')
+def _read_sat_rhel_version(hostname):
+    """Read the Satellite RHEL version over SSH once per hostname and xdist run, None on failure"""
     try:
-        return Satellite().os_version
+        return Satellite(hostname).os_version.base_version
     except (AuthenticationError, ContentHostError, BoxKeyError) as err:
         logger.warning('Failed to get RHEL version from Satellite: %s', err)
+
+
+def get_sat_version(offline=False):
+    """Try to read sat_version from the Satellite host
+    if not available, or offline, fallback to robottelo configuration.
+
+    The value read from the Satellite is cached for the session and shared by xdist workers.
+    """
+    online = not offline and settings.server.hostname
+    sat_version = _read_sat_version(settings.server.hostname) if online else None
+    if not sat_version:
+        sat_version = str(settings.server.version.get('release'))
+        if sat_version == 'stream':
+            sat_version = str(settings.robottelo.get('satellite_version'))
+    if not sat_version or sat_version == 'None':
+        sat_version = SATELLITE_VERSION
+    return Version('9999' if 'nightly' in sat_version else sat_version)
+
+
+def get_sat_rhel_version(offline=False):
+    """Try to read rhel_version from the Satellite host
+    if not available, or offline, fallback to robottelo configuration.
+
+    The value read from the Satellite is cached for the session and shared by xdist workers.
+    """
+    online = not offline and settings.server.hostname
+    rhel_version = _read_sat_rhel_version(settings.server.hostname) if online else None
+    if not rhel_version:
         if hasattr(settings.server.version, 'rhel_version'):
             rhel_version = str(settings.server.version.rhel_version)
         elif hasattr(settings.robottelo, 'rhel_version'):
@@ -127,7 +157,6 @@ def get_sat_rhel_version():
 
 
 class ContentHost(Host, ContentHostMixins):
-    run = Host.execute
     default_timeout = settings.server.ssh_client.command_timeout
     # Extend the keep_keys tuple from the parent class
     keep_keys = (*Host.keep_keys, 'net_type', 'blank')
@@ -151,8 +180,19 @@ class ContentHost(Host, ContentHostMixins):
         if nt := kwargs.get('net_type'):
             self._net_type = NetworkType(nt)
         self.blank = kwargs.get('blank', False)
+        self._baseline_fingerprint = None
+        self.reusable = False
         super().__init__(hostname=hostname, **kwargs)
 
+    def execute(self, command, timeout=None):
+        """Execute a command on the host using SSH, and account it to the running test"""
+        with resource_usage.measure('ssh', sent=command) as call:
+            result = super().execute(command, timeout=timeout)
+            call.finish(received=(result.stdout, result.stderr), error=result.status != 0)
+        return result
+
+    run = execute
+
     @property
     def network_type(self):
         if not hasattr(self, '_net_type'):
@@ -160,7 +200,7 @@ class ContentHost(Host, ContentHostMixins):
             if nt := broker_args.get('net_type'):
                 self._net_type = NetworkType(nt)
             else:
-                self._net_type = NetworkType(settings.content_host.network_type)
+                self._net_type = NetworkType(hot_settings(settings).content_host.network_type)
         return self._net_type
 
     @classmethod
@@ -375,10 +415,70 @@ class ContentHost(Host, ContentHostMixins):
             self.unregister()
             if type(self) is not Satellite:  # do not delete Satellite's host record
                 self.delete_host_record()
+            if self._baseline_fingerprint:
+                self.reusable = self.reset_to_baseline()
 
         logger.debug('END: tearing down host %s', self)
 
-    def power_control(self, state=VmState.RUNNING, ensure=True):
+    def fingerprint(self):
+        """Return a digest of the host state that a reset to baseline has to restore
+
+        The digest covers the rhsm configuration, /etc/hosts, the yum repo definitions,
+        installed katello-ca packages and the registration state of the host.
+        """
+        result = self.execute(
+            'cat /etc/rhsm/rhsm.conf /etc/hosts /etc/yum.repos.d/*.repo 2>/dev/null; '
+            'rpm -qa "katello-ca-consumer*" | sort; '
+            'test -f /etc/pki/consumer/cert.pem && echo registered'
+        )
+        return hashlib.sha256(result.stdout.encode()).hexdigest()
+
+    def capture_baseline(self):
+        """Save the current host state so that it can be restored by ``reset_to_baseline``"""
+        backup = constants.CONTENT_HOST_BASELINE_PATH
+        result = self.execute(
+            f'rm -rf {backup} && mkdir -p {backup} && '
+            f'cp -a /etc/hosts /etc/yum.repos.d {backup}/ && '
+            f'cp -a /etc/rhsm/rhsm.conf {backup}/rhsm.conf'
+        )
+        if result.status != 0:
+            raise ContentHostError(
+                f'Failed to capture baseline of {self.hostname}: {result.stderr}'
+            )
+        self._baseline_fingerprint = self.fingerprint()
+
+    def reset_to_baseline(self):
+        """Reset the host to the state saved by ``capture_baseline``
+
+        Unregisters the host, cleans rhsm and yum state, removes the katello-ca consumer
+        package and restores /etc/hosts, rhsm.conf and yum repo definitions.
+
+        :return: True if the host matches its baseline fingerprint after the reset
+        """
+        backup = constants.CONTENT_HOST_BASELINE_PATH
+        self.execute('subscription-manager unregister; subscription-manager clean')
+        self.execute('rpm -qa "katello-ca-consumer*" | xargs -r rpm -e --nodeps')
+        result = self.execute(
+            f'\\cp -f {backup}/hosts /etc/hosts && '
+            f'\\cp -f {backup}/rhsm.conf /etc/rhsm/rhsm.conf && '
+            f'rm -rf /etc/yum.repos.d && cp -a {backup}/yum.repos.d /etc/yum.repos.d && '
+            'yum clean all && rm -rf /var/cache/yum /var/cache/dnf'
+        )
+        self._satellite = None
+        if result.status != 0:
+            logger.warning('Failed to reset %s to baseline: %s', self.hostname, result.stderr)
+            return False
+        if (current := self.fingerprint()) != self._baseline_fingerprint:
+            logger.warning(
+                'Host %s does not match its baseline fingerprint after reset: %s != %s',
+                self.hostname,
+                current,
+                self._baseline_fingerprint,
+            )
+            return False
+        return True
+
+    def power_control(self, state=VM_STATE_RUNNING, ensure=True):
         """Lookup the host workflow for power on and execute
 
         Args:
@@ -413,7 +513,7 @@ class ContentHost(Host, ContentHostMixins):
             == 'successful'
         )
 
-        if ensure and state in [VmState.RUNNING, 'reboot']:
+        if ensure and state in [VM_STATE_RUNNING, 'reboot']:
             try:
                 wait_for(
                     self.connect,
@@ -1319,6 +1419,7 @@ class ContentHost(Host, ContentHostMixins):
         :param bool exec_one_shot: whether to run the virt-who one-shot command after startup
         :param list extra_repos: (Optional) repositories dict options to setup additionally.
         """
+        from nailgun import entities
 
         org = (
             satellite.cli_factory.make_org()
@@ -1687,6 +1788,77 @@ class ContentHost(Host, ContentHostMixins):
             logger.warning(f'Podman is not logged into container registry {registry}')
 
 
+class ContentHostPool:
+    """A per-worker pool of container content hosts that are reset and reused between tests
+
+    Hosts are keyed by the Broker arguments used to check them out, so only hosts deployed
+    with the same arguments are handed out again. A host is returned to the pool only if
+    its teardown managed to restore its baseline fingerprint; otherwise, or once it has been
+    used ``max_uses`` times, it is checked in.
+    """
+
+    def __init__(self, max_uses=None):
+        self.max_uses = max_uses or settings.content_host.reuse_max_uses
+        self._free = {}
+        self._uses = {}
+
+    @staticmethod
+    def _key(host_class, broker_args):
+        return json.dumps(
+            {'host_class': host_class.__name__, **broker_args}, sort_keys=True, default=str
+        )
+
+    def checkout(self, host_class, **broker_args):
+        """Return a reset host from the pool, or check out and set up a new one"""
+        key = self._key(host_class, broker_args)
+        if self._free.get(key):
+            host = self._free[key].pop()
+            logger.debug('Reusing pooled content host %s', host.hostname)
+            try:
+                host.setup()
+            except Exception:
+                self._discard(host)
+                raise
+        else:
+            host = Broker(host_class=host_class, **broker_args).checkout()
+            host._pool_key = key
+            self._uses[host.name] = 0
+            try:
+                host.setup()
+                host.capture_baseline()
+            except Exception:
+                self._discard(host)
+                raise
+        self._uses[host.name] += 1
+        return host
+
+    def _discard(self, host):
+        """Check in a host that is not to be used again"""
+        self._uses.pop(host.name, None)
+        Broker(hosts=[host]).checkin()
+
+    def release(self, host):
+        """Tear down the host and return it to the pool if it was reset to its baseline"""
+        host.reusable = False
+        try:
+            host.teardown()
+        except Exception as err:  # any teardown failure disqualifies the host
+            logger.warning('Teardown of pooled content host %s failed: %s', host.hostname, err)
+        if host.reusable and self._uses[host.name] < self.max_uses:
+            self._free.setdefault(host._pool_key, []).append(host)
+        else:
+            self._discard(host)
+
+    def checkin_all(self):
+        """Check in every host remaining in the pool"""
+        hosts = [host for hosts in self._free.values() for host in hosts]
+        self._free.clear()
+        self._uses.clear()
+        if hosts:
+            logger.info('Checking in %s pooled content hosts', len(hosts))
+            Broker(hosts=hosts).checkin()
+
+
 class Capsule(ContentHost, CapsuleMixins):
     rex_key_path = '~foreman-proxy/.ssh/id_rsa_foreman_proxy.pub'
     product_rpm_name = 'satellite-capsule'
@@ -2425,9 +2597,14 @@ class Satellite(Capsule, SatelliteMixins):
         if self._api._configured:
             return self._api
         from nailgun import entities as _entities  # use a private import
-        from nailgun.config import ServerConfig
         from nailgun.entity_mixins import Entity
 
+        from robottelo.utils.api_session import SessionServerConfig, patch_nailgun_client
+
+        patch_nailgun_entities(_entities)
+        patch_nailgun_client()
+        resource_usage.instrument_nailgun()
+
         def inject_config(cls, server_config):
             """inject a nailgun server config into the init of nailgun entity classes"""
             import functools
@@ -2438,10 +2615,11 @@ class Satellite(Capsule, SatelliteMixins):
             return DecClass
 
         # set the server configuration to point to this satellite
-        self.nailgun_cfg = ServerConfig(
+        self.nailgun_cfg = SessionServerConfig(
             auth=(settings.server.admin_username, settings.server.admin_password),
             url=f'{self.url}',
             verify=settings.server.verify_ca,
+            session=self.api_session,
         )
         # add each nailgun entity to self.api, injecting our server config
         for name, obj in _entities.__dict__.items():
@@ -2456,6 +2634,21 @@ class Satellite(Capsule, SatelliteMixins):
         self._api._configured = True
         return self._api
 
+    @cached_property
+    def api_session(self):
+        """The keep-alive HTTP session shared by the entities of self.api, None if disabled"""
+        config = settings.server.api_session
+        if not config.enabled:
+            return None
+        from robottelo.utils.api_session import new_session
+
+        return new_session(
+            pool_size=config.pool_size,
+            retries=config.retries,
+            backoff_factor=config.backoff_factor,
+            retry_statuses=tuple(config.retry_statuses),
+        )
+
     @property
     def apidoc(self):
         """Provide Satellite's apidoc via apypie"""
@@ -2526,7 +2719,7 @@ class Satellite(Capsule, SatelliteMixins):
     @contextmanager
     def ui_session(self, testname=None, user=None, password=None, url=None, login=True):
         """Initialize an airgun Session object and store it as self.ui_session"""
-
+        configure_airgun()
         from airgun.session import Session
 
         def get_caller():
@@ -2704,14 +2897,14 @@ class Satellite(Capsule, SatelliteMixins):
         if self.hostname != settings.server.hostname:
             self._revert = True
             self._old_hostname = settings.server.hostname
-            settings.server.hostname = self.hostname
+            settings.set('server.hostname', self.hostname)
             configure_nailgun()
             configure_airgun()
         return self
 
     def __exit__(self, *err_args):
         if self._revert:
-            settings.server.hostname = self._old_hostname
+            settings.set('server.hostname', self._old_hostname)
             configure_nailgun()
             configure_airgun()
 
@@ -1,6 +1,11 @@
+import atexit
+import hashlib
+import json
 import logging
+from logging.handlers import QueueHandler, QueueListener
 import os
 from pathlib import Path
+import queue
 
 from box import Box
 import logzero
@@ -23,6 +28,12 @@ with robottelo_root_dir.joinpath('logging.yaml').open() as f:
 
 DEFAULT_DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
 
+# how the log files are written, see the output section of logging.yaml
+log_output = Box(
+    {'queue': True, 'queueSize': 10000, 'json': False, 'maxMessageSize': 262144}
+    | logging_yaml.get('output', {})
+)
+
 defaultFormatter = logzero.LogFormatter(
     fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s', datefmt=DEFAULT_DATE_FORMAT
 )
@@ -86,3 +97,151 @@ config_logger = logzero.setup_logger(
     fileLoglevel=logging_yaml.config.fileLevel,
     formatter=defaultFormatter,
 )
+
+
+def limit_message(message, max_size=None):
+    """Truncate a message longer than ``max_size`` characters, adding the hash of the whole of it
+
+    :param max_size: The maximum size, ``output.maxMessageSize`` of logging.yaml by default,
+        0 for no limit
+    """
+    max_size = log_output.maxMessageSize if max_size is None else max_size
+    if not max_size or len(message) <= max_size:
+        return message
+    digest = hashlib.sha256(message.encode(errors='replace')).hexdigest()
+    return (
+        f'{message[:max_size]}... [truncated {len(message) - max_size} characters, sha256:{digest}]'
+    )
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """Formats each log record as a line of JSON, with optional static fields like the worker id"""
+
+    def __init__(self, fields=None, datefmt=DEFAULT_DATE_FORMAT):
+        super().__init__(datefmt=datefmt)
+        self.fields = fields or {}
+
+    def format(self, record):
+        entry = {
+            'time': self.formatTime(record, self.datefmt),
+            **self.fields,
+            'name': record.name,
+            'level': record.levelname,
+            'message': record.getMessage(),
+        }
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry['exception'] = record.exc_text
+        return json.dumps(entry, default=str)
+
+
+class LogWriter(QueueListener):
+    """Writes the records queued by ``QueuedFileHandler`` to their file handlers, in one thread
+
+    The queue is bounded: records logged while it is full are dropped, and counted in the log,
+    so that logging never blocks the test threads on a slow file system.
+    """
+
+    def __init__(self, queue_size):
+        super().__init__(queue.Queue(queue_size))
+        self.dropped = 0
+        self.pid = os.getpid()
+
+    def handle(self, item):
+        handler, record = item
+        handler.handle(record)
+
+    def enqueue_sentinel(self):
+        # wait for room in the queue, so that the records before the sentinel are all written
+        self.queue.put(self._sentinel)
+
+    def flush(self):
+        """Wait until the queued records are written"""
+        if self._thread is not None and self.pid == os.getpid():
+            self.queue.join()
+
+    def stop(self):
+        if self._thread is not None and self.pid == os.getpid():
+            super().stop()
+
+
+class QueuedFileHandler(QueueHandler):
+    """Queues the records of a file handler for the log writer thread
+
+    Messages are truncated to ``output.maxMessageSize`` before being queued. A forked process
+    has no log writer thread, it writes its records itself.
+    """
+
+    def __init__(self, handler, writer=None):
+        self.writer = writer or log_writer
+        super().__init__(self.writer.queue)
+        self.handler = handler
+        self.baseFilename = handler.baseFilename
+        self.set_name(handler.get_name())
+        self.setLevel(handler.level)
+
+    def setFormatter(self, fmt):
+        # records are formatted by the file handler, in the log writer thread
+        self.handler.setFormatter(fmt)
+
+    def prepare(self, record):
+        record = super().prepare(record)
+        record.msg = record.message = limit_message(record.msg)
+        return record
+
+    def enqueue(self, record):
+        if self.writer.pid != os.getpid():
+            self.handler.handle(record)
+            return
+        try:
+            if dropped := self.writer.dropped:
+                self.queue.put_nowait((self.handler, self._dropped_record(record.name, dropped)))
+                self.writer.dropped -= dropped
+            self.queue.put_nowait((self.handler, record))
+        except queue.Full:
+            self.writer.dropped += 1
+
+    @staticmethod
+    def _dropped_record(name, dropped):
+        return logging.makeLogRecord(
+            {
+                'name': name,
+                'levelno': logging.WARNING,
+                'levelname': 'WARNING',
+                'msg': f'{dropped} log records were dropped, the log writer fell behind',
+            }
+        )
+
+    def close(self):
+        self.writer.flush()
+        self.handler.close()
+        super().close()
+
+
+def queued(handler):
+    """Return a handler writing the records of a file handler in the log writer thread
+
+    The file handler is returned as is when ``output.queue`` of logging.yaml is disabled.
+    """
+    return QueuedFileHandler(handler) if log_writer else handler
+
+
+def flush_logs():
+    """Wait until the queued log records are written to the log files"""
+    if log_writer:
+        log_writer.flush()
+
+
+log_writer = None
+if log_output.queue:
+    log_writer = LogWriter(log_output.queueSize)
+    log_writer.start()
+    atexit.register(log_writer.stop)
+for _logger in (logger, collection_logger, config_logger):
+    for _handler in [h for h in _logger.handlers if isinstance(h, logging.FileHandler)]:
+        if log_output.json:
+            _handler.setFormatter(JsonLinesFormatter())
+        if log_writer:
+            _logger.removeHandler(_handler)
+            _logger.addHandler(QueuedFileHandler(_handler))
@@ -15,16 +15,17 @@ def get_client(
     Processes ssh credentials in the order: password, key_filename, ssh_key
     Config validation enforces one of the three must be set in settings.server
     """
-    from robottelo.config import settings
+    from robottelo.config import hot_settings, settings
     from robottelo.hosts import ContentHost
 
+    server = hot_settings(settings).server
     return ContentHost(
-        hostname=hostname or settings.server.hostname,
-        username=username or settings.server.ssh_username,
-        password=password or settings.server.ssh_password,
-        port=port or settings.server.ssh_client.port,
+        hostname=hostname or server.hostname,
+        username=username or server.ssh_username,
+        password=password or server.ssh_password,
+        port=port or server.ssh_port,
         # TODO(ogajduse): we better get rid of the ssh module entirely
-        net_type=net_type or settings.server.network_type,
+        net_type=net_type or server.network_type,
     )
 
 
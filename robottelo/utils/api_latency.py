@@ -0,0 +1,249 @@
+"""Latency histograms of the API calls to a Satellite, by endpoint.
+
+The session of ``robottelo.utils.api_session`` calls ``record_response`` for each response it
+gets. While recording is enabled, by ``pytest_plugins.api_latency``, the method, path template
+and status of each call are recorded with its latency and response size. The path template is
+the URL path with its ids collapsed, so ``POST /katello/api/content_view_versions/42/promote``
+and ``POST /katello/api/content_view_versions/43/promote`` are the same endpoint::
+
+    POST /katello/api/content_view_versions/:id/promote
+
+The latency is the time to the response headers, as measured by requests. It is recorded in
+HDR-style histograms, whose buckets keep 2 significant digits whatever the magnitude, so they
+are small, exact enough for percentiles, and merged by adding the counts of their buckets.
+
+A call retried by urllib3, on a connection error or a 502, 503 or 504 status, is recorded in the
+``retried`` histogram of its endpoint, with the latency of all its attempts less the time slept
+between them, and the statuses of its failed attempts in ``retries``. The ``latency`` histogram
+only holds the calls answered at the first attempt, so retries do not skew its percentiles.
+"""
+
+import math
+import re
+import threading
+from urllib.parse import urlsplit
+
+# values below 2 ** SUB_BUCKET_BITS are exact, larger ones within 1 / 2 ** (SUB_BUCKET_BITS - 1)
+SUB_BUCKET_BITS = 7
+# endpoints beyond this many are recorded as OTHER_ENDPOINT, not to grow without bound
+MAX_ENDPOINTS = 2000
+OTHER_ENDPOINT = '* <other>'
+# the status of an attempt retried on a connection or read error
+RETRY_ERROR = 'error'
+
+id_regex = re.compile(
+    r'^(?:\d+|[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}|[0-9a-f]{16,})$',
+    re.IGNORECASE,
+)
+# host names, as in /api/hosts/<fqdn>
+name_regex = re.compile(r'^[\w-]+(?:\.[\w-]+){2,}$')
+
+_lock = threading.Lock()
+# {endpoint: EndpointStats} of the calls made by this process
+_endpoints = {}
+# whether the responses are recorded, set by pytest_plugins.api_latency
+enabled = False
+
+
+class LatencyHistogram:
+    """A histogram of latencies in microseconds, with log-linear buckets as HdrHistogram"""
+
+    __slots__ = ('counts', 'count', 'total', 'max')
+
+    def __init__(self):
+        # {bucket index: count}
+        self.counts = {}
+        self.count = 0
+        self.total = 0
+        self.max = 0
+
+    @staticmethod
+    def bucket(value):
+        """Return the index of the bucket of a value"""
+        shift = max(value.bit_length() - SUB_BUCKET_BITS, 0)
+        return (shift << (SUB_BUCKET_BITS - 1)) + (value >> shift)
+
+    @staticmethod
+    def highest_value(index):
+        """Return the highest value of a bucket"""
+        half = 1 << (SUB_BUCKET_BITS - 1)
+        if index < 2 * half:
+            return index
+        shift = index // half - 1
+        return ((index - shift * half + 1) << shift) - 1
+
+    def record(self, value):
+        value = max(int(value), 0)
+        index = self.bucket(value)
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    def merge(self, other):
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+
+    def percentile(self, percentile):
+        """Return the value that ``percentile`` percent of the recorded values are at most"""
+        if not self.count:
+            return 0
+        rank = max(math.ceil(percentile / 100 * self.count), 1)
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                return min(self.highest_value(index), self.max)
+        return self.max
+
+    def mean(self):
+        return self.total / self.count if self.count else 0
+
+    def to_dict(self):
+        return {
+            'counts': {str(index): count for index, count in self.counts.items()},
+            'count': self.count,
+            'total': self.total,
+            'max': self.max,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        histogram = cls()
+        histogram.counts = {int(index): count for index, count in data['counts'].items()}
+        histogram.count, histogram.total, histogram.max = data['count'], data['total'], data['max']
+        return histogram
+
+
+class EndpointStats:
+    """The latency histograms, statuses and response sizes of the calls to an endpoint"""
+
+    __slots__ = ('latency', 'retried', 'statuses', 'retries', 'size')
+
+    def __init__(self):
+        # the calls answered at the first attempt
+        self.latency = LatencyHistogram()
+        # the retried calls, without the time slept between their attempts
+        self.retried = LatencyHistogram()
+        # {status code: count} of the responses
+        self.statuses = {}
+        # {status code, or RETRY_ERROR: count} of the attempts that were retried
+        self.retries = {}
+        # total size of the responses, in bytes
+        self.size = 0
+
+    @property
+    def calls(self):
+        return self.latency.count + self.retried.count
+
+    @property
+    def errors(self):
+        return sum(count for status, count in self.statuses.items() if int(status) >= 400)
+
+    def merge(self, other):
+        self.latency.merge(other.latency)
+        self.retried.merge(other.retried)
+        for status, count in other.statuses.items():
+            self.statuses[status] = self.statuses.get(status, 0) + count
+        for status, count in other.retries.items():
+            self.retries[status] = self.retries.get(status, 0) + count
+        self.size += other.size
+
+    def to_dict(self):
+        return {
+            'latency': self.latency.to_dict(),
+            'retried': self.retried.to_dict(),
+            'statuses': self.statuses,
+            'retries': self.retries,
+            'size': self.size,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        stats = cls()
+        stats.latency = LatencyHistogram.from_dict(data['latency'])
+        if 'retried' in data:
+            stats.retried = LatencyHistogram.from_dict(data['retried'])
+        stats.statuses = {str(status): count for status, count in data['statuses'].items()}
+        stats.retries = dict(data.get('retries', {}))
+        stats.size = data['size']
+        return stats
+
+
+def path_template(url):
+    """Return the path of a URL with its ids and host names collapsed, without the query"""
+    segments = urlsplit(url).path.split('/')
+    return '/'.join(
+        ':id' if id_regex.match(segment) else ':name' if name_regex.match(segment) else segment
+        for segment in segments
+    )
+
+
+def record(method, url, status, seconds, size, retries=()):
+    """Record an API call
+
+    :param retries: The statuses of the attempts of the call that were retried, None for an
+        error, in which case ``seconds`` excludes the time slept between the attempts
+    """
+    endpoint = f'{method.upper()} {path_template(url)}'
+    with _lock:
+        if (stats := _endpoints.get(endpoint)) is None:
+            if len(_endpoints) >= MAX_ENDPOINTS:
+                endpoint = OTHER_ENDPOINT
+            stats = _endpoints.setdefault(endpoint, EndpointStats())
+        (stats.retried if retries else stats.latency).record(seconds * 1_000_000)
+        status = str(status)
+        stats.statuses[status] = stats.statuses.get(status, 0) + 1
+        for retry_status in retries:
+            retry_status = RETRY_ERROR if retry_status is None else str(retry_status)
+            stats.retries[retry_status] = stats.retries.get(retry_status, 0) + 1
+        stats.size += size
+
+
+def record_response(response, *args, **kwargs):
+    """A requests response hook recording the API call of a response, if recording is enabled"""
+    if not enabled:
+        return
+    if kwargs.get('stream'):
+        # reading the content of a streamed response here would consume it
+        size = int(response.headers.get('Content-Length') or 0)
+    else:
+        size = len(response.content)
+    # the urllib3 Retry of the last attempt, a TimedRetry for the sessions of api_session
+    retry = getattr(response.raw, 'retries', None)
+    history = getattr(retry, 'history', ())
+    record(
+        response.request.method,
+        response.request.url,
+        response.status_code,
+        response.elapsed.total_seconds() - getattr(retry, 'slept', 0.0),
+        size,
+        [attempt.status for attempt in history if attempt.redirect_location is None],
+    )
+
+
+def dump():
+    """Return the endpoint stats recorded by this process, as JSON serializable data"""
+    with _lock:
+        return {endpoint: stats.to_dict() for endpoint, stats in _endpoints.items()}
+
+
+def load(data):
+    """Return the {endpoint: EndpointStats} of dumped endpoint stats"""
+    return {endpoint: EndpointStats.from_dict(stats) for endpoint, stats in data.items()}
+
+
+def merge(data):
+    """Merge dumped endpoint stats, as those of an xdist worker, into the ones of this process"""
+    with _lock:
+        for endpoint, stats in load(data).items():
+            _endpoints.setdefault(endpoint, EndpointStats()).merge(stats)
+
+
+def endpoints():
+    """Return the {endpoint: EndpointStats} recorded by, or merged into, this process"""
+    with _lock:
+        return dict(_endpoints)
@@ -0,0 +1,118 @@
+"""Keep-alive HTTP sessions for the nailgun entities of a Satellite.
+
+``nailgun.client`` sends every request with ``requests.<method>``, so each ``search``, ``create``
+or ``read`` opens its own connection, with its own TLS handshake. ``Satellite.api`` gives its
+entity classes a ``SessionServerConfig``, which passes the session of the Satellite along with
+the other client kwargs, and ``patch_nailgun_client`` makes ``nailgun.client`` send the requests
+given a session through it. Requests without one, as those of the tests calling
+``nailgun.client`` with their own kwargs, are sent as before.
+"""
+
+from http.cookiejar import DefaultCookiePolicy
+import time
+
+from nailgun.config import ServerConfig
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from robottelo.utils import api_latency
+
+
+class TimedRetry(Retry):
+    """A urllib3 Retry keeping the time slept between the attempts of a request in ``slept``"""
+
+    slept = 0.0
+
+    def new(self, **kwargs):
+        retry = super().new(**kwargs)
+        retry.slept = self.slept
+        return retry
+
+    def sleep(self, response=None):
+        start = time.monotonic()
+        super().sleep(response)
+        self.slept += time.monotonic() - start
+
+
+def new_session(pool_size=10, retries=3, backoff_factor=0.5, retry_statuses=(502, 503, 504)):
+    """Return a session keeping up to ``pool_size`` connections alive per host
+
+    The session can be shared by threads. Failed connections, and idempotent requests answered
+    with one of ``retry_statuses`` or failing on a read, are retried ``retries`` times, waiting
+    ``backoff_factor * 2 ** retry`` seconds in between. The latency of its API calls is recorded
+    by ``robottelo.utils.api_latency``, the retried calls apart and without the time slept.
+    """
+    session = requests.Session()
+    session.hooks['response'].append(api_latency.record_response)
+    # as with a new session for every request, no cookie is sent back to the server
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    retry = TimedRetry(
+        total=retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=retry_statuses,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=retry)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+class SessionServerConfig(ServerConfig):
+    """A nailgun server config sending the requests of the entities through a session"""
+
+    # a slot keeps the session out of vars(), which nailgun uses as the client kwargs and repr
+    __slots__ = ('session',)
+
+    def __init__(self, url, auth=None, version=None, verify=None, session=None):
+        super().__init__(url, auth, version, verify)
+        self.session = session
+
+    def get_client_kwargs(self):
+        kwargs = super().get_client_kwargs()
+        if self.session is not None:
+            kwargs['session'] = self.session
+        return kwargs
+
+
+class _SessionRequests:
+    """Stands for the requests module in nailgun.client, to send requests through a session"""
+
+    def __getattr__(self, name):
+        return getattr(requests, name)
+
+    def request(self, method, url, session=None, **kwargs):
+        return (session or requests).request(method, url, **kwargs)
+
+    def head(self, url, **kwargs):
+        kwargs.setdefault('allow_redirects', False)
+        return self.request('HEAD', url, **kwargs)
+
+    def get(self, url, params=None, **kwargs):
+        return self.request('GET', url, params=params, **kwargs)
+
+    def post(self, url, data=None, json=None, **kwargs):
+        return self.request('POST', url, data=data, json=json, **kwargs)
+
+    def put(self, url, data=None, **kwargs):
+        return self.request('PUT', url, data=data, **kwargs)
+
+    def patch(self, url, data=None, **kwargs):
+        return self.request('PATCH', url, data=data, **kwargs)
+
+    def delete(self, url, **kwargs):
+        return self.request('DELETE', url, **kwargs)
+
+
+def patch_nailgun_client(client=None):
+    """Make nailgun.client send the requests given a ``session`` kwarg through that session
+
+    Satellite.api reimports nailgun when switching its version, so this is called on each use.
+
+    :param client: The nailgun.client module, the imported one by default
+    """
+    if client is None:
+        from nailgun import client
+    if not isinstance(client.requests, _SessionRequests):
+        client.requests = _SessionRequests()
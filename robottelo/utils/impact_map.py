@@ -0,0 +1,199 @@
+"""A map of the framework lines executed by each test, to select the tests impacted by a change.
+
+The map is built from the data file of a coverage run with per-test contexts::
+
+    pytest tests/foreman --cov=robottelo --cov=pytest_fixtures --cov=pytest_plugins \
+        --cov-context=test
+    python scripts/build_impact_map.py .coverage
+
+and is used by ``pytest --impacted-by <git range>``. It is stored as JSON::
+
+    {
+        "version": 1,
+        "tests": ["tests/foreman/cli/test_foo.py::test_bar", ...],
+        "files": {
+            "robottelo/cli/base.py": {
+                "import": [[1, 40], [52, 52]],  # lines run at import time, outside of any test
+                "0": [[60, 75], [80, 82]],  # lines run by the test at index 0 of "tests"
+            },
+        },
+    }
+
+A change to a line run at import time (a constant, a class attribute, a decorator) impacts every
+test that ran any line of that file. Changes the map cannot track, to a ``conftest.py`` under
+``tests`` or to a file outside of the framework and the test modules (settings, test data,
+requirements), impact every test of its directory or every test, see ``unmapped_changes``.
+"""
+
+from bisect import bisect_right
+from collections import defaultdict
+import json
+from pathlib import Path
+import re
+import subprocess
+
+from robottelo.logging import logger as _root_logger
+
+logger = _root_logger.getChild('impact_map')
+
+IMPACT_MAP_VERSION = 1
+FRAMEWORK_PATHS = ('robottelo', 'pytest_fixtures', 'pytest_plugins', 'conftest.py')
+IMPORT_CONTEXT = 'import'
+
+hunk_regex = re.compile(r'^@@ -(?P<start>\d+)(?:,(?P<count>\d+))? \+\d+(?:,\d+)? @@')
+
+
+def _ranges(lines):
+    """Compress a set of line numbers into a sorted list of [start, end] ranges"""
+    ranges = []
+    for line in sorted(lines):
+        if ranges and line == ranges[-1][1] + 1:
+            ranges[-1][1] = line
+        else:
+            ranges.append([line, line])
+    return ranges
+
+
+def _intersects(ranges, lines):
+    """Whether any of the given lines falls into a sorted list of [start, end] ranges"""
+    starts = [start for start, _ in ranges]
+    for line in lines:
+        index = bisect_right(starts, line) - 1
+        if index >= 0 and ranges[index][1] >= line:
+            return True
+    return False
+
+
+def _is_framework_file(path):
+    return any(path == prefix or path.startswith(f'{prefix}/') for prefix in FRAMEWORK_PATHS)
+
+
+def _is_test_module(path):
+    path = Path(path)
+    return path.parts[0] == 'tests' and path.name.startswith('test_') and path.suffix == '.py'
+
+
+def build_from_coverage(data_file, root):
+    """Build an impact map from a coverage data file recorded with ``--cov-context=test``
+
+    :param data_file: The coverage data file, usually ``.coverage``
+    :param root: The robottelo checkout the coverage run was made in
+    :return: The impact map
+    """
+    try:
+        from coverage import CoverageData
+    except ImportError as err:
+        raise RuntimeError(
+            'Building an impact map requires coverage, install requirements-optional.txt'
+        ) from err
+    root = Path(root).resolve()
+    data = CoverageData(basename=str(data_file))
+    data.read()
+    tests = {}
+    files = {}
+    for filename in sorted(data.measured_files()):
+        try:
+            path = Path(filename).resolve().relative_to(root).as_posix()
+        except ValueError:
+            continue
+        if not _is_framework_file(path):
+            continue
+        lines_by_context = defaultdict(set)
+        for lineno, contexts in data.contexts_by_lineno(filename).items():
+            for context in contexts:
+                # pytest-cov names the contexts <nodeid>|setup, <nodeid>|run and <nodeid>|teardown
+                nodeid = context.rpartition('|')[0] if '|' in context else context
+                key = str(tests.setdefault(nodeid, len(tests))) if nodeid else IMPORT_CONTEXT
+                lines_by_context[key].add(lineno)
+        files[path] = {key: _ranges(lines) for key, lines in lines_by_context.items()}
+    logger.info(f'Built an impact map of {len(tests)} tests and {len(files)} framework files')
+    return {'version': IMPACT_MAP_VERSION, 'tests': list(tests), 'files': files}
+
+
+def save(impact_map, path):
+    path = Path(path)
+    tmp_file = path.with_suffix('.tmp')
+    tmp_file.write_text(json.dumps(impact_map, separators=(',', ':')))
+    tmp_file.replace(path)
+
+
+def load(path):
+    impact_map = json.loads(Path(path).read_text())
+    if impact_map.get('version') != IMPACT_MAP_VERSION:
+        raise ValueError(f'Unsupported impact map version in {path}')
+    return impact_map
+
+
+def changed_lines(git_range, root):
+    """Return the lines changed by a git range, numbered as before the change
+
+    A pure insertion is reported as a change of the lines around it.
+
+    :return: A dict of {file path: set of line numbers}, the set is empty for added files
+    """
+    diff = subprocess.run(
+        ['git', 'diff', '--unified=0', '--no-renames', git_range, '--'],
+        cwd=root,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    changes = {}
+    path = None
+    for line in diff.splitlines():
+        if line.startswith('--- '):
+            path = line[6:] if line.startswith('--- a/') else None
+        elif line.startswith('+++ ') and path is None and line.startswith('+++ b/'):
+            # added file, nothing could have executed it
+            changes.setdefault(line[6:], set())
+        elif (match := hunk_regex.match(line)) and path is not None:
+            start, count = int(match['start']), int(match['count'] or 1)
+            lines = changes.setdefault(path, set())
+            lines.update(range(start, start + count) if count else (start, start + 1))
+    return changes
+
+
+def impacted_tests(impact_map, changes):
+    """Return the node ids of the mapped tests impacted by the given changed lines
+
+    :param dict impact_map: The impact map
+    :param dict changes: The changed lines by file path, as returned by ``changed_lines``
+    """
+    tests = impact_map['tests']
+    impacted = set()
+    for path, lines in changes.items():
+        file_map = impact_map['files'].get(path)
+        if not file_map or not lines:
+            continue
+        if _intersects(file_map.get(IMPORT_CONTEXT, []), lines):
+            impacted.update(tests[int(key)] for key in file_map if key != IMPORT_CONTEXT)
+            continue
+        impacted.update(
+            tests[int(key)]
+            for key, ranges in file_map.items()
+            if key != IMPORT_CONTEXT and _intersects(ranges, lines)
+        )
+    return impacted
+
+
+def unmapped_changes(changes):
+    """Return the directories of the tests impacted by changed files the map cannot track
+
+    Changes to the framework modules are in the map, and a changed test module impacts its own
+    tests. A changed ``conftest.py`` under ``tests`` impacts every test of its directory, any other
+    changed file, e.g. ``conf/*.yaml``, ``tests/foreman/data/*`` or ``requirements.txt``, every
+    test.
+
+    :param dict changes: The changed lines by file path, as returned by ``changed_lines``
+    :return: A dict of {directory: changed file}, the directory is ``''`` for every test and ends
+        with a slash otherwise
+    """
+    directories = {}
+    for path in changes:
+        if (_is_framework_file(path) and path.endswith('.py')) or _is_test_module(path):
+            continue
+        if path.startswith('tests/') and Path(path).name == 'conftest.py':
+            directories.setdefault(f'{Path(path).parent.as_posix()}/', path)
+        else:
+            directories.setdefault('', path)
+    return directories
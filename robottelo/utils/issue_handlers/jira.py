@@ -1,12 +1,16 @@
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 import json
+import math
 from pathlib import Path
+import random
+import sqlite3
+import threading
 import time
 
-from jira import JIRA
-from jira.exceptions import JIRAError
 import pytest
-from wait_for import TimedOutError, wait_for
+from requests.adapters import HTTPAdapter
+from wait_for import TimedOutError
 
 from robottelo.config import settings
 from robottelo.constants import (
@@ -40,56 +44,154 @@ def _issue_to_flat_dict(issue, out_fields):
     return result
 
 
+# stale cache entries older than this many TTLs are dropped instead of being refreshed
+STALE_TTL_FACTOR = 4
+# max number of SQL variables in a single query on older SQLite builds
+SQLITE_BATCH_SIZE = 500
+
+
 class JiraStatusCache:
     """Handles caching of Jira issue statuses to reduce API calls.
     This class manages a local cache of Jira issue data, allowing for
-    efficient retrieval and storage of issue statuses. The cache is
-    periodically cleaned to remove expired entries based on a configurable
-    time-to-live (TTL) value.
+    efficient retrieval and storage of issue statuses. Entries older than a
+    configurable time-to-live (TTL) value are not returned by ``get``, but are
+    kept as stale entries, so that they can be refreshed incrementally by
+    asking Jira only for the issues updated since they were cached.
+
+    The cache is stored in an SQLite database in WAL mode, so that xdist workers can read and
+    upsert entries concurrently. Updates are buffered in memory and written in batches by
+    ``save`` once every ``cache_flush_interval`` seconds, and by ``flush`` at session end.
+    A legacy JSON cache file found next to the database is imported once.
     """
 
     def __init__(self):
-        self.cache_file = Path(settings.jira.cache_file)
+        cache_file = Path(settings.jira.cache_file)
+        self.cache_file = cache_file.with_suffix('.db')
+        self.legacy_cache_file = cache_file.with_suffix('.json')
         self.cache_ttl_days = settings.jira.cache_ttl_days
-        self.cache = self._load_cache()
-
-    def _load_cache(self):
-        if self.cache_file.exists():
-            logger.debug(f"Loading Jira cache from {self.cache_file}")
-            data = json.loads(self.cache_file.read_text())
-            self._clean_expired_entries(data)
-            logger.debug(f"Loaded {len(self.cache)} entries from Jira cache")
-            return self.cache
-        logger.debug("Jira cache file does not exist, using empty cache")
-        return {}
+        self.flush_interval = settings.jira.cache_flush_interval
+        self._pending = {}
+        self._lock = threading.RLock()
+        self._db = None
+        self._last_flush = time.monotonic()
+
+    @property
+    def db(self):
+        """The database connection, opened on first use"""
+        with self._lock:
+            if self._db is None:
+                logger.debug(f"Opening Jira cache {self.cache_file}")
+                self._db = sqlite3.connect(self.cache_file, timeout=60, check_same_thread=False)
+                self._db.execute("PRAGMA journal_mode=WAL")
+                with self._db:
+                    self._db.execute(
+                        "CREATE TABLE IF NOT EXISTS issues "
+                        "(key TEXT PRIMARY KEY, data TEXT NOT NULL, timestamp REAL NOT NULL)"
+                    )
+                self._import_legacy_cache()
+                self._clean_expired_entries()
+            return self._db
+
+    def _import_legacy_cache(self):
+        if not self.legacy_cache_file.exists():
+            return
+        if self._db.execute("SELECT 1 FROM issues LIMIT 1").fetchone():
+            return
+        issues = json.loads(self.legacy_cache_file.read_text()).get("issues", {})
+        with self._db:
+            self._db.executemany(
+                "INSERT OR IGNORE INTO issues VALUES (?, ?, ?)",
+                [
+                    (key, json.dumps(value), value.get("timestamp", 0))
+                    for key, value in issues.items()
+                ],
+            )
+        logger.debug(f"Imported {len(issues)} entries from {self.legacy_cache_file}")
+
+    def _fresh_since(self):
+        return time.time() - self.cache_ttl_days * 86400
+
+    def _query(self, issue_ids, min_timestamp, max_timestamp=math.inf):
+        """Return the entries of the given issues cached within the given time range"""
+        issue_ids = list(dict.fromkeys(issue_ids))
+        results = {}
+        with self._lock:
+            for i in range(0, len(issue_ids), SQLITE_BATCH_SIZE):
+                batch = issue_ids[i : i + SQLITE_BATCH_SIZE]
+                rows = self.db.execute(
+                    f"SELECT key, data, timestamp FROM issues WHERE key IN "
+                    f"({','.join('?' * len(batch))}) AND timestamp >= ? AND timestamp < ?",
+                    [*batch, min_timestamp, max_timestamp],
+                )
+                for key, data, timestamp in rows:
+                    results[key] = json.loads(data) | {"timestamp": timestamp}
+            # entries waiting to be flushed take precedence over the stored ones
+            for issue_id in issue_ids:
+                if (data := self._pending.get(issue_id)) is not None:
+                    results.pop(issue_id, None)
+                    if min_timestamp <= data["timestamp"] < max_timestamp:
+                        results[issue_id] = data
+        return results
 
     def get(self, issue_id):
-        return self.cache.get(issue_id)
+        return self._query([issue_id], self._fresh_since()).get(issue_id)
 
     def get_many(self, issue_ids):
-        results = {issue_id: self.cache.get(issue_id) for issue_id in issue_ids}
-        logger.debug(
-            f"Retrieved {sum(1 for v in results.values() if v is not None)} entries from cache"
-        )
+        found = self._query(issue_ids, self._fresh_since())
+        results = {issue_id: found.get(issue_id) for issue_id in issue_ids}
+        logger.debug(f"Retrieved {len(found)} entries from cache")
         return results
 
+    def get_stale(self, issue_ids):
+        """Return the expired entries of the given issues, to be refreshed"""
+        fresh_since = self._fresh_since()
+        expired_since = time.time() - self.cache_ttl_days * 86400 * STALE_TTL_FACTOR
+        return self._query(issue_ids, expired_since, fresh_since)
+
     def update(self, issue_id, data):
-        self.cache[issue_id] = data | {"timestamp": time.time()}
+        with self._lock:
+            self._pending[issue_id] = data | {"timestamp": time.time()}
+
+    def touch(self, issue_ids):
+        """Mark cached entries as fresh, for issues that did not change since they were cached"""
+        now = time.time()
+        with self._lock:
+            for issue_id, data in self._query(issue_ids, 0).items():
+                self._pending[issue_id] = data | {"timestamp": now}
 
     def save(self):
-        logger.debug(f"Saving {len(self.cache)} entries to Jira cache file")
-        self.cache_file.write_text(json.dumps({"issues": self.cache}))
+        """Flush the pending updates if the flush interval has elapsed"""
+        if time.monotonic() - self._last_flush >= self.flush_interval:
+            self.flush()
+
+    def flush(self):
+        """Write the pending updates to the database in a single transaction"""
+        with self._lock:
+            self._last_flush = time.monotonic()
+            if not self._pending:
+                return
+            logger.debug(f"Saving {len(self._pending)} entries to Jira cache {self.cache_file}")
+            with self.db:
+                # concurrent writers keep the most recently fetched data
+                self.db.executemany(
+                    "INSERT INTO issues VALUES (?, ?, ?) ON CONFLICT(key) DO UPDATE "
+                    "SET data = excluded.data, timestamp = excluded.timestamp "
+                    "WHERE excluded.timestamp >= issues.timestamp",
+                    [
+                        (key, json.dumps(data), data["timestamp"])
+                        for key, data in self._pending.items()
+                    ],
+                )
+            self._pending = {}
 
-    def _clean_expired_entries(self, data):
-        now = time.time()
-        ttl = self.cache_ttl_days * 86400
-        old_count = len(data.get("issues", {}))
-        self.cache = {
-            key: value
-            for key, value in data.get("issues", {}).items()
-            if now - value.get("timestamp", 0) <= ttl
-        }
-        logger.debug(f"Cleaned expired cache entries: {old_count} → {len(self.cache)}")
+    def _clean_expired_entries(self):
+        # stale entries are kept for incremental refresh, only drop the long forgotten ones
+        expired_since = time.time() - self.cache_ttl_days * 86400 * STALE_TTL_FACTOR
+        with self._db:
+            deleted = self._db.execute(
+                "DELETE FROM issues WHERE timestamp < ?", (expired_since,)
+            ).rowcount
+        logger.debug(f"Cleaned {deleted} expired cache entries")
 
 
 # Create a global instance of JiraStatusCache
@@ -181,18 +283,71 @@ def try_from_cache(issue_id):
 # cannot use lru_cache in functions that has unhashable args
 CACHED_RESPONSES = defaultdict(dict)
 
+# attempts and base delay (seconds) of the exponential backoff of Jira requests
+JIRA_ATTEMPTS = 4
+JIRA_RETRY_DELAY = 5
+
 
-def _jira_client():
+def _jira_client(pool_size=None):
     """Create a JIRA client with basic auth (email and api_key)."""
-    return JIRA(
+    from jira import JIRA
+
+    jira = JIRA(
         server=settings.jira.url,
         basic_auth=(settings.jira.email, settings.jira.api_key),
     )
+    if pool_size:
+        # let concurrent requests reuse connections instead of opening new ones
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        jira._session.mount('https://', adapter)
+        jira._session.mount('http://', adapter)
+    return jira
+
+
+def _is_rate_limited(err):
+    from jira.exceptions import JIRAError
+
+    return isinstance(err, JIRAError) and err.status_code == 429
+
+
+def _retry_delay(err, attempt):
+    """Seconds to wait before retrying a failed Jira request
 
+    Rate limited requests wait as long as Jira asks for in the Retry-After header,
+    other failures back off exponentially, with jitter so that workers do not retry in sync.
+    """
+    if _is_rate_limited(err) and err.response is not None:
+        retry_after = err.response.headers.get('Retry-After', '')
+        if retry_after.isdigit():
+            return int(retry_after)
+    return min(JIRA_RETRY_DELAY * 2**attempt, 60) * random.uniform(0.5, 1.0)
+
+
+def _search_batch(jira, jql, fields, expand, max_results):
+    """Run a Jira search, retrying with backoff on rate limits and errors"""
+    for attempt in range(JIRA_ATTEMPTS):
+        try:
+            return jira.search_issues(
+                jql_str=jql, fields=fields, expand=expand, maxResults=max_results
+            )
+        except Exception as err:  # retry any failure, like wait_for did
+            if attempt == JIRA_ATTEMPTS - 1:
+                logger.error(f"Maximum retries reached when accessing Jira API: {err}")
+                raise TimedOutError(f"Could not query Jira after {JIRA_ATTEMPTS} attempts") from err
+            delay = _retry_delay(err, attempt)
+            if _is_rate_limited(err):
+                logger.warning(f"Hit Jira API rate limit (429). Retrying in {delay:.0f}s.")
+            else:
+                logger.warning(f"Jira API request failed: {err}. Retrying in {delay:.0f}s.")
+            time.sleep(delay)
+    raise TimedOutError(f"Could not query Jira after {JIRA_ATTEMPTS} attempts")
 
-def get_jira(issue_ids, fields=None, expand='renderedFields', max_results=100):
+
+def get_jira(issue_ids, fields=None, expand='renderedFields', max_results=100, updated_since=None):
     """Retrieve Jira issues for the given list of issue keys/IDs and fields.
 
+    Batches of ``max_results`` issues are fetched concurrently, over a pooled session.
+
     :param issue_ids: Jira issue ids to get data for
     :type issue_ids: list
     :param fields: The custom fields in query to retrieve the data for
@@ -201,39 +356,27 @@ def get_jira(issue_ids, fields=None, expand='renderedFields', max_results=100):
     :type fields: str
     :param max_results: Maximum number of issues to return.
     :type max_results: int
+    :param updated_since: Only return the issues updated after this timestamp
+    :type updated_since: float
     :returns: List of Issue objects from the jira library
     :rtype: list
     """
     fields_str = ','.join(fields) if fields else None
-
-    def _make_request():
-        try:
-            jira = _jira_client()
-            all_issues = []
-            for i in range(0, len(issue_ids), max_results):
-                batch = issue_ids[i : i + max_results]
-                jql = ' OR '.join([f"id = {issue_id}" for issue_id in batch])
-                issues = jira.search_issues(
-                    jql_str=jql, fields=fields_str, expand=expand, maxResults=max_results
-                )
-                all_issues.extend(issues)
-            return all_issues
-        except JIRAError as err:
-            if getattr(err, 'status_code', None) == 429:
-                logger.warning("Hit Jira API rate limit (429). Will retry after wait period.")
-            raise
-
-    try:
-        return wait_for(
-            _make_request,
-            timeout=80,
-            delay=20,
-            attempts=4,
-            handle_exception=True,
-        ).out
-    except TimedOutError as err:
-        logger.error(f"Maximum retries reached when accessing Jira API: {err}")
-        raise
+    jqls = [
+        ' OR '.join([f"id = {issue_id}" for issue_id in issue_ids[i : i + max_results]])
+        for i in range(0, len(issue_ids), max_results)
+    ]
+    if updated_since:
+        # relative dates do not depend on the timezone of the Jira user, add a minute of margin
+        minutes = math.ceil((time.time() - updated_since) / 60) + 1
+        jqls = [f'({jql}) AND updated >= -{minutes}m' for jql in jqls]
+    workers = max(1, min(settings.jira.max_workers, len(jqls)))
+    jira = _jira_client(pool_size=workers if workers > 1 else None)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(
+            lambda jql: _search_batch(jira, jql, fields_str, expand, max_results), jqls
+        )
+        return [issue for issues in results for issue in issues]
 
 
 def get_data_jira(issue_ids, cached_data=None, jira_fields=None):  # pragma: no cover
@@ -275,22 +418,28 @@ def get_data_jira(issue_ids, cached_data=None, jira_fields=None):  # pragma: no
         logger.debug(f"Using JiraStatusCache for {set(issue_ids)}")
         return [cached_issues[issue_id] for issue_id in issue_ids]
 
+    # Expired entries are refreshed by only fetching the issues updated since they were cached
+    stale_issues = jira_cache.get_stale(remaining_issues)
+    missing_issues = [issue for issue in remaining_issues if issue not in stale_issues]
+
     # Ensure API key is set
     if not (settings.jira.email and settings.jira.api_key):
         logger.warning(
             "Config file is missing either jira email or api_key. Provide Jira email and api_key or a jira_cache.json."
         )
-        # Provide default data for collected Jira's.
-        default_data = [get_default_jira(issue_id) for issue_id in remaining_issues]
+        # Provide default data for collected Jira's, expired data is still better than none
+        default_data = [get_default_jira(issue_id) for issue_id in missing_issues]
         # Update cache with defaults
         for issue in default_data:
             jira_cache.update(issue['key'], issue)
         jira_cache.save()
 
         # Return combination of cached and default data
-        return [
-            cached_issues[issue_id] for issue_id in issue_ids if issue_id in cached_issues
-        ] + default_data
+        return (
+            [cached_issues[issue_id] for issue_id in issue_ids if issue_id in cached_issues]
+            + list(stale_issues.values())
+            + default_data
+        )
 
     # No cached data so Call Jira API for remaining issues
     logger.debug(f"Calling Jira API for {set(remaining_issues)}")
@@ -299,12 +448,27 @@ def get_data_jira(issue_ids, cached_data=None, jira_fields=None):  # pragma: no
         assert field not in jira_fields
 
     # Generate jql
-    if isinstance(remaining_issues, str):
-        remaining_issues = [issue_id.strip() for issue_id in remaining_issues.split(',')]
-    issues = get_jira(remaining_issues, jira_fields)
-    fetched_data = [
-        _issue_to_flat_dict(issue, jira_fields) for issue in issues if issue is not None
-    ]
+    if isinstance(missing_issues, str):
+        missing_issues = [issue_id.strip() for issue_id in missing_issues.split(',')]
+    fetched_data = []
+    if missing_issues:
+        issues = get_jira(missing_issues, jira_fields)
+        fetched_data = [
+            _issue_to_flat_dict(issue, jira_fields) for issue in issues if issue is not None
+        ]
+    unchanged_data = []
+    if stale_issues:
+        last_sync = min(issue.get('timestamp', 0) for issue in stale_issues.values())
+        issues = get_jira(list(stale_issues), jira_fields, updated_since=last_sync)
+        updated_data = [
+            _issue_to_flat_dict(issue, jira_fields) for issue in issues if issue is not None
+        ]
+        logger.debug(f"{len(updated_data)} of {len(stale_issues)} expired Jira issues changed")
+        fetched_data.extend(updated_data)
+        updated_keys = {issue['key'] for issue in updated_data}
+        unchanged = [issue_id for issue_id in stale_issues if issue_id not in updated_keys]
+        jira_cache.touch(unchanged)
+        unchanged_data = [stale_issues[issue_id] for issue_id in unchanged]
 
     # Update cache with new data
     for issue in fetched_data:
@@ -312,9 +476,11 @@ def get_data_jira(issue_ids, cached_data=None, jira_fields=None):  # pragma: no
     jira_cache.save()
 
     # Combine cached and fetched data
-    result_data = [
-        cached_issues[issue_id] for issue_id in issue_ids if issue_id in cached_issues
-    ] + fetched_data
+    result_data = (
+        [cached_issues[issue_id] for issue_id in issue_ids if issue_id in cached_issues]
+        + fetched_data
+        + unchanged_data
+    )
     CACHED_RESPONSES['get_data'][str(sorted(issue_ids))] = result_data
     return result_data
 
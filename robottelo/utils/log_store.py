@@ -0,0 +1,193 @@
+"""A merged store of the robottelo log files of an xdist run, indexed by test and phase.
+
+The log files of the controller and of each worker are merged by timestamp, without loading
+them, into a single file of independently gzipped blocks, which is still readable with
+``zcat``. A side index records the byte ranges of each test phase in the uncompressed blocks::
+
+    {
+        "version": 1,
+        "blocks": [[0, 52311], [52311, 49870]],  # offset and length of each gzipped block
+        "tests": {
+            "tests/foreman/cli/test_foo.py::test_bar": {
+                "setup": [{"source": "robottelo_gw1.log", "ranges": [[0, 1024, 2048], ...]}],
+                "call": [...],
+                "teardown": [...],
+            },
+        },
+    }
+
+where each range is ``[block, start, end]``. The phases are delimited by the ``Started Test``
+and ``Finished <phase> for test`` records of ``pytest_plugins.logging_hooks``, so showing the
+log of a test only decompresses the blocks holding it.
+"""
+
+import gzip
+import heapq
+import json
+from pathlib import Path
+import re
+
+from robottelo.logging import logger as _root_logger
+
+logger = _root_logger.getChild('log_store')
+
+LOG_STORE_VERSION = 1
+PHASES = ('setup', 'call', 'teardown')
+# uncompressed size of each gzipped block
+BLOCK_SIZE = 1 << 20
+
+# To match the timestamp of the text and JSON lines formats of robottelo.logging
+timestamp_regex = re.compile(rb'^(?:\{"time": ")?(\d{4}-\d\d-\d\d \d\d:\d\d:\d\d)')
+started_regex = re.compile(r'Started Test: (?P<nodeid>.+)$')
+finished_regex = re.compile(
+    r'Finished (?P<phase>setup|call|teardown) for test: (?P<nodeid>.+), result: \w+$'
+)
+
+
+def index_path(store):
+    """Return the path of the index of a log store"""
+    return Path(store).with_suffix('.index.json')
+
+
+def _records(path, source):
+    """Yield the timestamp, source and text of each record of a log file
+
+    Lines without timestamp, as tracebacks, belong to the record before them.
+    """
+    timestamp, lines = b'', []
+    with open(path, 'rb') as log_file:
+        for line in log_file:
+            if match := timestamp_regex.match(line):
+                if lines:
+                    yield timestamp, source, b''.join(lines)
+                timestamp, lines = match[1], [line]
+            else:
+                lines.append(line)
+    if lines:
+        yield timestamp, source, b''.join(lines)
+
+
+def _message(record):
+    """Return the first line of the message of a record, for the records marking test phases"""
+    if record.startswith(b'{"time": '):
+        return json.loads(record)['message'].partition('\n')[0]
+    return record.partition(b'\n')[0].decode(errors='replace')
+
+
+class _BlockWriter:
+    """Writes data in independently gzipped blocks of about ``block_size`` bytes"""
+
+    def __init__(self, store_file, block_size):
+        self.store_file = store_file
+        self.block_size = block_size
+        self.blocks = []
+        self.buffer = bytearray()
+
+    def write(self, data):
+        """Write data, and return its position as [block, start, end]"""
+        start = len(self.buffer)
+        self.buffer += data
+        position = [len(self.blocks), start, len(self.buffer)]
+        if len(self.buffer) >= self.block_size:
+            self.flush()
+        return position
+
+    def flush(self):
+        if self.buffer:
+            offset = self.store_file.tell()
+            self.store_file.write(gzip.compress(bytes(self.buffer)))
+            self.blocks.append([offset, self.store_file.tell() - offset])
+            self.buffer.clear()
+
+
+def merge_logs(log_files, store, block_size=BLOCK_SIZE):
+    """Merge log files by timestamp into a log store, and write its index
+
+    Records of the same second keep the order of the log files they come from. The log files
+    logging the phases of several tests at once, as the one of an xdist controller, are merged
+    but not indexed.
+
+    :param log_files: The log files to merge, e.g. robottelo.log and robottelo_gw*.log
+    :param store: The gzipped log store to write, the index is written next to it
+    :return: The index
+    """
+    log_files = [Path(log_file) for log_file in log_files]
+    sources = [log_file.name for log_file in log_files]
+    streams = [
+        _records(log_file, source) for source, log_file in zip(sources, log_files, strict=True)
+    ]
+    tests = {}
+    # ranges of each source since its last phase marker, and the test it is running
+    pending = {source: [] for source in sources}
+    running = dict.fromkeys(sources)
+    # sources logging the phases of several tests at once, as the controller of an xdist run
+    interleaved = set()
+    with open(store, 'wb') as store_file:
+        writer = _BlockWriter(store_file, block_size)
+        for _, source, record in heapq.merge(*streams, key=lambda item: item[0]):
+            block, start, end = writer.write(record)
+            ranges = pending[source]
+            if ranges and ranges[-1][0] == block and ranges[-1][2] == start:
+                ranges[-1][2] = end
+            else:
+                ranges.append([block, start, end])
+            if b'Started Test: ' in record and (match := started_regex.search(_message(record))):
+                if running[source] is not None:
+                    interleaved.add(source)
+                running[source] = match['nodeid']
+                # records between tests belong to none of them
+                pending[source] = [[block, start, end]]
+            elif b' for test: ' in record and (match := finished_regex.search(_message(record))):
+                phases = tests.setdefault(match['nodeid'], {})
+                phases.setdefault(match['phase'], []).append({'source': source, 'ranges': ranges})
+                pending[source] = []
+                if match['phase'] == 'teardown':
+                    running[source] = None
+        writer.flush()
+    if interleaved:
+        logger.debug(f'Not indexing the interleaved test phases of {", ".join(interleaved)}')
+        tests = {
+            nodeid: {
+                phase: [entry for entry in entries if entry['source'] not in interleaved]
+                for phase, entries in phases.items()
+            }
+            for nodeid, phases in tests.items()
+        }
+    index = {'version': LOG_STORE_VERSION, 'blocks': writer.blocks, 'tests': tests}
+    index_path(store).write_text(json.dumps(index, separators=(',', ':')))
+    logger.info(f'Merged {len(log_files)} log files of {len(tests)} tests into {store}')
+    return index
+
+
+def load_index(store):
+    index = json.loads(index_path(store).read_text())
+    if index.get('version') != LOG_STORE_VERSION:
+        raise ValueError(f'Unsupported log store version in {index_path(store)}')
+    return index
+
+
+def show(store, nodeid, phases=PHASES, index=None):
+    """Yield the source, phase and log text of each phase of a test, from a log store
+
+    Only the blocks holding the test phases are read and decompressed.
+
+    :raises KeyError: If the test is not in the log store
+    """
+    index = index or load_index(store)
+    test_phases = index['tests'][nodeid]
+    blocks = {}
+    with open(store, 'rb') as store_file:
+
+        def read_block(block):
+            if block not in blocks:
+                offset, length = index['blocks'][block]
+                store_file.seek(offset)
+                blocks[block] = gzip.decompress(store_file.read(length))
+            return blocks[block]
+
+        for phase in phases:
+            for entry in test_phases.get(phase, []):
+                text = b''.join(
+                    read_block(block)[start:end] for block, start, end in entry['ranges']
+                )
+                yield entry['source'], phase, text.decode(errors='replace')
@@ -0,0 +1,200 @@
+"""A local manifest cache shared by all xdist workers on the same machine.
+
+Generating a manifest through Manifester is slow and rate-limited, while most fixtures only need
+"a fresh manifest of category X". This module keeps a configurable number of pre-generated
+manifests per manifest category on disk. Each manifest is handed out to exactly one consumer
+(a manifest can only be imported into one organization), and the cache is refilled in a
+background thread so the next consumer does not have to wait for Manifester. The refills are
+joined at the end of the session by ``join_refills``, so no allocation is left out of the cache.
+
+The cache directory holds one sub-directory per category, with an ``index.json`` file that all
+workers read and write under a file lock. Manifests older than ``manifest.cache.max_age`` seconds
+are removed and their subscription allocations deleted.
+
+Example:
+    >>> with ManifestCache('golden_ticket').checkout() as manifest:
+    ...     target_sat.upload_manifest(org.id, manifest.content)
+"""
+
+from contextlib import contextmanager
+import json
+from pathlib import Path
+import threading
+import time
+
+from broker.helpers import FileLock
+from manifester import Manifester
+
+from robottelo.config import robottelo_tmp_dir, settings
+from robottelo.logging import logger as _root_logger
+
+logger = _root_logger.getChild('manifest_cache')
+
+# the refill threads started by this process, see join_refills
+_refills = set()
+_refills_lock = threading.Lock()
+
+
+def join_refills(timeout=None):
+    """Wait for the cache refills started by this process to finish
+
+    :param timeout: Seconds to wait for each refill, None to wait until it finishes
+    """
+    with _refills_lock:
+        refills = list(_refills)
+    for thread in refills:
+        logger.debug('Waiting for %s to finish', thread.name)
+        thread.join(timeout)
+
+
+class CachedManifest:
+    """A manifest handed out by the cache, with the attributes of a Manifester manifest"""
+
+    def __init__(self, path, uuid):
+        self.path = Path(path)
+        self.name = Path(self.path.name)
+        self.uuid = uuid
+
+    @property
+    def content(self):
+        return self.path.read_bytes()
+
+
+class ManifestCache:
+    """A file-locked pool of pre-generated manifests for a single manifest category.
+
+    Attributes:
+        category (str): The name of the manifest category in ``settings.manifest``.
+        size (int): The number of manifests to keep ready in the cache.
+        max_age (int): The number of seconds after which a cached manifest is discarded.
+        cache_dir (Path): The directory holding the cached manifests of this category.
+    """
+
+    # how long a pending generation may take before other workers stop counting on it
+    pending_timeout = 1800
+
+    def __init__(self, category, size=None, max_age=None):
+        self.category = category
+        self.size = settings.manifest.cache.size if size is None else size
+        self.max_age = settings.manifest.cache.max_age if max_age is None else max_age
+        self.cache_dir = robottelo_tmp_dir.joinpath('manifest_cache', category)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.index_file = self.cache_dir / 'index.json'
+        self.lock = FileLock(self.index_file, timeout=120)
+
+    def _manifester(self):
+        return Manifester(manifest_category=settings.manifest[self.category])
+
+    def _read_index(self):
+        if self.index_file.exists():
+            return json.loads(self.index_file.read_text())
+        return {'ready': [], 'pending': []}
+
+    def _write_index(self, index):
+        self.index_file.write_text(json.dumps(index))
+
+    def _expire(self, index):
+        """Remove expired manifests and stale pending generations from the index
+
+        :return: The list of expired manifest entries, to be deleted outside the lock
+        """
+        now = time.time()
+        expired = [entry for entry in index['ready'] if now - entry['created'] > self.max_age]
+        index['ready'] = [entry for entry in index['ready'] if entry not in expired]
+        index['pending'] = [
+            started for started in index['pending'] if now - started < self.pending_timeout
+        ]
+        return expired
+
+    def _delete(self, entries):
+        """Delete the local files and subscription allocations of the given entries"""
+        manifester = None
+        for entry in entries:
+            logger.debug('Discarding cached manifest %s', entry['uuid'])
+            Path(entry['path']).unlink(missing_ok=True)
+            try:
+                manifester = manifester or self._manifester()
+                manifester.delete_subscription_allocation(uuid=entry['uuid'])
+            except Exception as err:  # cleanup should never break a test
+                logger.warning('Failed to delete allocation %s: %s', entry['uuid'], err)
+
+    def _generate(self):
+        """Generate a new manifest with Manifester and move it into the cache directory"""
+        manifester = self._manifester()
+        try:
+            manifest = manifester.get_manifest()
+        except Exception:
+            manifester.delete_subscription_allocation()
+            raise
+        cached_path = self.cache_dir / manifest.path.name
+        manifest.path.replace(cached_path)
+        return {'path': str(cached_path), 'uuid': manifest.uuid, 'created': time.time()}
+
+    def refill(self):
+        """Generate manifests until the cache holds ``size`` ready or pending manifests"""
+        while True:
+            with self.lock:
+                index = self._read_index()
+                expired = self._expire(index)
+                missing = self.size - len(index['ready']) - len(index['pending'])
+                if missing > 0:
+                    started = time.time()
+                    index['pending'].append(started)
+                self._write_index(index)
+            self._delete(expired)
+            if missing <= 0:
+                return
+            entry = None
+            try:
+                entry = self._generate()
+            finally:
+                with self.lock:
+                    index = self._read_index()
+                    if started in index['pending']:
+                        index['pending'].remove(started)
+                    if entry:
+                        index['ready'].append(entry)
+                    self._write_index(index)
+            logger.debug('Added manifest %s to the %s cache', entry['uuid'], self.category)
+
+    def refill_in_background(self):
+        """Start a thread that refills the cache, joined by ``join_refills``"""
+
+        def _refill():
+            try:
+                self.refill()
+            except Exception as err:  # checkout falls back to Manifester
+                logger.warning('Failed to refill the %s manifest cache: %s', self.category, err)
+            finally:
+                with _refills_lock:
+                    _refills.discard(threading.current_thread())
+
+        thread = threading.Thread(target=_refill, name=f'manifest-cache-{self.category}')
+        with _refills_lock:
+            _refills.add(thread)
+        thread.start()
+        return thread
+
+    @contextmanager
+    def checkout(self):
+        """Hand out a cached manifest, or a freshly generated one if the cache is empty
+
+        The manifest is removed from the cache, and its subscription allocation is deleted when
+        the context exits, just like with ``Manifester`` used as a context manager.
+        """
+        with self.lock:
+            index = self._read_index()
+            expired = self._expire(index)
+            entry = index['ready'].pop(0) if index['ready'] else None
+            self._write_index(index)
+        self._delete(expired)
+        if entry is None:
+            logger.info('Manifest cache for %s is empty, generating a manifest', self.category)
+            entry = self._generate()
+        else:
+            logger.info('Using cached manifest %s for %s', entry['uuid'], self.category)
+        self.refill_in_background()
+        try:
+            yield CachedManifest(entry['path'], entry['uuid'])
+        finally:
+            self._delete([entry])
@@ -0,0 +1,273 @@
+"""A persistent index of the testimony metadata of test modules.
+
+Collecting tests used to call ``inspect.getdoc`` and ``inspect.getsource`` for every item and run
+the testimony token regexes on the result, which makes collecting ``tests/foreman`` slow. This
+module parses each test module once with ``ast`` and stores the parsed tokens and ``is_open``
+usages in an on-disk index, keyed by file path and content hash, so that only changed files are
+parsed again.
+
+The index is shared by the ``metadata_markers`` and ``issue_handlers`` plugins and the scripts
+in ``scripts/``. Entries of a file look like::
+
+    {
+        "hash": "<sha256 of the file content>",
+        "source_component": "Repositories",  # first :CaseComponent: anywhere in the file
+        "is_open": [["SA", "12345"]],  # is_open usages anywhere in the file
+        "not is_open": [],
+        "objects": {
+            "": {...},  # the module docstring
+            "TestClass": {...},
+            "TestClass.test_foo": {
+                "component": "repositories",
+                "importance": "high",
+                "team": "phoenix",
+                "blocked_by": ["SAT-1234"],
+                "verifies": ["SAT-5678"],
+                "tokens": {"casecomponent": "Repositories", ...},
+                "is_open": [["SA", "12345"]],
+                "not is_open": [],
+            },
+        },
+    }
+"""
+
+import ast
+import contextlib
+import hashlib
+import inspect
+import json
+from pathlib import Path
+import re
+
+from broker.helpers import FileLock
+
+from robottelo.config import robottelo_tmp_dir
+from robottelo.logging import logger as _root_logger
+
+logger = _root_logger.getChild('metadata_index')
+
+INDEX_VERSION = 1
+
+component_regex = re.compile(
+    # To match :CaseComponent: FooBar
+    r'\s*:CaseComponent:\s*(?P<component>\S*)',
+    re.IGNORECASE,
+)
+
+importance_regex = re.compile(
+    # To match :CaseImportance: Critical
+    r'\s*:CaseImportance:\s*(?P<importance>\S*)',
+    re.IGNORECASE,
+)
+
+team_regex = re.compile(
+    # To match :Team: Rocket
+    r'\s*:Team:\s*(?P<team>\S*)',
+    re.IGNORECASE,
+)
+
+blocked_by_regex = re.compile(
+    # To match :BlockedBy: SAT-32932
+    r'\s*:BlockedBy:\s*(?P<blocked_by>.*\S*)',
+    re.IGNORECASE,
+)
+
+verifies_regex = re.compile(
+    # To match :Verifies: SAT-32932
+    r'\s*:Verifies:\s*(?P<verifies>.*\S*)',
+    re.IGNORECASE,
+)
+
+token_regex = re.compile(
+    # To match any testimony token, e.g. :customerscenario: true
+    r'^\s*:(?P<name>\w+):\s*(?P<value>.*?)\s*$',
+    re.MULTILINE,
+)
+
+IS_OPEN = re.compile(
+    # To match `if is_open('SAT:123456'):`
+    r"\s*if\sis_open\(\S(?P<src>\D{2})\s*:\s*(?P<num>\d*)\S\)\d*"
+)
+
+NOT_IS_OPEN = re.compile(
+    # To match `if not is_open('SAT:123456'):`
+    r"\s*if\snot\sis_open\(\S(?P<src>\D{2})\s*:\s*(?P<num>\d*)\S\)\d*"
+)
+
+
+def parse_docstring(docstring):
+    """Parse the testimony tokens of a docstring
+
+    :return: A dict of the tokens used for markers, and of all ``tokens`` by lowercase name
+    """
+    docstring = docstring or ''
+    component = component_regex.findall(docstring)
+    importance = importance_regex.findall(docstring)
+    team = team_regex.findall(docstring)
+    blocked_by = blocked_by_regex.findall(docstring)
+    verifies = verifies_regex.findall(docstring)
+    tokens = {}
+    for name, value in token_regex.findall(docstring):
+        tokens.setdefault(name.lower(), value)
+    return {
+        'component': component[0].lower() if component else None,
+        'importance': importance[0].lower() if importance else None,
+        'team': team[0].lower() if team else None,
+        'blocked_by': [b.strip() for b in blocked_by[-1].split(',')] if blocked_by else [],
+        'verifies': [v.strip() for v in verifies[-1].split(',')] if verifies else [],
+        'tokens': tokens,
+    }
+
+
+def _is_open_usages(source):
+    # lists rather than tuples, to be the same once loaded from the index file
+    return {
+        'is_open': [list(match) for match in IS_OPEN.findall(source)],
+        'not is_open': [list(match) for match in NOT_IS_OPEN.findall(source)],
+    }
+
+
+def parse_file(path, content=None):
+    """Parse the docstrings and is_open usages of all classes and functions of a python file"""
+    source = (content if content is not None else Path(path).read_bytes()).decode()
+    lines = source.splitlines(keepends=True)
+    tree = ast.parse(source, filename=str(path))
+    source_component = component_regex.findall(source)
+    objects = {'': {**parse_docstring(ast.get_docstring(tree)), **_is_open_usages('')}}
+
+    def visit(node, prefix):
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, ast.ClassDef | ast.FunctionDef | ast.AsyncFunctionDef):
+                qualname = f'{prefix}{child.name}'
+                start = min([d.lineno for d in child.decorator_list] + [child.lineno])
+                objects[qualname] = {
+                    **parse_docstring(ast.get_docstring(child)),
+                    **_is_open_usages(''.join(lines[start - 1 : child.end_lineno])),
+                }
+                nested = '.<locals>.' if not isinstance(child, ast.ClassDef) else '.'
+                visit(child, f'{qualname}{nested}')
+
+    visit(tree, '')
+    return {
+        'source_component': source_component[0] if source_component else None,
+        **_is_open_usages(source),
+        'objects': objects,
+    }
+
+
+def _locate(obj):
+    """Return the file path and qualified name under which an object is indexed"""
+    if inspect.ismodule(obj):
+        return obj.__file__, ''
+    obj = inspect.unwrap(obj)
+    if inspect.isfunction(obj):
+        return obj.__code__.co_filename, obj.__qualname__
+    return inspect.getfile(obj), obj.__qualname__
+
+
+def inherited_tokens(objects, qualname):
+    """Return the tokens of an object merged with those of its module and enclosing classes
+
+    The tokens of the object take precedence over those of its classes, and those of the
+    classes over those of the module.
+
+    :param dict objects: The ``objects`` of the file metadata
+    """
+    tokens = dict(objects['']['tokens'])
+    parts = qualname.split('.')
+    for depth in range(1, len(parts) + 1):
+        if entry := objects.get('.'.join(parts[:depth])):
+            tokens.update(entry['tokens'])
+    return tokens
+
+
+class MetadataIndex:
+    """The on-disk index of parsed testimony metadata, keyed by file path and content hash.
+
+    Attributes:
+        index_file (Path): The JSON file holding the index.
+        entries (dict): The index entries by resolved file path.
+    """
+
+    def __init__(self, index_file=None):
+        self.index_file = Path(index_file or robottelo_tmp_dir / 'metadata_index.json')
+        self.entries = self._load()
+        self._updated = {}
+        # files checked by this process, so that each file is hashed only once
+        self._checked = {}
+
+    def _load(self):
+        with contextlib.suppress(OSError, ValueError):
+            data = json.loads(self.index_file.read_text())
+            if data.get('version') == INDEX_VERSION:
+                return data['files']
+        return {}
+
+    def file_metadata(self, path):
+        """Return the metadata of a file, parsing it only if it changed since it was indexed"""
+        if (entry := self._checked.get(str(path))) is not None:
+            return entry
+        key, path = str(path), str(Path(path).resolve())
+        content = Path(path).read_bytes()
+        content_hash = hashlib.sha256(content).hexdigest()
+        entry = self.entries.get(path)
+        if entry is None or entry['hash'] != content_hash:
+            logger.debug(f'Indexing metadata of {path}')
+            entry = {'hash': content_hash, **parse_file(path, content)}
+            self.entries[path] = self._updated[path] = entry
+        self._checked[key] = entry
+        return entry
+
+    def metadata(self, obj):
+        """Return the metadata of a module, class or function, None if it can't be located"""
+        try:
+            path, qualname = _locate(obj)
+            return self.file_metadata(path)['objects'].get(qualname)
+        except (OSError, TypeError, SyntaxError):
+            return None
+
+    def get_testcases(self, paths):
+        """Return the metadata of the test functions found under the given paths
+
+        As with ``testimony.get_testcases``, the ``tokens`` of each test are merged with those of
+        its module and classes, see ``inherited_tokens``.
+
+        :return: A dict of {file path: {test qualname: metadata}}
+        """
+        testcases = {}
+        for path in paths:
+            path = Path(path)
+            for test_file in sorted(path.rglob('test_*.py') if path.is_dir() else [path]):
+                objects = self.file_metadata(test_file)['objects']
+                if tests := {
+                    qualname: {**data, 'tokens': inherited_tokens(objects, qualname)}
+                    for qualname, data in objects.items()
+                    if qualname.rpartition('.')[2].startswith('test_')
+                }:
+                    testcases[str(test_file)] = tests
+        return testcases
+
+    def save(self):
+        """Merge the entries parsed by this process into the index file"""
+        if not self._updated:
+            return
+        with FileLock(self.index_file, timeout=120):
+            files = self._load()
+            files.update(self._updated)
+            files = {path: entry for path, entry in files.items() if Path(path).exists()}
+            tmp_file = self.index_file.with_suffix('.tmp')
+            tmp_file.write_text(json.dumps({'version': INDEX_VERSION, 'files': files}))
+            tmp_file.replace(self.index_file)
+        logger.debug(f'Saved metadata of {len(self._updated)} files to {self.index_file}')
+        self._updated = {}
+
+
+_index = None
+
+
+def get_index():
+    """Return the metadata index shared by the plugins of this process"""
+    global _index
+    if _index is None:
+        _index = MetadataIndex()
+    return _index
@@ -1,9 +1,19 @@
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import json
+import math
+import os
+
 import requests
+from requests.adapters import HTTPAdapter
 from tenacity import retry, stop_after_attempt, wait_fixed
 
-from robottelo.config import settings
+from robottelo.config import robottelo_tmp_dir, settings
 from robottelo.logging import logger
 
+# launches in these states may still get new test items, their items are not cached
+UNFINISHED_LAUNCH_STATUSES = ('IN_PROGRESS', 'INTERRUPTED')
+
 
 class ReportPortal:
     """Represents ReportPortal
@@ -27,19 +37,25 @@ class ReportPortal:
     statuses = ['FAILED', 'PASSED', 'SKIPPED', 'INTERRUPTED', 'IN_PROGRESS']
     importance_levels = ['Low', 'Medium', 'High', 'Critical', 'Fips']
 
-    def __init__(self, rp_url=None, rp_api_key=None, rp_project=None):
+    def __init__(self, rp_url=None, rp_api_key=None, rp_project=None, cache_dir=None):
         """initiate report portal properties"""
         self.rp_url = rp_url or settings.report_portal.portal_url
         self.rp_project = rp_project or settings.report_portal.project
         self.rp_api_key = rp_api_key or settings.report_portal.api_key
         self.rp_project_settings = None
+        self.max_workers = settings.report_portal.max_workers
+        self.cache_dir = cache_dir or robottelo_tmp_dir / 'report_portal'
+
+        # keep the connections alive between the requests, one per concurrent page fetch
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.session.verify = False
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.max_workers)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
 
         # fetch the project settings
-        settings_req = requests.get(
-            url=f'{self.api_url}/settings', headers=self.headers, verify=False
-        )
-        settings_req.raise_for_status()
-        self.rp_project_settings = settings_req.json()
+        self.rp_project_settings = self._get('settings')
 
     @property
     def api_url(self):
@@ -51,8 +67,40 @@ class ReportPortal:
         """The headers for Report Portal Requests."""
         return {'Authorization': f'Bearer {self.rp_api_key}'}
 
+    def _get(self, endpoint, params=None):
+        resp = self.session.get(url=f'{self.api_url}/{endpoint}', params=params)
+        resp.raise_for_status()
+        return resp.json()
+
+    def _get_pages(self, endpoint, params, max_pages=None):
+        """Fetch the content of all pages of a paginated endpoint
+
+        The first page tells the total number of pages, the others are fetched concurrently.
+        """
+        first = self._get(endpoint, params | {'page.page': 1})
+        total_pages = first['page']['totalPages']
+        if max_pages is not None:
+            total_pages = min(total_pages, max_pages)
+        content = list(first['content'])
+        if total_pages > 1:
+            logger.debug(f'Fetching {total_pages} pages of Report Portal {endpoint}')
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                pages = executor.map(
+                    lambda page: self._get(endpoint, params | {'page.page': page})['content'],
+                    range(2, total_pages + 1),
+                )
+                for page_content in pages:
+                    content.extend(page_content)
+        return content
+
     def get_launches(
-        self, sat_version=None, include_unfinished=False, importances=None, name=None, uuid=None
+        self,
+        sat_version=None,
+        include_unfinished=False,
+        importances=None,
+        name=None,
+        uuid=None,
+        limit=20,
     ):
         """Returns Report Portal launches customized by sat_version, launch_name and
         latest number of launches sorted by latest sat version/snap version.
@@ -66,16 +114,17 @@ class ReportPortal:
         :param list importances: A list of importance levels we want to fetch launches for
         :param str name: Name of the launch to be filtered
         :param str uuid: Optional, UUID of the launch to be fetched - overrides the other parameters
+        :param int limit: The maximum number of the latest launches to be fetched
         :returns dict: The launches of Report portal.
             if sat_version is given,
             ```{'snap_version1':launch_object1, 'snap_version2':launch_object2}```
             else,
             ```{'sat_version1':{'snap_version1':launch_object1, ..}, 'sat_version2':{}}```
         """
-        # fixme: we might want to implement pagination eventually
         if importances is None:
             importances = self.importance_levels
-        params = {'page.page': 1, 'page.size': 20, 'page.sort': 'startTime,desc'}
+        page_size = min(limit, 100)
+        params = {'page.size': page_size, 'page.sort': 'startTime,desc'}
         if uuid is not None:
             params['filter.eq.uuid'] = uuid
         else:
@@ -91,15 +140,37 @@ class ReportPortal:
                 # outside of report portal and a current launch has been already started
                 params['filter.ne.status'] = "IN_PROGRESS"
 
-        resp = requests.get(
-            url=f'{self.api_url}/launch', headers=self.headers, params=params, verify=False
-        )
-        resp.raise_for_status()
+        launches = self._get_pages('launch', params, max_pages=math.ceil(limit / page_size))
         # this should further filter out unfinished launches as RP API currently doesn't
         # support usage of the same filter type multiple times (filter.ne.status)
-        return [
-            launch for launch in resp.json()['content'] if launch['status'] not in ['INTERRUPTED']
-        ]
+        return [launch for launch in launches[:limit] if launch['status'] not in ['INTERRUPTED']]
+
+    def _cache_file(self, launch, params):
+        """Return the cache file of the items of a finished launch, None if it can't be cached"""
+        if not launch.get('uuid') or launch.get('status') in UNFINISHED_LAUNCH_STATUSES:
+            return None
+        params_hash = hashlib.sha1(json.dumps(params, sort_keys=True).encode()).hexdigest()
+        return self.cache_dir / f'{launch["uuid"]}-{params_hash[:12]}.json'
+
+    def _get_launch_items(self, launch, params):
+        """Return the test items of a launch, from the disk cache if the launch is finished"""
+        cache_file = self._cache_file(launch, params)
+        if cache_file is not None and cache_file.exists():
+            try:
+                items = json.loads(cache_file.read_text())
+            except (OSError, ValueError) as err:
+                logger.warning(f'Ignoring the unreadable Report Portal cache {cache_file}: {err}')
+            else:
+                logger.debug(f'Using cached Report Portal items of launch {launch["uuid"]}')
+                return items
+        items = self._get_pages('item', params)
+        if cache_file is not None:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            # every xdist worker may fetch the same launch, each writes its own temporary file
+            tmp_file = cache_file.with_suffix(f'.{os.getpid()}.tmp')
+            tmp_file.write_text(json.dumps(items))
+            tmp_file.replace(cache_file)
+        return items
 
     @retry(
         stop=stop_after_attempt(6),
@@ -118,7 +189,7 @@ class ReportPortal:
             ```{'test_name1':test1_properties_dict, 'test_name2':test2_properties_dict}```
         """
         params = {
-            'page.size': 50,
+            'page.size': 100,
             'page.sort': 'name',
             'filter.eq.launchId': launch["id"],
             'filter.ne.type': "SUITE",
@@ -137,23 +208,8 @@ class ReportPortal:
             params['filter.has.attributeKey'] = 'team'
             params['filter.has.attributeValue'] = test_args['team']
 
-        # send HTTP request to RP API, retrieve the paginated results and join them together
-        page = 1
-        total_pages = 1
-        resp_tests = []
-        while page <= total_pages:
-            logger.debug(page)
-            params['page.page'] = page
-            resp = requests.get(
-                url=f'{self.api_url}/item',
-                headers=self.headers,
-                params=params,
-                verify=False,
-            )
-            resp.raise_for_status()
-            resp_tests.extend(resp.json()['content'])
-            total_pages = resp.json()['page']['totalPages']
-            page += 1
+        # send HTTP requests to RP API, retrieve the paginated results and join them together
+        resp_tests = self._get_launch_items(launch, params)
 
         # Only select tests matching the supplied paths. This is a workaround for RP API limitation
         # - unable to combine multiple filters of a same type
@@ -0,0 +1,163 @@
+"""Accounting of the remote calls made by each test phase: SSH commands, hammer and API calls.
+
+``pytest_plugins.resource_usage`` starts the accounting of each test phase with ``begin`` and
+collects it with ``end``. Meanwhile, every remote call measured with ``measure`` adds to the
+usage of its kind:
+
+* ``ssh``: the commands run by ``ContentHost.execute``, ``robottelo.ssh.command`` included
+* ``hammer``: the hammer calls of ``robottelo.cli.base.Base.execute``, which are run over SSH,
+  so their time and bytes are also part of the ``ssh`` usage
+* ``api``: the HTTP calls of ``nailgun.client``, once ``instrument_nailgun`` wrapped them
+
+Outside of an accounted test phase, measuring a call does nothing.
+"""
+
+import functools
+import threading
+import time
+
+KINDS = ('ssh', 'hammer', 'api')
+# kinds whose time adds up to the time a test spent waiting on remote hosts
+REMOTE_KINDS = ('ssh', 'api')
+NAILGUN_METHODS = ('request', 'head', 'get', 'post', 'put', 'patch', 'delete')
+
+_lock = threading.Lock()
+# usage of the running test phase by kind, None when not accounting
+_current = None
+# whether the HTTP calls of nailgun are to be measured, set by pytest_plugins.resource_usage
+enabled = False
+
+
+class Usage:
+    """The calls, errors, wall time and bytes sent and received of a kind of remote call"""
+
+    __slots__ = ('calls', 'errors', 'seconds', 'sent', 'received')
+
+    def __init__(self, calls=0, errors=0, seconds=0.0, sent=0, received=0):
+        self.calls = calls
+        self.errors = errors
+        self.seconds = seconds
+        self.sent = sent
+        self.received = received
+
+    def add(self, other):
+        self.calls += other.calls
+        self.errors += other.errors
+        self.seconds += other.seconds
+        self.sent += other.sent
+        self.received += other.received
+
+    def as_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+def _size(data):
+    """Return the size in bytes of the text, bytes or byte count of a call, 0 for anything else"""
+    if isinstance(data, int):
+        return data
+    if isinstance(data, bytes | bytearray):
+        return len(data)
+    if isinstance(data, str):
+        return len(data) if data.isascii() else len(data.encode(errors='replace'))
+    return 0
+
+
+def begin():
+    """Start accounting the remote calls of a test phase"""
+    global _current
+    with _lock:
+        _current = {}
+
+
+def end():
+    """Stop accounting, and return the usage of the test phase as {kind: Usage}"""
+    global _current
+    with _lock:
+        usage, _current = _current or {}, None
+    return usage
+
+
+class measure:
+    """Measure a remote call, and add it to the usage of the running test phase
+
+    The call is an error if it raises, or if ``finish`` says so::
+
+        with resource_usage.measure('ssh', sent=command) as call:
+            result = self.session.run(command)
+            call.finish(received=(result.stdout, result.stderr), error=result.status != 0)
+    """
+
+    __slots__ = ('kind', 'sent', 'received', 'error', 'start')
+
+    def __init__(self, kind, sent=None):
+        self.kind = kind
+        self.sent = sent
+        self.received = ()
+        self.error = False
+
+    def finish(self, received=(), error=False):
+        """Set the outcome of the call: the data received, and whether it failed"""
+        self.received = received if isinstance(received, tuple | list) else (received,)
+        self.error = error
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        seconds = time.perf_counter() - self.start
+        if _current is None:
+            return
+        call = Usage(
+            calls=1,
+            errors=int(self.error or exc_type is not None),
+            seconds=seconds,
+            sent=_size(self.sent),
+            received=sum(_size(data) for data in self.received),
+        )
+        with _lock:
+            if _current is not None:
+                _current.setdefault(self.kind, Usage()).add(call)
+
+
+def _measured_http(func):
+    """Wrap a nailgun.client function to measure its HTTP calls"""
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with measure('api') as call:
+            response = func(*args, **kwargs)
+            request = getattr(response, 'request', None)
+            if kwargs.get('stream'):
+                # reading the content of a streamed response here would consume it
+                received = int(response.headers.get('Content-Length') or 0)
+            else:
+                received = response.content
+            call.sent = getattr(request, 'body', None)
+            call.finish(received=received, error=response.status_code >= 400)
+        return response
+
+    wrapper._resource_usage = True
+    return wrapper
+
+
+def instrument_nailgun(client=None):
+    """Measure the HTTP calls of nailgun.client, if accounting is enabled
+
+    Satellite.api reimports nailgun when switching its version, so this is called again there.
+
+    :param client: The nailgun.client module, the imported one by default
+    """
+    if not enabled:
+        return
+    if client is None:
+        from nailgun import client
+    for name in NAILGUN_METHODS:
+        func = getattr(client, name, None)
+        if callable(func) and not getattr(func, '_resource_usage', False):
+            setattr(client, name, _measured_http(func))
+
+
+def remote_seconds(usage):
+    """Return the time a test phase spent waiting on remote hosts, from its usage by kind"""
+    return sum(usage[kind].seconds for kind in REMOTE_KINDS if kind in usage)
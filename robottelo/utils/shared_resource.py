@@ -5,8 +5,11 @@ before continuing with some common action. The most common use case in this fram
 be to wait for all pre-upgrade setups to be ready before performing the upgrade.
 
 The system works by creating a file in /tmp with the name of the resource. This is a common file
-where each process can communicate its status. The first process to register will be the main
-watcher. The main watcher will wait for all other processes to be ready, then perform the action.
+where each process can communicate its status. Updates are serialized with an flock on a sibling
+lock file and written atomically, and waiting processes are woken up by inotify events on the
+file instead of polling it (polling remains as a fallback where inotify is not available). The
+first process to register will be the main watcher. The main watcher will wait for all other
+processes to be ready, then perform the action.
 If the main actor fails to complete the action, and the action is recoverable, another process
 will take over as the main watcher and attempt to perform the action. If the action is not
 recoverable, the main watcher will fail and release all other processes.
@@ -20,15 +23,35 @@ Example:
     ...     resource.ready()  # tell the other processes that we are ready
     ...     yield target_sat  # give the upgraded satellite to the test
     ...     # Do post-upgrade cleanup steps if any
+
+The ``xdist_once`` decorator builds on the same shared file approach for expensive, idempotent
+setup steps (syncing a repository, publishing a content view, enabling a plugin). The first
+worker computes the result and publishes it, other workers wait for it and reuse it.
+
+Example:
+    >>> @xdist_once(key='rhel9_bos_repo')
+    ... def synced_rhel9_bos(target_sat, org_id):
+    ...     repo_id = target_sat.api_factory.enable_sync_redhat_repo(REPOS['rhel9_bos'], org_id)
+    ...     return {'repo_id': repo_id}
 """
 
+import contextlib
+import ctypes
+import ctypes.util
+import fcntl
+from functools import wraps
+import hashlib
 import json
 import os
 from pathlib import Path
+import select
+import shutil
+import struct
+import tempfile
 import time
 from uuid import uuid4
 
-from broker.helpers import FileLock
+import pytest
 from wait_for import wait_for
 
 from robottelo.config import settings
@@ -41,6 +64,112 @@ class SharedResourceError(Exception):
     """An exception class for SharedResource errors."""
 
 
+class ResourceLock:
+    """An exclusive lock on a shared file, held with flock on a sibling lock file.
+
+    Unlike a polled lock file, a process waiting for the lock is woken up by the kernel as soon as
+    it is released. The lock file can be removed while the lock is held: a process that locked
+    the removed file sees it is no longer the one at the lock path, and locks the new one.
+    """
+
+    def __init__(self, file_name):
+        self.lock = Path(f"{file_name}.flock")
+        self._fd = None
+
+    def __enter__(self):
+        while True:
+            fd = os.open(self.lock, os.O_RDWR | os.O_CREAT, 0o666)
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            with contextlib.suppress(FileNotFoundError):
+                locked, current = os.fstat(fd), os.stat(self.lock)
+                if (locked.st_dev, locked.st_ino) == (current.st_dev, current.st_ino):
+                    break
+            os.close(fd)
+        self._fd = fd
+        return self
+
+    def __exit__(self, *tb_info):
+        fd, self._fd = self._fd, None
+        fcntl.flock(fd, fcntl.LOCK_UN)
+        os.close(fd)
+
+    def remove(self):
+        """Remove the lock file, while holding the lock"""
+        self.lock.unlink(missing_ok=True)
+
+
+class ResourceWatcher:
+    """Wait for changes of a shared file using inotify, falling back to polling.
+
+    The parent directory is watched, so that atomic replacements and removals of the file are
+    seen. Events are queued from the moment the watcher is created, so checking a condition
+    and then calling ``wait`` cannot miss a change made in between.
+    """
+
+    IN_CLOSE_WRITE = 0x008
+    IN_MOVED_TO = 0x080
+    IN_CREATE = 0x100
+    IN_DELETE = 0x200
+    IN_NONBLOCK = os.O_NONBLOCK
+    EVENT_HEADER = struct.Struct("iIII")
+    poll_interval = 1
+    use_inotify = True
+
+    def __init__(self, file_name):
+        self.file_name = Path(file_name)
+        self._fd = None
+        if not self.use_inotify:
+            return
+        with contextlib.suppress(OSError, AttributeError):
+            libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+            fd = libc.inotify_init1(self.IN_NONBLOCK)
+            if fd < 0:
+                return
+            mask = self.IN_CLOSE_WRITE | self.IN_MOVED_TO | self.IN_CREATE | self.IN_DELETE
+            if libc.inotify_add_watch(fd, str(self.file_name.parent).encode(), mask) < 0:
+                os.close(fd)
+                return
+            self._fd = fd
+
+    def _file_changed(self):
+        """Drain pending events and return True if any concerns the watched file."""
+        changed = False
+        with contextlib.suppress(BlockingIOError):
+            while data := os.read(self._fd, 65536):
+                offset = 0
+                while offset < len(data):
+                    _, _, _, length = self.EVENT_HEADER.unpack_from(data, offset)
+                    offset += self.EVENT_HEADER.size
+                    name = data[offset : offset + length].rstrip(b"\0").decode()
+                    offset += length
+                    changed |= name == self.file_name.name
+        return changed
+
+    def wait(self, timeout):
+        """Block until the watched file changes, or at most timeout seconds."""
+        if self._fd is None:
+            time.sleep(min(timeout, self.poll_interval))
+            return
+        deadline = time.monotonic() + timeout
+        while (remaining := deadline - time.monotonic()) > 0:
+            if select.select([self._fd], [], [], remaining)[0] and self._file_changed():
+                return
+
+    def close(self):
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *tb_info):
+        self.close()
+
+    def __del__(self):
+        self.close()
+
+
 class SharedResource:
     """A class representing a shared resource.
 
@@ -76,7 +205,8 @@ class SharedResource:
         """
         self.resource_name = resource_name
         self.resource_file = Path(f"/tmp/{resource_name}.shared")
-        self.lock_file = FileLock(self.resource_file, timeout=120)
+        self.lock_file = ResourceLock(self.resource_file)
+        self.watcher = ResourceWatcher(self.resource_file)
         self.id = str(uuid4().fields[-1])
         self.action = action
         self.action_validator = action_validator
@@ -87,6 +217,21 @@ class SharedResource:
         self.retries = retries
         self.delay = delay
 
+    def _read(self):
+        return json.loads(self.resource_file.read_text())
+
+    def _write(self, data):
+        """Atomically replace the resource file, so it can be read without holding the lock."""
+        tmp_file = self.resource_file.with_name(f"{self.resource_file.name}.{self.id}")
+        tmp_file.write_text(json.dumps(data))
+        tmp_file.replace(self.resource_file)
+
+    def _remove(self):
+        """Remove the resource file, and its lock file."""
+        with self.lock_file:
+            self.resource_file.unlink(missing_ok=True)
+            self.lock_file.remove()
+
     def _update_status(self, status):
         """Updates the status of the shared resource.
 
@@ -94,10 +239,10 @@ class SharedResource:
             status (str): The new status of the shared resource.
         """
         with self.lock_file:
-            curr_data = json.loads(self.resource_file.read_text())
+            curr_data = self._read()
             curr_data["statuses"][self.id] = status
             logger.debug("Updating watcher status to %s", status)
-            self.resource_file.write_text(json.dumps(curr_data, indent=4))
+            self._write(curr_data)
 
     def _update_main_status(self, status):
         """Updates the main status of the shared resource.
@@ -106,9 +251,9 @@ class SharedResource:
             status (str): The new main status of the shared resource.
         """
         with self.lock_file:
-            curr_data = json.loads(self.resource_file.read_text())
+            curr_data = self._read()
             curr_data["main_status"] = status
-            self.resource_file.write_text(json.dumps(curr_data, indent=4))
+            self._write(curr_data)
 
     def _check_all_status(self, status):
         """Checks if all watchers have the specified status.
@@ -120,7 +265,7 @@ class SharedResource:
             bool: True if all watchers have the specified status, False otherwise.
         """
         with self.lock_file:
-            curr_data = json.loads(self.resource_file.read_text())
+            curr_data = self._read()
             for watcher_id in curr_data["watchers"]:
                 if curr_data["statuses"].get(watcher_id) != status:
                     return False
@@ -135,18 +280,18 @@ class SharedResource:
         while not self._check_all_status(status):
             if status == "done":
                 logger.debug("Main worker still waiting for all workers to report status 'done'.")
-            time.sleep(1)
+            self.watcher.wait(settings.robottelo.shared_resource_wait)
 
     def _wait_for_main_watcher(self):
         """Waits for the main watcher to finish."""
         while True:
-            curr_data = json.loads(self.resource_file.read_text())
+            curr_data = self._read()
             if curr_data["main_status"] == "error":
                 raise Exception(f"Error in main watcher: {curr_data['main_watcher']}")
             if curr_data["main_status"] == "action_error":
                 self._try_take_over()
             elif curr_data["main_status"] != "done":
-                time.sleep(settings.robottelo.shared_resource_wait)
+                self.watcher.wait(settings.robottelo.shared_resource_wait)
             else:
                 logger.debug("Main status now done, breaking wait loop")
                 break
@@ -154,11 +299,11 @@ class SharedResource:
     def _try_take_over(self):
         """Tries to take over as the main watcher."""
         with self.lock_file:
-            curr_data = json.loads(self.resource_file.read_text())
+            curr_data = self._read()
             if curr_data["main_status"] in ("action_error", "error"):
                 curr_data["main_status"] = "recovering"
                 curr_data["main_watcher"] = self.id
-                self.resource_file.write_text(json.dumps(curr_data, indent=4))
+                self._write(curr_data)
                 self.is_main = True
                 self.is_recovering = True
         self.wait()
@@ -167,7 +312,7 @@ class SharedResource:
         """Registers the current process as a watcher."""
         with self.lock_file:
             if self.resource_file.exists():
-                curr_data = json.loads(self.resource_file.read_text())
+                curr_data = self._read()
                 self.is_main = False
             else:  # First watcher to register, becomes the main watcher, and creates the file
                 curr_data = {
@@ -179,18 +324,18 @@ class SharedResource:
                 self.is_main = True
             curr_data["watchers"].append(self.id)
             curr_data["statuses"][self.id] = "pending"
-            self.resource_file.write_text(json.dumps(curr_data, indent=4))
+            self._write(curr_data)
 
     def unregister(self):
         """Unregisters the current process as a watcher."""
         logger.debug("Unregistering %s", os.environ.get('PYTEST_XDIST_WORKER', 'worker'))
         with self.lock_file:
-            curr_data = json.loads(self.resource_file.read_text())
+            curr_data = self._read()
             logger.debug("Removing watcher ID from resource file")
             curr_data["watchers"].remove(self.id)
             del curr_data["statuses"][self.id]
             logger.debug("Writing new resource file")
-            self.resource_file.write_text(json.dumps(curr_data, indent=4))
+            self._write(curr_data)
 
     def ready(self):
         """Marks the current process as ready to perform the action."""
@@ -212,7 +357,7 @@ class SharedResource:
         except Exception as err:
             if not self.action_is_recoverable:
                 self._update_main_status("error")
-                self.resource_file.unlink()
+                self._remove()
                 raise SharedResourceError('Main worker failed during action') from err
             self._update_main_status('action_error')
             raise SharedResourceError('Recoverable failures in main worker') from err
@@ -257,6 +402,7 @@ class SharedResource:
                 '%s did not find resource file. Has it already been deleted?',
                 os.environ.get('PYTEST_XDIST_WORKER', 'Worker'),
             )
+            self.watcher.close()
             raise exc_value
         if exc_type:
             # Only try to update status if the resource file still exists
@@ -267,7 +413,7 @@ class SharedResource:
                     if self._check_all_status("error"):
                         # All have failed, delete the file
                         logger.warning("All workers FAILED, removing resource file")
-                        self.resource_file.unlink()
+                        self._remove()
                     else:
                         logger.warning("Setting main status to ERROR")
                         self._update_main_status("error")
@@ -275,10 +421,155 @@ class SharedResource:
                 logger.debug(
                     "Resource file was deleted during error handling, skipping status update"
                 )
+            self.watcher.close()
             raise exc_value
         logger.debug('Setting status to done')
-        self.done()
+        try:
+            self.done()
+        except FileNotFoundError:
+            # the main watcher removes the file once all remaining watchers are done,
+            # which may happen as soon as this one has unregistered
+            logger.debug("Resource file already removed, all watchers are done")
         if self.is_main:
             self._wait_for_status("done")
             logger.debug("All workers done, removing resource file")
-            self.resource_file.unlink()
+            self._remove()
+        self.watcher.close()
+
+
+def _default_token():
+    """Identify the Satellite a shared result is computed against"""
+    return settings.server.hostname
+
+
+def xdist_once(key, invalidate_on=_default_token, timeout=3600):
+    """Compute the result of the decorated function once and share it between xdist workers
+
+    The first worker to call the function computes the result and publishes it in a shared file,
+    the other workers block until it is published and return it without calling the function.
+    The result has to be JSON serializable, e.g. a dict of entity IDs. If the computation fails,
+    the error is propagated to every worker waiting for, or later asking for, the result, and if
+    it is skipped, they skip with the same reason.
+
+    Results are shared within a single xdist run only, and removed by the controller at the end
+    of the run. Outside of xdist, the function is called every time.
+
+    :param key: The name of the shared result, or a callable building it from the function
+        arguments
+    :param invalidate_on: A callable returning a token identifying the state the result depends
+        on, by default the Satellite hostname. A different token means a different result, which
+        is computed again, so workers aligned to different Satellites do not share results.
+    :param timeout: Seconds to wait for another worker to publish the result
+    """
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            run_id = os.environ.get('PYTEST_XDIST_TESTRUNUID')
+            if not run_id:
+                return func(*args, **kwargs)
+            name = key(*args, **kwargs) if callable(key) else key
+            token = hashlib.sha1(str(invalidate_on()).encode()).hexdigest()[:12]
+            result = SharedResult(f'{name}-{token}', timeout, shared_results_dir(run_id))
+            return result.get(func, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def shared_results_dir(run_id):
+    """Return the directory holding the shared results of an xdist run"""
+    return Path(tempfile.gettempdir(), f'robottelo-once-{run_id}')
+
+
+def remove_shared_results(run_id):
+    """Remove the shared results of an xdist run, once all of its workers are done"""
+    shutil.rmtree(shared_results_dir(run_id), ignore_errors=True)
+
+
+class SharedResult:
+    """A result computed by one process and shared with the others through a file.
+
+    Attributes:
+        result_file (Path): The path to the file holding the shared result.
+        timeout (int): Seconds to wait for another process to publish the result.
+    """
+
+    def __init__(self, name, timeout=3600, directory=None):
+        directory = Path(directory or tempfile.gettempdir())
+        directory.mkdir(parents=True, exist_ok=True)
+        self.result_file = directory / f"{name}.once"
+        self.lock_file = ResourceLock(self.result_file)
+        self.timeout = timeout
+        self.id = str(uuid4().fields[-1])
+
+    def _read(self):
+        if self.result_file.exists():
+            return json.loads(self.result_file.read_text())
+        return None
+
+    def _write(self, data):
+        tmp_file = self.result_file.with_name(f"{self.result_file.name}.{self.id}")
+        tmp_file.write_text(json.dumps(data))
+        tmp_file.replace(self.result_file)
+
+    def _claim(self):
+        """Claim the computation, or return the current shared state if another process did
+
+        Returns:
+            dict: The shared state, None if the current process has to compute the result.
+        """
+        with self.lock_file:
+            if data := self._read():
+                return data
+            self._write({"status": "computing", "owner": self.id})
+            return None
+
+    def _wait(self):
+        """Wait until the owner of the computation publishes the result or fails."""
+        deadline = time.time() + self.timeout
+        with ResourceWatcher(self.result_file) as watcher:
+            while time.time() < deadline:
+                data = self._read()
+                if data is None or data["status"] != "computing":
+                    return data
+                watcher.wait(deadline - time.time())
+        raise SharedResourceError(f"Timed out waiting for {self.result_file} to be computed")
+
+    def get(self, func, *args, **kwargs):
+        """Return the shared result, computing it with func if no other process did."""
+        data = self._claim()
+        if data and data["status"] == "computing":
+            data = self._wait()
+            if data is None:  # the result file was removed while waiting
+                return self.get(func, *args, **kwargs)
+        if data is None:
+            return self._compute(func, *args, **kwargs)
+        if data["status"] == "skipped":
+            pytest.skip(data["reason"])
+        if data["status"] == "error":
+            raise SharedResourceError(
+                f"{self.result_file.name} failed in another worker: {data['error']}"
+            )
+        logger.debug("Reusing shared result %s", self.result_file.name)
+        return data["result"]
+
+    def _compute(self, func, *args, **kwargs):
+        logger.debug("Computing shared result %s", self.result_file.name)
+        try:
+            result = func(*args, **kwargs)
+            data = {"status": "done", "result": result}
+            json.dumps(data)
+        except pytest.skip.Exception as err:
+            # the other workers skip for the same reason
+            data = {"status": "skipped", "reason": err.msg}
+            raise
+        except BaseException as err:
+            # failures and interrupts are published too, not to leave the others waiting
+            data = {"status": "error", "error": repr(err)}
+            raise
+        finally:
+            with self.lock_file:
+                self._write(data)
+        return result
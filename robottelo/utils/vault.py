@@ -1,26 +1,53 @@
 """Hashicorp Vault Utils where vault CLI is wrapped to perform vault operations"""
 
+import contextlib
+import hashlib
 import json
 import os
+from pathlib import Path
 import re
 import subprocess
 import sys
+import tempfile
+import threading
+import time
+
+from broker.helpers import FileLock
 
 from robottelo.exceptions import InvalidVaultURLForOIDC
 from robottelo.logging import logger, robottelo_root_dir
 
 
 class Vault:
+    """Wrapper of the vault CLI, logging in with OIDC and keeping the token in the env file
+
+    The expiry time of the tokens looked up is stored in ``token_cache_file``, by token hash, so
+    that a valid token is not looked up again by every pytest process. A token expiring within
+    ``RENEW_THRESHOLD`` seconds is renewed in a background thread, and an expired one leads to a
+    new login, shared by the concurrent processes through a file lock.
+    """
+
     HELP_TEXT = (
         "Vault CLI in not installed in your system, "
         "refer link https://learn.hashicorp.com/tutorials/vault/getting-started-install to "
         "install vault CLI as per your system spec!"
     )
+    # renew the token when it expires within this many seconds
+    RENEW_THRESHOLD = 3600
+    RENEW_INCREMENT = '10h'
+    # the OIDC login waits for the user to sign-in in the browser
+    LOGIN_TIMEOUT = 600
 
-    def __init__(self, env_file='.env'):
+    def __init__(self, env_file='.env', token_cache_file=None):
         self.env_path = robottelo_root_dir.joinpath(env_file)
         self.envdata = None
         self.vault_enabled = None
+        self.token_cache_file = Path(
+            token_cache_file
+            or Path(tempfile.gettempdir()) / f'robottelo-vault-tokens-{os.getuid()}.json'
+        )
+        self.renew_thread = None
+        self.vault_addr = None
 
     def setup(self):
         if self.env_path.exists():
@@ -39,6 +66,7 @@ class Vault:
 
         # Set Vault CLI Env Var
         os.environ['VAULT_ADDR'] = vaulturl
+        self.vault_addr = vaulturl
 
         # Dynaconf Vault Env Vars
         if (
@@ -57,6 +85,9 @@ class Vault:
         :param command str: The vault CLI command
         :param kwargs dict: Arguments to the subprocess run command to customize the run behavior
         """
+        if self.vault_addr and 'env' not in kwargs:
+            # the renewal thread may run the command after teardown removed VAULT_ADDR
+            kwargs['env'] = {**os.environ, 'VAULT_ADDR': self.vault_addr}
         vcommand = subprocess.run(command, shell=True, capture_output=True, **kwargs)
         if vcommand.returncode != 0:
             verror = str(vcommand.stderr)
@@ -75,13 +106,112 @@ class Vault:
                     logger.error(f"Error! {verror}")
         return vcommand
 
-    def login(self, **kwargs):
-        if (
+    @property
+    def oidc_enabled(self):
+        return (
             self.vault_enabled
             and self.vault_enabled in ['True', 'true']
             and 'VAULT_SECRET_ID_FOR_DYNACONF' not in os.environ
-            and self.status(**kwargs).returncode != 0
-        ):
+        )
+
+    @property
+    def env_token(self):
+        """The token set in the env file, None if there is none"""
+        token = re.findall('^VAULT_TOKEN_FOR_DYNACONF=(.*)$', self.envdata or '', re.MULTILINE)
+        return token[0].strip() if token else None
+
+    def set_env_token(self, token):
+        self.envdata = re.sub(
+            '.*VAULT_TOKEN_FOR_DYNACONF=.*', f"VAULT_TOKEN_FOR_DYNACONF={token}", self.envdata
+        )
+        self.env_path.write_text(self.envdata)
+
+    @staticmethod
+    def _token_hash(token):
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    def _cached_tokens(self):
+        with contextlib.suppress(OSError, ValueError):
+            return json.loads(self.token_cache_file.read_text())
+        return {}
+
+    def _update_token_cache(self, token, ttl=None):
+        """Store the expiry time of a token, or forget the token if ttl is None"""
+        with FileLock(self.token_cache_file, timeout=30):
+            now = time.time()
+            tokens = {
+                token_hash: expire_time
+                for token_hash, expire_time in self._cached_tokens().items()
+                if expire_time is None or expire_time > now
+            }
+            tokens.pop(self._token_hash(token), None)
+            if ttl is not None:
+                # tokens without ttl, as root tokens, never expire
+                tokens[self._token_hash(token)] = now + ttl if ttl else None
+            tmp_file = self.token_cache_file.with_suffix(f'.{os.getpid()}.tmp')
+            tmp_file.touch(mode=0o600)
+            tmp_file.write_text(json.dumps(tokens))
+            tmp_file.replace(self.token_cache_file)
+
+    def token_ttl(self, lookup=True, **kwargs):
+        """Return the number of seconds the vault token is valid for, 0 if it is not valid
+
+        The expiry time of the env file token is read from the token cache, unless it is due
+        for renewal. Otherwise the vault CLI token is looked up, and set in the env file.
+
+        :param lookup: Whether to look up the token when the cache is not conclusive
+        """
+        if token := self.env_token:
+            expire_time = self._cached_tokens().get(self._token_hash(token), 0)
+            if expire_time is None:
+                return float('inf')
+            if (ttl := expire_time - time.time()) > self.RENEW_THRESHOLD:
+                return ttl
+        if not lookup:
+            return 0
+        vstatus = self.exec_vault_command('vault token lookup --format json', **kwargs)
+        if vstatus.returncode != 0:
+            return 0
+        data = json.loads(vstatus.stdout.decode('UTF-8'))['data']
+        self._update_token_cache(data['id'], data['ttl'])
+        if data['id'] != token:
+            self.set_env_token(data['id'])
+            logger.info("Success! Vault token added to .env file to access secrets from vault!")
+        return data['ttl'] or float('inf')
+
+    def renew(self, **kwargs):
+        """Renew the vault token, unless another process renewed it already"""
+        with FileLock(self.token_cache_file, timeout=self.LOGIN_TIMEOUT):
+            if self.token_ttl(lookup=False) > self.RENEW_THRESHOLD:
+                return
+            vstatus = self.exec_vault_command(
+                f"vault token renew -i {self.RENEW_INCREMENT} --format json", **kwargs
+            )
+            if vstatus.returncode == 0:
+                auth = json.loads(vstatus.stdout.decode('UTF-8'))['auth']
+                self._update_token_cache(auth['client_token'], auth['lease_duration'])
+                logger.info(f"Success! Vault token extended for {self.RENEW_INCREMENT}!")
+
+    def renew_async(self, **kwargs):
+        """Renew the vault token in a background thread, the token is still valid meanwhile"""
+        self.renew_thread = threading.Thread(
+            target=self.renew, kwargs=kwargs, name='vault-token-renew'
+        )
+        self.renew_thread.start()
+
+    def login(self, **kwargs):
+        if not self.oidc_enabled:
+            return
+        if (ttl := self.token_ttl(**kwargs)) > self.RENEW_THRESHOLD:
+            return
+        if ttl > 0:
+            self.renew_async(**kwargs)
+            return
+        with FileLock(self.token_cache_file, timeout=self.LOGIN_TIMEOUT):
+            # another process may have logged in while this one was waiting for the lock
+            self.envdata = self.env_path.read_text()
+            if self.token_ttl(**kwargs) > 0:
+                return
             logger.info(
                 "Warning! The browser is about to open for vault OIDC login, "
                 "close the tab once the sign-in is done!"
@@ -90,21 +220,18 @@ class Vault:
                 self.exec_vault_command(command="vault login -method=oidc", **kwargs).returncode
                 == 0
             ):
-                self.exec_vault_command(command="vault token renew -i 10h", **kwargs)
-                logger.info("Success! Vault OIDC Logged-In and extended for 10 hours!")
-            # Fetching tokens
-            token = self.exec_vault_command("vault token lookup --format json").stdout
-            token = json.loads(str(token.decode('UTF-8')))['data']['id']
-            # Setting new token in env file
-            _envdata = re.sub(
-                '.*VAULT_TOKEN_FOR_DYNACONF=.*',
-                f"VAULT_TOKEN_FOR_DYNACONF={token}",
-                self.envdata,
-            )
-            self.env_path.write_text(_envdata)
-            logger.info("Success! New OIDC token added to .env file to access secrets from vault!")
+                self.exec_vault_command(
+                    command=f"vault token renew -i {self.RENEW_INCREMENT}", **kwargs
+                )
+                logger.info(
+                    f"Success! Vault OIDC Logged-In and extended for {self.RENEW_INCREMENT}!"
+                )
+            # Fetching the new token, and setting it in env file
+            self.token_ttl(**kwargs)
 
     def logout(self):
+        if token := self.env_token:
+            self._update_token_cache(token)
         # Teardown - Setting dymmy token in env file
         _envdata = re.sub(
             '.*VAULT_TOKEN_FOR_DYNACONF=.*', "# VAULT_TOKEN_FOR_DYNACONF=myroot", self.envdata
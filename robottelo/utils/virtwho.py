@@ -5,7 +5,6 @@ import re
 import uuid
 
 from fauxfactory import gen_integer, gen_string, gen_url
-from nailgun import entities
 import requests
 from wait_for import wait_for
 
@@ -597,6 +596,8 @@ def create_http_proxy(org, location, name=None, url=None, http_type='https'):
     :param org: instance of the organization
     :return:
     """
+    from nailgun import entities
+
     org = entities.Organization().search(query={'search': f'name="{org.name}"'})[0]
     http_proxy_name = name or gen_string('alpha', 15)
     http_proxy_url = (
@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+"""Benchmark nailgun API requests per second with and without the keep-alive session.
+
+The same GET request is sent through nailgun.client by a number of threads, first with a new
+connection per request as nailgun does by default, then through the session of
+``robottelo.utils.api_session`` that ``Satellite.api`` uses.
+
+Usage:
+    scripts/api_session_benchmark.py -n 500 -t 1 -t 8
+    scripts/api_session_benchmark.py --url https://satellite.example.com/api/status
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+import time
+
+import click
+from nailgun import client
+
+from robottelo.config import get_credentials, get_url, settings
+from robottelo.utils.api_session import new_session, patch_nailgun_client
+
+
+def run(url, requests_count, threads, session):
+    kwargs = {'auth': get_credentials(), 'verify': settings.server.verify_ca}
+    if session is not None:
+        kwargs['session'] = session
+
+    def send(_):
+        client.get(url, **kwargs).raise_for_status()
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        list(executor.map(send, range(requests_count)))
+    return requests_count / (time.perf_counter() - start)
+
+
+@click.command()
+@click.option('--url', help='The URL to GET, the status API of the configured server by default')
+@click.option('-n', '--requests', 'requests_count', type=int, default=200, show_default=True)
+@click.option('-t', '--threads', type=int, multiple=True, default=(1, 8))
+def main(url, requests_count, threads):
+    url = url or f'{get_url()}/api/status'
+    patch_nailgun_client()
+    api_session = settings.server.api_session
+    click.echo(f'{"threads":>7} {"new connections":>16} {"session":>10} {"speedup":>8}')
+    for count in threads:
+        session = new_session(
+            pool_size=max(count, api_session.pool_size),
+            retries=api_session.retries,
+            backoff_factor=api_session.backoff_factor,
+        )
+        before = run(url, requests_count, count, None)
+        after = run(url, requests_count, count, session)
+        session.close()
+        click.echo(f'{count:7d} {before:12.1f} r/s {after:6.1f} r/s {after / before:7.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,37 @@
+"""Build the impact map used by ``pytest --impacted-by`` from a coverage data file.
+
+The coverage run has to record per-test contexts, e.g.::
+
+    pytest tests/foreman --cov=robottelo --cov=pytest_fixtures --cov=pytest_plugins \
+        --cov-context=test
+"""
+
+from pathlib import Path
+
+import click
+
+from robottelo.config import robottelo_tmp_dir
+from robottelo.utils import impact_map
+
+
+@click.command()
+@click.argument('data_file', type=click.Path(exists=True, dir_okay=False), default='.coverage')
+@click.option(
+    '-o',
+    '--output',
+    type=click.Path(dir_okay=False),
+    default=str(robottelo_tmp_dir / 'impact_map.json'),
+    show_default=True,
+    help='Where to write the impact map.',
+)
+def build_impact_map(data_file, output):
+    """Build an impact map of the framework lines executed by each test"""
+    mapping = impact_map.build_from_coverage(data_file, root=Path(__file__).parents[1])
+    impact_map.save(mapping, output)
+    click.echo(
+        f"Mapped {len(mapping['tests'])} tests and {len(mapping['files'])} files to {output}"
+    )
+
+
+if __name__ == '__main__':
+    build_impact_map()
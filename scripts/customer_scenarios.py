@@ -4,17 +4,16 @@
 # dependencies = [
 #     "click",
 #     "requests",
-#     "testimony",
 # ]
 # ///
 
 import click
 from jira import JIRA
-import testimony
 
 from robottelo.config import settings
 from robottelo.constants import JIRA_COMMON_FIELDS
 from robottelo.utils.issue_handlers.jira import get_data_jira
+from robottelo.utils.metadata_index import get_index
 
 
 @click.group()
@@ -46,21 +45,19 @@ def get_tests_path_without_customer_tag(paths):
     Arguments:
         paths {list} -- List of test modules paths
     """
-    testcases = testimony.get_testcases(paths)
+    index = get_index()
+    testcases = index.get_testcases(paths)
+    index.save()
     result = {}
     for path, tests in testcases.items():
         path_result = []
-        for test in tests:
-            test_dict = test.to_dict()
-            test_data = {**test_dict['tokens'], **test_dict['invalid-tokens']}
-            # 1st level lowering should be good enough as `verifies` and `customerscenario`
-            # tokens are at 1st level
-            lowered_test_data = {name.lower(): val for name, val in test_data.items()}
-            if 'verifies' in lowered_test_data and (
-                'customerscenario' not in lowered_test_data
-                or lowered_test_data['customerscenario'] == 'false'
+        for qualname, metadata in tests.items():
+            # token names are lowered in the index
+            tokens = metadata['tokens']
+            if 'verifies' in tokens and (
+                'customerscenario' not in tokens or tokens['customerscenario'].lower() == 'false'
             ):
-                path_result.append([test.name, lowered_test_data['verifies']])
+                path_result.append([qualname.rpartition('.')[2], tokens['verifies']])
         if path_result:
             result[path] = path_result
     return result
@@ -5,25 +5,13 @@
 # ]
 # ///
 from pathlib import Path
-import re
 
 import click
 
 from robottelo.config import settings
 from robottelo.constants import JIRA_COMMON_FIELDS
 from robottelo.utils.issue_handlers.jira import get_data_jira, jira_cache
-
-blocked_by_regex = re.compile(
-    # To match :BlockedBy: SAT-32932
-    r'\s*:BlockedBy:\s*(?P<blocked_by>.*\S*)',
-    re.IGNORECASE,
-)
-
-verifies_regex = re.compile(
-    # To match :Verifies: SAT-32932
-    r'\s*:Verifies:\s*(?P<verifies>.*\S*)',
-    re.IGNORECASE,
-)
+from robottelo.utils.metadata_index import get_index
 
 
 @click.command()
@@ -32,27 +20,14 @@ verifies_regex = re.compile(
 def populate_jira_cache(tests_dir, fresh):
     """Scan test files for Jira issues and populate the Jira cache."""
 
-    def extract_jira_issues_from_file(file_path):
-        """Extract Jira issue IDs from a Python file's docstrings."""
-        content = Path(file_path).read_text()
-
-        issues = []
-        blocked_by = blocked_by_regex.findall(content)
-        verifies = verifies_regex.findall(content)
-        if blocked_by:
-            issues.extend(issue.strip() for match in blocked_by for issue in match.split(','))
-        if verifies:
-            issues.extend(issue.strip() for match in verifies for issue in match.split(','))
-        return issues
-
     def scan_test_directory(directory_path):
-        """Recursively scan directory for Python files and extract Jira issues."""
+        """Extract Jira issue IDs from the docstrings of all test modules in the directory."""
+        index = get_index()
         all_issues = set()
-
-        directory = Path(directory_path)
-        for file_path in directory.glob('**/test_*.py'):
-            issues = extract_jira_issues_from_file(file_path)
-            all_issues.update(issues)
+        for file_path in Path(directory_path).glob('**/test_*.py'):
+            for metadata in index.file_metadata(file_path)['objects'].values():
+                all_issues.update(metadata['blocked_by'] + metadata['verifies'])
+        index.save()
         return all_issues
 
     click.echo(f"Scanning {tests_dir} for Jira issues...")
@@ -85,7 +60,7 @@ def populate_jira_cache(tests_dir, fresh):
     for issue in jira_data:
         jira_cache.update(issue['key'], issue)
 
-    jira_cache.save()
+    jira_cache.flush()
     click.echo(f"Cache updated with {len(jira_data)} issues")
 
 
@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+"""Merge the robottelo log files of an xdist run, and show the log of a single test.
+
+scripts/robottelo_logs.py merge
+scripts/robottelo_logs.py show 'tests/foreman/cli/test_foo.py::test_bar' --phase call
+"""
+
+import click
+
+from robottelo.logging import robottelo_log_dir
+from robottelo.utils import log_store
+
+DEFAULT_STORE = str(robottelo_log_dir / 'robottelo_merged.log.gz')
+
+
+@click.group()
+def robottelo_logs():
+    """Merge the robottelo log files, and show the log of a test"""
+
+
+@robottelo_logs.command()
+@click.argument('log_files', nargs=-1, type=click.Path(exists=True, dir_okay=False))
+@click.option(
+    '-o', '--output', type=click.Path(dir_okay=False), default=DEFAULT_STORE, show_default=True
+)
+def merge(log_files, output):
+    """Merge log files by timestamp, robottelo*.log of the log directory by default"""
+    log_files = log_files or sorted(robottelo_log_dir.glob('robottelo*.log'))
+    index = log_store.merge_logs(log_files, output)
+    click.echo(f"Merged {len(log_files)} log files of {len(index['tests'])} tests into {output}")
+
+
+@robottelo_logs.command()
+@click.argument('nodeid')
+@click.option(
+    '--phase',
+    'phases',
+    type=click.Choice(log_store.PHASES),
+    multiple=True,
+    help='The test phases to show, all by default.',
+)
+@click.option(
+    '-i', '--input', 'store', type=click.Path(exists=True), default=DEFAULT_STORE, show_default=True
+)
+def show(nodeid, phases, store):
+    """Show the log of a test, NODEID can be a part of the test node id"""
+    index = log_store.load_index(store)
+    if nodeid not in index['tests']:
+        matches = [test for test in index['tests'] if nodeid in test]
+        if len(matches) != 1:
+            raise click.ClickException(
+                f'{len(matches)} tests match {nodeid}' + ''.join(f'\n  {m}' for m in matches[:20])
+            )
+        nodeid = matches[0]
+    for source, phase, text in log_store.show(store, nodeid, phases or log_store.PHASES, index):
+        click.secho(f'==> {source} {phase} {nodeid} <==', bold=True)
+        click.echo(text, nl=False)
+
+
+if __name__ == '__main__':
+    robottelo_logs()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+"""Benchmark SharedResource state transitions for a growing number of workers.
+
+For each worker count, all workers register on the same resource, report ready, and wait for the
+main watcher to perform a no-op action. The script reports how long workers needed to notice the
+action was done (transition latency) and how long the resource lock was held.
+
+Usage:
+    scripts/shared_resource_benchmark.py -w 2 -w 8 -w 32
+    scripts/shared_resource_benchmark.py -w 32 --poll  # compare with polling
+"""
+
+import multiprocessing
+from pathlib import Path
+import statistics
+import time
+from uuid import uuid4
+
+import click
+
+from robottelo.utils import shared_resource
+from robottelo.utils.shared_resource import ResourceLock, ResourceWatcher, SharedResource
+
+
+def _action(done_file):
+    Path(done_file).write_text(str(time.time()))
+
+
+def _timed_lock(hold_times):
+    """Patch ResourceLock to record how long it is held"""
+    enter, exit_ = ResourceLock.__enter__, ResourceLock.__exit__
+
+    def timed_enter(self):
+        enter(self)
+        self._acquired = time.perf_counter()
+        return self
+
+    def timed_exit(self, *tb_info):
+        hold_times.append(time.perf_counter() - self._acquired)
+        exit_(self, *tb_info)
+
+    ResourceLock.__enter__, ResourceLock.__exit__ = timed_enter, timed_exit
+
+
+def _worker(args):
+    resource_name, done_file, poll, start_at = args
+    ResourceWatcher.use_inotify = not poll
+    hold_times = []
+    _timed_lock(hold_times)
+    time.sleep(max(0, start_at - time.time()))
+    with SharedResource(resource_name, _action, done_file) as resource:
+        resource.ready()
+        released = time.time()
+    return released, hold_times
+
+
+def run(workers, poll):
+    resource_name = f'benchmark_{uuid4().hex[:8]}'
+    done_file = Path(f'/tmp/{resource_name}.done')
+    start_at = time.time() + 2
+    with multiprocessing.Pool(workers) as pool:
+        results = pool.map(_worker, [(resource_name, str(done_file), poll, start_at)] * workers)
+    action_done = float(done_file.read_text())
+    done_file.unlink()
+    latencies = [released - action_done for released, _ in results]
+    hold_times = [hold for _, holds in results for hold in holds]
+    return {
+        'latency_mean': statistics.mean(latencies),
+        'latency_max': max(latencies),
+        'hold_mean': statistics.mean(hold_times),
+        'hold_max': max(hold_times),
+        'locks': len(hold_times),
+    }
+
+
+@click.command()
+@click.option('-w', '--workers', type=int, multiple=True, default=(2, 8, 16, 32))
+@click.option('--poll', is_flag=True, help='Disable inotify and poll the resource file')
+def main(workers, poll):
+    # the action is instant, so the configured wait only matters for polling
+    shared_resource.settings.set('robottelo.shared_resource_wait', 1)
+    click.echo(
+        f'{"workers":>7} {"latency mean":>13} {"latency max":>12} '
+        f'{"hold mean":>10} {"hold max":>10} {"locks":>6}'
+    )
+    for count in workers:
+        stats = run(count, poll)
+        click.echo(
+            f'{count:7d} {stats["latency_mean"]:12.4f}s {stats["latency_max"]:11.4f}s '
+            f'{stats["hold_mean"]:9.5f}s {stats["hold_max"]:9.5f}s {stats["locks"]:6d}'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -26,7 +26,7 @@ pytestmark = pytest.mark.destructive
 @pytest.mark.e2e
 @pytest.mark.parametrize(
     "sat_ready_rhel",
-    [8, 9] if get_sat_rhel_version().major < 9 else [9],
+    [8, 9] if get_sat_rhel_version(offline=True).major < 9 else [9],
     indirect=True,
 )
 @pytest.mark.parametrize('backup_type', ['online', 'offline'])
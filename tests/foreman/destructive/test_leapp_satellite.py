@@ -19,7 +19,7 @@ from robottelo.hosts import get_sat_rhel_version, get_sat_version
 @pytest.mark.e2e
 @pytest.mark.pit_server
 @pytest.mark.skipif(
-    get_sat_version().minor != 16 or get_sat_rhel_version().major != 8,
+    get_sat_version(offline=True).minor != 16 or get_sat_rhel_version(offline=True).major != 8,
     reason='Run only on Satellite 6.16 el8',
 )
 def test_positive_leapp(target_sat):
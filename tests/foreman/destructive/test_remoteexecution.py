@@ -23,7 +23,7 @@ from robottelo.hosts import get_sat_version
 from robottelo.logging import logger
 from robottelo.utils.installer import InstallerCommand
 
-CAPSULE_TARGET_VERSION = f'6.{get_sat_version().minor}.z'
+CAPSULE_TARGET_VERSION = f'6.{get_sat_version(offline=True).minor}.z'
 
 pytestmark = pytest.mark.destructive
 
@@ -19,7 +19,7 @@ from robottelo.config import robottelo_tmp_dir, settings
 from robottelo.constants import MAINTAIN_HAMMER_YML
 from robottelo.hosts import get_sat_rhel_version, get_sat_version
 
-sat_x_y_release = f'{get_sat_version().major}.{get_sat_version().minor}'
+sat_x_y_release = f'{get_sat_version(offline=True).major}.{get_sat_version(offline=True).minor}'
 
 
 def get_satellite_capsule_repos(
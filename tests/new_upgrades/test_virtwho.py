@@ -70,7 +70,7 @@ def create_virt_who_configuration_setup(
         3. Report is sent to satellite.
     """
     target_sat = virt_who_upgrade_shared_satellite
-    settings.server.hostname = target_sat.hostname
+    settings.set('server.hostname', target_sat.hostname)
     manifest = virt_who_upgrade_manifest
     with SharedResource(target_sat.hostname, upgrade_action, target_sat=target_sat) as sat_upgrade:
         test_name = f'virt_who_upgrade_{gen_alpha()}'
@@ -24,7 +24,8 @@ def dummy_test(request):
 def exec_test(request, dummy_test):
     """Create a temporary file with the string provided by dummy_test, and run it with pytest.main
 
-    pytest arguments can be indirectly parametrized, and are handled as a string
+    pytest arguments can be indirectly parametrized, and are handled as a whitespace separated
+    string
 
     Writes and returns a junit-xml file
 
@@ -32,7 +33,7 @@ def exec_test(request, dummy_test):
     param_args = getattr(request, 'param', None)
     pytest_args = ['--capture=sys', '-q']
     if param_args:
-        pytest_args.append(param_args)
+        pytest_args.extend(param_args.split())
     test_dir = str(Path(__file__).parent)
     report_file = f'report_{gen_string("alphanumeric")}.xml'
     pytest_args.append(f'--junit-xml={report_file}')
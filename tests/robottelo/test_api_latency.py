@@ -0,0 +1,136 @@
+from datetime import timedelta
+import json
+from pathlib import Path
+import random
+from types import SimpleNamespace
+
+import pytest
+
+from robottelo.utils import api_latency
+from robottelo.utils.api_latency import LatencyHistogram
+
+latency_path = 'api_latency_test'
+baseline_path = 'api_latency_baseline_test.json'
+dummy_test_name = 'test_api_latency_dummy'
+dummy_test_body = f'''import pytest
+
+from robottelo.utils import api_latency
+
+
+@pytest.mark.parametrize('worker', [1, 2])
+def {dummy_test_name}(worker):
+    """A dummy test used by test_api_latency_report.
+    Not to be run as a standalone test
+    """
+    for cv_id in range(10):
+        api_latency.record(
+            'post',
+            f'https://sat/katello/api/content_view_versions/{{cv_id}}/promote',
+            202,
+            0.3,
+            100,
+        )
+        api_latency.record('get', f'https://sat/api/hosts?page={{cv_id}}', 200, 0.01, 1024)
+    api_latency.record('get', 'https://sat/api/hosts/host1.example.com', 404, 0.01, 50)
+'''
+
+
+def test_histogram_percentiles():
+    values = [random.randint(0, 10_000_000) for _ in range(10000)]
+    histogram, other = LatencyHistogram(), LatencyHistogram()
+    for i, value in enumerate(values):
+        (histogram if i % 2 else other).record(value)
+    histogram.merge(LatencyHistogram.from_dict(json.loads(json.dumps(other.to_dict()))))
+    assert histogram.count == len(values)
+    assert histogram.max == max(values)
+    values.sort()
+    for percentile in (50, 90, 99, 100):
+        exact = values[int(percentile / 100 * len(values)) - 1]
+        assert abs(histogram.percentile(percentile) - exact) <= exact / 2**6 + 1
+    assert len(histogram.counts) < 1000
+    small = LatencyHistogram()
+    for value in range(100):
+        small.record(value)
+    assert small.percentile(50) == 49
+
+
+def test_path_template():
+    assert (
+        api_latency.path_template('https://sat/katello/api/content_view_versions/42/promote')
+        == '/katello/api/content_view_versions/:id/promote'
+    )
+    assert (
+        api_latency.path_template(
+            'https://sat/pulp/api/v3/tasks/0190c5f4-7ea1-7a0b-9cb0-46b33b8a1a07/?limit=1'
+        )
+        == '/pulp/api/v3/tasks/:id/'
+    )
+    assert api_latency.path_template('https://sat/api/hosts/host1.example.com/facts') == (
+        '/api/hosts/:name/facts'
+    )
+    assert api_latency.path_template('https://sat/api/v2/hosts') == '/api/v2/hosts'
+
+
+def test_record_response(monkeypatch):
+    monkeypatch.setattr(api_latency, '_endpoints', {})
+    response = SimpleNamespace(
+        request=SimpleNamespace(method='GET', url='https://sat/api/hosts/7'),
+        status_code=200,
+        elapsed=timedelta(milliseconds=20),
+        content=b'{}',
+        headers={},
+        raw=None,
+    )
+    api_latency.record_response(response)
+    assert api_latency.endpoints() == {}, 'responses are only recorded when enabled'
+    monkeypatch.setattr(api_latency, 'enabled', True)
+    api_latency.record_response(response)
+    stats = api_latency.endpoints()['GET /api/hosts/:id']
+    assert stats.statuses == {'200': 1}
+    assert stats.size == 2
+    assert stats.latency.max == 20000
+
+
+@pytest.fixture
+def baseline():
+    stats = api_latency.EndpointStats()
+    for _ in range(10):
+        stats.latency.record(100_000)
+    Path(baseline_path).write_text(
+        json.dumps({'POST /katello/api/content_view_versions/:id/promote': stats.to_dict()})
+    )
+    yield
+    Path(baseline_path).unlink()
+
+
+@pytest.mark.parametrize(
+    'exec_test',
+    [f'--api-latency={latency_path} --api-latency-baseline={baseline_path} -n2'],
+    ids=['xdist'],
+    indirect=True,
+)
+@pytest.mark.parametrize(
+    'dummy_test',
+    [{'name': dummy_test_name, 'body': dummy_test_body}],
+    ids=['dummy_test'],
+    indirect=True,
+)
+def test_api_latency_report(baseline, exec_test):
+    """Asserts the histograms of the workers are merged and compared with the baseline"""
+    report, data = Path(f'{latency_path}.txt'), Path(f'{latency_path}.json')
+    try:
+        report_lines = report.read_text().splitlines()
+        endpoints = api_latency.load(json.loads(data.read_text()))
+    finally:
+        report.unlink(missing_ok=True)
+        data.unlink(missing_ok=True)
+    assert set(endpoints) == {
+        'POST /katello/api/content_view_versions/:id/promote',
+        'GET /api/hosts',
+        'GET /api/hosts/:name',
+    }
+    assert endpoints['GET /api/hosts'].latency.count == 20
+    assert endpoints['GET /api/hosts/:name'].errors == 2
+    slowest = report_lines[1].split()
+    assert slowest[-1] == '/katello/api/content_view_versions/:id/promote'
+    assert 2.9 <= float(slowest[-3]) <= 3.1
@@ -0,0 +1,96 @@
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import threading
+from types import SimpleNamespace
+
+import pytest
+import requests
+
+from robottelo.utils import api_latency
+from robottelo.utils.api_session import SessionServerConfig, new_session, patch_nailgun_client
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def do_GET(self):
+        if self.path.startswith('/api/flaky') and self.server.failures:
+            self.server.failures -= 1
+            self.send_response(503)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        body = b'{"results": []}'
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Set-Cookie', '_session_id=abc; path=/')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), KeepAliveHandler)
+    httpd.connections = 0
+    httpd.failures = 0
+    httpd.lock = threading.Lock()
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_nailgun_client_session(server):
+    url = f'http://127.0.0.1:{server.server_port}/api/hosts'
+    client = SimpleNamespace(requests=requests)
+    patch_nailgun_client(client)
+    patch_nailgun_client(client)
+    session = new_session(pool_size=2)
+    for _ in range(5):
+        assert client.requests.get(url, session=session).status_code == 200
+    assert server.connections == 1
+    assert not session.cookies, 'cookies are not kept between requests'
+    for _ in range(2):
+        client.requests.get(url)
+    assert server.connections == 3, 'requests without a session use a connection each'
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        responses = list(
+            executor.map(lambda _: client.requests.get(url, session=session), range(20))
+        )
+    assert all(response.ok for response in responses)
+    assert server.connections <= 5
+
+
+def test_session_server_config():
+    session = new_session()
+    config = SessionServerConfig('https://satellite', auth=('admin', 'changeme'), session=session)
+    assert config.get_client_kwargs() == {'auth': ('admin', 'changeme'), 'session': session}
+    assert 'session=' not in repr(config)
+
+
+def test_retried_latency(server, monkeypatch):
+    """Retried calls are recorded apart, without the time slept between their attempts"""
+    monkeypatch.setattr(api_latency, '_endpoints', {})
+    monkeypatch.setattr(api_latency, 'enabled', True)
+    server.failures = 2
+    session = new_session(backoff_factor=0.2)
+    response = session.get(f'http://127.0.0.1:{server.server_port}/api/flaky')
+    assert response.status_code == 200
+    assert response.elapsed.total_seconds() >= 0.4
+    session.get(f'http://127.0.0.1:{server.server_port}/api/flaky')
+    stats = api_latency.endpoints()['GET /api/flaky']
+    assert stats.calls == 2
+    assert stats.retried.count == 1
+    assert stats.retries == {'503': 2}
+    assert stats.statuses == {'200': 2}
+    assert stats.retried.max < 200_000
@@ -0,0 +1,57 @@
+from pathlib import Path
+
+import pytest
+
+profile_path = 'fixture_profile_test'
+dummy_test_name = 'test_fixture_profile_dummy'
+dummy_test_body = f'''import time
+
+import pytest
+
+
+@pytest.fixture(scope='module')
+def slow_module_fixture():
+    time.sleep(0.2)
+    yield
+    time.sleep(0.1)
+
+
+@pytest.fixture(params=['a', 'b'])
+def param_fixture(request, slow_module_fixture):
+    return request.param
+
+
+def {dummy_test_name}(param_fixture):
+    """A dummy test used by test_fixture_profile.
+    Not to be run as a standalone test
+    """
+'''
+
+
+@pytest.mark.parametrize(
+    'exec_test',
+    [f'--fixture-profile={profile_path} -n2', f'--fixture-profile={profile_path} -n0'],
+    ids=['xdist', 'non_xdist'],
+    indirect=True,
+)
+@pytest.mark.parametrize(
+    'dummy_test',
+    [{'name': dummy_test_name, 'body': dummy_test_body}],
+    ids=['dummy_test'],
+    indirect=True,
+)
+def test_fixture_profile(exec_test):
+    """Asserts the fixture profile report and collapsed stacks are written and merged"""
+    report, folded = Path(f'{profile_path}.txt'), Path(f'{profile_path}.folded')
+    try:
+        report_lines = report.read_text().splitlines()
+        stacks = dict(line.rsplit(' ', 1) for line in folded.read_text().splitlines())
+    finally:
+        report.unlink(missing_ok=True)
+        folded.unlink(missing_ok=True)
+    ranked = [line.split() for line in report_lines[report_lines.index('') + 2 :]]
+    assert ranked[0][-1] == 'slow_module_fixture'
+    assert float(ranked[0][1]) >= 0.2
+    assert float(ranked[0][2]) >= 0.1
+    assert {'param_fixture[a]', 'param_fixture[b]'} <= {row[-1] for row in ranked}
+    assert 'slow_module_fixture;teardown' in stacks
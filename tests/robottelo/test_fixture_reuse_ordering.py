@@ -0,0 +1,74 @@
+from types import SimpleNamespace
+
+import pytest
+
+from pytest_plugins.fixture_reuse_ordering import count_setups, reorder
+
+
+class FakeItem:
+    """Minimal stand-in for a collected pytest item"""
+
+    def __init__(self, name, parent, markers=(), **params):
+        self.name = name
+        self.parent = parent
+        # a parent 'module::Class' is a class of the module
+        self.module, _, self.cls = parent.partition('::')
+        self.markers = markers
+        self.fixturenames = ['target_sat', *params]
+        self.callspec = SimpleNamespace(indices=params)
+        self._fixtureinfo = SimpleNamespace(
+            name2fixturedefs={
+                'target_sat': [SimpleNamespace(scope='session')],
+                'module_repo': [SimpleNamespace(scope='module')],
+                'class_org': [SimpleNamespace(scope='class')],
+            }
+        )
+
+    def get_closest_marker(self, name):
+        return name if name in self.markers else None
+
+    def getparent(self, cls):
+        if cls is pytest.Module:
+            return self.module
+        return self.cls or None
+
+
+def test_reorder_groups_fixture_params():
+    """Items sharing a parametrized fixture are grouped, broader scopes first"""
+    items = [
+        FakeItem('a', 'mod', module_repo=0, class_org=0),
+        FakeItem('b', 'mod', module_repo=1, class_org=0),
+        FakeItem('c', 'mod', module_repo=0, class_org=0),
+        FakeItem('d', 'mod', module_repo=1, class_org=1),
+        FakeItem('e', 'mod'),
+    ]
+    assert count_setups(items) == 6
+    reordered = reorder(items)
+    assert [item.name for item in reordered] == ['e', 'a', 'c', 'b', 'd']
+    assert count_setups(reordered) == 4
+
+
+def test_reorder_keeps_parents_and_order_markers():
+    """Items are never moved across parents, and explicitly ordered groups are left alone"""
+    items = [
+        FakeItem('a', 'mod1', module_repo=1),
+        FakeItem('b', 'mod1', module_repo=0),
+        FakeItem('c', 'mod2', markers=('order',), module_repo=1),
+        FakeItem('d', 'mod2', module_repo=0),
+    ]
+    assert [item.name for item in reorder(items)] == ['b', 'a', 'c', 'd']
+
+
+def test_reorder_class_blocks():
+    """Classes and functions of a module are regrouped by their module fixture parameters"""
+    items = [
+        FakeItem('a', 'mod', module_repo=0),
+        FakeItem('b', 'mod', module_repo=1),
+        FakeItem('c', 'mod::TestA', module_repo=1, class_org=1),
+        FakeItem('d', 'mod::TestA', module_repo=1, class_org=0),
+        FakeItem('e', 'mod::TestB', module_repo=0),
+        FakeItem('f', 'mod', module_repo=0),
+    ]
+    reordered = reorder(items)
+    assert [item.name for item in reordered] == ['a', 'e', 'f', 'b', 'd', 'c']
+    assert (count_setups(items), count_setups(reordered)) == (5, 4)
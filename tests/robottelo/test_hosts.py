@@ -0,0 +1,115 @@
+from packaging.version import Version
+import pytest
+
+from robottelo import hosts
+from robottelo.config import settings
+
+
+class FakeSatellite:
+    connections = 0
+
+    def __init__(self, hostname):
+        FakeSatellite.connections += 1
+        self.os_version = Version('9.6')
+        self.version = '6.18.0'
+
+
+def test_sat_versions_are_cached(monkeypatch):
+    """The Satellite is only contacted once per hostname, and never when offline"""
+    monkeypatch.setattr(hosts, 'Satellite', FakeSatellite)
+    monkeypatch.setattr(settings.server, 'hostname', 'sat.example.com')
+    monkeypatch.delenv('PYTEST_XDIST_TESTRUNUID', raising=False)
+    hosts._read_sat_rhel_version.cache_clear()
+    hosts._read_sat_version.cache_clear()
+    FakeSatellite.connections = 0
+    assert hosts.get_sat_rhel_version(offline=True) == Version(
+        str(settings.server.version.rhel_version)
+    )
+    assert FakeSatellite.connections == 0
+    assert hosts.get_sat_rhel_version() == Version('9.6')
+    assert hosts.get_sat_rhel_version() == Version('9.6')
+    assert hosts.get_sat_version() == Version('6.18.0')
+    assert FakeSatellite.connections == 2
+
+
+class FakeHost:
+    """A content host whose setup and reset to baseline succeed unless told otherwise"""
+
+    count = 0
+
+    def __init__(self, fail_setup=False):
+        FakeHost.count += 1
+        self.name = self.hostname = f'host{FakeHost.count}'
+        self.fail_setup = fail_setup
+        self.reset_ok = True
+        self.reusable = False
+
+    def setup(self):
+        if self.fail_setup:
+            raise RuntimeError('setup failed')
+
+    def capture_baseline(self):
+        pass
+
+    def teardown(self):
+        self.reusable = self.reset_ok
+
+
+class FakeBroker:
+    """Checks out new FakeHosts, and records the hosts checked in"""
+
+    checked_in = []
+    fail_setup = False
+
+    def __init__(self, host_class=None, hosts=None, **broker_args):
+        self.hosts = hosts
+
+    def checkout(self):
+        return FakeHost(fail_setup=FakeBroker.fail_setup)
+
+    def checkin(self):
+        FakeBroker.checked_in.extend(self.hosts)
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    monkeypatch.setattr(hosts, 'Broker', FakeBroker)
+    FakeBroker.checked_in = []
+    FakeBroker.fail_setup = False
+    return hosts.ContentHostPool(max_uses=2)
+
+
+def test_pool_reuses_reset_hosts(pool):
+    """A host reset to its baseline is reused, until max_uses, and the rest are checked in"""
+    host = pool.checkout(FakeHost, workflow='deploy-rhel')
+    pool.release(host)
+    assert pool.checkout(FakeHost, workflow='deploy-rhel') is host
+    assert pool.checkout(FakeHost, workflow='other') is not host
+    pool.release(host)
+    assert FakeBroker.checked_in == [host], 'the host was used max_uses times'
+    other = pool.checkout(FakeHost, workflow='deploy-rhel')
+    assert other is not host
+    pool.release(other)
+    pool.checkin_all()
+    assert FakeBroker.checked_in == [host, other]
+
+
+def test_pool_checks_in_failed_hosts(pool):
+    """Hosts failing their reset or their setup are checked in, not pooled"""
+    host = pool.checkout(FakeHost)
+    host.reset_ok = False
+    pool.release(host)
+    assert FakeBroker.checked_in == [host]
+    FakeBroker.fail_setup = True
+    with pytest.raises(RuntimeError):
+        pool.checkout(FakeHost)
+    assert len(FakeBroker.checked_in) == 2
+    FakeBroker.fail_setup = False
+    host = pool.checkout(FakeHost)
+    pool.release(host)
+    host.fail_setup = True
+    with pytest.raises(RuntimeError):
+        pool.checkout(FakeHost)
+    assert FakeBroker.checked_in[-1] is host
+    pool.checkin_all()
+    assert len(FakeBroker.checked_in) == 3
@@ -0,0 +1,52 @@
+from unittest import mock
+
+import pytest
+
+from robottelo.config import RobotteloSettings, hot_settings
+
+
+@pytest.fixture
+def settings():
+    settings = RobotteloSettings(
+        core_loaders=[], loaders=[], envless_mode=True, lowercase_read=True
+    )
+    settings.update(
+        {
+            'SERVER': {
+                'HOSTNAME': 'sat.example.com',
+                'ADMIN_USERNAME': 'admin',
+                'SSH_CLIENT': {'PORT': 22},
+            },
+            'PERFORMANCE': {'TIME_HAMMER': False},
+            'ROBOTTELO': {'LOCALE': 'en_US.UTF-8'},
+            'CONTENT_HOST': {'NETWORK_TYPE': 'ipv4'},
+        },
+        tomlfy=False,
+        validate=False,
+    )
+    return settings
+
+
+def test_snapshot_rebuilt_on_set(settings):
+    """The snapshot is built once, and rebuilt only after settings.set"""
+    snapshot = hot_settings(settings)
+    assert snapshot.server.hostname == 'sat.example.com'
+    assert snapshot.server.ssh_port == 22
+    assert snapshot.server.ssh_password is None
+    assert snapshot.robottelo.locale == 'en_US.UTF-8'
+    assert hot_settings(settings) is snapshot
+    with pytest.raises(AttributeError):
+        snapshot.server.hostname = 'other.example.com'
+    settings.set('server.hostname', 'other.example.com')
+    assert settings.server.admin_username == 'admin'
+    assert hot_settings(settings).server.hostname == 'other.example.com'
+    assert hot_settings(settings).content_host.network_type == 'ipv4'
+
+
+def test_snapshot_of_mocked_settings():
+    """Mocked settings are changed by assigning attributes, they are never cached"""
+    settings = mock.MagicMock()
+    settings.server.hostname = 'sat.example.com'
+    assert hot_settings(settings).server.hostname == 'sat.example.com'
+    settings.server.hostname = 'other.example.com'
+    assert hot_settings(settings).server.hostname == 'other.example.com'
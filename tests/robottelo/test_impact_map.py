@@ -0,0 +1,71 @@
+import subprocess
+
+from robottelo.utils import impact_map
+
+MAP = {
+    'version': 1,
+    'tests': ['tests/test_a.py::test_a', 'tests/test_b.py::test_b'],
+    'files': {
+        'robottelo/cli/base.py': {
+            'import': [[1, 10]],
+            '0': [[20, 25]],
+            '1': [[30, 30], [40, 45]],
+        },
+        'robottelo/hosts.py': {'1': [[5, 8]]},
+    },
+}
+
+
+def test_ranges():
+    assert impact_map._ranges({5, 1, 2, 3, 7, 8}) == [[1, 3], [5, 5], [7, 8]]
+
+
+def test_impacted_tests():
+    """Tests are impacted by changes of the lines they ran, or of their import time lines"""
+    assert impact_map.impacted_tests(MAP, {'robottelo/cli/base.py': {22}}) == {MAP['tests'][0]}
+    assert impact_map.impacted_tests(MAP, {'robottelo/cli/base.py': {26, 29, 31}}) == set()
+    assert impact_map.impacted_tests(MAP, {'robottelo/cli/base.py': {3}}) == set(MAP['tests'])
+    assert impact_map.impacted_tests(
+        MAP, {'robottelo/hosts.py': {8}, 'robottelo/new.py': set()}
+    ) == {MAP['tests'][1]}
+
+
+def test_unmapped_changes():
+    """Changes out of the map select every test of a conftest directory, or every test"""
+    changes = {
+        'robottelo/hosts.py': {8},
+        'conftest.py': {3},
+        'tests/foreman/api/test_host.py': {10},
+        'tests/foreman/api/conftest.py': {5},
+    }
+    assert impact_map.unmapped_changes(changes) == {
+        'tests/foreman/api/': 'tests/foreman/api/conftest.py'
+    }
+    for path in ('conf/server.yaml.template', 'tests/foreman/data/test.csv', 'requirements.txt'):
+        assert impact_map.unmapped_changes({**changes, path: {1}})[''] == path
+
+
+def test_changed_lines(tmp_path):
+    """Changed lines are numbered as before the change, added files have no lines"""
+
+    def git(*args):
+        subprocess.run(['git', *args], cwd=tmp_path, check=True, capture_output=True)
+
+    git('init', '-q')
+    (tmp_path / 'base.py').write_text(''.join(f'line{i}\n' for i in range(1, 11)))
+    (tmp_path / 'gone.py').write_text('x\ny\n')
+    git('add', '.')
+    git('-c', 'user.name=t', '-c', 'user.email=t@t', 'commit', '-qm', 'base')
+    lines = [f'line{i}\n' for i in range(1, 11)]
+    lines[2] = 'changed\n'
+    lines.insert(6, 'inserted\n')
+    (tmp_path / 'base.py').write_text(''.join(lines))
+    (tmp_path / 'gone.py').unlink()
+    (tmp_path / 'new.py').write_text('z\n')
+    git('add', '-A')
+    git('-c', 'user.name=t', '-c', 'user.email=t@t', 'commit', '-qm', 'change')
+    assert impact_map.changed_lines('HEAD~1..HEAD', tmp_path) == {
+        'base.py': {3, 6, 7},
+        'gone.py': {1, 2},
+        'new.py': set(),
+    }
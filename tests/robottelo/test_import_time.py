@@ -0,0 +1,71 @@
+"""Guard the startup time of pytest, measured with ``python -X importtime``.
+
+The test imports the plugins and fixture modules listed in the root conftest.py in a fresh
+interpreter, the same way pytest does before collecting any test.
+"""
+
+import os
+from pathlib import Path
+import subprocess
+import sys
+
+# slow to import, loaded on first use only
+LAZY_MODULES = (
+    'airgun',
+    'wrapanapi',
+    'github',
+    'jira',
+    'nailgun.entities',
+    'robottelo.constants.foreman_ansible',
+    'robottelo.constants.permissions',
+    'robottelo.constants.pulp',
+    'robottelo.constants.rh_repos',
+)
+# total import time in seconds, including the validation of the settings
+IMPORT_TIME_BUDGET = float(os.environ.get('ROBOTTELO_IMPORT_TIME_BUDGET', 15))
+
+ROOT_DIR = Path(__file__).parents[2]
+LOAD_PLUGINS = (
+    'import importlib, conftest; [importlib.import_module(p) for p in conftest.pytest_plugins]'
+)
+
+
+def importtime(code):
+    """Return the import time in seconds of each module imported by some code"""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        cwd=ROOT_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        self_time, _, name = line.removeprefix('import time:').split('|')
+        modules[name.strip()] = int(self_time) / 1_000_000
+    return modules
+
+
+def test_plugins_import_time():
+    """Slow dependencies are imported lazily, and the plugins load within the time budget"""
+    modules = importtime(LOAD_PLUGINS)
+    assert not [module for module in LAZY_MODULES if module in modules]
+    total = sum(modules.values())
+    slowest = sorted(modules, key=modules.get, reverse=True)[:5]
+    assert total < IMPORT_TIME_BUDGET, (
+        f'Plugins took {total:.2f}s to import, the slowest modules were: '
+        + ', '.join(f'{module} ({modules[module]:.2f}s)' for module in slowest)
+    )
+
+
+def test_lazy_constants():
+    """The large tables of robottelo.constants are loaded on first access, under the same names"""
+    from robottelo import constants
+    from robottelo.constants import REPOS, rh_repos
+
+    assert REPOS is rh_repos.REPOS
+    assert constants.DISTRO_REPOS['rhel7'] is REPOS['rhel7']
+    assert 'PERMISSIONS' in dir(constants)
+    assert constants.PERMISSIONS is constants.permissions.PERMISSIONS
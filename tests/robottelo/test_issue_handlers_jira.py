@@ -2,6 +2,7 @@
 
 from unittest import mock
 
+from jira.exceptions import JIRAError
 import pytest
 
 from robottelo.config import settings
@@ -111,6 +112,47 @@ class TestJiraIssueHandler:
         assert cache.get('SAT-1') == data | {'timestamp': mock.ANY}
         assert cache.get('SAT-2') is None
 
+    def test_jira_status_cache_write_behind(self, tmp_path, monkeypatch):
+        """Updates are buffered until the flush interval elapses, then shared through the db."""
+        monkeypatch.setattr(settings.jira, 'cache_file', str(tmp_path / 'cache.db'))
+        monkeypatch.setattr(settings.jira, 'cache_flush_interval', 3600)
+        writer, reader = jira.JiraStatusCache(), jira.JiraStatusCache()
+        writer.update('SAT-1', {'key': 'SAT-1', 'status': 'Open'})
+        writer.save()
+        assert writer.get('SAT-1')['status'] == 'Open'
+        assert reader.get('SAT-1') is None
+        writer.flush()
+        assert reader.get('SAT-1')['status'] == 'Open'
+        # the most recently fetched data wins, whatever the order of the flushes
+        reader.update('SAT-1', {'key': 'SAT-1', 'status': 'Closed'})
+        writer.update('SAT-1', {'key': 'SAT-1', 'status': 'Testing'})
+        writer.flush()
+        reader.flush()
+        assert jira.JiraStatusCache().get('SAT-1')['status'] == 'Testing'
+
+    def test_jira_status_cache_imports_legacy_json(self, tmp_path, monkeypatch):
+        """An existing JSON cache is imported into the db, without its long expired entries."""
+        legacy_file = tmp_path / 'cache.json'
+        now = jira.time.time()
+        legacy_file.write_text(
+            jira.json.dumps(
+                {
+                    'issues': {
+                        'SAT-1': {'key': 'SAT-1', 'status': 'Open', 'timestamp': now},
+                        'SAT-2': {'key': 'SAT-2', 'status': 'Open', 'timestamp': 0},
+                    }
+                }
+            )
+        )
+        monkeypatch.setattr(settings.jira, 'cache_file', str(legacy_file))
+        cache = jira.JiraStatusCache()
+        assert cache.get_many(['SAT-1', 'SAT-2']) == {
+            'SAT-1': {'key': 'SAT-1', 'status': 'Open', 'timestamp': now},
+            'SAT-2': None,
+        }
+        assert cache.cache_file == tmp_path / 'cache.db'
+        assert cache.get_stale(['SAT-2']) == {}
+
     def test_get_jira_returns_issue_objects_from_search(self):
         """get_jira returns list of Issue objects (mocked client)."""
         mock_issues = [mock.Mock(key='SAT-1'), mock.Mock(key='SAT-2')]
@@ -131,9 +173,13 @@ class TestJiraIssueHandler:
         """get_data_jira with empty issue_ids returns []."""
         assert jira.get_data_jira([]) == []
 
-    def test_get_data_jira_missing_credentials_returns_default(self):
+    def test_get_data_jira_missing_credentials_returns_default(self, tmp_path, monkeypatch):
         """get_data_jira without email/api_key returns default issue data."""
         jira.CACHED_RESPONSES['get_data'].clear()
+        cache = jira.JiraStatusCache()
+        cache.cache_file = tmp_path / 'jira_status_cache.db'
+        cache.legacy_cache_file = tmp_path / 'jira_status_cache.json'
+        monkeypatch.setattr(jira, 'jira_cache', cache)
         with (
             mock.patch('robottelo.utils.issue_handlers.jira.settings.jira.email', None),
             mock.patch('robottelo.utils.issue_handlers.jira.settings.jira.api_key', None),
@@ -290,3 +336,56 @@ class TestAddCommentOnJira:
         payload = mock_session.post.call_args[1]['json']
         assert payload['body'] == 'Verification comment'
         assert payload['visibility'] == {'type': 'role', 'value': 'Internal'}
+
+
+class TestIncrementalFetch:
+    """Tests for concurrent batches, rate limit retries and incremental refresh."""
+
+    def test_get_jira_batches_and_updated_since(self):
+        """Batches are queried separately, restricted to recently updated issues if asked."""
+        with mock.patch.object(jira, '_jira_client') as m_client:
+            m_client.return_value.search_issues.side_effect = lambda jql_str, **kw: [jql_str]
+            result = jira.get_jira(
+                ['SAT-1', 'SAT-2', 'SAT-3'], max_results=2, updated_since=jira.time.time() - 90
+            )
+        assert sorted(result) == [
+            '(id = SAT-1 OR id = SAT-2) AND updated >= -3m',
+            '(id = SAT-3) AND updated >= -3m',
+        ]
+
+    def test_get_jira_retries_on_rate_limit(self, monkeypatch):
+        """A 429 response is retried after the delay requested by Jira."""
+        sleeps = []
+        monkeypatch.setattr(jira.time, 'sleep', sleeps.append)
+        response = mock.Mock(headers={'Retry-After': '7'})
+        rate_limited = JIRAError(status_code=429, response=response)
+        with mock.patch.object(jira, '_jira_client') as m_client:
+            m_client.return_value.search_issues.side_effect = [rate_limited, ['SAT-1']]
+            assert jira.get_jira(['SAT-1']) == ['SAT-1']
+        assert sleeps == [7]
+
+    def test_get_data_jira_refreshes_stale_entries_incrementally(self, tmp_path, monkeypatch):
+        """Expired entries are only refetched if Jira reports them as updated."""
+        monkeypatch.setattr(settings.jira, 'cache_file', str(tmp_path / 'cache.json'))
+        monkeypatch.setattr(settings.jira, 'email', 'user@example.com')
+        monkeypatch.setattr(settings.jira, 'api_key', 'key')
+        cache = jira.JiraStatusCache()
+        monkeypatch.setattr(jira, 'jira_cache', cache)
+        jira.CACHED_RESPONSES['get_data'].clear()
+        expired = jira.time.time() - cache.cache_ttl_days * 86400 - 60
+        with mock.patch.object(jira.time, 'time', return_value=expired):
+            for key in ('SAT-1', 'SAT-2'):
+                cache.update(key, {'key': key, 'status': 'New'})
+        updated = mock.Mock(key='SAT-2')
+        updated.fields.status.name = 'Closed'
+        with mock.patch.object(jira, 'get_jira', return_value=[updated]) as m_get_jira:
+            result = jira.get_data_jira(['SAT-1', 'SAT-2'], jira_fields=['key', 'status'])
+        m_get_jira.assert_called_once_with(
+            ['SAT-1', 'SAT-2'], ['key', 'status'], updated_since=expired
+        )
+        assert {issue['key']: issue['status'] for issue in result} == {
+            'SAT-1': 'New',
+            'SAT-2': 'Closed',
+        }
+        assert cache.get('SAT-1')
+        assert cache.get('SAT-2')['status'] == 'Closed'
@@ -0,0 +1,53 @@
+import gzip
+
+from robottelo.utils import log_store
+
+GW0_LOG = """\
+2024-01-01 10:00:00 - gw0 - robottelo - INFO - Started Test: tests/test_a.py::test_a
+2024-01-01 10:00:01 - gw0 - robottelo - DEBUG - setting up a
+2024-01-01 10:00:02 - gw0 - robottelo - INFO - Finished setup for test: tests/test_a.py::test_a, result: passed
+2024-01-01 10:00:03 - gw0 - robottelo - DEBUG - running a
+Traceback (most recent call last):
+  a traceback line
+2024-01-01 10:00:05 - gw0 - robottelo - INFO - Finished call for test: tests/test_a.py::test_a, result: failed
+2024-01-01 10:00:06 - gw0 - robottelo - INFO - Finished teardown for test: tests/test_a.py::test_a, result: passed
+"""
+GW1_LOG = """\
+{"time": "2024-01-01 10:00:01", "worker": "gw1", "name": "robottelo", "level": "INFO", "message": "Started Test: tests/test_b.py::test_b[x]"}
+{"time": "2024-01-01 10:00:03", "worker": "gw1", "name": "robottelo", "level": "DEBUG", "message": "running b"}
+{"time": "2024-01-01 10:00:04", "worker": "gw1", "name": "robottelo", "level": "INFO", "message": "Finished call for test: tests/test_b.py::test_b[x], result: passed"}
+"""
+
+
+CONTROLLER_LOG = """\
+2024-01-01 10:00:00 - robottelo - INFO - Started Test: tests/test_a.py::test_a
+2024-01-01 10:00:01 - robottelo - INFO - Started Test: tests/test_b.py::test_b[x]
+2024-01-01 10:00:02 - robottelo - INFO - Finished setup for test: tests/test_a.py::test_a, result: passed
+"""
+
+
+def test_merge_and_show(tmp_path):
+    """Logs are merged by timestamp, and the phases of a test are read back from the index"""
+    (tmp_path / 'robottelo_gw0.log').write_text(GW0_LOG)
+    (tmp_path / 'robottelo_gw1.log').write_text(GW1_LOG)
+    (tmp_path / 'robottelo.log').write_text(CONTROLLER_LOG)
+    store = tmp_path / 'merged.log.gz'
+    index = log_store.merge_logs(
+        [tmp_path / name for name in ('robottelo.log', 'robottelo_gw0.log', 'robottelo_gw1.log')],
+        store,
+        block_size=150,
+    )
+    assert len(index['blocks']) > 2
+    merged = gzip.decompress(store.read_bytes()).decode().splitlines()
+    assert len(merged) == 14
+    assert [line[:19] for line in merged if line[0] == '2'] == sorted(
+        line[:19] for line in merged if line[0] == '2'
+    )
+    assert set(index['tests']) == {'tests/test_a.py::test_a', 'tests/test_b.py::test_b[x]'}
+
+    [(source, phase, text)] = log_store.show(store, 'tests/test_a.py::test_a', phases=['call'])
+    assert (source, phase) == ('robottelo_gw0.log', 'call')
+    assert text.splitlines() == GW0_LOG.splitlines()[3:7]
+    shown = list(log_store.show(store, 'tests/test_b.py::test_b[x]'))
+    assert [phase for _, phase, _ in shown] == ['call']
+    assert shown[0][2].splitlines() == GW1_LOG.splitlines()
@@ -0,0 +1,47 @@
+import hashlib
+import json
+import logging
+
+from robottelo.logging import JsonLinesFormatter, LogWriter, QueuedFileHandler, limit_message
+
+
+def test_limit_message():
+    """Long messages are truncated, with the hash of the whole message"""
+    message = 'x' * 100
+    assert limit_message(message, max_size=100) == message
+    assert limit_message(message, max_size=0) == message
+    truncated = limit_message(message, max_size=10)
+    assert truncated.startswith('x' * 10 + '... [truncated 90 characters')
+    assert hashlib.sha256(message.encode()).hexdigest() in truncated
+
+
+def test_queued_file_handler(tmp_path):
+    """Records are written by the log writer thread, dropped ones are counted"""
+    writer = LogWriter(queue_size=2)
+    file_handler = logging.FileHandler(tmp_path / 'test.log')
+    file_handler.setFormatter(JsonLinesFormatter(fields={'worker': 'gw0'}))
+    handler = QueuedFileHandler(file_handler, writer=writer)
+    test_logger = logging.getLogger('robottelo.test_queued_file_handler')
+    test_logger.propagate = False
+    test_logger.addHandler(handler)
+    try:
+        for index in range(3):
+            test_logger.warning('record %s', index)
+        assert writer.dropped == 1
+        writer.start()
+        writer.flush()
+        test_logger.error('record 3')
+        writer.flush()
+    finally:
+        writer.stop()
+        test_logger.removeHandler(handler)
+        handler.close()
+    entries = [json.loads(line) for line in (tmp_path / 'test.log').read_text().splitlines()]
+    assert [entry['message'] for entry in entries] == [
+        'record 0',
+        'record 1',
+        '1 log records were dropped, the log writer fell behind',
+        'record 3',
+    ]
+    assert entries[0]['worker'] == 'gw0'
+    assert entries[-1]['level'] == 'ERROR'
@@ -0,0 +1,94 @@
+import time
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from robottelo.utils import manifest_cache
+from robottelo.utils.manifest_cache import ManifestCache
+
+refill_in_background = ManifestCache.refill_in_background
+
+
+class FakeManifester:
+    """Stand-in for Manifester that writes dummy manifests to a local directory"""
+
+    deleted = []
+    instances = 0
+
+    def __init__(self, directory):
+        FakeManifester.instances += 1
+        self.directory = directory
+        self.uuid = None
+
+    def get_manifest(self):
+        self.uuid = str(uuid4())
+        path = self.directory / f'{self.uuid}_manifest.zip'
+        path.write_bytes(self.uuid.encode())
+        return SimpleNamespace(path=path, uuid=self.uuid)
+
+    def delete_subscription_allocation(self, uuid=None):
+        self.deleted.append(uuid or self.uuid)
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    manifests_dir = tmp_path / 'manifests'
+    manifests_dir.mkdir()
+    FakeManifester.deleted = []
+    FakeManifester.instances = 0
+    monkeypatch.setattr(manifest_cache, 'robottelo_tmp_dir', tmp_path)
+    monkeypatch.setattr(ManifestCache, '_manifester', lambda self: FakeManifester(manifests_dir))
+    monkeypatch.setattr(ManifestCache, 'refill_in_background', lambda self: self.refill())
+    return ManifestCache('golden_ticket', size=2, max_age=3600)
+
+
+def test_checkout_from_empty_cache(cache):
+    """An empty cache generates a manifest for the consumer and is refilled afterwards"""
+    with cache.checkout() as manifest:
+        assert manifest.content == manifest.uuid.encode()
+        assert manifest.name == manifest.path.relative_to(cache.cache_dir)
+        assert len(cache._read_index()['ready']) == 2
+    assert FakeManifester.deleted == [manifest.uuid]
+    assert not manifest.path.exists()
+
+
+def test_checkout_uses_cached_manifest(cache):
+    """A ready manifest is handed out once and removed from the cache"""
+    cache.refill()
+    ready = [entry['uuid'] for entry in cache._read_index()['ready']]
+    with cache.checkout() as manifest:
+        assert manifest.uuid == ready[0]
+        assert manifest.uuid not in [entry['uuid'] for entry in cache._read_index()['ready']]
+
+
+def test_expired_manifests_are_discarded(cache):
+    """Manifests older than max_age are deleted and replaced on refill"""
+    cache.refill()
+    index = cache._read_index()
+    for entry in index['ready']:
+        entry['created'] = time.time() - cache.max_age - 1
+    cache._write_index(index)
+    expired = {entry['uuid'] for entry in index['ready']}
+    cache.refill()
+    assert set(FakeManifester.deleted) == expired
+    assert not expired & {entry['uuid'] for entry in cache._read_index()['ready']}
+
+
+def test_expired_manifests_deleted_by_one_manifester(cache):
+    cache.refill()
+    entries = cache._read_index()['ready']
+    FakeManifester.instances = 0
+    cache._delete(entries)
+    assert FakeManifester.instances == 1
+    assert FakeManifester.deleted == [entry['uuid'] for entry in entries]
+
+
+def test_background_refill_joined(cache):
+    """The refill threads are not daemons, and are waited for by join_refills"""
+    thread = refill_in_background(cache)
+    assert not thread.daemon
+    manifest_cache.join_refills()
+    assert not thread.is_alive()
+    assert not manifest_cache._refills
+    assert len(cache._read_index()['ready']) == 2
@@ -0,0 +1,113 @@
+from robottelo.utils import metadata_index
+from robottelo.utils.metadata_index import MetadataIndex
+
+test_module = '''"""Module docstring
+
+:CaseComponent: Repositories
+
+:Team: Phoenix-content
+"""
+from robottelo.utils.issue_handlers import is_open
+
+if is_open('BZ:1'):
+    pass
+
+
+class TestRepository:
+    """Class docstring
+
+    :CaseImportance: Critical
+    """
+
+    @staticmethod
+    def test_sync():
+        """Sync a repository
+
+        :Verifies: SAT-2, SAT-3
+
+        :BlockedBy: SAT-4
+
+        :customerscenario: true
+        """
+        if not is_open('BZ:5'):
+            pass
+'''
+
+
+def test_metadata_index(tmp_path, monkeypatch):
+    """Tokens and is_open usages are indexed, and files are only parsed again when changed"""
+    test_file = tmp_path / 'test_module.py'
+    test_file.write_text(test_module)
+    index = MetadataIndex(tmp_path / 'index.json')
+    metadata = index.file_metadata(test_file)
+    assert metadata['source_component'] == 'Repositories'
+    assert metadata['is_open'] == [['BZ', '1']]
+    module, cls, test = (
+        metadata['objects'][name] for name in ('', 'TestRepository', 'TestRepository.test_sync')
+    )
+    assert (module['component'], module['team']) == ('repositories', 'phoenix-content')
+    assert cls['importance'] == 'critical'
+    assert test['verifies'] == ['SAT-2', 'SAT-3']
+    assert test['blocked_by'] == ['SAT-4']
+    assert test['tokens']['customerscenario'] == 'true'
+    assert test['not is_open'] == [['BZ', '5']]
+    assert not test['is_open']
+    index.save()
+
+    parsed = []
+    monkeypatch.setattr(
+        metadata_index, 'parse_file', lambda *args: parsed.append(args) or {'objects': {}}
+    )
+    assert (
+        MetadataIndex(tmp_path / 'index.json').file_metadata(test_file)['objects']
+        == metadata['objects']
+    )
+    assert not parsed
+    test_file.write_text(test_module.replace('Critical', 'High'))
+    MetadataIndex(tmp_path / 'index.json').file_metadata(test_file)
+    assert len(parsed) == 1
+    monkeypatch.undo()
+    assert list(
+        MetadataIndex(tmp_path / 'index.json').get_testcases([tmp_path])[str(test_file)]
+    ) == ['TestRepository.test_sync']
+
+
+def test_get_testcases_inherited_tokens(tmp_path):
+    """Tests inherit the tokens of their module and classes, and may override them"""
+    test_file = tmp_path / 'test_scenarios.py'
+    test_file.write_text(
+        '''"""Module docstring
+
+:Verifies: SAT-1
+
+:customerscenario: false
+"""
+
+
+class TestScenario:
+    """Class docstring
+
+    :customerscenario: true
+    """
+
+    def test_inherited(self):
+        """Inherits the class customerscenario and the module verifies"""
+
+    def test_overridden(self):
+        """Overrides the class customerscenario
+
+        :customerscenario: false
+        """
+
+
+def test_module_level():
+    """Inherits the module tokens"""
+'''
+    )
+    tests = MetadataIndex(tmp_path / 'index.json').get_testcases([test_file])[str(test_file)]
+    tokens = {qualname: test['tokens'] for qualname, test in tests.items()}
+    assert tokens == {
+        'TestScenario.test_inherited': {'verifies': 'SAT-1', 'customerscenario': 'true'},
+        'TestScenario.test_overridden': {'verifies': 'SAT-1', 'customerscenario': 'false'},
+        'test_module_level': {'verifies': 'SAT-1', 'customerscenario': 'false'},
+    }
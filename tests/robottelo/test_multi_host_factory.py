@@ -0,0 +1,63 @@
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from pytest_fixtures.core import sat_cap_factory
+
+checked_in = []
+slow_checkout = threading.Event()
+
+
+class FakeBroker:
+    def __init__(self, hosts):
+        self.hosts = hosts
+
+    def checkin(self):
+        checked_in.extend(host.hostname for host in self.hosts)
+
+
+@pytest.fixture(scope='session')
+def satellite_factory():
+    def factory(hostname='sat', slow=False, **kwargs):
+        if slow:
+            assert slow_checkout.wait(timeout=10)
+        return SimpleNamespace(hostname=hostname)
+
+    return factory
+
+
+@pytest.fixture(scope='session')
+def capsule_factory():
+    def factory(fail=False, **kwargs):
+        if fail:
+            raise RuntimeError('no capsule available')
+        return SimpleNamespace(hostname='cap')
+
+    return factory
+
+
+def wait_for_checkins(count):
+    deadline = time.time() + 10
+    while len(checked_in) < count and time.time() < deadline:
+        time.sleep(0.05)
+    return sorted(checked_in)
+
+
+def test_multi_host_factory(multi_host_factory, monkeypatch):
+    """Hosts are provisioned concurrently, and checked in if any other host fails"""
+    monkeypatch.setattr(sat_cap_factory, 'Broker', FakeBroker)
+    sat, cap = multi_host_factory('satellite', 'capsule')
+    assert (sat.hostname, cap.hostname) == ('sat', 'cap')
+    assert not checked_in
+    with pytest.raises(RuntimeError, match='no capsule available'):
+        multi_host_factory(
+            ('satellite', {'hostname': 'sat1'}),
+            ('satellite', {'hostname': 'sat2', 'slow': True}),
+            ('capsule', {'fail': True}),
+        )
+    # the error is raised without waiting for the slow checkout, whose host is checked in later
+    assert wait_for_checkins(1) == ['sat1']
+    slow_checkout.set()
+    assert wait_for_checkins(2) == ['sat1', 'sat2']
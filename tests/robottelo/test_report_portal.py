@@ -0,0 +1,63 @@
+from unittest import mock
+
+import pytest
+
+from robottelo.utils.report_portal.portal import ReportPortal
+
+
+def _page(content, total_pages):
+    return {'content': content, 'page': {'totalPages': total_pages}}
+
+
+@pytest.fixture
+def rp(tmp_path):
+    with mock.patch('robottelo.utils.report_portal.portal.requests.Session'):
+        rp = ReportPortal(
+            rp_url='https://rp.example.com', rp_api_key='key', rp_project='proj', cache_dir=tmp_path
+        )
+    # forget the project settings request
+    rp.session.get.reset_mock()
+    responses = {
+        page: _page([{'name': f'tests/test_foo.py::test_{page}'}], 3) for page in range(1, 4)
+    }
+    rp.session.get.side_effect = lambda url, params: mock.Mock(
+        json=mock.Mock(return_value=responses[params['page.page']])
+    )
+    return rp
+
+
+def test_get_tests_fetches_all_pages(rp):
+    """All pages are fetched in order, and the items of a finished launch are cached"""
+    launch = {'id': 1, 'uuid': 'abc', 'status': 'FAILED'}
+    tests = rp.get_tests(launch=launch, status=['failed'])
+    assert [test['name'] for test in tests] == [
+        'tests/test_foo.py::test_1',
+        'tests/test_foo.py::test_2',
+        'tests/test_foo.py::test_3',
+    ]
+    assert rp.session.get.call_count == 3
+    assert rp.get_tests(launch=launch, status=['failed']) == tests
+    assert rp.session.get.call_count == 3
+    # different filters are cached separately
+    rp.get_tests(launch=launch, status=['skipped'])
+    assert rp.session.get.call_count == 6
+
+
+def test_get_tests_does_not_cache_unfinished_launches(rp):
+    """The items of a launch still in progress are fetched again"""
+    launch = {'id': 1, 'uuid': 'abc', 'status': 'IN_PROGRESS'}
+    rp.get_tests(launch=launch)
+    rp.get_tests(launch=launch)
+    assert rp.session.get.call_count == 6
+    assert not list(rp.cache_dir.iterdir())
+
+
+def test_get_tests_refetches_corrupt_cache(rp):
+    """A half-written cache file is a cache miss, replaced by the fetched items"""
+    launch = {'id': 1, 'uuid': 'abc', 'status': 'FAILED'}
+    tests = rp.get_tests(launch=launch)
+    [cache_file] = rp.cache_dir.iterdir()
+    cache_file.write_text('[{"name": "tests/test_fo')
+    assert rp.get_tests(launch=launch) == tests
+    assert rp.session.get.call_count == 6
+    assert [path.name for path in rp.cache_dir.iterdir()] == [cache_file.name]
@@ -0,0 +1,35 @@
+from unittest import mock
+
+import pytest
+
+from pytest_plugins.requirements import req_updater
+from pytest_plugins.requirements.req_updater import ReqUpdater
+
+
+@pytest.fixture
+def requirements(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'requirements.txt').write_text('# comment\npytest==0.0.1\nPyYAML==6.0.3\n')
+    (tmp_path / 'requirements-optional.txt').write_text('ruff==0.0.1\n')
+    return tmp_path
+
+
+def fake_distribution(name, version):
+    return mock.Mock(metadata={'Name': name}, version=version)
+
+
+def test_deviations_cached(requirements, monkeypatch):
+    """Installed packages are read once, until the requirements or site-packages change"""
+    dists = mock.Mock(
+        return_value=[fake_distribution('pyyaml', '6.0.3'), fake_distribution('pytest', '1.0')]
+    )
+    monkeypatch.setattr(req_updater, 'distributions', dists)
+    cache_file = requirements / 'requirements_check.json'
+    updater = ReqUpdater(cache_file=cache_file)
+    assert updater.req_deviation == {'pytest==0.0.1'}
+    assert updater.opt_deviation == {'ruff==0.0.1'}
+    assert ReqUpdater(cache_file=cache_file).req_deviation == {'pytest==0.0.1'}
+    assert dists.call_count == 1
+    (requirements / 'requirements.txt').write_text('pytest==1.0\n')
+    assert ReqUpdater(cache_file=cache_file).req_deviation == set()
+    assert dists.call_count == 2
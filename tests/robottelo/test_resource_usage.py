@@ -0,0 +1,112 @@
+import json
+from pathlib import Path
+from types import SimpleNamespace
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from robottelo.utils import resource_usage
+
+usage_path = 'resource_usage_test'
+dummy_test_name = 'test_resource_usage_dummy'
+dummy_test_body = f'''import pytest
+
+from robottelo.utils import resource_usage
+
+
+@pytest.fixture
+def remote_fixture():
+    with resource_usage.measure('ssh', sent='setup') as call:
+        call.finish(received='ok')
+    yield
+    with resource_usage.measure('ssh', sent='teardown') as call:
+        call.finish(received='', error=True)
+
+
+@pytest.mark.parametrize('calls', [1, 3])
+def {dummy_test_name}(remote_fixture, calls):
+    """A dummy test used by test_resource_usage_report.
+    Not to be run as a standalone test
+    """
+    for _ in range(calls):
+        with resource_usage.measure('hammer'), resource_usage.measure('ssh', sent='hammer -v'):
+            pass
+'''
+
+
+def test_measure():
+    with resource_usage.measure('ssh', sent='ls') as call:
+        call.finish(received='file')
+    resource_usage.begin()
+    with resource_usage.measure('ssh', sent='ls') as call:
+        call.finish(received=('file\n', 'é'), error=False)
+    with pytest.raises(TimeoutError), resource_usage.measure('ssh', sent='sleep 1000'):
+        raise TimeoutError
+    usage = resource_usage.end()
+    assert usage['ssh'].as_dict() == {
+        'calls': 2,
+        'errors': 1,
+        'seconds': usage['ssh'].seconds,
+        'sent': 12,
+        'received': 7,
+    }
+    # outside of an accounted test phase, nothing is recorded
+    with resource_usage.measure('ssh', sent='ls'):
+        pass
+    assert resource_usage.end() == {}
+
+
+def test_instrument_nailgun(monkeypatch):
+    def get(url, **kwargs):
+        return SimpleNamespace(
+            status_code=404, content=b'not found', request=SimpleNamespace(body=None), headers={}
+        )
+
+    client = SimpleNamespace(get=get)
+    resource_usage.instrument_nailgun(client)
+    assert client.get is get, 'nailgun is only instrumented when accounting is enabled'
+    monkeypatch.setattr(resource_usage, 'enabled', True)
+    resource_usage.instrument_nailgun(client)
+    resource_usage.instrument_nailgun(client)
+    assert client.get.__wrapped__ is get
+    resource_usage.begin()
+    client.get('https://satellite/api/hosts/1')
+    usage = resource_usage.end()
+    assert usage['api'].calls == 1
+    assert usage['api'].errors == 1
+    assert usage['api'].received == 9
+
+
+@pytest.mark.parametrize(
+    'exec_test', [f'--resource-usage={usage_path} -n2'], ids=['xdist'], indirect=True
+)
+@pytest.mark.parametrize(
+    'dummy_test',
+    [{'name': dummy_test_name, 'body': dummy_test_body}],
+    ids=['dummy_test'],
+    indirect=True,
+)
+def test_resource_usage_report(exec_test):
+    """Asserts the usage is attached to the junit report, merged and ranked"""
+    report, data = Path(f'{usage_path}.txt'), Path(f'{usage_path}.json')
+    try:
+        report_lines = report.read_text().splitlines()
+        tests = json.loads(data.read_text())
+    finally:
+        report.unlink(missing_ok=True)
+        data.unlink(missing_ok=True)
+    assert len(tests) == 2
+    usage = next(usage for nodeid, usage in tests.items() if nodeid.endswith('[3]'))
+    assert usage['setup']['ssh']['calls'] == 1
+    assert usage['call']['ssh']['calls'] == usage['call']['hammer']['calls'] == 3
+    assert usage['teardown']['ssh']['errors'] == 1
+    totals = {line.split()[-1]: line.split() for line in report_lines[1:4]}
+    assert totals['ssh'][1:3] == ['8', '2']
+    assert totals['hammer'][1] == '4'
+    ranked = report_lines[report_lines.index('') + 2 :]
+    assert len(ranked) == 2
+    properties = {
+        prop.get('name'): prop.get('value')
+        for prop in ET.parse(exec_test).getroot().iter('property')
+    }
+    assert {'resource_usage', 'remote_time'} <= set(properties)
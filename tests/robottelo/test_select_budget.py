@@ -0,0 +1,98 @@
+from types import SimpleNamespace
+
+import pytest
+
+from pytest_plugins import select_random_tests
+from pytest_plugins.select_random_tests import DurationStore, parse_budget, select_by_budget
+
+
+class FakeItem:
+    """Minimal stand-in for a collected pytest item"""
+
+    def __init__(self, nodeid, component, importance):
+        self.nodeid = nodeid
+        self.markers = {'component': component, 'importance': importance}
+
+    def get_closest_marker(self, name):
+        return SimpleNamespace(args=[self.markers[name]])
+
+
+def test_parse_budget():
+    assert parse_budget('45m') == 2700
+    assert parse_budget('1h30m') == 5400
+    assert parse_budget('90') == 90
+    with pytest.raises(pytest.UsageError):
+        parse_budget('45 minutes')
+
+
+def test_select_by_budget_covers_components():
+    """Every component gets a test before any component gets a second one"""
+    items = [
+        FakeItem(f'{component}-{i}', component, importance)
+        for component, importance in (('Hosts', 'Critical'), ('Repos', 'High'), ('CLI', 'Low'))
+        for i in range(10)
+    ]
+    durations = {item.nodeid: 10 for item in items}
+    selected = select_by_budget(items, 35, durations, 'seed')
+    assert len(selected) == 3
+    assert {item.markers['component'] for item in selected} == {'Hosts', 'Repos', 'CLI'}
+    assert selected == sorted(selected, key=items.index)
+    assert select_by_budget(items, 35, durations, 'seed') == selected
+    # a test too long for the remaining budget is skipped in favor of shorter ones
+    durations['CLI-0'] = durations['Hosts-0'] = 1000
+    assert len(select_by_budget(items, 95, durations, 'seed')) == 9
+
+
+def test_select_by_budget_components_span_importances():
+    """Components are covered first, each by its most important tests"""
+    items = [
+        FakeItem(f'{component}-{importance}-{i}', component, importance)
+        for component, importances in (
+            ('Hosts', ('Critical', 'High', 'Low')),
+            ('Repos', ('High', 'Medium')),
+            ('CLI', ('Low',)),
+        )
+        for importance in importances
+        for i in range(3)
+    ]
+    durations = {item.nodeid: 10 for item in items}
+    selected = select_by_budget(items, 35, durations, 'seed')
+    assert {(item.markers['component'], item.markers['importance']) for item in selected} == {
+        ('Hosts', 'Critical'),
+        ('Repos', 'High'),
+        ('CLI', 'Low'),
+    }
+    selected = select_by_budget(items, 95, durations, 'seed')
+    hosts = [
+        item.markers['importance'] for item in selected if item.markers['component'] == 'Hosts'
+    ]
+    assert sorted(hosts) == ['Critical'] * 3
+
+
+@pytest.mark.parametrize(
+    ('options', 'registered'),
+    [({}, False), ({'select_budget': '45m'}, True), ({'record_test_durations': True}, True)],
+)
+def test_duration_recorder_registration(tmp_path, options, registered):
+    """Durations are only recorded by sessions selecting by budget or asked to record them"""
+    plugins = {}
+    options = {
+        'select_budget': None,
+        'record_test_durations': False,
+        'test_durations_file': str(tmp_path / 'durations.json'),
+        **options,
+    }
+    config = SimpleNamespace(
+        getoption=options.get,
+        addinivalue_line=lambda *args: None,
+        pluginmanager=SimpleNamespace(register=lambda plugin, name: plugins.update({name: plugin})),
+    )
+    select_random_tests.pytest_configure(config)
+    assert ('duration_recorder' in plugins) is registered
+
+
+def test_duration_store_moving_average(tmp_path):
+    store = DurationStore(tmp_path / 'durations.json')
+    store.update({'test_a': 10})
+    store.update({'test_a': 20, 'test_b': 5})
+    assert store.load() == {'test_a': 15, 'test_b': 5}
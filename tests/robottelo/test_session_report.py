@@ -0,0 +1,22 @@
+from types import SimpleNamespace
+
+import pytest
+
+from pytest_plugins.session_report import SessionReport
+
+
+def test_session_report_requires_its_methods():
+    """A report missing one of dump, merge or write cannot be created"""
+
+    class IncompleteReport(SessionReport):
+        option = 'incomplete_report'
+
+        def dump(self):
+            return {}
+
+        def merge(self, data):
+            pass
+
+    config = SimpleNamespace(getoption=lambda name: 'report')
+    with pytest.raises(TypeError, match='write'):
+        IncompleteReport(config)
@@ -0,0 +1,68 @@
+from dynaconf import LazySettings
+import pytest
+
+from robottelo.config import settings_cache
+
+
+@pytest.fixture
+def inputs(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings_cache, 'robottelo_root_dir', tmp_path)
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(settings_cache.tempfile, 'gettempdir', lambda: str(tmp_path))
+    (tmp_path / 'conf').mkdir()
+    (tmp_path / 'conf' / 'server.yaml').write_text('SERVER:\n  HOSTNAME: foo\n')
+    return tmp_path
+
+
+def test_inputs_key(inputs, monkeypatch):
+    """The key changes with the input files and the ROBOTTELO_ environment variables"""
+    key = settings_cache.inputs_key()
+    assert settings_cache.inputs_key() == key
+    assert settings_cache.inputs_key(run_id='abc') != key
+    monkeypatch.setenv('ROBOTTELO_SERVER__HOSTNAME', 'bar')
+    env_key = settings_cache.inputs_key()
+    assert env_key != key
+    monkeypatch.setenv('SETTINGS_FILE_FOR_DYNACONF', 'other.yaml')
+    assert settings_cache.inputs_key() != env_key
+    monkeypatch.delenv('SETTINGS_FILE_FOR_DYNACONF')
+    (inputs / 'conf' / 'server.yaml').write_text('SERVER:\n  HOSTNAME: baz\n')
+    assert settings_cache.inputs_key() not in (key, env_key)
+    (inputs / '.secrets_ldap.yaml').write_text('LDAP: {}\n')
+    assert settings_cache.inputs_key() not in (key, env_key)
+
+
+def test_save_and_load(inputs):
+    """Cached settings keep their lazy values unevaluated"""
+    settings = LazySettings(core_loaders=[], loaders=[], envless_mode=True, lowercase_read=True)
+    settings.update(
+        {
+            'SERVER': {'NETWORK_TYPE': 'ipv4', 'PORTS': [443, 80]},
+            'CAPSULE': {'NETWORK_TYPE': '@jinja {{ this.server.network_type }}'},
+            'LDAP': {'WORKGROUP': {2016: 'FOO'}},
+        },
+        tomlfy=False,
+    )
+    assert settings_cache.load('key') is None
+    settings_cache.save(settings, 'key')
+    cached = LazySettings(core_loaders=[], loaders=[], envless_mode=True, lowercase_read=True)
+    cached.update(settings_cache.load('key'), tomlfy=False, validate=False)
+    assert cached.as_dict() == settings.as_dict()
+    cached.set('server.network_type', 'ipv6')
+    assert cached.capsule.network_type == 'ipv6'
+    assert cached.ldap.workgroup[2016] == 'FOO'
+
+
+def test_not_cached_with_vault(inputs, monkeypatch):
+    """Settings holding secrets read from Vault are neither stored nor loaded"""
+    monkeypatch.delenv('VAULT_ENABLED_FOR_DYNACONF', raising=False)
+    settings = LazySettings(core_loaders=[], loaders=[], envless_mode=True, lowercase_read=True)
+    settings.update({'SERVER': {'ADMIN_PASSWORD': 'secret'}}, tomlfy=False)
+    settings_cache.save(settings, 'key')
+    assert settings_cache.load('key') is not None
+    (inputs / '.env').write_text('VAULT_ENABLED_FOR_DYNACONF=true\n')
+    assert settings_cache.load('key') is None
+    (inputs / '.env').write_text('# VAULT_ENABLED_FOR_DYNACONF=true\n')
+    assert settings_cache.load('key') is not None
+    settings.set('VAULT_ENABLED_FOR_DYNACONF', True)
+    settings_cache.save(settings, 'vault_key')
+    assert settings_cache.load('vault_key') is None
@@ -1,10 +1,46 @@
 import multiprocessing
+import os
 from pathlib import Path
 import random
+import tempfile
 from threading import Thread
 import time
+from uuid import uuid4
+import xml.etree.ElementTree as ET
 
-from robottelo.utils.shared_resource import SharedResource
+import pytest
+
+from robottelo.utils.shared_resource import (
+    ResourceLock,
+    ResourceWatcher,
+    SharedResource,
+    SharedResourceError,
+    remove_shared_results,
+    shared_results_dir,
+    xdist_once,
+)
+
+dummy_test_name = 'test_xdist_once_dummy'
+dummy_test_body = f'''import os
+
+import pytest
+
+from robottelo.utils.shared_resource import shared_results_dir, xdist_once
+
+
+@xdist_once(key='test_xdist_once_cleanup')
+def setup():
+    return 42
+
+
+@pytest.mark.parametrize('worker', [1, 2])
+def {dummy_test_name}(worker):
+    """A dummy test used by test_xdist_once_results_removed.
+    Not to be run as a standalone test
+    """
+    assert setup() == 42
+    assert shared_results_dir(os.environ['PYTEST_XDIST_TESTRUNUID']).exists()
+'''
 
 
 def upgrade_action(*args, **kwargs):
@@ -45,6 +81,7 @@ def test_shared_resource():
         assert resource._check_all_status("ready")
 
     assert not Path("/tmp/test_resource.shared").exists()
+    assert not Path("/tmp/test_resource.shared.flock").exists()
 
 
 def test_shared_resource_multiprocessing():
@@ -53,6 +90,7 @@ def test_shared_resource_multiprocessing():
         pool.map(run_resource, ["test_resource_mp", "test_resource_mp"])
 
     assert not Path("/tmp/test_resource_mp.shared").exists()
+    assert not Path("/tmp/test_resource_mp.shared.flock").exists()
 
 
 def test_shared_resource_multithreading():
@@ -67,3 +105,140 @@ def test_shared_resource_multithreading():
     t2.join()
 
     assert not Path("/tmp/test_resource_th.shared").exists()
+
+
+def expensive_setup(calls_file):
+    with open(calls_file, 'a') as f:
+        f.write('call\n')
+    time.sleep(1)
+    return {'repo_id': 42}
+
+
+def run_once(calls_file):
+    return xdist_once(key='test_xdist_once')(expensive_setup)(calls_file)
+
+
+@pytest.fixture
+def tmpdir_env(tmp_path, monkeypatch):
+    """Make tmp_path the temporary directory of this process and of its children"""
+    monkeypatch.setenv('TMPDIR', str(tmp_path))
+    monkeypatch.setattr(tempfile, 'tempdir', None)
+    return tmp_path
+
+
+@pytest.fixture
+def run_id(tmpdir_env, monkeypatch):
+    """An xdist run ID, sharing its results in tmp_path"""
+    run_id = uuid4().hex
+    monkeypatch.setenv('PYTEST_XDIST_TESTRUNUID', run_id)
+    return run_id
+
+
+def test_xdist_once_multiprocessing(tmp_path, run_id):
+    """The result is computed by a single process and shared with the others"""
+    calls_file = tmp_path / 'calls'
+    with multiprocessing.Pool(3) as pool:
+        results = pool.map(run_once, [calls_file] * 3)
+    assert results == [{'repo_id': 42}] * 3
+    assert calls_file.read_text() == 'call\n'
+    assert shared_results_dir(run_id).parent == tmp_path
+    remove_shared_results(run_id)
+    assert not shared_results_dir(run_id).exists()
+
+
+def test_xdist_once_skip(run_id):
+    """A skip while computing the result skips the other callers, with the same reason"""
+    calls = []
+
+    @xdist_once(key='test_xdist_once_skip')
+    def setup():
+        calls.append(1)
+        pytest.skip('no repository')
+
+    for _ in range(2):
+        with pytest.raises(pytest.skip.Exception, match='no repository'):
+            setup()
+    assert calls == [1]
+
+
+def test_xdist_once_invalidation_and_failure(run_id):
+    """A new token discards the published result, and failures propagate to other callers"""
+    token = 'sat1'
+    calls = []
+
+    @xdist_once(key='test_xdist_once_failure', invalidate_on=lambda: token)
+    def setup():
+        calls.append(token)
+        if token == 'sat2':
+            raise RuntimeError('sync failed')
+        return len(calls)
+
+    assert setup() == 1
+    assert setup() == 1
+    token = 'sat2'
+    with pytest.raises(RuntimeError):
+        setup()
+    with pytest.raises(SharedResourceError, match='sync failed'):
+        setup()
+    assert calls == ['sat1', 'sat2']
+
+
+def test_resource_watcher_wakes_up_on_change(tmp_path):
+    """The watcher returns as soon as the file is replaced instead of waiting for the timeout"""
+    resource_file = tmp_path / 'resource.shared'
+    watcher = ResourceWatcher(resource_file)
+
+    def replace_file():
+        time.sleep(0.2)
+        tmp_file = tmp_path / 'resource.shared.tmp'
+        tmp_file.write_text('{}')
+        tmp_file.replace(resource_file)
+
+    Thread(target=replace_file).start()
+    start = time.time()
+    watcher.wait(timeout=10)
+    watcher.close()
+    assert time.time() - start < 5
+
+
+def test_resource_watcher_closed_when_collected(tmp_path):
+    watcher = ResourceWatcher(tmp_path / 'resource.shared')
+    fd = watcher._fd
+    assert fd is not None
+    del watcher
+    with pytest.raises(OSError, match="Bad file descriptor"):
+        os.fstat(fd)
+
+
+def test_resource_lock_removed_while_waiting(tmp_path):
+    """A process waiting for a removed lock file locks the new one instead"""
+    resource_file = tmp_path / 'resource.shared'
+    lock = ResourceLock(resource_file)
+    waiter = ResourceLock(resource_file)
+    locked = []
+
+    def wait_for_lock():
+        with waiter:
+            locked.append(waiter.lock.exists())
+
+    with lock:
+        thread = Thread(target=wait_for_lock)
+        thread.start()
+        time.sleep(0.2)
+        lock.remove()
+    thread.join()
+    assert locked == [True]
+    assert waiter.lock.exists()
+
+
+@pytest.mark.parametrize('exec_test', ['-n2'], ids=['xdist'], indirect=True)
+@pytest.mark.parametrize(
+    'dummy_test',
+    [{'name': dummy_test_name, 'body': dummy_test_body}],
+    ids=['dummy_test'],
+    indirect=True,
+)
+def test_xdist_once_results_removed(tmpdir_env, exec_test):
+    """Asserts the shared results of the workers are removed at the end of the run"""
+    assert ET.parse(exec_test).getroot().find('testsuite').get('failures') == '0'
+    assert not list(tmpdir_env.glob('robottelo-once-*'))
@@ -0,0 +1,108 @@
+import json
+import subprocess
+import threading
+
+import pytest
+
+from robottelo.utils import vault as vault_module
+from robottelo.utils.vault import Vault
+
+
+class FakeVaultCLI:
+    """Answers the vault commands, the lookup with the given tokens in turn"""
+
+    def __init__(self, *tokens):
+        self.tokens = list(tokens)
+        self.commands = []
+
+    def __call__(self, command, **kwargs):
+        self.commands.append(command)
+        data = {}
+        if command.startswith('vault token lookup'):
+            token, ttl = self.tokens.pop(0) if len(self.tokens) > 1 else self.tokens[0]
+            if not ttl:
+                return subprocess.CompletedProcess(command, 2, b'', b'Error looking up token')
+            data = {'data': {'id': token, 'ttl': ttl}}
+        elif command.startswith('vault token renew'):
+            data = {'auth': {'client_token': self.tokens[0][0], 'lease_duration': 36000}}
+        return subprocess.CompletedProcess(command, 0, json.dumps(data).encode(), b'')
+
+
+@pytest.fixture
+def vault(tmp_path, monkeypatch):
+    monkeypatch.delenv('VAULT_SECRET_ID_FOR_DYNACONF', raising=False)
+    monkeypatch.delenv('VAULT_ADDR', raising=False)
+    env_file = tmp_path / '.env'
+    env_file.write_text(
+        'VAULT_ENABLED_FOR_DYNACONF=true\n'
+        'VAULT_URL_FOR_DYNACONF=https://vault.example.com\n'
+        '# VAULT_TOKEN_FOR_DYNACONF=myroot\n'
+    )
+
+    def new_vault(vault_cli):
+        with Vault(env_file, token_cache_file=tmp_path / 'tokens.json') as vclient:
+            vclient.exec_vault_command = vault_cli
+            return vclient
+
+    return new_vault
+
+
+def test_valid_token_looked_up_once(vault):
+    """A valid token is looked up once, and set in the env file"""
+    vault_cli = FakeVaultCLI(('s.abc', 36000))
+    vault(vault_cli).login()
+    assert len(vault_cli.commands) == 1
+    vclient = vault(vault_cli)
+    assert 'VAULT_TOKEN_FOR_DYNACONF=s.abc' in vclient.envdata
+    vclient.login()
+    assert len(vault_cli.commands) == 1
+
+
+def test_expiring_token_renewed(vault):
+    """A token close to expiry is renewed in the background"""
+    vault_cli = FakeVaultCLI(('s.abc', 600))
+    vclient = vault(vault_cli)
+    vclient.login()
+    vclient.renew_thread.join()
+    assert vault_cli.commands[-1].startswith('vault token renew')
+    assert vclient.token_ttl(lookup=False) > Vault.RENEW_THRESHOLD
+
+
+def test_expired_token_login(vault):
+    """An expired token leads to an OIDC login, and the new token is set in the env file"""
+    vault_cli = FakeVaultCLI(('s.abc', 0), ('s.abc', 0), ('s.new', 36000))
+    vclient = vault(vault_cli)
+    vclient.login()
+    assert 'vault login -method=oidc' in vault_cli.commands
+    assert 'VAULT_TOKEN_FOR_DYNACONF=s.new' in vclient.env_path.read_text()
+
+
+def test_async_renew_after_teardown(tmp_path, monkeypatch):
+    """The renewal thread runs the vault CLI with VAULT_ADDR, even once the context exited"""
+    monkeypatch.delenv('VAULT_SECRET_ID_FOR_DYNACONF', raising=False)
+    monkeypatch.delenv('VAULT_ADDR', raising=False)
+    env_file = tmp_path / '.env'
+    env_file.write_text(
+        'VAULT_ENABLED_FOR_DYNACONF=true\n'
+        'VAULT_URL_FOR_DYNACONF=https://vault.example.com\n'
+        'VAULT_TOKEN_FOR_DYNACONF=s.abc\n'
+    )
+    vault_cli = FakeVaultCLI(('s.abc', 600))
+    exited = threading.Event()
+    environments = {}
+
+    def run(command, shell, capture_output, env=None, **kwargs):
+        if command.startswith('vault token renew'):
+            exited.wait(timeout=10)
+        environments[command.split(' -')[0]] = (env or {}).get('VAULT_ADDR')
+        return vault_cli(command)
+
+    monkeypatch.setattr(vault_module.subprocess, 'run', run)
+    with Vault(env_file, token_cache_file=tmp_path / 'tokens.json') as vclient:
+        vclient.login()
+    exited.set()
+    vclient.renew_thread.join()
+    assert environments == {
+        'vault token lookup': 'https://vault.example.com',
+        'vault token renew': 'https://vault.example.com',
+    }